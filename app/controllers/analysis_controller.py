@@ -2,6 +2,7 @@
 Analiz işlemleri kontrolcüsü.
 """
 
+import os
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Union
@@ -10,8 +11,10 @@ from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QThread
 
 # Mevcut analiz fonksiyonlarını içe aktar
 from src.data_processing import (
-    prepare_data_for_analysis, 
+    read_raw_data,
+    build_analysis_frame,
     get_latest_week_data,
+    memory_report,
     assign_kisim
 )
 from src.calculations import (
@@ -20,31 +23,66 @@ from src.calculations import (
     calculate_machine_stop_times,
     calculate_machine_stop_type_times,
     filter_sort_top_stops,
-    calculate_part_average_stop_times
+    calculate_part_average_stop_times,
+    calculate_category_stop_times
 )
+from src.oee import compute_oee_tables
+from src.reliability import compute_reliability, write_reliability_sheets
+from src.heatmap import compute_heatmaps
+from src.occupancy import compute_occupancy
+from src.anomaly import detect_anomalies
+from src.ranking import rank_changes
+from src.query_service import QueryService
+from src.pareto import compute_pareto_tables, write_pareto_sheets
+from src.trends import LEVEL_COLUMNS, LEVEL_TITLES, compute_trends, latest_increases
+from src.profiling import StageProfiler, count_rows
+from src import storage
+from src import sql_store
+from src import shared_frames
+from src.shared_frames import SharedFrameStore
+from src.parallel_charts import machine_chart_tasks, plot_oee, run_chart_tasks
+from src.ingest import store_frame, ingest_incremental, load_export_frame, weekly_aggregate_frame
 from src.visualization import (
     visualize_pie,
     visualize_weekly_comparison,
     visualize_bar,
     plot_bar,
     visualize_top_bottom_machines,
+    visualize_category_breakdown,
+    visualize_hour_of_week_heatmap,
+    visualize_trend_increases,
+    visualize_anomaly_summary,
+    visualize_pareto,
     generate_oee_visuals
 )
 
 # Tezgah listesi konfigürasyonunu içe aktar
-from config.tezgah_listesi import KISIMLAR_DICT
+from config.tezgah_listesi import KISIMLAR_DICT, OUTPUT_DIRS
 
 # Loglama yapılandırması
 logger = logging.getLogger(__name__)
 
+class AnalysisCancelled(Exception):
+    """
+    Analiz kullanıcı tarafından iptal edildiğinde iş parçacığı içinde yükseltilir.
+    """
+    pass
+
+
 class AnalysisWorker(QThread):
     """
     Analiz işlemlerini arka planda çalıştıran iş parçacığı sınıfı.
+    
+    Analiz aşamalara bölünmüştür; her aşamanın başında ve sonunda iptal
+    isteği kontrol edilir. Tamamlanan aşamaların sonuçları stage_cache
+    sözlüğüne yazılır, böylece iptal sonrası yeniden başlatılan analiz
+    kaldığı aşamadan devam eder.
     """
     # Sinyaller
     progress_updated = pyqtSignal(int, str)
     analysis_completed = pyqtSignal(dict)
     analysis_error = pyqtSignal(str)
+    analysis_cancelled = pyqtSignal()
     
     def __init__(self, 
                 durus_file: str, 
@@ -53,7 +91,14 @@ class AnalysisWorker(QThread):
                 show_plots: bool,
                 save_plots: bool,
                 export_excel: bool,
-                threshold: float):
+                threshold: float,
+                stage_cache: Optional[Dict] = None,
+                profile_memory: bool = False,
+                use_cprofile: bool = False,
+                store_path: Optional[str] = None,
+                incremental: bool = False,
+                chart_workers: int = 1,
+                sql_store_path: Optional[str] = None):
         """
         Worker'ı başlat.
         
@@ -65,6 +110,19 @@ class AnalysisWorker(QThread):
             save_plots: Grafikleri kaydetme bayrağı
             export_excel: Excel'e aktarma bayrağı
             threshold: Pasta grafik eşik değeri
+            stage_cache: Tamamlanan aşama sonuçlarının tutulduğu önbellek
+            profile_memory: Aşamaların tepe belleği tracemalloc ile ölçülsün mü
+            use_cprofile: cProfile çıktısı alınsın mı
+            store_path: İşlenmiş verinin yazılacağı hafta bölümlü depo dizini
+                (None ise depo kullanılmaz)
+            incremental: Artımlı aktarım; yalnızca depoda olmayan satırlar
+                işlenir ve analiz verisi depodan okunur (depo gerektirir)
+            chart_workers: Tezgah ve OEE grafiklerini çizen süreç sayısı. 1'den
+                büyükse tablolar paylaşımlı depoya yazılır ve grafikler süreç
+                havuzunda çizilir (pyarrow gerektirir; grafikler gösterilecekse
+                veya kaydedilmeyecekse yok sayılır)
+            sql_store_path: İşlenmiş duruş ve çalışma verisinin yazılacağı SQL
+                deposu dosyası (None ise SQL deposu kullanılmaz)
         """
         super().__init__()
         self.durus_file = durus_file
@@ -74,6 +132,127 @@ class AnalysisWorker(QThread):
         self.save_plots = save_plots
         self.export_excel = export_excel
         self.threshold = threshold
+        self.stage_cache = stage_cache if stage_cache is not None else {}
+        self.store_path = store_path if storage.is_available() else None
+        self.incremental = incremental and self.store_path is not None
+        self.chart_workers = chart_workers
+        self.sql_store_path = sql_store_path
+        self.shared_store = None
+        self._cancel_requested = False
+        self.profiler = StageProfiler(trace_memory=profile_memory, use_cprofile=use_cprofile)
+    
+    def request_cancel(self) -> None:
+        """
+        İşbirlikçi iptal isteği gönder. İş parçacığı bir sonraki kontrol
+        noktasında durur.
+        """
+        self._cancel_requested = True
+    
+    def is_cancel_requested(self) -> bool:
+        """
+        İptal isteği olup olmadığını döndür.
+        """
+        return self._cancel_requested
+    
+    def _checkpoint(self) -> None:
+        """
+        İptal kontrol noktası. İptal istenmişse AnalysisCancelled yükseltir.
+        """
+        if self._cancel_requested:
+            raise AnalysisCancelled()
+    
+    def _run_stage(self, name: str, func, params: Tuple = (), interruptible: bool = False,
+                   rows_in: Optional[int] = None):
+        """
+        Bir analiz aşamasını önbellek, iptal kontrolleri ve profil ölçümüyle çalıştır.
+        
+        Args:
+            name: Aşama adı
+            func: Aşamayı çalıştıran parametresiz fonksiyon
+            params: Aşama sonucunu etkileyen ek parametreler (önbellek anahtarına eklenir)
+            interruptible: Aşama kendi içinde iptal edilebiliyorsa True;
+                bu durumda iptal sonrası yarım kalan sonuç önbelleğe yazılmaz
+            rows_in: Aşamanın giriş satır sayısı (profil raporu için)
+            
+        Returns:
+            Aşamanın sonucu
+        """
+        key = (name,) + tuple(params)
+        if key in self.stage_cache:
+            logger.info(f"Aşama önbellekten alındı: {name}")
+            result = self.stage_cache[key]
+            self.profiler.record_cached(name, rows_in, count_rows(result))
+            return result
+        
+        self._checkpoint()
+        with self.profiler.stage(name, rows_in) as record:
+            result = func()
+            record["rows_out"] = count_rows(result)
+        
+        if interruptible and self._cancel_requested:
+            raise AnalysisCancelled()
+        
+        self.stage_cache[key] = result
+        self._checkpoint()
+        return result
+        
+    def _finish_profile(self) -> Dict:
+        """
+        Profil ölçümünü durdur ve raporu rapor klasörüne yaz.
+        
+        Returns:
+            Dict: Sonuç sözlüğüne eklenecek profil bilgileri
+        """
+        self.profiler.stop()
+        profile_info = {'profile': self.profiler.report()}
+        
+        try:
+            profile_info['profile_file'] = self.profiler.save_json(
+                os.path.join(OUTPUT_DIRS["main"], "Analiz Profili.json")
+            )
+            cprofile_file = self.profiler.dump_cprofile(
+                os.path.join(OUTPUT_DIRS["main"], "Analiz Profili.prof")
+            )
+            if cprofile_file:
+                profile_info['cprofile_file'] = cprofile_file
+        except Exception as e:
+            logger.warning(f"Profil raporu kaydedilemedi: {str(e)}")
+        
+        return profile_info
+    
+    def _use_parallel_charts(self) -> bool:
+        """
+        Grafiklerin süreç havuzunda çizilip çizilmeyeceğini döndür.
+        
+        Çalışan süreçler grafikleri yalnızca dosyaya kaydedebilir.
+        """
+        return (
+            self.chart_workers > 1
+            and shared_frames.is_available()
+            and self.save_plots
+            and not self.show_plots
+        )
+    
+    def _share_frames(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, str]:
+        """
+        Grafik süreçlerinin kullanacağı tabloları paylaşımlı depoya yaz.
+        
+        Tanıtıcılar analiz sonunda geçersizleştiği için bu aşama önbelleğe
+        alınmaz; depo run() sonunda kapatılır.
+        
+        Args:
+            frames: Tablo adı -> tablo
+            
+        Returns:
+            Dict[str, str]: Tablo adı -> tanıtıcı
+        """
+        self._checkpoint()
+        rows = sum(len(frame) for frame in frames.values())
+        with self.profiler.stage("veri_paylasimi", rows) as record:
+            self.shared_store = SharedFrameStore()
+            handles = {name: self.shared_store.put(name, frame) for name, frame in frames.items()}
+            record["rows_out"] = rows
+        return handles
         
     def run(self):
         """
@@ -82,170 +261,561 @@ class AnalysisWorker(QThread):
         try:
             logger.info("Analiz işlemi başlıyor...")
             results = {}
+            self.profiler.start()
+            
+            # Grafik aşamalarının sonucunu etkileyen parametreler
+            chart_params = (self.threshold, self.save_plots, self.show_plots)
             
             # İlerleme: Veri yükleme
             self.progress_updated.emit(10, "Veriler yükleniyor...")
             
-            # Veriyi hazırla
-            df, kisim_tezgah_sayilari, weeks = prepare_data_for_analysis(
-                self.durus_file,
-                self.calisma_file,
-                self.arizali_file
+            # Ham verileri oku
+            durus_df, calisma_df, arizali_tezgahlar = self._run_stage(
+                "veri_okuma",
+                lambda: read_raw_data(
+                    self.durus_file,
+                    self.calisma_file,
+                    self.arizali_file
+                )
+            )
+            
+            if self.incremental:
+                # Yalnızca depoda olmayan satırları işle ve depoya ekle
+                results['ingest'] = self._run_stage(
+                    "artimli_aktarim",
+                    lambda: ingest_incremental(
+                        durus_df,
+                        calisma_df,
+                        arizali_tezgahlar,
+                        self.store_path
+                    ),
+                    params=(self.store_path,),
+                    rows_in=len(durus_df)
+                )
+                
+                # Dışa aktarımın kapsadığı haftaları depodan oku
+                df, kisim_tezgah_sayilari, weeks = self._run_stage(
+                    "veri_hazirlama",
+                    lambda: load_export_frame(durus_df, arizali_tezgahlar, self.store_path),
+                    params=("artimli", self.store_path),
+                    rows_in=len(durus_df)
+                )
+            else:
+                # Veriyi hazırla
+                df, kisim_tezgah_sayilari, weeks = self._run_stage(
+                    "veri_hazirlama",
+                    lambda: build_analysis_frame(
+                        durus_df,
+                        calisma_df,
+                        arizali_tezgahlar
+                    ),
+                    rows_in=len(durus_df)
+                )
+            
+            if not weeks:
+                raise ValueError("Analiz için geçerli duruş kaydı bulunamadı.")
+            
+            # İşlenmiş veriyi hafta bölümlü depoya yaz
+            if self.store_path is not None and not self.incremental:
+                self._run_stage(
+                    "veri_saklama",
+                    lambda: store_frame(df, self.store_path),
+                    params=(self.store_path,),
+                    rows_in=len(df)
+                )
+            
+            # Serbest sorgular için duruş ve çalışma verisini SQL deposuna yaz
+            if self.sql_store_path is not None:
+                results['sql_deposu'] = self._run_stage(
+                    "sql_deposu",
+                    lambda: sql_store.write_store(df, calisma_df, self.sql_store_path),
+                    params=(self.sql_store_path,),
+                    rows_in=len(df)
+                )
+            
+            # Son hafta verisini al (depo varsa yalnızca son hafta bölümü okunur)
+            latest_week_df = self._run_stage(
+                "son_hafta",
+                lambda: get_latest_week_data(df, weeks, store_path=self.store_path),
+                rows_in=len(df)
             )
             
-            # Son hafta verisini al
-            latest_week_df = get_latest_week_data(df, weeks)
+            # Analiz dönemindeki tüm haftalar için arıza güvenilirlik göstergeleri
+            guvenilirlik = self._run_stage(
+                "guvenilirlik",
+                lambda: compute_reliability(df, weeks),
+                rows_in=len(df)
+            )
+            
+            # Arayüzde detaya inme sorguları için grup indeksleri (tüm haftalar)
+            query_service = self._run_stage(
+                "sorgu_servisi",
+                lambda: QueryService(df),
+                rows_in=len(df)
+            )
+            
+            # Son hafta duruş nedenlerinin Pareto / ABC tabloları (fabrika, kısım, tezgah)
+            pareto_tablolari = self._run_stage(
+                "pareto",
+                lambda: compute_pareto_tables(latest_week_df),
+                rows_in=len(latest_week_df)
+            )
             
-            # Excel'e dışa aktarma
+            # Excel'e dışa aktarma (son hafta verisi, güvenilirlik ve Pareto sayfaları)
             if self.export_excel:
                 output_file = 'Son Hafta için Analiz Edilen Veriler.xlsx'
-                latest_week_df.to_excel(output_file, index=False)
-                logger.info(f"Son hafta verileri dışa aktarıldı: {output_file}")
-                results['excel_file'] = output_file
+                
+                def _export():
+                    with pd.ExcelWriter(output_file) as writer:
+                        latest_week_df.to_excel(writer, index=False)
+                        write_reliability_sheets(writer, guvenilirlik)
+                        write_pareto_sheets(writer, pareto_tablolari)
+                    logger.info(f"Son hafta verileri dışa aktarıldı: {output_file}")
+                    return output_file
+                
+                results['excel_file'] = self._run_stage(
+                    "excel_aktarim", _export, rows_in=len(latest_week_df)
+                )
             
             # İlerleme: Hesaplamalar
             self.progress_updated.emit(30, "Hesaplamalar yapılıyor...")
             
             # Duruş sürelerini hesapla
-            toplam_sureler = calculate_stop_time_sum(latest_week_df)
+            toplam_sureler = self._run_stage(
+                "toplam_sureler",
+                lambda: calculate_stop_time_sum(latest_week_df),
+                rows_in=len(latest_week_df)
+            )
             
             # Kısımlara göre tek tezgah için ortalama süreleri hesapla
-            tezgah_basina_kisim_sureleri = calculate_part_machine_average_time(
-                latest_week_df, 
-                kisim_tezgah_sayilari
+            tezgah_basina_kisim_sureleri = self._run_stage(
+                "tezgah_basina_kisim_sureleri",
+                lambda: calculate_part_machine_average_time(
+                    latest_week_df, 
+                    kisim_tezgah_sayilari
+                ),
+                rows_in=len(latest_week_df)
             )
             
             # İş merkezlerinin toplam duruş sürelerini hesapla
-            tezgah_sureleri = calculate_machine_stop_times(latest_week_df)
+            tezgah_sureleri = self._run_stage(
+                "tezgah_sureleri",
+                lambda: calculate_machine_stop_times(latest_week_df),
+                rows_in=len(latest_week_df)
+            )
             
             # İş merkezleri için duruş tipine göre süreleri hesapla
-            tezgah_durus_ozet = calculate_machine_stop_type_times(latest_week_df)
+            tezgah_durus_ozet = self._run_stage(
+                "tezgah_durus_ozet",
+                lambda: calculate_machine_stop_type_times(latest_week_df),
+                rows_in=len(latest_week_df)
+            )
+            
+            # Duruş kategorilerine göre toplam süreleri hesapla
+            kategori_sureleri = self._run_stage(
+                "kategori_sureleri",
+                lambda: calculate_category_stop_times(latest_week_df),
+                rows_in=len(latest_week_df)
+            )
+            
+            # Kısım ve duruş kategorisine göre toplam süreleri hesapla
+            kisim_kategori_sureleri = self._run_stage(
+                "kisim_kategori_sureleri",
+                lambda: calculate_category_stop_times(latest_week_df, group_column="KISIM"),
+                rows_in=len(latest_week_df)
+            )
+            
+            # Zaman ağırlıklı OEE tabloları (tezgah, kısım ve fabrika x hafta)
+            oee_tablolari = self._run_stage(
+                "oee_tablolari",
+                lambda: compute_oee_tables(calisma_df, arizali_tezgahlar),
+                rows_in=len(calisma_df) if calisma_df is not None else 0
+            )
+            
+            # Haftanın saatlerine göre duruş dakikaları (tezgah ve kısım x 168 saat)
+            isi_haritalari = self._run_stage(
+                "isi_haritasi",
+                lambda: compute_heatmaps(df, weeks),
+                rows_in=len(df)
+            )
+            
+            # Son hafta için dakika çözünürlüklü doluluk (kullanım ve eş zamanlı duruş)
+            doluluk = self._run_stage(
+                "doluluk",
+                lambda: compute_occupancy(df, weeks[-1:]),
+                rows_in=len(df)
+            )
+            
+            # Haftalık trend aşamaları yalnızca grup x hafta toplamlarını kullanır;
+            # depo varsa satır verisi yerine depodaki haftalık özet okunur
+            haftalik_df = df
+            if self.store_path is not None:
+                haftalik_ozet = self._run_stage(
+                    "haftalik_ozet",
+                    lambda: weekly_aggregate_frame(weeks, arizali_tezgahlar, self.store_path),
+                    params=(self.store_path,),
+                    rows_in=len(df)
+                )
+                if not haftalik_ozet.empty:
+                    haftalik_df = haftalik_ozet
+            
+            # Tezgah, kısım ve duruş adı bazında kayan pencere / EWMA trendleri
+            trendler = self._run_stage(
+                "trendler",
+                lambda: compute_trends(haftalik_df, weeks),
+                rows_in=len(haftalik_df)
+            )
+            
+            # Son hafta ile önceki hafta arasındaki tezgah ve kısım sıra değişimleri
+            sira_degisimleri = self._run_stage(
+                "sira_degisimleri",
+                lambda: {
+                    "tezgah": rank_changes(haftalik_df, weeks, "İş Merkezi Kodu "),
+                    "kisim": rank_changes(haftalik_df, weeks, "KISIM"),
+                },
+                rows_in=len(haftalik_df)
+            )
+            
+            # Son haftada tezgah x duruş tipi sürelerindeki anomaliler (sağlam z-skoru)
+            anomaliler = self._run_stage(
+                "anomaliler",
+                lambda: detect_anomalies(haftalik_df, weeks),
+                rows_in=len(haftalik_df)
+            )
             
             # Haftalar boyunca en büyük 10 duruşu hesapla (kısımlara göre)
-            filtered_kisimlar = filter_sort_top_stops(df, weeks[0])
+            filtered_kisimlar = self._run_stage(
+                "filtered_kisimlar",
+                lambda: filter_sort_top_stops(df, weeks[0], store_path=self.store_path),
+                rows_in=len(df)
+            )
             
             # Haftalar boyunca en büyük 10 duruşu hesapla (tezgahlara göre)
-            filtered_machine = filter_sort_top_stops(
-                df, 
-                weeks[0], 
-                gozlemlenecek='İş Merkezi Kodu '
+            filtered_machine = self._run_stage(
+                "filtered_machine",
+                lambda: filter_sort_top_stops(
+                    df, 
+                    weeks[0], 
+                    gozlemlenecek='İş Merkezi Kodu ',
+                    store_path=self.store_path
+                ),
+                rows_in=len(df)
             )
             
             # Her kısım için tezgah başına ortalama duruş sürelerini hesapla
             kisim_avg_sureler = {}
             for kisim in kisim_tezgah_sayilari.keys():
-                kisim_avg_sureler[kisim] = calculate_part_average_stop_times(
-                    latest_week_df,
-                    kisim,
-                    kisim_tezgah_sayilari
+                kisim_avg_sureler[kisim] = self._run_stage(
+                    f"kisim_avg_sureler:{kisim}",
+                    lambda kisim=kisim: calculate_part_average_stop_times(
+                        latest_week_df,
+                        kisim,
+                        kisim_tezgah_sayilari
+                    ),
+                    rows_in=len(latest_week_df)
                 )
             
             # İlerleme: Görselleştirmeler
             self.progress_updated.emit(50, "Grafikler oluşturuluyor...")
             
             # Tüm tezgahlar için toplam duruş süreleri - pasta grafik
-            visualize_pie(
-                toplam_sureler, 
-                threshold=self.threshold, 
-                baslik="Tüm Tezgahlar Toplam",
-                save=self.save_plots, 
-                show=self.show_plots,
-                category_column="Duruş Adı"
+            self._run_stage(
+                "grafik:Tüm Tezgahlar Toplam",
+                lambda: visualize_pie(
+                    toplam_sureler, 
+                    threshold=self.threshold, 
+                    baslik="Tüm Tezgahlar Toplam",
+                    save=self.save_plots, 
+                    show=self.show_plots,
+                    category_column="Duruş Adı"
+                ),
+                chart_params,
+                rows_in=len(toplam_sureler)
             )
             
             # Tezgah başına ortalama duruş süreleri - pasta grafik
-            visualize_pie(
-                tezgah_basina_kisim_sureleri, 
-                baslik="Tüm Bölümler (Tezgah Başına)",
-                save=self.save_plots, 
-                show=self.show_plots,
-                category_column="KISIM"
+            self._run_stage(
+                "grafik:Tüm Bölümler (Tezgah Başına)",
+                lambda: visualize_pie(
+                    tezgah_basina_kisim_sureleri, 
+                    baslik="Tüm Bölümler (Tezgah Başına)",
+                    save=self.save_plots, 
+                    show=self.show_plots,
+                    category_column="KISIM"
+                ),
+                chart_params,
+                rows_in=len(tezgah_basina_kisim_sureleri)
             )
             
-            # Her kısım için tezgah başına ortalama duruş süreleri - pasta grafik
-            for kisim, data in kisim_avg_sureler.items():
-                visualize_pie(
-                    data, 
-                    baslik=f"{kisim} (Tezgah Başına)", 
+            # Duruş kategorileri - pasta grafik
+            self._run_stage(
+                "grafik:Duruş Kategorileri",
+                lambda: visualize_pie(
+                    kategori_sureleri,
                     threshold=self.threshold,
-                    save=self.save_plots, 
+                    baslik="Duruş Kategorileri",
+                    save=self.save_plots,
                     show=self.show_plots,
-                    category_column="Duruş Adı"
+                    category_column="Duruş Kategorisi"
+                ),
+                chart_params,
+                rows_in=len(kategori_sureleri)
+            )
+            
+            # Kısımlara göre duruş kategorileri - yığılmış çubuk grafik
+            self._run_stage(
+                "grafik:Kısımlara Göre Duruş Kategorileri",
+                lambda: visualize_category_breakdown(
+                    kisim_kategori_sureleri,
+                    save=self.save_plots,
+                    show=self.show_plots
+                ),
+                chart_params,
+                rows_in=len(kisim_kategori_sureleri)
+            )
+            
+            # Her kısım için tezgah başına ortalama duruş süreleri - pasta grafik
+            for kisim, data in kisim_avg_sureler.items():
+                self._run_stage(
+                    f"grafik:{kisim} (Tezgah Başına)",
+                    lambda kisim=kisim, data=data: visualize_pie(
+                        data, 
+                        baslik=f"{kisim} (Tezgah Başına)", 
+                        threshold=self.threshold,
+                        save=self.save_plots, 
+                        show=self.show_plots,
+                        category_column="Duruş Adı"
+                    ),
+                    chart_params,
+                    rows_in=len(data)
                 )
             
             # İlerleme güncelle
             self.progress_updated.emit(70, "Tezgah grafikleri oluşturuluyor...")
             
             # En fazla duruş yapan tezgahlar - çubuk grafik
-            visualize_bar(
-                tezgah_sureleri, 
-                colors="Reds", 
-                bundan=-10, 
-                baslik="En Fazla Duruş Yapan 10 Tezgah",
-                save=self.save_plots, 
-                show=self.show_plots
+            self._run_stage(
+                "grafik:En Fazla Duruş Yapan 10 Tezgah",
+                lambda: visualize_bar(
+                    tezgah_sureleri, 
+                    colors="Reds", 
+                    top_k=10, 
+                    baslik="En Fazla Duruş Yapan 10 Tezgah",
+                    save=self.save_plots, 
+                    show=self.show_plots
+                ),
+                chart_params,
+                rows_in=len(tezgah_sureleri)
             )
             
             # En az duruş yapan tezgahlar - çubuk grafik
-            visualize_bar(
-                tezgah_sureleri, 
-                colors="Greens", 
-                bundan=0, 
-                buna=10, 
-                baslik="En Az Duruş Yapan 10 Tezgah",
-                save=self.save_plots, 
-                show=self.show_plots
+            self._run_stage(
+                "grafik:En Az Duruş Yapan 10 Tezgah",
+                lambda: visualize_bar(
+                    tezgah_sureleri, 
+                    colors="Greens", 
+                    top_k=10, 
+                    largest=False, 
+                    baslik="En Az Duruş Yapan 10 Tezgah",
+                    save=self.save_plots, 
+                    show=self.show_plots
+                ),
+                chart_params,
+                rows_in=len(tezgah_sureleri)
             )
             
             # En az ve en çok duruş yapan tezgahlar karşılaştırması - çubuk grafik
-            visualize_top_bottom_machines(
-                tezgah_sureleri,
-                save=self.save_plots, 
-                show=self.show_plots
+            self._run_stage(
+                "grafik:İlk ve Son Tezgah",
+                lambda: visualize_top_bottom_machines(
+                    tezgah_sureleri,
+                    save=self.save_plots, 
+                    show=self.show_plots
+                ),
+                chart_params,
+                rows_in=len(tezgah_sureleri)
             )
             
-            # Her tezgah için duruş nedenleri pasta grafikleri
-            logger.info("Her tezgah için duruş nedenleri pasta grafikleri oluşturuluyor...")
-            unique_machines = latest_week_df["İş Merkezi Kodu "].unique()
-            
             # Her tezgah için duruş nedenleri - çubuk grafik
-            plot_bar(
-                tezgah_durus_ozet,
-                save=self.save_plots, 
-                show=self.show_plots
+            logger.info("Her tezgah için duruş nedenleri grafikleri oluşturuluyor...")
+            parallel_charts = self._use_parallel_charts()
+            if parallel_charts:
+                # Süreçlere tablolar yerine paylaşımlı depo tanıtıcıları gönderilir;
+                # yalnızca grafiklerin okuduğu özet tablolar paylaşılır (satır
+                # düzeyindeki df süreçlere gönderilmez). OEE grafikleri tezgah
+                # grafikleriyle aynı havuzda çizilir
+                handles = self._share_frames({
+                    'tezgah_durus_ozet': tezgah_durus_ozet,
+                    **{f"oee_{level}": table for level, table in oee_tablolari.items()}
+                })
+                codes = [str(c) for c in tezgah_durus_ozet['İş Merkezi Kodu '].unique()]
+                tasks = machine_chart_tasks(
+                    handles['tezgah_durus_ozet'], codes, self.chart_workers, save=self.save_plots
+                )
+                tasks.append((plot_oee, ({level: handles[f"oee_{level}"] for level in oee_tablolari}, weeks)))
+                self._run_stage(
+                    "grafik:Tezgahlar Son Hafta ve OEE (paralel)",
+                    lambda: run_chart_tasks(tasks, self.chart_workers, cancel_check=self.is_cancel_requested),
+                    chart_params + (self.chart_workers,),
+                    interruptible=True,
+                    rows_in=len(tezgah_durus_ozet)
+                )
+            else:
+                self._run_stage(
+                    "grafik:Tezgahlar Son Hafta",
+                    lambda: plot_bar(
+                        tezgah_durus_ozet,
+                        save=self.save_plots, 
+                        show=self.show_plots,
+                        cancel_check=self.is_cancel_requested
+                    ),
+                    chart_params,
+                    interruptible=True,
+                    rows_in=len(tezgah_durus_ozet)
+                )
+            
+            # Haftanın saatlerine göre duruş ısı haritaları
+            self._run_stage(
+                "grafik:Isı Haritası Kısımlar",
+                lambda: visualize_hour_of_week_heatmap(
+                    isi_haritalari['kisim'],
+                    baslik="Kısımlar",
+                    folder_path=OUTPUT_DIRS["heatmap"],
+                    save=self.save_plots,
+                    show=self.show_plots
+                ),
+                chart_params,
+                rows_in=len(isi_haritalari['kisim'])
+            )
+            for kisim, matris in isi_haritalari['tezgah'].groupby(level="KISIM"):
+                self._run_stage(
+                    f"grafik:Isı Haritası {kisim}",
+                    lambda kisim=kisim, matris=matris: visualize_hour_of_week_heatmap(
+                        matris.droplevel("KISIM"),
+                        baslik=kisim,
+                        folder_path=os.path.join(OUTPUT_DIRS["heatmap"], "Kısımlar"),
+                        save=self.save_plots,
+                        show=self.show_plots
+                    ),
+                    chart_params,
+                    rows_in=len(matris)
+                )
+            
+            # Son haftada en çok artan tezgah, kısım ve duruşlar
+            for level, trend in trendler.items():
+                artislar = latest_increases(trend)
+                self._run_stage(
+                    f"grafik:{LEVEL_TITLES[level]}",
+                    lambda artislar=artislar, level=level: visualize_trend_increases(
+                        artislar,
+                        group_column=LEVEL_COLUMNS[level],
+                        baslik=LEVEL_TITLES[level],
+                        save=self.save_plots,
+                        show=self.show_plots
+                    ),
+                    chart_params,
+                    rows_in=len(artislar)
+                )
+            
+            # Pareto grafikleri (fabrika ve kısımlar)
+            self._run_stage(
+                "grafik:Pareto - Genel",
+                lambda: visualize_pareto(
+                    pareto_tablolari['genel'],
+                    baslik="Pareto - Genel",
+                    folder_path=OUTPUT_DIRS["general"],
+                    save=self.save_plots,
+                    show=self.show_plots
+                ),
+                chart_params,
+                rows_in=len(pareto_tablolari['genel'])
+            )
+            for kisim, tablo in pareto_tablolari['kisim'].groupby("KISIM", observed=True):
+                self._run_stage(
+                    f"grafik:Pareto {kisim}",
+                    lambda kisim=kisim, tablo=tablo: visualize_pareto(
+                        tablo,
+                        baslik=f"Pareto - {kisim}",
+                        folder_path=OUTPUT_DIRS["pareto"],
+                        save=self.save_plots,
+                        show=self.show_plots
+                    ),
+                    chart_params,
+                    rows_in=len(tablo)
+                )
+            
+            # Anomali özeti (tek grafik)
+            self._run_stage(
+                "grafik:Duruş Anomalileri",
+                lambda: visualize_anomaly_summary(
+                    anomaliler,
+                    save=self.save_plots,
+                    show=self.show_plots
+                ),
+                chart_params,
+                rows_in=len(anomaliler)
             )
             
             # 4 haftalık karşılaştırmalar
             self.progress_updated.emit(85, "Haftalık karşılaştırma grafikleri oluşturuluyor...")
             
             # 4 haftalık kısımlara göre duruş karşılaştırması - çubuk grafik
-            visualize_weekly_comparison(
-                filtered_kisimlar,
-                egiklik=75,
-                sort_by_last_week=True,
-                target_week=weeks[0],
-                save=self.save_plots, 
-                show=self.show_plots
+            self._run_stage(
+                "grafik:Kısımlar 4 Haftalık",
+                lambda: visualize_weekly_comparison(
+                    filtered_kisimlar,
+                    egiklik=75,
+                    sort_by_last_week=True,
+                    target_week=weeks[0],
+                    save=self.save_plots, 
+                    show=self.show_plots,
+                    cancel_check=self.is_cancel_requested
+                ),
+                chart_params,
+                interruptible=True,
+                rows_in=len(filtered_kisimlar)
             )
 
             # 4 haftalık tezgahlara göre duruş karşılaştırması - çubuk grafik
-            visualize_weekly_comparison(
-                filtered_machine, 
-                gozlem="İş Merkezi Kodu ", 
-                egiklik=75,
-                palet="Accent",
-                sort_by_last_week=True,
-                target_week=weeks[0],
-                save=self.save_plots, 
-                show=self.show_plots
+            self._run_stage(
+                "grafik:Tezgahlar 4 Haftalık",
+                lambda: visualize_weekly_comparison(
+                    filtered_machine, 
+                    gozlem="İş Merkezi Kodu ", 
+                    egiklik=75,
+                    palet="Accent",
+                    sort_by_last_week=True,
+                    target_week=weeks[0],
+                    save=self.save_plots, 
+                    show=self.show_plots,
+                    cancel_check=self.is_cancel_requested
+                ),
+                chart_params,
+                interruptible=True,
+                rows_in=len(filtered_machine)
             )
             
-            # OEE ve diğer metrik görselleri
-            generate_oee_visuals(df, weeks)
+            # OEE ve diğer metrik görselleri (paralel çizimde havuzda çizildi)
+            if not parallel_charts:
+                self._run_stage(
+                    "grafik:OEE",
+                    lambda: generate_oee_visuals(
+                        oee_tablolari, weeks, cancel_check=self.is_cancel_requested
+                    ),
+                    chart_params,
+                    interruptible=True,
+                    rows_in=len(oee_tablolari['tezgah'])
+                )
+            
+            # Profil raporunu yaz
+            results.update(self._finish_profile())
             
             # Sonuçları hazırla
             results.update({
                 'df': df,
+                'memory_report': memory_report(df),
+                'store_path': self.store_path,
+                'sql_store_path': self.sql_store_path,
                 'kisim_tezgah_sayilari': kisim_tezgah_sayilari,
                 'weeks': weeks,
                 'latest_week_df': latest_week_df,
@@ -254,10 +824,27 @@ class AnalysisWorker(QThread):
                 'tezgah_sureleri': tezgah_sureleri,
                 'tezgah_durus_ozet': tezgah_durus_ozet,
                 'kisim_avg_sureler': kisim_avg_sureler,
+                'kategori_sureleri': kategori_sureleri,
+                'kisim_kategori_sureleri': kisim_kategori_sureleri,
+                'oee_tablolari': oee_tablolari,
+                'guvenilirlik': guvenilirlik,
+                'isi_haritalari': isi_haritalari,
+                'doluluk': doluluk,
+                'trendler': trendler,
+                'anomaliler': anomaliler,
+                'sira_degisimleri': sira_degisimleri,
+                'pareto_tablolari': pareto_tablolari,
+                'query_service': query_service,
                 'filtered_kisimlar': filtered_kisimlar,
                 'filtered_machine': filtered_machine
             })
             
+            # Grafik ve dışa aktarma aşamaları yan etki üretir; analiz
+            # tamamlandıktan sonra yeniden çalıştırmada tekrar üretilmeleri için
+            # önbellekten çıkarılır. Hesaplama sonuçları saklanmaya devam eder.
+            for key in [k for k in self.stage_cache if k[0].startswith(("grafik:", "excel_aktarim"))]:
+                del self.stage_cache[key]
+            
             # İlerleme: Tamamlandı
             self.progress_updated.emit(100, "Analiz tamamlandı!")
             
@@ -265,20 +852,37 @@ class AnalysisWorker(QThread):
             self.analysis_completed.emit(results)
             
             logger.info("Analiz işlemi tamamlandı.")
+        
+        except AnalysisCancelled:
+            logger.info(f"Analiz iptal edildi. Önbellekte {len(self.stage_cache)} tamamlanmış aşama var.")
+            self._finish_profile()
+            self.analysis_cancelled.emit()
             
         except Exception as e:
             logger.error(f"Analiz hatası: {str(e)}", exc_info=True)
+            self._finish_profile()
             self.analysis_error.emit(f"Analiz işlemi sırasında bir hata oluştu: {str(e)}")
+        
+        finally:
+            # Paylaşımlı tablolar yalnızca analiz süresince geçerlidir
+            if self.shared_store is not None:
+                self.shared_store.close()
+                self.shared_store = None
 
 
 class AnalysisController(QObject):
     """
     Analiz işlemleri kontrolcüsü sınıfı.
+    
+    Tamamlanan analiz aşamalarının sonuçlarını girdi verisi değişene kadar
+    saklar; iptal edilen bir analiz yeniden başlatıldığında tamamlanmış
+    aşamalar tekrar çalıştırılmaz.
     """
     # Sinyaller
     analysis_progress = pyqtSignal(int, str)
     analysis_completed = pyqtSignal(dict)
     analysis_error = pyqtSignal(str)
+    analysis_cancelled = pyqtSignal()
     
     def __init__(self, parent=None):
         """
@@ -286,6 +890,8 @@ class AnalysisController(QObject):
         """
         super().__init__(parent)
         self.worker = None
+        self._stage_cache = {}
+        self._cache_token = None
     
     def start_analysis(self, 
                       durus_file: str, 
@@ -294,7 +900,14 @@ class AnalysisController(QObject):
                       show_plots: bool,
                       save_plots: bool,
                       export_excel: bool,
-                      threshold: float):
+                      threshold: float,
+                      data_token=None,
+                      profile_memory: bool = False,
+                      use_cprofile: bool = False,
+                      store_data: bool = True,
+                      incremental: bool = False,
+                      chart_workers: int = 1,
+                      store_sql: bool = False):
         """
         Analiz işlemini başlat.
         
@@ -306,12 +919,32 @@ class AnalysisController(QObject):
             save_plots: Grafikleri kaydetme bayrağı
             export_excel: Excel'e aktarma bayrağı
             threshold: Pasta grafik eşik değeri
+            data_token: Girdi verisini tanımlayan değer. Bu değer, store_data
+                veya incremental değişirse aşama önbelleği temizlenir.
+                Verilmezse dosya yolları kullanılır.
+            profile_memory: Aşamaların tepe belleği tracemalloc ile ölçülsün mü
+            use_cprofile: cProfile çıktısı alınsın mı
+            store_data: İşlenmiş veri hafta bölümlü Parquet deposuna yazılsın mı
+                (pyarrow kurulu değilse yok sayılır)
+            incremental: Artımlı aktarım kullanılsın mı (store_data gerektirir)
+            chart_workers: Tezgah ve OEE grafiklerini çizen süreç sayısı
+            store_sql: İşlenmiş veri serbest sorgular için SQL deposuna yazılsın mı
         """
-        # Eğer zaten çalışan bir worker varsa durdur
+        # Eğer zaten çalışan bir worker varsa durmasını iste ve bekle
         if self.worker is not None and self.worker.isRunning():
-            self.worker.terminate()
+            self.worker.request_cancel()
             self.worker.wait()
         
+        # Girdi verisi veya hazırlama yolu (artımlı aktarım, depo) değiştiyse
+        # önbelleği temizle; veri hazırlamadan sonraki aşamaların sonuçları
+        # bu seçeneklere bağlıdır
+        if data_token is None:
+            data_token = (durus_file, calisma_file, arizali_file)
+        data_token = (data_token, store_data, incremental)
+        if data_token != self._cache_token:
+            self.clear_cache()
+            self._cache_token = data_token
+        
         # Yeni worker oluştur
         self.worker = AnalysisWorker(
             durus_file,
@@ -320,24 +953,70 @@ class AnalysisController(QObject):
             show_plots,
             save_plots,
             export_excel,
-            threshold
+            threshold,
+            stage_cache=self._stage_cache,
+            profile_memory=profile_memory,
+            use_cprofile=use_cprofile,
+            store_path=storage.DEFAULT_STORE_PATH if store_data else None,
+            incremental=incremental,
+            chart_workers=chart_workers,
+            sql_store_path=sql_store.DEFAULT_DB_PATH if store_sql else None
         )
         
-        # Sinyalleri bağla
-        self.worker.progress_updated.connect(self.analysis_progress.emit)
-        self.worker.analysis_completed.connect(self.analysis_completed.emit)
-        self.worker.analysis_error.connect(self.analysis_error.emit)
+        # Sinyalleri bağla (yalnızca güncel worker'ın sinyalleri iletilir)
+        self.worker.progress_updated.connect(self._worker_progress)
+        self.worker.analysis_completed.connect(self._worker_completed)
+        self.worker.analysis_error.connect(self._worker_error)
+        self.worker.analysis_cancelled.connect(self._worker_cancelled)
         
         # Worker'ı başlat
         self.worker.start()
         
         logger.info("Analiz işlemi başlatıldı.")
     
+    def _is_current_worker(self) -> bool:
+        """
+        Sinyali gönderen worker'ın son başlatılan worker olup olmadığını döndürür.
+        
+        Yerine yenisi başlatılan worker'ın kuyrukta bekleyen sinyalleri (örn.
+        iptal bildirimi) yeni analizin arayüz durumunu değiştirmemelidir.
+        """
+        return self.sender() is self.worker
+    
+    @pyqtSlot(int, str)
+    def _worker_progress(self, progress, message):
+        if self._is_current_worker():
+            self.analysis_progress.emit(progress, message)
+    
+    @pyqtSlot(dict)
+    def _worker_completed(self, results):
+        if self._is_current_worker():
+            self.analysis_completed.emit(results)
+    
+    @pyqtSlot(str)
+    def _worker_error(self, error_message):
+        if self._is_current_worker():
+            self.analysis_error.emit(error_message)
+    
+    @pyqtSlot()
+    def _worker_cancelled(self):
+        if self._is_current_worker():
+            self.analysis_cancelled.emit()
+    
     def cancel_analysis(self):
         """
         Analiz işlemini iptal et.
+        
+        İş parçacığı zorla sonlandırılmaz; bir sonraki kontrol noktasında
+        durur ve analysis_cancelled sinyali gönderilir.
         """
         if self.worker is not None and self.worker.isRunning():
-            self.worker.terminate()
-            self.worker.wait()
-            logger.info("Analiz işlemi iptal edildi.")
\ No newline at end of file
+            self.worker.request_cancel()
+            logger.info("Analiz işlemi için iptal isteği gönderildi.")
+    
+    def clear_cache(self):
+        """
+        Tamamlanmış aşama önbelleğini temizle.
+        """
+        self._stage_cache.clear()
+        self._cache_token = None
@@ -4,11 +4,19 @@ Dosya işlemleri kontrolcüsü.
 
 import os
 import pandas as pd
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Union
 import logging
+from PyQt5.QtCore import QThread, pyqtSignal
 
 # Tezgah listesi konfigürasyonunu içe aktar
 from config.tezgah_listesi import KISIMLAR_DICT
+from src.data_processing import DURUS_COLUMNS, CALISMA_COLUMNS
+from src.multi_file import resolve_sources, is_multi_source, load_files, format_report
+from src.readers import read_table
+from src.validation import validate_frames, format_quality_report
+
+# Önizlemede gösterilen satır sayısı
+PREVIEW_ROWS = 10
 
 # Loglama yapılandırması
 logger = logging.getLogger(__name__)
@@ -19,49 +27,136 @@ class FileController:
     """
     
     @staticmethod
-    def load_durus_data(file_path: str) -> Tuple[bool, Optional[pd.DataFrame], str]:
+    def load_sources(
+        source: Union[str, List[str]],
+        columns: List[str],
+        max_workers: Optional[int] = None
+    ) -> Tuple[pd.DataFrame, Dict]:
+        """
+        Tek dosya, dizin, glob deseni veya dosya listesinden veri yükler.
+        
+        Birden fazla dosya süreç havuzunda paralel okunur ve tek tabloda
+        birleştirilir.
+        
+        Args:
+            source: Dosya yolu, dizin, glob deseni veya dosya listesi
+            columns: Okunacak sütunlar
+            max_workers: En fazla süreç sayısı
+            
+        Returns:
+            Tuple[pd.DataFrame, Dict]: Yüklenmiş veri ve dosya bazında okuma raporu
+        """
+        files = resolve_sources(source)
+        if not files:
+            raise ValueError(f"Dosya bulunamadı: {source}")
+        return load_files(files, columns, max_workers=max_workers)
+    
+    @staticmethod
+    def load_preview(
+        source: Union[str, List[str]],
+        columns: List[str],
+        max_rows: int = PREVIEW_ROWS
+    ) -> pd.DataFrame:
+        """
+        Kaynağın yalnızca başlığını ve ilk satırlarını okur.
+        
+        Çoklu kaynaklarda yalnızca ilk dosya okunur; dosyaların geri kalanı
+        ayrıştırılmadığından süre dosya boyutundan bağımsızdır.
+        
+        Args:
+            source: Dosya yolu, dizin, glob deseni veya dosya listesi
+            columns: Okunacak sütunlar
+            max_rows: Okunacak satır sayısı
+            
+        Returns:
+            pd.DataFrame: Önizleme verisi
+        """
+        files = resolve_sources(source)
+        if not files:
+            raise ValueError(f"Dosya bulunamadı: {source}")
+        return read_table(files[0], columns, nrows=max_rows)
+    
+    @staticmethod
+    def preview_durus_data(file_path: Union[str, List[str]]) -> Tuple[bool, Optional[pd.DataFrame], str]:
+        """
+        Duruş verisinin önizlemesini yükler.
+        
+        Args:
+            file_path: Veri dosyasının yolu; dizin, glob deseni veya dosya listesi de olabilir
+            
+        Returns:
+            Tuple[bool, Optional[pd.DataFrame], str]: Başarı durumu, önizleme verisi ve mesaj
+        """
+        try:
+            df = FileController.load_preview(file_path, DURUS_COLUMNS)
+            return True, df, f"Duruş verisi önizlemesi yüklendi. {len(df)} satır gösteriliyor."
+        except Exception as e:
+            error_msg = f"Duruş verisi önizleme hatası: {str(e)}"
+            logger.error(error_msg)
+            return False, None, error_msg
+    
+    @staticmethod
+    def preview_calisma_data(file_path: Union[str, List[str]]) -> Tuple[bool, Optional[pd.DataFrame], str]:
+        """
+        Çalışma süresi verisinin önizlemesini yükler.
+        
+        Args:
+            file_path: Veri dosyasının yolu; dizin, glob deseni veya dosya listesi de olabilir
+            
+        Returns:
+            Tuple[bool, Optional[pd.DataFrame], str]: Başarı durumu, önizleme verisi ve mesaj
+        """
+        try:
+            df = FileController.load_preview(file_path, CALISMA_COLUMNS)
+            return True, df, f"Çalışma süresi verisi önizlemesi yüklendi. {len(df)} satır gösteriliyor."
+        except Exception as e:
+            error_msg = f"Çalışma süresi verisi önizleme hatası: {str(e)}"
+            logger.error(error_msg)
+            return False, None, error_msg
+    
+    @staticmethod
+    def load_durus_data(file_path: Union[str, List[str]]) -> Tuple[bool, Optional[pd.DataFrame], str]:
         """
         Duruş verilerini yükler.
         
         Args:
-            file_path: Excel dosyasının yolu
+            file_path: Veri dosyasının yolu (xlsx, csv, parquet...); dizin, glob deseni veya dosya listesi de olabilir
             
         Returns:
             Tuple[bool, Optional[pd.DataFrame], str]: Başarı durumu, yüklenmiş veri ve mesaj
         """
         try:
             logger.info(f"Duruş verisi yükleniyor: {file_path}")
-            df = pd.read_excel(
-                file_path, 
-                usecols=["İş Merkezi Kodu ", "Duruş Adı", "Duruş Başlangıç Tarih", "Duruş Bitiş Tarih"]
-            )
+            df, report = FileController.load_sources(file_path, DURUS_COLUMNS)
             logger.info(f"Duruş verisi yüklendi. Satır sayısı: {len(df)}")
-            return True, df, f"Duruş verisi başarıyla yüklendi. {len(df)} satır okundu."
+            message = f"Duruş verisi başarıyla yüklendi. {len(df)} satır okundu."
+            if is_multi_source(file_path):
+                message += "\n" + format_report(report)
+            return True, df, message
         except Exception as e:
             error_msg = f"Duruş verisi yükleme hatası: {str(e)}"
             logger.error(error_msg)
             return False, None, error_msg
     
     @staticmethod
-    def load_calisma_data(file_path: str) -> Tuple[bool, Optional[pd.DataFrame], str]:
+    def load_calisma_data(file_path: Union[str, List[str]]) -> Tuple[bool, Optional[pd.DataFrame], str]:
         """
         Çalışma süresi verilerini yükler.
         
         Args:
-            file_path: Excel dosyasının yolu
+            file_path: Veri dosyasının yolu (xlsx, csv, parquet...); dizin, glob deseni veya dosya listesi de olabilir
             
         Returns:
             Tuple[bool, Optional[pd.DataFrame], str]: Başarı durumu, yüklenmiş veri ve mesaj
         """
         try:
             logger.info(f"Çalışma süresi verisi yükleniyor: {file_path}")
-            df = pd.read_excel(
-                file_path, 
-                usecols=["Makina Kodu", "Tarih", "Çalışma Zamanı", "Planlı Duruş",
-                        "Plansız Duruş", "Oee", "Performans", "Kullanılabilirlik", "Kalite"]
-            )
+            df, report = FileController.load_sources(file_path, CALISMA_COLUMNS)
             logger.info(f"Çalışma süresi verisi yüklendi. Satır sayısı: {len(df)}")
-            return True, df, f"Çalışma süresi verisi başarıyla yüklendi. {len(df)} satır okundu."
+            message = f"Çalışma süresi verisi başarıyla yüklendi. {len(df)} satır okundu."
+            if is_multi_source(file_path):
+                message += "\n" + format_report(report)
+            return True, df, message
         except Exception as e:
             error_msg = f"Çalışma süresi verisi yükleme hatası: {str(e)}"
             logger.error(error_msg)
@@ -94,6 +189,11 @@ class FileController:
         """
         Yüklenen verilerin doğruluğunu kontrol eder.
         
+        Sütunlar ve ortak makina kodları eksikse veri geçersizdir. Yapısal
+        kontrolleri geçen veride satır bazındaki kalite kuralları (tarih sırası,
+        süre, tekrar, makina kodu, OEE aralığı) çalıştırılır ve kalite raporu
+        mesaja eklenir; kalite ihlalleri veriyi geçersiz kılmaz.
+        
         Args:
             durus_df: Duruş verileri DataFrame'i
             calisma_df: Çalışma süresi verileri DataFrame'i
@@ -144,6 +244,10 @@ class FileController:
             else:
                 messages.append(f"{len(common_machines)} ortak makine kodu bulundu.")
         
+        # Satır bazında kalite kontrolleri
+        if is_valid:
+            messages.append(format_quality_report(validate_frames(durus_df, calisma_df)))
+        
         return is_valid, "\n".join(messages)
     
     @staticmethod
@@ -197,7 +301,8 @@ class FileController:
             "Genel": "Raporlar/Genel",
             "Kısımlar": "Raporlar/Kısımlar",
             "Tezgahlar": "Raporlar/Tezgahlar",
-            "Tee": "Raporlar/Tee"
+            "Tee": "Raporlar/Tee",
+            "Isı Haritası": "Raporlar/Isı Haritası"
         }
         
         for category, directory in report_dirs.items():
@@ -217,4 +322,79 @@ class FileController:
         # Tarihe göre sırala (en yeni en üstte)
         report_files.sort(key=lambda x: x["date"], reverse=True)
         
-        return report_files
\ No newline at end of file
+        return report_files
+
+
+class DataLoadWorker(QThread):
+    """
+    Veri dosyalarını arka planda tam olarak okuyup doğrulayan iş parçacığı sınıfı.
+    
+    Büyük dosyaların ayrıştırılması arayüzü bloke etmez; sonuç
+    load_completed sinyaliyle, hata load_error sinyaliyle bildirilir.
+    """
+    # Sinyaller
+    progress_updated = pyqtSignal(int, str)
+    load_completed = pyqtSignal(dict)
+    load_error = pyqtSignal(str)
+    
+    def __init__(self, 
+                durus_file: Union[str, List[str]], 
+                calisma_file: Union[str, List[str]], 
+                arizali_file: Optional[str] = None):
+        """
+        İş parçacığını başlat.
+        
+        Args:
+            durus_file: Duruş verisi kaynağı
+            calisma_file: Çalışma süresi verisi kaynağı
+            arizali_file: Arızalı tezgah listesi dosya yolu
+        """
+        super().__init__()
+        self.durus_file = durus_file
+        self.calisma_file = calisma_file
+        self.arizali_file = arizali_file
+    
+    def run(self):
+        """
+        Verileri okur, doğrular ve sonucu sinyal olarak gönderir.
+        """
+        try:
+            self.progress_updated.emit(10, "Duruş verisi okunuyor...")
+            durus_success, durus_df, durus_message = FileController.load_durus_data(self.durus_file)
+            if not durus_success:
+                self.load_error.emit(durus_message)
+                return
+        
+            self.progress_updated.emit(40, "Çalışma süresi verisi okunuyor...")
+            calisma_success, calisma_df, calisma_message = FileController.load_calisma_data(self.calisma_file)
+            if not calisma_success:
+                self.load_error.emit(calisma_message)
+                return
+        
+            # Arızalı tezgah dosyasını yükle (varsa)
+            self.progress_updated.emit(70, "Arızalı tezgah listesi okunuyor...")
+            warnings = []
+            arizali_tezgahlar = []
+            if self.arizali_file and os.path.exists(self.arizali_file):
+                arizali_success, arizali_tezgahlar, arizali_message = FileController.load_arizali_tezgahlar(self.arizali_file)
+                if not arizali_success:
+                    warnings.append(arizali_message)
+        
+            # Verileri doğrula
+            self.progress_updated.emit(85, "Veriler doğrulanıyor...")
+            is_valid, validation_message = FileController.validate_data(durus_df, calisma_df)
+            if not is_valid:
+                self.load_error.emit(validation_message)
+                return
+        
+            self.progress_updated.emit(100, "Veri yükleme tamamlandı")
+            self.load_completed.emit({
+                'durus_df': durus_df,
+                'calisma_df': calisma_df,
+                'arizali_tezgahlar': arizali_tezgahlar,
+                'messages': [durus_message, calisma_message, validation_message],
+                'warnings': warnings
+            })
+        except Exception as e:
+            logger.error(f"Veri yükleme hatası: {str(e)}", exc_info=True)
+            self.load_error.emit(f"Veri yükleme sırasında bir hata oluştu: {str(e)}")
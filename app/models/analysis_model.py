@@ -23,6 +23,9 @@ class AnalysisModel:
         self.calisma_data = None
         self.arizali_tezgahlar = []
         
+        # Ham veriler her değiştiğinde artan yükleme sayacı (analiz önbelleği anahtarı)
+        self.data_version = 0
+        
         # İşlenmiş veriler
         self.processed_data = None
         self.kisim_tezgah_sayilari = {}
@@ -47,6 +50,7 @@ class AnalysisModel:
             data: Duruş verileri DataFrame'i
         """
         self.durus_data = data
+        self.data_version += 1
         logger.info(f"Duruş verileri modele yüklendi. Satır sayısı: {len(data)}")
     
     def set_calisma_data(self, data: pd.DataFrame) -> None:
@@ -57,6 +61,7 @@ class AnalysisModel:
             data: Çalışma süresi verileri DataFrame'i
         """
         self.calisma_data = data
+        self.data_version += 1
         logger.info(f"Çalışma verileri modele yüklendi. Satır sayısı: {len(data)}")
     
     def set_arizali_tezgahlar(self, tezgahlar: List[str]) -> None:
@@ -67,6 +72,7 @@ class AnalysisModel:
             tezgahlar: Arızalı tezgah kodları listesi
         """
         self.arizali_tezgahlar = tezgahlar
+        self.data_version += 1
         logger.info(f"Arızalı tezgah listesi modele yüklendi. Tezgah sayısı: {len(tezgahlar)}")
     
     def set_processed_data(self, 
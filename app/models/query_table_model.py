@@ -0,0 +1,119 @@
+"""
+SQL deposu sorgu sonuçları için sayfalı tablo modeli.
+"""
+
+from collections import OrderedDict
+import numbers
+import logging
+
+import pandas as pd
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Bellekte tutulacak en fazla sayfa
+MAX_CACHED_PAGES = 20
+
+
+class QueryTableModel(QAbstractTableModel):
+    """
+    QueryPager sonucunu gösteren sanal tablo modeli.
+
+    Görünüm yalnızca ekrandaki hücreleri ister; her hücrenin sayfası ilk
+    istendiğinde depodan okunur ve son kullanılan sayfalar önbellekte
+    tutulur. Satır sayısı ne kadar büyük olursa olsun bellekte en fazla
+    MAX_CACHED_PAGES sayfa bulunur.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Modeli başlat.
+
+        Args:
+            parent: Üst nesne
+        """
+        super().__init__(parent)
+        self.pager = None
+        self._pages: "OrderedDict[int, list]" = OrderedDict()
+
+    def set_pager(self, pager) -> None:
+        """
+        Gösterilecek sorgu sonucunu değiştir; önceki imleç kapatılır.
+
+        Args:
+            pager: QueryPager nesnesi (None ise model boşaltılır)
+        """
+        self.beginResetModel()
+        if self.pager is not None:
+            self.pager.close()
+        self.pager = pager
+        self._pages.clear()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        """
+        Satır sayısı.
+        """
+        if parent.isValid() or self.pager is None:
+            return 0
+        return self.pager.row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        """
+        Sütun sayısı.
+        """
+        if parent.isValid() or self.pager is None:
+            return 0
+        return len(self.pager.columns)
+
+    def _page_rows(self, number: int) -> list:
+        """
+        Sayfanın satırlarını önbellekten ya da depodan döndür.
+        """
+        if number in self._pages:
+            self._pages.move_to_end(number)
+            return self._pages[number]
+
+        rows = list(self.pager.page(number).itertuples(index=False, name=None))
+        self._pages[number] = rows
+        if len(self._pages) > MAX_CACHED_PAGES:
+            self._pages.popitem(last=False)
+        return rows
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Hücre verisi.
+        """
+        if not index.isValid() or self.pager is None:
+            return QVariant()
+
+        if role in (Qt.DisplayRole, Qt.TextAlignmentRole):
+            number, offset = divmod(index.row(), self.pager.page_size)
+            rows = self._page_rows(number)
+            if offset >= len(rows):
+                return QVariant()
+            value = rows[offset][index.column()]
+
+            if role == Qt.TextAlignmentRole:
+                if isinstance(value, numbers.Number) and not isinstance(value, bool):
+                    return Qt.AlignRight | Qt.AlignVCenter
+                return QVariant()
+
+            if value is None or (isinstance(value, float) and pd.isna(value)):
+                return ""
+            if isinstance(value, float):
+                return f"{value:,.2f}"
+            return str(value)
+
+        return QVariant()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """
+        Başlık verisi.
+        """
+        if role != Qt.DisplayRole or self.pager is None:
+            return QVariant()
+        if orientation == Qt.Horizontal:
+            return self.pager.columns[section]
+        return str(section + 1)
@@ -15,7 +15,9 @@ from app.controllers.analysis_controller import AnalysisController
 from app.views.tabs.data_tab import DataTab
 from app.views.tabs.analysis_tab import AnalysisTab
 from app.views.tabs.reports_tab import ReportsTab
+from app.views.tabs.query_tab import QueryTab
 from app.views.tabs.settings_tab import SettingsTab
+from src.readers import file_dialog_filter
 
 import logging
 logger = logging.getLogger(__name__)
@@ -51,12 +53,14 @@ class MainWindow(QMainWindow):
         self.data_tab = DataTab(self.model, self.file_controller)
         self.analysis_tab = AnalysisTab(self.model, self.analysis_controller)
         self.reports_tab = ReportsTab(self.model, self.file_controller)
+        self.query_tab = QueryTab(self.model)
         self.settings_tab = SettingsTab(self.model)
         
         # Tabları ekle
         self.tab_widget.addTab(self.data_tab, "Veri Yükleme")
         self.tab_widget.addTab(self.analysis_tab, "Analiz")
         self.tab_widget.addTab(self.reports_tab, "Raporlar")
+        self.tab_widget.addTab(self.query_tab, "Sorgu")
         self.tab_widget.addTab(self.settings_tab, "Ayarlar")
         
         # Merkez widget olarak ayarla
@@ -178,7 +182,7 @@ class MainWindow(QMainWindow):
         Duruş verisi dosyasını aç.
         """
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Duruş Verisi Aç", "", "Excel Dosyaları (*.xlsx *.xls);;Tüm Dosyalar (*)"
+            self, "Duruş Verisi Aç", "", file_dialog_filter()
         )
         
         if file_path:
@@ -191,7 +195,7 @@ class MainWindow(QMainWindow):
         Çalışma süresi dosyasını aç.
         """
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Çalışma Süresi Aç", "", "Excel Dosyaları (*.xlsx *.xls);;Tüm Dosyalar (*)"
+            self, "Çalışma Süresi Aç", "", file_dialog_filter()
         )
         
         if file_path:
@@ -317,6 +321,9 @@ class MainWindow(QMainWindow):
         # Raporlar tabına geç
         self.tab_widget.setCurrentIndex(2)
         self.reports_tab.refresh_report_list()
+        # SQL deposu güncellendiyse sorgu tabını yenile
+        if results.get('sql_store_path'):
+            self.query_tab.set_database(results['sql_store_path'])
     
     @pyqtSlot(str)
     def _show_error(self, error_message):
@@ -13,9 +13,17 @@ from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QSize
 from PyQt5.QtGui import QPixmap
 
 from app.widgets.chart_widgets import PieChartWidget
+from app.widgets.drilldown_widget import DrillDownPanel
+from src import storage
+from src import sql_store
+from src import shared_frames
+from src.data_processing import week_label
 import logging
 logger = logging.getLogger(__name__)
 
+# Analiz iş parçacığına veri aktarımında kullanılan geçici dosya biçimi
+TEMP_EXTENSION = ".parquet" if storage.is_available() else ".xlsx"
+
 class AnalysisTab(QWidget):
     """
     Analiz tab'ı sınıfı.
@@ -70,6 +78,42 @@ class AnalysisTab(QWidget):
         self.export_excel_cb = QCheckBox("Excel'e aktar")
         options_layout.addWidget(self.export_excel_cb)
         
+        # İşlenmiş veriyi hafta bölümlü depoya yaz
+        self.store_data_cb = QCheckBox("İşlenmiş veriyi depola (Parquet)")
+        self.store_data_cb.setChecked(storage.is_available())
+        self.store_data_cb.setEnabled(storage.is_available())
+        self.store_data_cb.setToolTip(
+            f"İşlenmiş veriyi haftalık bölümler halinde {storage.DEFAULT_STORE_PATH} altına kaydeder"
+            if storage.is_available() else "Parquet deposu için pyarrow kurulu olmalıdır"
+        )
+        options_layout.addWidget(self.store_data_cb)
+        
+        # Artımlı aktarım
+        self.incremental_cb = QCheckBox("Artımlı aktarım (yalnızca yeni kayıtlar)")
+        self.incremental_cb.setToolTip(
+            "Depoda bulunan kayıtlar yeniden işlenmez; analiz verisi depodan okunur"
+        )
+        self.incremental_cb.setEnabled(self.store_data_cb.isChecked())
+        self.store_data_cb.toggled.connect(self.incremental_cb.setEnabled)
+        options_layout.addWidget(self.incremental_cb)
+        
+        # Serbest sorgular için SQL deposu
+        self.sql_store_cb = QCheckBox("SQL deposuna yaz (Sorgu sekmesi)")
+        self.sql_store_cb.setToolTip(
+            f"İşlenmiş duruş ve çalışma verisini {sql_store.DEFAULT_DB_PATH} "
+            f"dosyasına yazar ({sql_store.BACKEND})"
+        )
+        options_layout.addWidget(self.sql_store_cb)
+        
+        # Bellek profili
+        self.profile_memory_cb = QCheckBox("Bellek profili çıkar")
+        self.profile_memory_cb.setToolTip("Her aşamanın tepe bellek kullanımını ölçer (analizi yavaşlatır)")
+        options_layout.addWidget(self.profile_memory_cb)
+        
+        # cProfile çıktısı
+        self.cprofile_cb = QCheckBox("cProfile çıktısı kaydet")
+        options_layout.addWidget(self.cprofile_cb)
+        
         options_group.setLayout(options_layout)
         left_layout.addWidget(options_group)
         
@@ -90,6 +134,18 @@ class AnalysisTab(QWidget):
         self.target_week_combo.addItem("Son Hafta", -1)
         params_layout.addRow("Hedef Hafta:", self.target_week_combo)
         
+        # Grafik süreç sayısı
+        self.chart_workers_spin = QSpinBox()
+        self.chart_workers_spin.setRange(1, os.cpu_count() or 1)
+        self.chart_workers_spin.setValue(1)
+        self.chart_workers_spin.setEnabled(shared_frames.is_available())
+        self.chart_workers_spin.setToolTip(
+            "1'den büyükse tezgah ve OEE grafikleri ayrı süreçlerde çizilir "
+            "(yalnızca grafikler kaydedilip gösterilmediğinde)"
+            if shared_frames.is_available() else "Paralel grafik çizimi için pyarrow kurulu olmalıdır"
+        )
+        params_layout.addRow("Grafik Süreçleri:", self.chart_workers_spin)
+        
         params_group.setLayout(params_layout)
         left_layout.addWidget(params_group)
         
@@ -165,9 +221,24 @@ class AnalysisTab(QWidget):
         
         right_panel.setWidget(self.charts_widget)
         
+        # Detaya inme paneli (KISIM -> tezgah -> duruş)
+        drilldown_group = QGroupBox("Detaya İnme")
+        drilldown_layout = QVBoxLayout()
+        self.drilldown_panel = DrillDownPanel()
+        drilldown_layout.addWidget(self.drilldown_panel)
+        drilldown_group.setLayout(drilldown_layout)
+        drilldown_group.setFixedHeight(300)
+        
+        right_container = QWidget()
+        right_layout = QVBoxLayout()
+        right_layout.setContentsMargins(0, 0, 0, 0)
+        right_layout.addWidget(drilldown_group)
+        right_layout.addWidget(right_panel)
+        right_container.setLayout(right_layout)
+        
         # Ana layout'a panelleri ekle
         main_layout.addWidget(left_panel)
-        main_layout.addWidget(right_panel)
+        main_layout.addWidget(right_container)
         
         self.setLayout(main_layout)
     
@@ -179,6 +250,7 @@ class AnalysisTab(QWidget):
         self.analysis_controller.analysis_progress.connect(self._update_progress)
         self.analysis_controller.analysis_completed.connect(self._analysis_completed)
         self.analysis_controller.analysis_error.connect(self._analysis_error)
+        self.analysis_controller.analysis_cancelled.connect(self._analysis_cancelled)
     
     @pyqtSlot()
     def _start_analysis(self):
@@ -203,8 +275,15 @@ class AnalysisTab(QWidget):
         self.analysis_started.emit()
         
         # Analiz parametrelerini hazırla
-        durus_file = self.model.durus_data.to_excel("temp_durus.xlsx", index=False)
-        calisma_file = self.model.calisma_data.to_excel("temp_calisma.xlsx", index=False)
+        # pyarrow varsa veriler Parquet ile aktarılır; xlsx yazıp yeniden okuma maliyeti oluşmaz
+        durus_file = f"temp_durus{TEMP_EXTENSION}"
+        calisma_file = f"temp_calisma{TEMP_EXTENSION}"
+        if TEMP_EXTENSION == ".parquet":
+            self.model.durus_data.to_parquet(durus_file, index=False)
+            self.model.calisma_data.to_parquet(calisma_file, index=False)
+        else:
+            self.model.durus_data.to_excel(durus_file, index=False)
+            self.model.calisma_data.to_excel(calisma_file, index=False)
         
         arizali_file = None
         if self.model.arizali_tezgahlar:
@@ -214,13 +293,20 @@ class AnalysisTab(QWidget):
         
         # Analizi başlat
         self.analysis_controller.start_analysis(
-            durus_file="temp_durus.xlsx",
-            calisma_file="temp_calisma.xlsx",
+            durus_file=durus_file,
+            calisma_file=calisma_file,
             arizali_file=arizali_file,
             show_plots=self.show_plots_cb.isChecked(),
             save_plots=self.save_plots_cb.isChecked(),
             export_excel=self.export_excel_cb.isChecked(),
-            threshold=self.threshold_spin.value()
+            threshold=self.threshold_spin.value(),
+            data_token=self.model.data_version,
+            profile_memory=self.profile_memory_cb.isChecked(),
+            use_cprofile=self.cprofile_cb.isChecked(),
+            store_data=self.store_data_cb.isChecked(),
+            incremental=self.incremental_cb.isChecked(),
+            store_sql=self.sql_store_cb.isChecked(),
+            chart_workers=self.chart_workers_spin.value()
         )
     
     @pyqtSlot()
@@ -230,12 +316,21 @@ class AnalysisTab(QWidget):
         """
         self.analysis_controller.cancel_analysis()
         
+        # İptal, iş parçacığı bir sonraki kontrol noktasına geldiğinde tamamlanır
+        self.cancel_button.setEnabled(False)
+        self.progress_label.setText("İlerleme: İptal ediliyor...")
+    
+    @pyqtSlot()
+    def _analysis_cancelled(self):
+        """
+        Analiz iptali tamamlandığında çağrılır.
+        """
         # Butonları güncelle
         self.analyze_button.setEnabled(True)
         self.cancel_button.setEnabled(False)
         
         # İlerleme çubuğunu güncelle
-        self.progress_label.setText("İlerleme: İptal edildi")
+        self.progress_label.setText("İlerleme: İptal edildi (tamamlanan aşamalar saklandı)")
     
     @pyqtSlot(int, str)
     def _update_progress(self, progress, message):
@@ -304,7 +399,7 @@ class AnalysisTab(QWidget):
             df = results['latest_week_df']
             total_time = df['Süre (Dakika)'].sum() if 'Süre (Dakika)' in df else 0
             machine_count = len(df['İş Merkezi Kodu '].unique()) if 'İş Merkezi Kodu ' in df else 0
-            week_info = f"Hafta: {results['weeks'][0]}" if 'weeks' in results and results['weeks'] else "Hafta bilgisi yok"
+            week_info = f"Hafta: {week_label(results['weeks'][-1])}" if 'weeks' in results and results['weeks'] else "Hafta bilgisi yok"
             
             summary_text = (
                 f"Analiz Sonuçları\n"
@@ -317,8 +412,27 @@ class AnalysisTab(QWidget):
             if 'excel_file' in results:
                 summary_text += f"\nExcel Dosyası: {results['excel_file']}\n"
             
+            if 'profile' in results:
+                total = results['profile']['total']
+                summary_text += f"\nAnaliz Süresi: {total['wall_time_s']:.2f} saniye\n"
+                if 'profile_file' in results:
+                    summary_text += f"Profil Raporu: {results['profile_file']}\n"
+            
+            if results.get('store_path'):
+                summary_text += f"Veri Deposu: {results['store_path']}\n"
+            
+            if 'ingest' in results:
+                ingest = results['ingest']
+                summary_text += (
+                    f"Artımlı Aktarım: {ingest['rows_new']} yeni satır, "
+                    f"{len(ingest['partitions'])} hafta güncellendi\n"
+                )
+            
             self.results_text.setText(summary_text)
         
+        # Detaya inme panelini yeni sorgu servisiyle doldur
+        self.drilldown_panel.set_service(results.get('query_service'), results.get('weeks'))
+        
         # Grafikleri göster
         self._display_charts()
     
@@ -337,7 +451,8 @@ class AnalysisTab(QWidget):
         chart_folders = [
             "Raporlar/Genel",
             "Raporlar/Kısımlar/Son Hafta",
-            "Raporlar/Tezgahlar/Son Hafta"
+            "Raporlar/Tezgahlar/Son Hafta",
+            "Raporlar/Isı Haritası"
         ]
         
         chart_count = 0
@@ -384,7 +499,7 @@ class AnalysisTab(QWidget):
         """
         Geçici dosyaları temizle.
         """
-        temp_files = ['temp_durus.xlsx', 'temp_calisma.xlsx', 'temp_arizali.txt']
+        temp_files = [f'temp_durus{TEMP_EXTENSION}', f'temp_calisma{TEMP_EXTENSION}', 'temp_arizali.txt']
         
         for file in temp_files:
             if os.path.exists(file):
@@ -400,6 +515,9 @@ class AnalysisTab(QWidget):
         # Sonuç metnini temizle
         self.results_text.clear()
         
+        # Detaya inme panelini boşalt
+        self.drilldown_panel.set_service(None)
+        
         # Grafikleri temizle
         while self.charts_layout.count() > 3:  # İlk 3 widget'ı koru
             item = self.charts_layout.takeAt(3)
@@ -419,11 +537,11 @@ class AnalysisTab(QWidget):
         Hedef hafta combobox'ını güncelle.
         
         Args:
-            weeks: Hafta numaraları listesi
+            weeks: Yıl-hafta anahtarları
         """
         self.target_week_combo.clear()
         self.target_week_combo.addItem("Son Hafta", -1)
         
         if weeks:
             for week in weeks:
-                self.target_week_combo.addItem(f"Hafta {week}", week)
\ No newline at end of file
+                self.target_week_combo.addItem(f"Hafta {week_label(week)}", week)
\ No newline at end of file
@@ -10,6 +10,10 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLa
 from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QSize
 from PyQt5.QtGui import QStandardItemModel, QStandardItem
 
+from app.controllers.file_controller import DataLoadWorker
+from src.multi_file import resolve_sources
+from src.readers import file_dialog_filter
+
 import logging
 logger = logging.getLogger(__name__)
 
@@ -42,6 +46,9 @@ class DataTab(QWidget):
         self.durus_preview = None
         self.calisma_preview = None
         
+        # Arka plan veri yükleme iş parçacığı
+        self.load_worker = None
+        
         # UI oluştur
         self._create_ui()
         
@@ -60,22 +67,30 @@ class DataTab(QWidget):
         durus_layout = QHBoxLayout()
         self.durus_line_edit = QLineEdit()
         self.durus_line_edit.setReadOnly(True)
-        self.durus_line_edit.setPlaceholderText("Duruş verisi Excel dosyası seçin")
+        self.durus_line_edit.setPlaceholderText("Duruş verisi dosyası veya klasörü seçin")
         self.durus_browse_button = QPushButton("Gözat")
         self.durus_browse_button.clicked.connect(self._browse_durus_file)
+        self.durus_folder_button = QPushButton("Klasör")
+        self.durus_folder_button.setToolTip("Klasördeki tüm veri dosyalarını birlikte yükle")
+        self.durus_folder_button.clicked.connect(self._browse_durus_folder)
         durus_layout.addWidget(self.durus_line_edit)
         durus_layout.addWidget(self.durus_browse_button)
+        durus_layout.addWidget(self.durus_folder_button)
         file_layout.addRow("Duruş Verisi:", durus_layout)
         
         # Çalışma süresi dosya seçimi
         calisma_layout = QHBoxLayout()
         self.calisma_line_edit = QLineEdit()
         self.calisma_line_edit.setReadOnly(True)
-        self.calisma_line_edit.setPlaceholderText("Çalışma süresi Excel dosyası seçin")
+        self.calisma_line_edit.setPlaceholderText("Çalışma süresi dosyası veya klasörü seçin")
         self.calisma_browse_button = QPushButton("Gözat")
         self.calisma_browse_button.clicked.connect(self._browse_calisma_file)
+        self.calisma_folder_button = QPushButton("Klasör")
+        self.calisma_folder_button.setToolTip("Klasördeki tüm veri dosyalarını birlikte yükle")
+        self.calisma_folder_button.clicked.connect(self._browse_calisma_folder)
         calisma_layout.addWidget(self.calisma_line_edit)
         calisma_layout.addWidget(self.calisma_browse_button)
+        calisma_layout.addWidget(self.calisma_folder_button)
         file_layout.addRow("Çalışma Süresi:", calisma_layout)
         
         # Arızalı tezgah listesi dosya seçimi
@@ -140,7 +155,7 @@ class DataTab(QWidget):
         Duruş verisi dosyasını seç.
         """
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Duruş Verisi Aç", "", "Excel Dosyaları (*.xlsx *.xls);;Tüm Dosyalar (*)"
+            self, "Duruş Verisi Aç", "", file_dialog_filter()
         )
         
         if file_path:
@@ -152,12 +167,32 @@ class DataTab(QWidget):
         Çalışma süresi dosyasını seç.
         """
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Çalışma Süresi Aç", "", "Excel Dosyaları (*.xlsx *.xls);;Tüm Dosyalar (*)"
+            self, "Çalışma Süresi Aç", "", file_dialog_filter()
         )
         
         if file_path:
             self.set_calisma_file(file_path)
     
+    @pyqtSlot()
+    def _browse_durus_folder(self):
+        """
+        Duruş verisi dosyalarının bulunduğu klasörü seç.
+        """
+        directory = QFileDialog.getExistingDirectory(self, "Duruş Verisi Klasörü Seç")
+        
+        if directory:
+            self.set_durus_file(directory)
+    
+    @pyqtSlot()
+    def _browse_calisma_folder(self):
+        """
+        Çalışma süresi dosyalarının bulunduğu klasörü seç.
+        """
+        directory = QFileDialog.getExistingDirectory(self, "Çalışma Süresi Klasörü Seç")
+        
+        if directory:
+            self.set_calisma_file(directory)
+    
     @pyqtSlot()
     def _browse_arizali_file(self):
         """
@@ -175,13 +210,13 @@ class DataTab(QWidget):
         Duruş verisi dosya yolunu ayarla ve önizleme oluştur.
         
         Args:
-            file_path: Dosya yolu
+            file_path: Dosya yolu, klasör veya glob deseni
         """
         self.durus_file = file_path
         self.durus_line_edit.setText(file_path)
         
-        # Önizleme yükle
-        success, df, message = self.file_controller.load_durus_data(file_path)
+        # Yalnızca ilk satırlar okunur; tam okuma "Verileri Yükle" ile arka planda yapılır
+        success, df, message = self.file_controller.preview_durus_data(file_path)
         
         if success:
             self.durus_preview = df
@@ -194,13 +229,13 @@ class DataTab(QWidget):
         Çalışma süresi dosya yolunu ayarla ve önizleme oluştur.
         
         Args:
-            file_path: Dosya yolu
+            file_path: Dosya yolu, klasör veya glob deseni
         """
         self.calisma_file = file_path
         self.calisma_line_edit.setText(file_path)
         
-        # Önizleme yükle
-        success, df, message = self.file_controller.load_calisma_data(file_path)
+        # Yalnızca ilk satırlar okunur; tam okuma "Verileri Yükle" ile arka planda yapılır
+        success, df, message = self.file_controller.preview_calisma_data(file_path)
         
         if success:
             self.calisma_preview = df
@@ -263,62 +298,59 @@ class DataTab(QWidget):
     @pyqtSlot()
     def _load_data(self):
         """
-        Veri dosyalarını yükle.
+        Veri dosyalarının tam okumasını arka planda başlat.
         """
         # Dosya yollarını kontrol et
-        if not self.durus_file or not os.path.exists(self.durus_file):
+        if not self.durus_file or not resolve_sources(self.durus_file):
             QMessageBox.warning(self, "Uyarı", "Lütfen geçerli bir duruş verisi dosyası seçin!")
             return
         
-        if not self.calisma_file or not os.path.exists(self.calisma_file):
+        if not self.calisma_file or not resolve_sources(self.calisma_file):
             QMessageBox.warning(self, "Uyarı", "Lütfen geçerli bir çalışma süresi dosyası seçin!")
             return
         
-        # İlerleme çubuğunu göster
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(10)
-        
-        # Verileri yükle
-        durus_success, durus_df, durus_message = self.file_controller.load_durus_data(self.durus_file)
-        if not durus_success:
-            QMessageBox.critical(self, "Hata", durus_message)
-            self.progress_bar.setVisible(False)
-            return
-        
-        self.progress_bar.setValue(30)
-        
-        calisma_success, calisma_df, calisma_message = self.file_controller.load_calisma_data(self.calisma_file)
-        if not calisma_success:
-            QMessageBox.critical(self, "Hata", calisma_message)
-            self.progress_bar.setVisible(False)
+        if self.load_worker is not None and self.load_worker.isRunning():
             return
         
-        self.progress_bar.setValue(50)
-        
-        # Arızalı tezgah dosyasını yükle (varsa)
-        arizali_tezgahlar = []
-        if self.arizali_file and os.path.exists(self.arizali_file):
-            arizali_success, arizali_tezgahlar, arizali_message = self.file_controller.load_arizali_tezgahlar(self.arizali_file)
-            if not arizali_success:
-                QMessageBox.warning(self, "Uyarı", arizali_message)
-        
-        self.progress_bar.setValue(70)
+        # İlerleme çubuğunu göster
+        self.load_button.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
+        
+        # Dosyaların tamamı arka planda okunur; arayüz bu sırada bloke olmaz
+        self.load_worker = DataLoadWorker(self.durus_file, self.calisma_file, self.arizali_file)
+        self.load_worker.progress_updated.connect(self._on_load_progress)
+        self.load_worker.load_completed.connect(self._on_load_completed)
+        self.load_worker.load_error.connect(self._on_load_error)
+        self.load_worker.start()
+    
+    @pyqtSlot(int, str)
+    def _on_load_progress(self, value, message):
+        """
+        Veri yükleme ilerlemesini güncelle.
         
-        # Verileri doğrula
-        is_valid, validation_message = self.file_controller.validate_data(durus_df, calisma_df)
-        if not is_valid:
-            QMessageBox.critical(self, "Doğrulama Hatası", validation_message)
-            self.progress_bar.setVisible(False)
-            return
+        Args:
+            value: İlerleme değeri (0-100)
+            message: İlerleme mesajı
+        """
+        self.progress_bar.setValue(value)
+        self.progress_bar.setFormat(f"{message} (%p%)")
+    
+    @pyqtSlot(dict)
+    def _on_load_completed(self, result):
+        """
+        Veri yükleme tamamlandığında verileri modele kaydet.
         
-        self.progress_bar.setValue(90)
+        Args:
+            result: DataLoadWorker sonuçları
+        """
+        for warning in result['warnings']:
+            QMessageBox.warning(self, "Uyarı", warning)
         
         # Verileri modele kaydet
-        self.model.set_durus_data(durus_df)
-        self.model.set_calisma_data(calisma_df)
-        self.model.set_arizali_tezgahlar(arizali_tezgahlar)
-        
-        self.progress_bar.setValue(100)
+        self.model.set_durus_data(result['durus_df'])
+        self.model.set_calisma_data(result['calisma_df'])
+        self.model.set_arizali_tezgahlar(result['arizali_tezgahlar'])
         
         # Veri yükleme sinyali gönder
         self.data_loaded.emit({
@@ -329,9 +361,25 @@ class DataTab(QWidget):
         
         # İlerleme çubuğunu gizle
         self.progress_bar.setVisible(False)
+        self.load_button.setEnabled(True)
+        
+        # Bilgi mesajı göster (dosya bazında okuma raporu, doğrulama ve kalite raporu ile)
+        QMessageBox.information(
+            self, "Veri Yükleme",
+            "Veriler başarıyla yüklendi! Analiz tabına geçebilirsiniz.\n\n" + "\n\n".join(result['messages'])
+        )
+    
+    @pyqtSlot(str)
+    def _on_load_error(self, message):
+        """
+        Veri yükleme hatasını göster.
         
-        # Bilgi mesajı göster
-        QMessageBox.information(self, "Veri Yükleme", "Veriler başarıyla yüklendi! Analiz tabına geçebilirsiniz.")
+        Args:
+            message: Hata mesajı
+        """
+        self.progress_bar.setVisible(False)
+        self.load_button.setEnabled(True)
+        QMessageBox.critical(self, "Hata", message)
     
     def clear_fields(self):
         """
@@ -0,0 +1,243 @@
+"""
+SQL sorgu konsolu tab'ı.
+"""
+
+import time
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                           QPlainTextEdit, QTableView, QGroupBox, QSplitter, QShortcut,
+                           QApplication)
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QFontDatabase, QKeySequence
+
+from app.models.query_table_model import QueryTableModel
+from src import sql_store
+
+import logging
+logger = logging.getLogger(__name__)
+
+class QueryWorker(QThread):
+    """
+    Sorguyu arka planda çalıştırıp sonuç imlecini hazırlayan iş parçacığı.
+
+    Sonuç tablosunun oluşturulması ve satırlarının sayılması büyük
+    sonuçlarda saniyeler sürebilir; arayüz bu sırada bloke olmaz.
+    """
+    # Sinyaller
+    query_completed = pyqtSignal(object, float)
+    query_error = pyqtSignal(str)
+
+    def __init__(self, sql: str, db_path: str, parent=None):
+        """
+        İş parçacığını başlat.
+
+        Args:
+            sql: Sorgu metni
+            db_path: SQL deposu dosyası
+            parent: Üst nesne (iş parçacığı bitene kadar yaşamasını sağlar)
+        """
+        super().__init__(parent)
+        self.sql = sql
+        self.db_path = db_path
+
+    def run(self):
+        """
+        Sorguyu çalıştırır; imleci ve geçen süreyi sinyal olarak gönderir.
+        """
+        start = time.perf_counter()
+        try:
+            pager = sql_store.QueryPager(self.sql, self.db_path)
+        except Exception as e:
+            self.query_error.emit(str(e))
+            return
+        self.query_completed.emit(pager, time.perf_counter() - start)
+
+class QueryTab(QWidget):
+    """
+    SQL deposu üzerinde serbest sorgu çalıştırma tab'ı.
+
+    Sonuçlar sanal tablo modeliyle sayfa sayfa okunur; büyük sonuçlar
+    belleğe bir kerede alınmaz.
+    """
+
+    def __init__(self, model, db_path: str = sql_store.DEFAULT_DB_PATH):
+        """
+        Tab'ı başlat.
+
+        Args:
+            model: Veri modeli
+            db_path: SQL deposu dosyası
+        """
+        super().__init__()
+
+        self.model = model
+        self.db_path = db_path
+        self.worker = None
+
+        # UI oluştur
+        self._create_ui()
+
+        # Tablo listesini yükle
+        self.refresh_tables()
+
+    def _create_ui(self):
+        """
+        Kullanıcı arayüzünü oluştur.
+        """
+        # Ana layout
+        main_layout = QVBoxLayout()
+        splitter = QSplitter(Qt.Vertical)
+
+        # Sorgu alanı
+        query_group = QGroupBox(f"Sorgu ({sql_store.BACKEND})")
+        query_layout = QVBoxLayout()
+
+        self.tables_label = QLabel()
+        self.tables_label.setWordWrap(True)
+        self.tables_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        query_layout.addWidget(self.tables_label)
+
+        self.query_edit = QPlainTextEdit()
+        self.query_edit.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.query_edit.setPlainText(sql_store.EXAMPLE_QUERY)
+        query_layout.addWidget(self.query_edit)
+
+        # Butonlar
+        button_layout = QHBoxLayout()
+        self.run_button = QPushButton("Çalıştır (Ctrl+Enter)")
+        self.run_button.clicked.connect(self.run_query)
+        self.example_button = QPushButton("Örnek Sorgu")
+        self.example_button.clicked.connect(
+            lambda: self.query_edit.setPlainText(sql_store.EXAMPLE_QUERY)
+        )
+        button_layout.addWidget(self.run_button)
+        button_layout.addWidget(self.example_button)
+        button_layout.addStretch()
+        query_layout.addLayout(button_layout)
+
+        QShortcut(QKeySequence("Ctrl+Return"), self.query_edit, activated=self.run_query)
+
+        query_group.setLayout(query_layout)
+        splitter.addWidget(query_group)
+
+        # Sonuç alanı
+        result_group = QGroupBox("Sonuç")
+        result_layout = QVBoxLayout()
+
+        self.status_label = QLabel("Sorgu çalıştırılmadı.")
+        result_layout.addWidget(self.status_label)
+
+        self.result_model = QueryTableModel(self)
+        self.result_table = QTableView()
+        self.result_table.setModel(self.result_model)
+        self.result_table.setAlternatingRowColors(True)
+        self.result_table.setWordWrap(False)
+        self.result_table.verticalHeader().setDefaultSectionSize(22)
+        result_layout.addWidget(self.result_table)
+
+        result_group.setLayout(result_layout)
+        splitter.addWidget(result_group)
+        splitter.setStretchFactor(1, 1)
+        splitter.setSizes([250, 450])
+
+        main_layout.addWidget(splitter)
+        self.setLayout(main_layout)
+
+    def set_database(self, db_path: str):
+        """
+        Sorgulanacak depo dosyasını değiştir ve tablo listesini yenile.
+
+        Args:
+            db_path: SQL deposu dosyası
+        """
+        self.db_path = db_path
+        # Önceki depoda çalışan sorgunun sonucu gösterilmez
+        self.worker = None
+        self.result_model.set_pager(None)
+        self.status_label.setStyleSheet("")
+        self.status_label.setText("Sorgu çalıştırılmadı.")
+        self.refresh_tables()
+
+    def refresh_tables(self):
+        """
+        Depodaki tabloları ve sütunlarını göster.
+        """
+        try:
+            tables = sql_store.list_tables(self.db_path)
+        except Exception as e:
+            logger.error(f"SQL deposu okunamadı: {str(e)}")
+            tables = {}
+
+        if tables:
+            self.tables_label.setText("<br>".join(
+                f"<b>{table}</b>: {', '.join(columns)}" for table, columns in tables.items()
+            ))
+        else:
+            self.tables_label.setText(
+                f"SQL deposu bulunamadı ({self.db_path}). Analiz sekmesinde "
+                "'SQL deposuna yaz' seçeneğiyle bir analiz çalıştırın."
+            )
+        self.run_button.setEnabled(bool(tables))
+
+    @pyqtSlot()
+    def run_query(self):
+        """
+        Editördeki sorguyu arka planda çalıştır; sonuç hazır olunca tabloya bağla.
+        """
+        if not self.run_button.isEnabled():
+            return
+
+        self.run_button.setEnabled(False)
+        self.status_label.setStyleSheet("")
+        self.status_label.setText("Sorgu çalıştırılıyor...")
+        QApplication.setOverrideCursor(Qt.BusyCursor)
+
+        self.worker = QueryWorker(self.query_edit.toPlainText(), self.db_path, self)
+        self.worker.query_completed.connect(self.on_query_completed)
+        self.worker.query_error.connect(self.on_query_error)
+        self.worker.finished.connect(self.on_query_finished)
+        self.worker.finished.connect(self.worker.deleteLater)
+        self.worker.start()
+
+    def _is_current_worker(self) -> bool:
+        """
+        Sinyali gönderen iş parçacığının son başlatılan sorgu olup olmadığını döndürür.
+        """
+        return self.sender() is self.worker
+
+    @pyqtSlot(object, float)
+    def on_query_completed(self, pager, elapsed: float):
+        """
+        Sorgu tamamlandığında sonucu tabloya bağla.
+        """
+        if not self._is_current_worker():
+            pager.close()
+            return
+
+        self.result_model.set_pager(pager)
+        self.status_label.setStyleSheet("")
+        self.status_label.setText(
+            f"{pager.row_count:,} satır, {len(pager.columns)} sütun ({elapsed:.2f} sn)"
+        )
+
+    @pyqtSlot(str)
+    def on_query_error(self, error_message: str):
+        """
+        Sorgu hatasını göster.
+        """
+        if not self._is_current_worker():
+            return
+
+        logger.error(f"Sorgu hatası: {error_message}")
+        self.result_model.set_pager(None)
+        self.status_label.setStyleSheet("color: red;")
+        self.status_label.setText(f"Sorgu hatası: {error_message}")
+
+    @pyqtSlot()
+    def on_query_finished(self):
+        """
+        İş parçacığı bittiğinde imleci ve çalıştır butonunu geri al.
+        """
+        QApplication.restoreOverrideCursor()
+        if self._is_current_worker():
+            self.worker = None
+            self.run_button.setEnabled(True)
@@ -6,9 +6,11 @@ from app.widgets.chart_widgets import PieChartWidget, BarChartWidget, LineChartW
 from app.widgets.custom_widgets import (
     ClickableLabel, ImageButton, StatusWidget, InfoPanel, HeaderWidget
 )
+from app.widgets.drilldown_widget import DrillDownPanel
 
 # Bu değişkenleri dışarıya aktar
 __all__ = [
     'PieChartWidget', 'BarChartWidget', 'LineChartWidget',
-    'ClickableLabel', 'ImageButton', 'StatusWidget', 'InfoPanel', 'HeaderWidget'
+    'ClickableLabel', 'ImageButton', 'StatusWidget', 'InfoPanel', 'HeaderWidget',
+    'DrillDownPanel'
 ]
\ No newline at end of file
@@ -94,13 +94,12 @@ class PieChartWidget(QWidget):
             if 'Süre (Dakika)' in data.columns:
                 total = data['Süre (Dakika)'].sum()
                 
-                # Yüzdeleri hesapla
-                data = data.copy()
-                data['Yüzde'] = data['Süre (Dakika)'] / total * 100
+                # Yüzdeleri hesapla (girdi tabloyu değiştirmeden yeni tabloda)
+                data = data.assign(Yüzde=data['Süre (Dakika)'] / total * 100)
                 
                 # Eşik değerinin altındakileri "Diğer" olarak grupla
-                other_value = data[data['Yüzde'] < threshold]['Süre (Dakika)'].sum()
-                filtered_data = data[data['Yüzde'] >= threshold].copy()
+                other_value = data.loc[data['Yüzde'] < threshold, 'Süre (Dakika)'].sum()
+                filtered_data = data[data['Yüzde'] >= threshold]
                 
                 if other_value > 0:
                     other_df = pd.DataFrame({
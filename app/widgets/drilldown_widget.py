@@ -0,0 +1,208 @@
+"""
+KISIM -> tezgah -> duruş detaya inme paneli.
+"""
+
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
+                           QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView)
+from PyQt5.QtCore import Qt, pyqtSlot
+
+from src.data_processing import WEEK_KEY_COLUMN, week_label
+
+import logging
+logger = logging.getLogger(__name__)
+
+class DrillDownPanel(QWidget):
+    """
+    Sorgu servisi üzerinden kısım, tezgah ve duruş seçimleriyle detaya inme paneli.
+
+    Her seçim QueryService'e tek bir sorgu gönderir; sonuçlar servisin
+    önbelleğinde tutulduğundan aynı seçime dönmek yeniden hesap gerektirmez.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Widget'ı başlat.
+
+        Args:
+            parent: Üst widget
+        """
+        super().__init__(parent)
+
+        self.service = None
+
+        # Layout oluştur
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # Hafta seçimi
+        week_layout = QHBoxLayout()
+        week_layout.addWidget(QLabel("Hafta:"))
+        self.week_combo = QComboBox()
+        self.week_combo.addItem("Tüm Haftalar", None)
+        self.week_combo.currentIndexChanged.connect(self._week_changed)
+        week_layout.addWidget(self.week_combo)
+        week_layout.addStretch()
+        layout.addLayout(week_layout)
+
+        # Kısım, tezgah, duruş ve haftalık tablolar
+        tables_layout = QHBoxLayout()
+        self.kisim_table = self._create_table(["Kısım", "Süre (dk)"])
+        self.machine_table = self._create_table(["Tezgah", "Süre (dk)"])
+        self.stop_table = self._create_table(["Duruş", "Süre (dk)", "Adet"])
+        self.week_table = self._create_table(["Hafta", "Süre (dk)", "Adet"])
+
+        for title, table in [("Kısımlar", self.kisim_table), ("Tezgahlar", self.machine_table),
+                             ("Duruşlar", self.stop_table), ("Duruşun Haftaları", self.week_table)]:
+            column_layout = QVBoxLayout()
+            label = QLabel(title)
+            label.setStyleSheet("font-weight: bold;")
+            column_layout.addWidget(label)
+            column_layout.addWidget(table)
+            tables_layout.addLayout(column_layout)
+
+        layout.addLayout(tables_layout)
+
+        # Seçim sinyalleri
+        self.kisim_table.itemSelectionChanged.connect(self._kisim_selected)
+        self.machine_table.itemSelectionChanged.connect(self._machine_selected)
+        self.stop_table.itemSelectionChanged.connect(self._stop_selected)
+
+        self.setLayout(layout)
+
+    def _create_table(self, headers):
+        """
+        Salt okunur, tek satır seçimli tablo oluştur.
+
+        Args:
+            headers: Sütun başlıkları
+        """
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SingleSelection)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        return table
+
+    def _fill_table(self, table, data, columns):
+        """
+        Tabloyu sorgu sonucuyla doldur.
+
+        Args:
+            table: Doldurulacak tablo
+            data: Sorgu sonucu DataFrame'i
+            columns: Gösterilecek sütunlar
+        """
+        table.blockSignals(True)
+        table.clearContents()
+        table.setRowCount(len(data))
+        for row, values in enumerate(data[columns].itertuples(index=False)):
+            for column, value in enumerate(values):
+                text = f"{value:.0f}" if isinstance(value, float) else str(value)
+                item = QTableWidgetItem(text)
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                table.setItem(row, column, item)
+        table.blockSignals(False)
+
+    def _clear_tables(self, tables):
+        """
+        Verilen tabloları boşalt.
+        """
+        for table in tables:
+            table.blockSignals(True)
+            table.setRowCount(0)
+            table.blockSignals(False)
+
+    @staticmethod
+    def _selected_text(table):
+        """
+        Tablodaki seçili satırın ilk hücre metnini döndür.
+        """
+        items = table.selectedItems()
+        return items[0].text() if items else None
+
+    def _selected_week(self):
+        """
+        Seçili yıl-hafta anahtarı (tüm haftalar için None).
+        """
+        return self.week_combo.currentData()
+
+    def set_service(self, service, weeks=None):
+        """
+        Paneli yeni bir sorgu servisiyle doldur.
+
+        Args:
+            service: QueryService nesnesi (None ise panel boşaltılır)
+            weeks: Yıl-hafta anahtarları
+        """
+        self.service = service
+
+        self.week_combo.blockSignals(True)
+        self.week_combo.clear()
+        self.week_combo.addItem("Tüm Haftalar", None)
+        for week in weeks or []:
+            self.week_combo.addItem(f"Hafta {week_label(week)}", int(week))
+        self.week_combo.blockSignals(False)
+
+        self._refresh_kisim()
+
+    def _refresh_kisim(self):
+        """
+        Kısım tablosunu seçili haftaya göre yenile.
+        """
+        self._clear_tables([self.kisim_table, self.machine_table, self.stop_table, self.week_table])
+        if self.service is None:
+            return
+
+        data = self.service.aggregate("kisim", hafta=self._selected_week())
+        self._fill_table(self.kisim_table, data, ["KISIM", "Süre (Dakika)"])
+
+    @pyqtSlot(int)
+    def _week_changed(self, index):
+        """
+        Hafta değiştiğinde tabloları yenile.
+        """
+        self._refresh_kisim()
+
+    @pyqtSlot()
+    def _kisim_selected(self):
+        """
+        Kısım seçildiğinde tezgahlarını göster.
+        """
+        self._clear_tables([self.machine_table, self.stop_table, self.week_table])
+        kisim = self._selected_text(self.kisim_table)
+        if self.service is None or kisim is None:
+            return
+
+        data = self.service.kisim_machines(kisim, hafta=self._selected_week())
+        self._fill_table(self.machine_table, data, ["İş Merkezi Kodu ", "Süre (Dakika)"])
+
+    @pyqtSlot()
+    def _machine_selected(self):
+        """
+        Tezgah seçildiğinde duruş dağılımını göster.
+        """
+        self._clear_tables([self.stop_table, self.week_table])
+        tezgah = self._selected_text(self.machine_table)
+        if self.service is None or tezgah is None:
+            return
+
+        data = self.service.machine_stops(tezgah, hafta=self._selected_week())
+        self._fill_table(self.stop_table, data, ["Duruş Adı", "Süre (Dakika)", "Duruş Sayısı"])
+
+    @pyqtSlot()
+    def _stop_selected(self):
+        """
+        Duruş seçildiğinde tezgahtaki haftalık sürelerini göster.
+        """
+        self._clear_tables([self.week_table])
+        durus = self._selected_text(self.stop_table)
+        tezgah = self._selected_text(self.machine_table)
+        if self.service is None or durus is None:
+            return
+
+        data = self.service.stop_weeks(durus, tezgah=tezgah)
+        data = data.assign(**{WEEK_KEY_COLUMN: data[WEEK_KEY_COLUMN].map(week_label)})
+        self._fill_table(self.week_table, data, [WEEK_KEY_COLUMN, "Süre (Dakika)", "Duruş Sayısı"])
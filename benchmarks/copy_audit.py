@@ -0,0 +1,223 @@
+"""
+Analiz sırasında ham duruş tablosunun tam boyutlu kopyasının oluşturulmadığını denetler.
+
+Ham tabloyu girdi olarak alan her aşama tracemalloc ile ölçülür ve aşamanın
+tepe bellek artışı, aynı tablonun bir kez kopyalanmasının (df.copy()) bellek
+maliyetiyle karşılaştırılır. Tam boyutlu kopya oluşturan bir aşama en az bu
+kadar bellek ayırmak zorunda olduğundan, sınırı aşan aşamalar ihlal olarak
+raporlanır. Gruplama gibi işlemlerin satır başına ayırdığı geçici diziler bu
+sınırın altında kalır; satır başına birden çok sayısal ara dizi ayıran
+aşamaların sınırı STAGE_ALLOWANCES ile genişletilir.
+
+İhlal varsa assert_no_full_copies AssertionError yükseltir; komut satırı
+çıkış kodu 1 olur ve tests/test_copy_audit.py testi başarısız olur.
+
+Kullanım:
+    python -m benchmarks.copy_audit
+    python -m benchmarks.copy_audit --rows 2000000
+"""
+
+import sys
+import argparse
+import contextlib
+import tracemalloc
+from typing import Dict, List
+import logging
+
+import pandas as pd
+
+from src.synthetic_data import generate_dataset
+from src.data_processing import build_analysis_frame
+from src.profiling import StageProfiler
+from benchmarks.run_benchmarks import benchmark_calculations
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Varsayılan denetim boyutu (duruş satır sayısı)
+DEFAULT_ROWS = 1_000_000
+
+# Satır başına birden çok sayısal ara dizi (saniye, saat dilimi, kod dizileri)
+# ayıran aşamaların tepe bellek sınırı (tam kopya maliyetinin katı). Bu
+# aşamalara eklenecek bir tam kopya da sınırı aşar.
+STAGE_ALLOWANCES = {
+    "compute_heatmaps": 1.5,
+    "detect_anomalies": 1.5,
+    "compute_pareto_tables": 1.5,
+}
+
+
+def copy_on_write():
+    """
+    Denetim süresince pandas copy-on-write davranışını etkinleştirir.
+
+    pandas 3 ile bu davranış varsayılandır ve seçenek kullanımdan kaldırılmıştır.
+    """
+    if int(pd.__version__.split(".")[0]) < 3:
+        return pd.option_context("mode.copy_on_write", True)
+    return contextlib.nullcontext()
+
+
+def stage_limit(stage: str, copy_cost: int) -> float:
+    """
+    Aşamanın izin verilen tepe bellek artışını döndürür.
+
+    Args:
+        stage: Aşama adı
+        copy_cost: Tam kopya maliyeti (bayt)
+
+    Returns:
+        float: Sınır (bayt)
+    """
+    return copy_cost * STAGE_ALLOWANCES.get(stage, 1.0)
+
+
+def measure_copy_cost(df: pd.DataFrame) -> int:
+    """
+    Tablonun bir kez tam kopyalanmasının tepe bellek maliyetini ölçer.
+
+    Args:
+        df: Ham duruş tablosu
+
+    Returns:
+        int: Kopyalama sırasındaki tepe bellek artışı (bayt)
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        kopya = df.copy()
+        cost = tracemalloc.get_traced_memory()[1] - before
+        del kopya
+    finally:
+        if started:
+            tracemalloc.stop()
+    return cost
+
+
+def audit_stages(df: pd.DataFrame, kisim_tezgah_sayilari: Dict, weeks: List[int]) -> List[Dict]:
+    """
+    Ham tabloyu girdi olarak alan analiz aşamalarını ölçer.
+
+    Args:
+        df: Ham duruş tablosu
+        kisim_tezgah_sayilari: Kısım-tezgah sayıları
+        weeks: Hafta listesi
+
+    Returns:
+        List[Dict]: Aşama kayıtları (StageProfiler biçiminde)
+    """
+    profiler = StageProfiler(trace_memory=True)
+    profiler.start()
+    try:
+        # Görselleştirmeler ham tabloyu almaz (OEE grafikleri çalışma
+        # verisinden hesaplanan küçük tablolarla çizilir)
+        benchmark_calculations(df, kisim_tezgah_sayilari, weeks, profiler)
+    finally:
+        profiler.stop()
+    return profiler.stages
+
+
+def run_copy_audit(n_rows: int = DEFAULT_ROWS, seed: int = 0) -> Dict:
+    """
+    Sentetik veri üzerinde kopya denetimini çalıştırır.
+
+    Args:
+        n_rows: Duruş satır sayısı
+        seed: Sentetik veri tohumu
+
+    Returns:
+        Dict: Tablo boyutu, kopya maliyeti, aşama ölçümleri ve ihlaller
+    """
+    dataset = generate_dataset(n_rows=n_rows, seed=seed)
+    df, kisim_tezgah_sayilari, weeks = build_analysis_frame(
+        dataset["durus"], dataset["calisma"], dataset["arizali"]
+    )
+    del dataset
+
+    frame_bytes = int(df.memory_usage(deep=True).sum())
+    with copy_on_write():
+        copy_cost = measure_copy_cost(df)
+        stages = audit_stages(df, kisim_tezgah_sayilari, weeks)
+    violations = [
+        s for s in stages if (s["peak_memory_bytes"] or 0) >= stage_limit(s["stage"], copy_cost)
+    ]
+
+    return {
+        "n_rows": len(df),
+        "frame_bytes": frame_bytes,
+        "copy_cost_bytes": copy_cost,
+        "stages": stages,
+        "violations": violations,
+    }
+
+
+def assert_no_full_copies(result: Dict) -> None:
+    """
+    Hiçbir aşamanın ham tablonun tam boyutlu kopyasını oluşturmadığını doğrular.
+
+    Args:
+        result: run_copy_audit çıktısı
+
+    Raises:
+        AssertionError: Sınırı aşan aşama varsa
+    """
+    copy_cost = result["copy_cost_bytes"]
+    assert not result["violations"], (
+        f"{len(result['violations'])} aşama ham tablonun tam boyutlu kopyasını oluşturuyor: "
+        + ", ".join(
+            f"{s['stage']} ({(s['peak_memory_bytes'] or 0) / 1e6:.1f} MB, "
+            f"sınır {stage_limit(s['stage'], copy_cost) / 1e6:.1f} MB)"
+            for s in result["violations"]
+        )
+    )
+
+
+def print_report(result: Dict) -> None:
+    """
+    Denetim sonucunu tablo olarak yazdırır.
+
+    Args:
+        result: run_copy_audit çıktısı
+    """
+    copy_cost = result["copy_cost_bytes"]
+    print(f"\n=== {result['n_rows']:,} satır | tablo {result['frame_bytes'] / 1e6:.1f} MB "
+          f"| tam kopya {copy_cost / 1e6:.1f} MB ===")
+    print(f"{'Aşama':45s} {'Tepe (MB)':>10s} {'Kopya oranı':>12s} {'Sınır':>6s}")
+    for s in result["stages"]:
+        peak = s["peak_memory_bytes"] or 0
+        flag = "  << KOPYA" if s in result["violations"] else ""
+        print(f"{s['stage']:45s} {peak / 1e6:10.1f} {peak / copy_cost:12.2f} "
+              f"{STAGE_ALLOWANCES.get(s['stage'], 1.0):6.2f}{flag}")
+
+    if result["violations"]:
+        print(f"\n{len(result['violations'])} aşama ham tablonun tam boyutlu kopyasını oluşturuyor.")
+    else:
+        print("\nHiçbir aşama ham tablonun tam boyutlu kopyasını oluşturmuyor.")
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Komut satırı giriş noktası.
+    """
+    parser = argparse.ArgumentParser(description="Ham duruş tablosu kopya denetimi")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS, help="Duruş satır sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="Sentetik veri tohumu")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    result = run_copy_audit(args.rows, seed=args.seed)
+    print_report(result)
+    try:
+        assert_no_full_copies(result)
+    except AssertionError as e:
+        logger.error(str(e))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
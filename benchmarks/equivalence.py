@@ -0,0 +1,452 @@
+"""
+Hesaplama motorları için referans çıktı eşdeğerlik kontrolü.
+
+Referans, optimizasyonlardan önceki src.calculations çıktılarının sabit
+tohumlu sentetik veri üzerinde kaydedilmiş halidir (golden/ altındaki
+Parquet dosyaları). Aday motor, aynı adlı fonksiyonları sağlayan bir modül
+veya nesnedir; sağlamadığı fonksiyonlar atlanır. Çıktı tabloları tolerans ve
+sıralama kurallarıyla kayıtlı çıktılarla karşılaştırılır; böylece canlı
+modüldeki bir değişiklik kendi kendisiyle karşılaştırılmış olmaz.
+
+Kayıtlı çıktıların bulunmadığı boyutlarda (ör. hız ölçümü için büyük veri)
+canlı src.calculations modülü referans alınır ve hızlanma oranları
+raporlanır.
+
+Kullanım:
+    python -m benchmarks.equivalence --engine paket.hizli_motor --sizes 10000 1000000
+    python -m benchmarks.equivalence --write-golden
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+import importlib
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+
+import pandas as pd
+import numpy as np
+
+import src.calculations as reference_engine
+from src.synthetic_data import generate_dataset
+from src.classification import fold_text
+from src.data_processing import build_analysis_frame, get_latest_week_data
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Kayıtlı referans çıktıların dizini
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+
+# Referans çıktıları kaydedilen sentetik veri boyutları ve tohumu
+GOLDEN_SIZES = [10_000]
+GOLDEN_SEED = 0
+
+# Sütun bazında varsayılan mutlak toleranslar. Dakika sütunu saniyeden
+# tamsayı bölme ile türetildiğinden saniyedeki küçük farklar bir dakikalık
+# farka yol açabilir.
+DEFAULT_ATOL = {
+    "Süre (Saniye)": 1e-6,
+    "Süre (Dakika)": 1.0,
+}
+DEFAULT_RTOL = 1e-9
+
+# Sıralama kuralları:
+#   "keys"  - satır sırası anahtar sütunlara göre referansla aynı olmalı
+#   "value" - satır sırası sort_column'a göre referansla aynı yönde olmalı (eşitlikler serbest)
+#   "none"  - satır sırası önemsiz
+#   "top"   - grup başına ilk N; değerler aynı olmalı, sınırdaki eşit değerlerde anahtarlar serbest
+OUTPUT_SPECS = {
+    "toplam_sureler": {
+        "keys": ["Duruş Adı"], "order": "value", "sort_column": "Süre (Saniye)", "ascending": False
+    },
+    "tezgah_basina_kisim_sureleri": {
+        "keys": ["KISIM"], "order": "keys"
+    },
+    "tezgah_sureleri": {
+        "keys": ["İş Merkezi Kodu "], "order": "value", "sort_column": "Süre (Dakika)", "ascending": True
+    },
+    "tezgah_durus_ozet": {
+        "keys": ["İş Merkezi Kodu ", "Duruş Adı"], "order": "none"
+    },
+    "filtered_kisimlar": {
+        "keys": ["KISIM", "Duruş Adı"], "order": "top", "group": "KISIM", "sort_column": "Süre (Saniye)"
+    },
+    "filtered_machine": {
+        "keys": ["İş Merkezi Kodu ", "Duruş Adı"], "order": "top", "group": "İş Merkezi Kodu ",
+        "sort_column": "Süre (Saniye)"
+    },
+    "kisim_avg_sureler": {
+        "keys": ["Duruş Adı"], "order": "value", "sort_column": "Süre (Saniye)", "ascending": False
+    },
+}
+
+
+def build_jobs(df: pd.DataFrame, kisim_tezgah_sayilari: Dict, weeks: List[int]) -> List[Tuple[str, str, str, Callable]]:
+    """
+    Analiz iş parçacığındaki hesaplama çağrılarının listesini oluşturur.
+
+    Args:
+        df: İşlenmiş veri
+        kisim_tezgah_sayilari: Kısım-tezgah sayıları
+        weeks: Hafta listesi
+
+    Returns:
+        List[Tuple[str, str, str, Callable]]: (çıktı adı, spec adı, fonksiyon adı, çağrı) listesi.
+            Çağrı, motoru alıp çıktıyı döndüren bir fonksiyondur.
+    """
+    latest_week_df = get_latest_week_data(df, weeks)
+    target_week = weeks[0]
+
+    jobs = [
+        ("toplam_sureler", "toplam_sureler", "calculate_stop_time_sum",
+         lambda f: f(latest_week_df)),
+        ("tezgah_basina_kisim_sureleri", "tezgah_basina_kisim_sureleri", "calculate_part_machine_average_time",
+         lambda f: f(latest_week_df, kisim_tezgah_sayilari)),
+        ("tezgah_sureleri", "tezgah_sureleri", "calculate_machine_stop_times",
+         lambda f: f(latest_week_df)),
+        ("tezgah_durus_ozet", "tezgah_durus_ozet", "calculate_machine_stop_type_times",
+         lambda f: f(latest_week_df)),
+        ("filtered_kisimlar", "filtered_kisimlar", "filter_sort_top_stops",
+         lambda f: f(df, target_week)),
+        ("filtered_machine", "filtered_machine", "filter_sort_top_stops",
+         lambda f: f(df, target_week, gozlemlenecek="İş Merkezi Kodu ")),
+    ]
+    for kisim in kisim_tezgah_sayilari:
+        jobs.append((
+            f"kisim_avg_sureler[{kisim}]", "kisim_avg_sureler", "calculate_part_average_stop_times",
+            lambda f, kisim=kisim: f(latest_week_df, kisim, kisim_tezgah_sayilari)
+        ))
+    return jobs
+
+
+def _normalize(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Karşılaştırma için tabloyu normalleştirir (kategorik sütunlar metne,
+    indeks sıfırlanır).
+    """
+    frame = frame.reset_index(drop=True)
+    converted = {
+        col: frame[col].astype(str)
+        for col in frame.columns
+        if isinstance(frame[col].dtype, pd.CategoricalDtype) or frame[col].dtype == object
+    }
+    return frame.assign(**converted) if converted else frame
+
+
+def _compare_values(ref: pd.DataFrame, cand: pd.DataFrame, columns: List[str],
+                    atol: Dict[str, float], rtol: float) -> List[str]:
+    """
+    Aynı sıradaki iki tablonun sütun değerlerini karşılaştırır.
+    """
+    problems = []
+    for col in columns:
+        ref_values, cand_values = ref[col].to_numpy(), cand[col].to_numpy()
+        if pd.api.types.is_numeric_dtype(ref[col]) and pd.api.types.is_numeric_dtype(cand[col]):
+            close = np.isclose(
+                ref_values.astype(float), cand_values.astype(float),
+                rtol=rtol, atol=atol.get(col, 0.0), equal_nan=True
+            )
+        else:
+            close = ref_values.astype(str) == cand_values.astype(str)
+        if not close.all():
+            bad = int(np.flatnonzero(~close)[0])
+            problems.append(
+                f"'{col}' sütununda {int((~close).sum())} farklı değer "
+                f"(ilk satır {bad}: referans={ref_values[bad]!r}, aday={cand_values[bad]!r})"
+            )
+    return problems
+
+
+def compare_frames(ref: pd.DataFrame, cand: pd.DataFrame, spec: Dict,
+                   atol: Optional[Dict[str, float]] = None, rtol: float = DEFAULT_RTOL) -> List[str]:
+    """
+    Referans ve aday çıktı tablolarını spec kurallarına göre karşılaştırır.
+
+    Args:
+        ref: Referans çıktı
+        cand: Aday çıktı
+        spec: OUTPUT_SPECS girdisi
+        atol: Sütun bazında mutlak toleranslar
+        rtol: Göreli tolerans
+
+    Returns:
+        List[str]: Bulunan farklar (boşsa tablolar eşdeğer)
+    """
+    atol = DEFAULT_ATOL if atol is None else atol
+    ref, cand = _normalize(ref), _normalize(cand)
+
+    if set(ref.columns) != set(cand.columns):
+        return [f"Sütunlar farklı: referans={sorted(ref.columns)}, aday={sorted(cand.columns)}"]
+    if len(ref) != len(cand):
+        return [f"Satır sayısı farklı: referans={len(ref)}, aday={len(cand)}"]
+    if ref.empty:
+        return []
+
+    keys = spec["keys"]
+    values = [c for c in ref.columns if c not in keys]
+    order = spec["order"]
+    problems = []
+
+    if order == "keys":
+        return _compare_values(ref, cand[ref.columns], list(ref.columns), atol, rtol)
+
+    if order == "value":
+        # Aday sıralamasının yönü doğru olmalı
+        column = cand[spec["sort_column"]].to_numpy(dtype=float)
+        steps = np.diff(column)
+        tolerance = atol.get(spec["sort_column"], 0.0)
+        wrong = steps < -tolerance if spec["ascending"] else steps > tolerance
+        if wrong.any():
+            problems.append(f"Aday çıktı '{spec['sort_column']}' sütununa göre sıralı değil")
+
+    if order == "top":
+        # Grup başına sıralı değer listeleri aynı olmalı
+        sort_column = spec["sort_column"]
+        group = spec["group"]
+        ref_top = ref.sort_values([group, sort_column], ascending=[True, False], kind="stable")
+        cand_top = cand.sort_values([group, sort_column], ascending=[True, False], kind="stable")
+        problems.extend(_compare_values(
+            ref_top.reset_index(drop=True), cand_top.reset_index(drop=True),
+            [group, sort_column], atol, rtol
+        ))
+        # Sınırdaki eşitlikler dışında anahtarlar aynı olmalı
+        boundary = ref.groupby(group)[sort_column].transform("min")
+        ref_inner = ref[ref[sort_column] > boundary]
+        merged = ref_inner.merge(cand, on=keys, how="left", suffixes=("", "_aday"), indicator=True)
+        missing = merged["_merge"] != "both"
+        if missing.any():
+            problems.append(f"Adayda bulunmayan {int(missing.sum())} ilk-N satırı var")
+        return problems
+
+    # Anahtarlara göre hizalayıp değerleri karşılaştır
+    ref_sorted = ref.sort_values(keys, kind="stable").reset_index(drop=True)
+    cand_sorted = cand.sort_values(keys, kind="stable").reset_index(drop=True)
+    problems.extend(_compare_values(ref_sorted, cand_sorted[ref.columns], keys + values, atol, rtol))
+    return problems
+
+
+def golden_path(output: str, n_rows: int, seed: int = GOLDEN_SEED, directory: str = GOLDEN_DIR) -> str:
+    """
+    Bir çıktının kayıtlı referans dosyasının yolunu döndürür.
+
+    Args:
+        output: Çıktı adı (ör. 'kisim_avg_sureler[KISIM 2.1]')
+        n_rows: Sentetik veri satır sayısı
+        seed: Sentetik veri tohumu
+        directory: Referans dizini
+
+    Returns:
+        str: Parquet dosya yolu
+    """
+    name = re.sub(r"[^0-9a-z]+", "_", fold_text(output)).strip("_")
+    return os.path.join(directory, f"seed{seed}_{n_rows}", f"{name}.parquet")
+
+
+def generated_frame(n_rows: int, seed: int = GOLDEN_SEED) -> Tuple[pd.DataFrame, Dict, List[int]]:
+    """
+    Sentetik veri setini üretip analiz veri setine dönüştürür.
+
+    Args:
+        n_rows: Duruş satır sayısı
+        seed: Sentetik veri tohumu
+
+    Returns:
+        Tuple[pd.DataFrame, Dict, List[int]]: İşlenmiş veri, kısım-tezgah sayıları ve hafta listesi
+    """
+    dataset = generate_dataset(n_rows=n_rows, seed=seed)
+    return build_analysis_frame(dataset["durus"], dataset["calisma"], dataset["arizali"])
+
+
+def write_golden(n_rows: int, seed: int = GOLDEN_SEED, reference=reference_engine,
+                 directory: str = GOLDEN_DIR) -> List[str]:
+    """
+    Referans motorun çıktılarını Parquet dosyaları olarak kaydeder.
+
+    Args:
+        n_rows: Sentetik veri satır sayısı
+        seed: Sentetik veri tohumu
+        reference: Çıktıları kaydedilecek motor
+        directory: Referans dizini
+
+    Returns:
+        List[str]: Yazılan dosyalar
+    """
+    df, kisim_tezgah_sayilari, weeks = generated_frame(n_rows, seed)
+    paths = []
+    for output, _, func_name, call in build_jobs(df, kisim_tezgah_sayilari, weeks):
+        path = golden_path(output, n_rows, seed, directory)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _normalize(call(getattr(reference, func_name))).to_parquet(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def read_golden(output: str, n_rows: int, seed: int = GOLDEN_SEED, directory: str = GOLDEN_DIR) -> pd.DataFrame:
+    """
+    Bir çıktının kayıtlı referans tablosunu okur.
+
+    Raises:
+        FileNotFoundError: Referans dosyası yoksa
+    """
+    return pd.read_parquet(golden_path(output, n_rows, seed, directory))
+
+
+def has_golden(n_rows: int, seed: int = GOLDEN_SEED, directory: str = GOLDEN_DIR) -> bool:
+    """
+    Boyut ve tohum için kayıtlı referans çıktıların bulunup bulunmadığını döndürür.
+    """
+    return os.path.isdir(os.path.dirname(golden_path("", n_rows, seed, directory)))
+
+
+def _timed(func: Callable, repeat: int) -> Tuple[object, float]:
+    """
+    Fonksiyonu repeat kez çalıştırır; son çıktıyı ve en iyi süreyi döndürür.
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def run_equivalence(candidate, df: pd.DataFrame, kisim_tezgah_sayilari: Dict, weeks: List[int],
+                    reference=reference_engine, atol: Optional[Dict[str, float]] = None,
+                    rtol: float = DEFAULT_RTOL, repeat: int = 3,
+                    golden: Optional[Callable[[str], pd.DataFrame]] = None) -> List[Dict]:
+    """
+    Aday motoru aynı veri üzerinde referansla karşılaştırır.
+
+    Args:
+        candidate: Aday motor (calculate_* fonksiyonlarını sağlayan modül veya nesne)
+        df: İşlenmiş veri
+        kisim_tezgah_sayilari: Kısım-tezgah sayıları
+        weeks: Hafta listesi
+        reference: Referans motor (golden verilmemişse çalıştırılır)
+        atol: Sütun bazında mutlak toleranslar
+        rtol: Göreli tolerans
+        repeat: Süre ölçümü tekrar sayısı
+        golden: Çıktı adından kayıtlı referans tabloyu döndüren fonksiyon;
+            verilirse referans motor çalıştırılmaz ve hızlanma hesaplanmaz
+
+    Returns:
+        List[Dict]: Çıktı bazında sonuç satırları
+    """
+    rows = []
+    for output, spec_name, func_name, call in build_jobs(df, kisim_tezgah_sayilari, weeks):
+        candidate_func = getattr(candidate, func_name, None)
+        if candidate_func is None:
+            rows.append({"output": output, "status": "atlandı", "problems": [],
+                         "reference_s": None, "candidate_s": None, "speedup": None})
+            continue
+
+        if golden is not None:
+            ref_out, ref_time = golden(output), None
+        else:
+            ref_out, ref_time = _timed(lambda: call(getattr(reference, func_name)), repeat)
+        cand_out, cand_time = _timed(lambda: call(candidate_func), repeat)
+        problems = compare_frames(ref_out, cand_out, OUTPUT_SPECS[spec_name], atol, rtol)
+        rows.append({
+            "output": output,
+            "status": "eşdeğer" if not problems else "FARKLI",
+            "problems": problems,
+            "reference_s": ref_time,
+            "candidate_s": cand_time,
+            "speedup": ref_time / cand_time if ref_time is not None and cand_time > 0 else None,
+        })
+    return rows
+
+
+def run_on_generated(candidate, sizes: List[int], seed: int = GOLDEN_SEED, live_reference: bool = False,
+                     **kwargs) -> Dict[int, List[Dict]]:
+    """
+    Aday motoru farklı boyutlardaki sentetik veri setleri üzerinde doğrular.
+
+    Kayıtlı referans çıktıları olan boyutlarda aday bu çıktılarla, diğer
+    boyutlarda canlı referans motorla karşılaştırılır.
+
+    Args:
+        candidate: Aday motor
+        sizes: Duruş satır sayıları
+        seed: Sentetik veri tohumu
+        live_reference: True ise kayıtlı çıktılar yok sayılır
+        **kwargs: run_equivalence parametreleri
+
+    Returns:
+        Dict[int, List[Dict]]: Boyut bazında sonuç satırları
+    """
+    report = {}
+    for n_rows in sizes:
+        df, kisim_tezgah_sayilari, weeks = generated_frame(n_rows, seed)
+        golden = None
+        if not live_reference and has_golden(n_rows, seed):
+            golden = lambda output, n_rows=n_rows: read_golden(output, n_rows, seed)
+        report[n_rows] = run_equivalence(candidate, df, kisim_tezgah_sayilari, weeks, golden=golden, **kwargs)
+    return report
+
+
+def print_report(report: Dict[int, List[Dict]]) -> bool:
+    """
+    Doğrulama raporunu yazdırır.
+
+    Returns:
+        bool: Tüm çıktılar eşdeğerse True
+    """
+    all_ok = True
+    for n_rows, rows in report.items():
+        print(f"\n{n_rows:,} satır")
+        print(f"{'Çıktı':40s} {'Durum':10s} {'Referans (s)':>13s} {'Aday (s)':>10s} {'Hızlanma':>9s}")
+        for row in rows:
+            if row["status"] == "atlandı":
+                print(f"{row['output']:40s} {row['status']:10s}")
+                continue
+            if row["reference_s"] is None:
+                # Kayıtlı referansla karşılaştırıldı; referans süresi yok
+                print(f"{row['output']:40s} {row['status']:10s} {'kayıtlı':>13s} {row['candidate_s']:10.4f}")
+            else:
+                print(f"{row['output']:40s} {row['status']:10s} {row['reference_s']:13.4f} "
+                      f"{row['candidate_s']:10.4f} {row['speedup']:8.2f}x")
+            for problem in row["problems"]:
+                print(f"    - {problem}")
+            all_ok &= not row["problems"]
+    return all_ok
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Komut satırı giriş noktası.
+    """
+    parser = argparse.ArgumentParser(description="Hesaplama motoru eşdeğerlik kontrolü")
+    parser.add_argument("--engine", default="src.calculations",
+                        help="Aday motor modülünün yolu (ör. paket.hizli_motor)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000],
+                        help="Duruş satır sayıları")
+    parser.add_argument("--seed", type=int, default=GOLDEN_SEED, help="Sentetik veri tohumu")
+    parser.add_argument("--rtol", type=float, default=DEFAULT_RTOL, help="Göreli tolerans")
+    parser.add_argument("--repeat", type=int, default=3, help="Süre ölçümü tekrar sayısı")
+    parser.add_argument("--live-reference", action="store_true",
+                        help="Kayıtlı çıktılar yerine canlı src.calculations modülünü referans al")
+    parser.add_argument("--write-golden", action="store_true",
+                        help="src.calculations çıktılarını GOLDEN_SIZES boyutlarında referans olarak kaydet")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.write_golden:
+        for n_rows in GOLDEN_SIZES:
+            paths = write_golden(n_rows, seed=args.seed)
+            print(f"{n_rows:,} satır: {len(paths)} referans çıktı yazıldı ({os.path.dirname(paths[0])})")
+        return 0
+
+    candidate = importlib.import_module(args.engine)
+    report = run_on_generated(candidate, args.sizes, seed=args.seed, live_reference=args.live_reference,
+                              rtol=args.rtol, repeat=args.repeat)
+    return 0 if print_report(report) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,441 @@
+"""
+Sentetik veri üzerinde veri hazırlama, hesaplama ve görselleştirme fonksiyonlarının süre ölçümü.
+
+Her ölçüm çalıştırması JSON geçmiş dosyasına eklenir ve aynı satır sayısındaki
+bir önceki çalıştırmayla karşılaştırılır.
+
+Kullanım:
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --sizes 10000 1000000 --skip-visuals
+"""
+
+import os
+import sys
+import json
+import argparse
+import datetime
+import platform
+import subprocess
+import tempfile
+from typing import Dict, List, Optional
+import logging
+
+import matplotlib
+matplotlib.use("Agg")
+
+import pandas as pd
+import numpy as np
+
+from src.synthetic_data import generate_dataset, write_dataset
+from src.data_processing import read_raw_data, build_analysis_frame, get_latest_week_data
+from src.calculations import (
+    second_to_minute,
+    calculate_stop_time_sum,
+    calculate_part_machine_average_time,
+    calculate_machine_stop_times,
+    calculate_machine_stop_type_times,
+    filter_sort_top_stops,
+    calculate_part_average_stop_times,
+    calculate_category_stop_times
+)
+from src.visualization import (
+    visualize_pie,
+    visualize_bar,
+    visualize_weekly_comparison,
+    plot_bar,
+    visualize_top_bottom_machines,
+    generate_oee_visuals
+)
+from src.profiling import StageProfiler, count_rows
+from src.validation import validate_frames
+from src.oee import compute_oee_tables
+from src.reliability import compute_reliability
+from src.heatmap import compute_heatmaps
+from src.occupancy import compute_occupancy
+from src.trends import compute_trends
+from src.anomaly import detect_anomalies
+from src.pareto import compute_pareto_tables
+from src.ranking import rank_changes
+from src import sql_store
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Varsayılan ölçüm boyutları (duruş satır sayısı)
+DEFAULT_SIZES = [10_000, 1_000_000, 10_000_000]
+
+# Excel dosyasına yazılabilecek en büyük satır sayısı
+EXCEL_MAX_ROWS = 1_048_575
+
+# Ölçüm geçmişi dosyası
+HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "history.json")
+
+# Bu orandan fazla yavaşlayan aşamalar gerileme olarak işaretlenir
+DEFAULT_REGRESSION_RATIO = 1.2
+
+# Bu süreden kısa aşamalar ölçüm gürültüsü nedeniyle gerileme sayılmaz
+MIN_REGRESSION_SECONDS = 0.05
+
+
+def _measure(profiler: StageProfiler, name: str, func, rows_in: Optional[int] = None):
+    """
+    Bir fonksiyonu profilleyici aşaması içinde çalıştırır.
+    """
+    with profiler.stage(name, rows_in) as record:
+        result = func()
+        record["rows_out"] = count_rows(result)
+    return result
+
+
+def benchmark_ingest(dataset: Dict, profiler: StageProfiler, include_excel: bool = False) -> tuple:
+    """
+    Veri okuma ve hazırlama aşamalarını ölçer.
+
+    Args:
+        dataset: generate_dataset çıktısı
+        profiler: Ölçümleri toplayan profilleyici
+        include_excel: Excel dosyasından okuma da ölçülsün mü
+
+    Returns:
+        tuple: build_analysis_frame çıktısı
+    """
+    durus, calisma, arizali = dataset["durus"], dataset["calisma"], dataset["arizali"]
+
+    if include_excel and len(durus) <= EXCEL_MAX_ROWS:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            files = write_dataset(dataset, tmp_dir)
+            durus, calisma, arizali = _measure(
+                profiler, "read_raw_data", lambda: read_raw_data(*files), rows_in=len(durus)
+            )
+
+    _measure(profiler, "validate_frames", lambda: validate_frames(durus, calisma), rows_in=len(durus))
+
+    return _measure(
+        profiler,
+        "build_analysis_frame",
+        lambda: build_analysis_frame(durus, calisma, arizali),
+        rows_in=len(durus)
+    )
+
+
+def benchmark_calculations(df: pd.DataFrame, kisim_tezgah_sayilari: Dict, weeks: List[int],
+                           profiler: StageProfiler) -> Dict:
+    """
+    src.calculations fonksiyonlarını tüm veri üzerinde ölçer.
+
+    Args:
+        df: İşlenmiş veri
+        kisim_tezgah_sayilari: Kısım-tezgah sayıları
+        weeks: Hafta listesi
+        profiler: Ölçümleri toplayan profilleyici
+
+    Returns:
+        Dict: Görselleştirme ölçümlerinde kullanılacak hesaplama çıktıları
+    """
+    n = len(df)
+    outputs = {}
+
+    _measure(profiler, "get_latest_week_data", lambda: get_latest_week_data(df, weeks), rows_in=n)
+    _measure(profiler, "second_to_minute", lambda: second_to_minute(df), rows_in=n)
+    outputs["toplam_sureler"] = _measure(
+        profiler, "calculate_stop_time_sum", lambda: calculate_stop_time_sum(df), rows_in=n
+    )
+    outputs["tezgah_basina_kisim_sureleri"] = _measure(
+        profiler, "calculate_part_machine_average_time",
+        lambda: calculate_part_machine_average_time(df, kisim_tezgah_sayilari), rows_in=n
+    )
+    outputs["tezgah_sureleri"] = _measure(
+        profiler, "calculate_machine_stop_times", lambda: calculate_machine_stop_times(df), rows_in=n
+    )
+    outputs["tezgah_durus_ozet"] = _measure(
+        profiler, "calculate_machine_stop_type_times", lambda: calculate_machine_stop_type_times(df), rows_in=n
+    )
+    outputs["filtered_kisimlar"] = _measure(
+        profiler, "filter_sort_top_stops[KISIM]", lambda: filter_sort_top_stops(df, weeks[-1]), rows_in=n
+    )
+    outputs["filtered_machine"] = _measure(
+        profiler, "filter_sort_top_stops[İş Merkezi Kodu]",
+        lambda: filter_sort_top_stops(df, weeks[-1], gozlemlenecek="İş Merkezi Kodu "), rows_in=n
+    )
+    outputs["kisim_avg_sureler"] = _measure(
+        profiler, "calculate_part_average_stop_times",
+        lambda: {
+            kisim: calculate_part_average_stop_times(df, kisim, kisim_tezgah_sayilari)
+            for kisim in kisim_tezgah_sayilari
+        },
+        rows_in=n
+    )
+    outputs["kisim_kategori_sureleri"] = _measure(
+        profiler, "calculate_category_stop_times[KISIM]",
+        lambda: calculate_category_stop_times(df, group_column="KISIM"), rows_in=n
+    )
+    outputs["guvenilirlik"] = _measure(
+        profiler, "compute_reliability", lambda: compute_reliability(df, weeks), rows_in=n
+    )
+    outputs["isi_haritalari"] = _measure(
+        profiler, "compute_heatmaps", lambda: compute_heatmaps(df, weeks), rows_in=n
+    )
+    outputs["doluluk"] = _measure(
+        profiler, "compute_occupancy", lambda: compute_occupancy(df, weeks[-1:]), rows_in=n
+    )
+    outputs["trendler"] = _measure(
+        profiler, "compute_trends", lambda: compute_trends(df, weeks), rows_in=n
+    )
+    outputs["anomaliler"] = _measure(
+        profiler, "detect_anomalies", lambda: detect_anomalies(df, weeks), rows_in=n
+    )
+    outputs["pareto_tablolari"] = _measure(
+        profiler, "compute_pareto_tables", lambda: compute_pareto_tables(df), rows_in=n
+    )
+    outputs["sira_degisimleri"] = _measure(
+        profiler, "rank_changes", lambda: rank_changes(df, weeks), rows_in=n
+    )
+    return outputs
+
+
+def benchmark_sql_store(df: pd.DataFrame, calisma_df: pd.DataFrame, profiler: StageProfiler) -> None:
+    """
+    SQL deposuna yazmayı ve örnek gruplama sorgusunu geçici bir dosyada ölçer.
+
+    Args:
+        df: İşlenmiş veri
+        calisma_df: Ham çalışma süresi verisi
+        profiler: Ölçümleri toplayan profilleyici
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, os.path.basename(sql_store.DEFAULT_DB_PATH))
+        _measure(
+            profiler, "sql_store.write_store",
+            lambda: sql_store.write_store(df, calisma_df, db_path), rows_in=len(df)
+        )
+        _measure(
+            profiler, "sql_store.run_query",
+            lambda: sql_store.run_query(sql_store.EXAMPLE_QUERY, db_path=db_path), rows_in=len(df)
+        )
+
+
+def benchmark_visualizations(df: pd.DataFrame, weeks: List[int], outputs: Dict,
+                             profiler: StageProfiler, output_dir: str) -> None:
+    """
+    src.visualization fonksiyonlarını ölçer. Grafikler output_dir altına kaydedilir.
+
+    Args:
+        df: İşlenmiş veri
+        weeks: Hafta listesi
+        outputs: benchmark_calculations çıktıları
+        profiler: Ölçümleri toplayan profilleyici
+        output_dir: Grafiklerin kaydedileceği çalışma dizini
+    """
+    cwd = os.getcwd()
+    os.chdir(output_dir)
+    try:
+        tezgah_sureleri = outputs["tezgah_sureleri"]
+        _measure(
+            profiler, "visualize_pie",
+            lambda: visualize_pie(outputs["toplam_sureler"], baslik="Tüm Tezgahlar Toplam",
+                                  show=False, category_column="Duruş Adı"),
+            rows_in=len(outputs["toplam_sureler"])
+        )
+        _measure(
+            profiler, "visualize_bar",
+            lambda: visualize_bar(tezgah_sureleri, colors="Reds", top_k=10,
+                                  baslik="En Fazla Duruş Yapan 10 Tezgah", show=False),
+            rows_in=len(tezgah_sureleri)
+        )
+        _measure(
+            profiler, "visualize_top_bottom_machines",
+            lambda: visualize_top_bottom_machines(tezgah_sureleri, show=False),
+            rows_in=len(tezgah_sureleri)
+        )
+        _measure(
+            profiler, "plot_bar",
+            lambda: plot_bar(outputs["tezgah_durus_ozet"], show=False),
+            rows_in=len(outputs["tezgah_durus_ozet"])
+        )
+        _measure(
+            profiler, "visualize_weekly_comparison",
+            lambda: visualize_weekly_comparison(outputs["filtered_kisimlar"], show=False,
+                                                target_week=weeks[-1]),
+            rows_in=len(outputs["filtered_kisimlar"])
+        )
+        _measure(
+            profiler, "generate_oee_visuals",
+            lambda: generate_oee_visuals(outputs["oee_tables"], weeks),
+            rows_in=len(outputs["oee_tables"]["tezgah"])
+        )
+    finally:
+        os.chdir(cwd)
+
+
+def run_benchmark(n_rows: int, include_visuals: bool = True, include_excel: bool = False,
+                  trace_memory: bool = False, seed: int = 0) -> Dict:
+    """
+    Tek bir veri boyutu için tüm ölçümleri çalıştırır.
+
+    Args:
+        n_rows: Duruş satır sayısı
+        include_visuals: Görselleştirme fonksiyonları ölçülsün mü
+        include_excel: Excel dosyasından okuma ölçülsün mü
+        trace_memory: Tepe bellek ölçülsün mü
+        seed: Sentetik veri tohumu
+
+    Returns:
+        Dict: Ölçüm kaydı
+    """
+    logger.info(f"Ölçüm başlıyor: {n_rows} satır")
+    dataset = generate_dataset(n_rows=n_rows, seed=seed)
+
+    profiler = StageProfiler(trace_memory=trace_memory)
+    profiler.start()
+    try:
+        df, kisim_tezgah_sayilari, weeks = benchmark_ingest(dataset, profiler, include_excel)
+        outputs = benchmark_calculations(df, kisim_tezgah_sayilari, weeks, profiler)
+        outputs["oee_tables"] = _measure(
+            profiler, "compute_oee_tables",
+            lambda: compute_oee_tables(dataset["calisma"], dataset["arizali"]),
+            rows_in=len(dataset["calisma"])
+        )
+        benchmark_sql_store(df, dataset["calisma"], profiler)
+        if include_visuals:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                benchmark_visualizations(df, weeks, outputs, profiler, tmp_dir)
+    finally:
+        profiler.stop()
+
+    report = profiler.report()
+    return {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "n_rows": n_rows,
+        "seed": seed,
+        "stages": report["stages"],
+        "total": report["total"],
+    }
+
+
+def _git_commit() -> Optional[str]:
+    """
+    Çalışılan git commit kimliğini döndürür.
+    """
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return None
+
+
+def load_history(path: str = HISTORY_FILE) -> List[Dict]:
+    """
+    Ölçüm geçmişini yükler.
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_history(history: List[Dict], path: str = HISTORY_FILE) -> None:
+    """
+    Ölçüm geçmişini kaydeder.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(history, f, ensure_ascii=False, indent=2)
+
+
+def compare_with_previous(entry: Dict, history: List[Dict],
+                          regression_ratio: float = DEFAULT_REGRESSION_RATIO) -> List[Dict]:
+    """
+    Ölçüm kaydını aynı satır sayısındaki bir önceki kayıtla karşılaştırır.
+
+    Args:
+        entry: Yeni ölçüm kaydı
+        history: Önceki ölçüm kayıtları
+        regression_ratio: Gerileme eşiği (yeni süre / önceki süre)
+
+    Returns:
+        List[Dict]: Aşama bazında karşılaştırma satırları
+    """
+    previous = next((h for h in reversed(history) if h["n_rows"] == entry["n_rows"]), None)
+    if previous is None:
+        return []
+
+    previous_times = {s["stage"]: s["wall_time_s"] for s in previous["stages"]}
+    rows = []
+    for stage in entry["stages"]:
+        before = previous_times.get(stage["stage"])
+        if not before:
+            continue
+        ratio = stage["wall_time_s"] / before
+        rows.append({
+            "stage": stage["stage"],
+            "previous_s": before,
+            "current_s": stage["wall_time_s"],
+            "ratio": ratio,
+            "regression": ratio > regression_ratio and stage["wall_time_s"] >= MIN_REGRESSION_SECONDS
+        })
+    return rows
+
+
+def _print_entry(entry: Dict, comparison: List[Dict]) -> None:
+    """
+    Ölçüm sonuçlarını tablo olarak yazdırır.
+    """
+    ratios = {row["stage"]: row for row in comparison}
+    print(f"\n{entry['n_rows']:,} satır ({entry['timestamp']}, commit {entry['commit']})")
+    print(f"{'Aşama':45s} {'Süre (s)':>10s} {'CPU (s)':>10s} {'Önceki':>10s} {'Oran':>7s}")
+    for stage in entry["stages"]:
+        row = ratios.get(stage["stage"])
+        previous = f"{row['previous_s']:10.3f}" if row else f"{'-':>10s}"
+        ratio = f"{row['ratio']:6.2f}x" if row else f"{'-':>7s}"
+        flag = "  << GERİLEME" if row and row["regression"] else ""
+        print(f"{stage['stage']:45s} {stage['wall_time_s']:10.3f} {stage['cpu_time_s']:10.3f} "
+              f"{previous} {ratio}{flag}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Komut satırı giriş noktası.
+    """
+    parser = argparse.ArgumentParser(description="Tezgah duruş analizi performans ölçümleri")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Ölçülecek duruş satır sayıları")
+    parser.add_argument("--skip-visuals", action="store_true", help="Görselleştirmeleri ölçme")
+    parser.add_argument("--excel", action="store_true",
+                        help="Excel dosyasından okumayı da ölç (yalnızca Excel sınırına kadar)")
+    parser.add_argument("--memory", action="store_true", help="Tepe belleği tracemalloc ile ölç")
+    parser.add_argument("--seed", type=int, default=0, help="Sentetik veri tohumu")
+    parser.add_argument("--history", default=HISTORY_FILE, help="Ölçüm geçmişi dosyası")
+    parser.add_argument("--regression-ratio", type=float, default=DEFAULT_REGRESSION_RATIO,
+                        help="Gerileme eşiği")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    history = load_history(args.history)
+    regressions = 0
+    for n_rows in args.sizes:
+        entry = run_benchmark(
+            n_rows,
+            include_visuals=not args.skip_visuals,
+            include_excel=args.excel,
+            trace_memory=args.memory,
+            seed=args.seed
+        )
+        comparison = compare_with_previous(entry, history, args.regression_ratio)
+        regressions += sum(row["regression"] for row in comparison)
+        _print_entry(entry, comparison)
+        history.append(entry)
+        save_history(history, args.history)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -50,7 +50,9 @@ OUTPUT_DIRS = {
     "tee": "Raporlar/Tee",
     "parts": "Raporlar/Kısımlar",
     "machines": "Raporlar/Tezgahlar",
-    "general": "Raporlar/Genel"
+    "general": "Raporlar/Genel",
+    "heatmap": "Raporlar/Isı Haritası",
+    "pareto": "Raporlar/Kısımlar/Pareto"
 }
 
 # Görselleştirme için ayarlar
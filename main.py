@@ -7,11 +7,13 @@ Tezgah Duruş Analizi GUI uygulaması ana giriş noktası.
 import sys
 import os
 import logging
+import multiprocessing
 
 # Modül yollarını ayarla
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)  # Ana dizini Python yoluna ekle
 
+import pandas as pd
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import QTranslator, QLocale
 from app.views.main_window import MainWindow
@@ -41,11 +43,13 @@ def setup_environment():
         "Raporlar/Kısımlar/Son Hafta",
         "Raporlar/Kısımlar/4 haftalık",
         "Raporlar/Kısımlar/Son Hafta Tezgah Başına Ortalama",
+        "Raporlar/Kısımlar/Pareto",
         "Raporlar/Tezgahlar/Son Hafta",
         "Raporlar/Tezgahlar/4 haftalık",
         "Raporlar/Tee/Genel",
         "Raporlar/Tee/Kısımlar",
-        "Raporlar/Tee/Tezgahlar"
+        "Raporlar/Tee/Tezgahlar",
+        "Raporlar/Isı Haritası/Kısımlar"
     ]
     
     for directory in directories:
@@ -53,12 +57,25 @@ def setup_environment():
     
     logger.info("Çalışma ortamı hazırlandı.")
 
+def configure_pandas():
+    """
+    pandas'ın uygulama genelindeki davranışını ayarlar.
+    
+    pandas 2.x sürümlerinde copy-on-write etkinleştirilir; hesaplama ve
+    görselleştirme fonksiyonları girdi tablolarını kopyalamadan filtreler ve
+    türetilmiş sütunları yeni tablolarda oluşturur. pandas 3 ile bu davranış
+    varsayılandır ve seçenek kullanımdan kaldırılmıştır.
+    """
+    if int(pd.__version__.split(".")[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
+
 def main():
     """
     Uygulama ana fonksiyonu.
     """
     # Uygulama çalışma ortamını hazırla
     setup_environment()
+    configure_pandas()
     
     # PyQt uygulamasını başlat
     app = QApplication(sys.argv)
@@ -72,6 +89,8 @@ def main():
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
+    # Çoklu dosya okuma süreç havuzu kullanır; paketlenmiş uygulamalarda gereklidir
+    multiprocessing.freeze_support()
     main()
 
 
@@ -1,3 +1,3 @@
 """
 Kaynak kod modülleri.
-"""
\ No newline at end of file
+"""
@@ -0,0 +1,144 @@
+"""
+Tezgah x duruş tipi haftalık sürelerinde sağlam z-skoru ile anomali tespiti.
+
+Her (tezgah, duruş adı) çifti için haftalık duruş dakikaları bir satırda
+toplanır (çift x hafta matrisi, tek np.bincount). Her satırın kendi geçmişine
+göre medyanı ve medyan mutlak sapması (MAD) tüm matris üzerinde eksen
+boyunca hesaplanır:
+
+    z = 0.6745 x (süre - medyan) / MAD
+
+MAD sıfırsa (geçmişin yarısından fazlası aynı değerse) ortalama mutlak
+sapma kullanılır: z = (süre - medyan) / (1.2533 x ortalama mutlak sapma).
+İkisi de sıfırsa satırın yayılımı yoktur ve z-skoru boş kalır.
+
+|z| >= Z_THRESHOLD olan hücreler anomali sayılır; sonuç tablosu z-skoruna
+göre azalan sıralıdır (önce en büyük artışlar).
+"""
+
+from typing import List
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing import WEEK_KEY_COLUMN, week_keys, week_ordinals, week_range
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Anomali eşiği (Iglewicz-Hoaglin değiştirilmiş z-skoru)
+Z_THRESHOLD = 3.5
+
+# Sağlam istatistik için gereken en az hafta sayısı
+MIN_WEEKS = 4
+
+# MAD'ın normal dağılımdaki standart sapmaya oranı ve ortalama mutlak sapma karşılığı
+MAD_SCALE = 0.6745
+MEAN_AD_SCALE = 1.2533
+
+# Sonuç tablosunun sütunları
+ANOMALY_COLUMNS = [
+    "İş Merkezi Kodu ", "KISIM", "Duruş Adı", WEEK_KEY_COLUMN,
+    "Süre (Dakika)", "Medyan (Dakika)", "Z-Skoru"
+]
+
+
+def robust_z_scores(values: np.ndarray) -> np.ndarray:
+    """
+    Her satırı kendi medyanı ve MAD'ı ile ölçekleyerek sağlam z-skorlarını hesaplar.
+
+    Args:
+        values: (satır, hafta) dakika matrisi
+
+    Returns:
+        np.ndarray: Aynı boyutta z-skoru matrisi (yayılımı olmayan satırlarda NaN)
+    """
+    median = np.median(values, axis=1, keepdims=True)
+    deviation = values - median
+    mad = np.median(np.abs(deviation), axis=1, keepdims=True)
+    mean_ad = np.mean(np.abs(deviation), axis=1, keepdims=True)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.where(
+            mad > 0,
+            MAD_SCALE * deviation / mad,
+            np.where(mean_ad > 0, deviation / (MEAN_AD_SCALE * mean_ad), np.nan)
+        )
+    return z
+
+
+def detect_anomalies(
+    df: pd.DataFrame,
+    weeks: List[int],
+    threshold: float = Z_THRESHOLD,
+    latest_only: bool = True,
+    machine_column: str = "İş Merkezi Kodu "
+) -> pd.DataFrame:
+    """
+    Tezgah x duruş tipi haftalık sürelerinde anomalileri bulur.
+
+    Hafta ekseni ilk ve son hafta arasındaki tüm ISO haftaları (yıl
+    geçişleri dahil) içerir; kaydı olmayan haftalar sıfır dakika sayılır. ÇALIŞMA SÜRESİ kayıtları duruş
+    sayılmaz.
+
+    Args:
+        df: İşlenmiş duruş verisi
+        weeks: Sıralı yıl-hafta anahtarları
+        threshold: Anomali sayılacak en küçük |z|
+        latest_only: True ise yalnızca son haftanın anomalileri döndürülür
+        machine_column: Tezgah kodu sütunu
+
+    Returns:
+        pd.DataFrame: ANOMALY_COLUMNS sütunlu, z-skoruna göre azalan sıralı tablo
+    """
+    week_axis = week_range(weeks[0], weeks[-1]) if len(weeks) else []
+    if len(week_axis) < MIN_WEEKS:
+        logger.warning(f"Anomali tespiti için en az {MIN_WEEKS} haftalık veri gerekli.")
+        return pd.DataFrame(columns=ANOMALY_COLUMNS)
+
+    week_count = len(week_axis)
+    keys = week_keys(df)
+    mask = (df["Duruş Adı"] != "ÇALIŞMA SÜRESİ").to_numpy() & (keys >= weeks[0]) & (keys <= weeks[-1])
+    data = df.loc[mask, [machine_column, "KISIM", "Duruş Adı", "Süre (Saniye)"]]
+    if data.empty:
+        return pd.DataFrame(columns=ANOMALY_COLUMNS)
+
+    # (tezgah, duruş adı) çiftleri: iki kodun birleşiminden tek çift kodu
+    machine_codes, machines = pd.factorize(data[machine_column], sort=True)
+    stop_codes, stops = pd.factorize(data["Duruş Adı"], sort=True)
+    pair_keys = machine_codes.astype(np.int64) * len(stops) + stop_codes
+    pair_keys_unique, first_rows, pair_codes = np.unique(pair_keys, return_index=True, return_inverse=True)
+
+    # Çift x hafta dakika matrisi
+    week_codes = week_ordinals(keys[mask]) - week_ordinals([weeks[0]])[0]
+    values = np.bincount(
+        pair_codes.astype(np.int64) * week_count + week_codes,
+        weights=data["Süre (Saniye)"].to_numpy(dtype=np.float64) / 60,
+        minlength=len(pair_keys_unique) * week_count
+    ).reshape(len(pair_keys_unique), week_count)
+
+    z = robust_z_scores(values)
+    median = np.median(values, axis=1)
+
+    # Eşiği aşan hücreler (son hafta ya da tüm haftalar)
+    candidates = np.abs(np.nan_to_num(z)) >= threshold
+    if latest_only:
+        candidates[:, :-1] = False
+    rows, columns = np.nonzero(candidates)
+
+    result = pd.DataFrame({
+        machine_column: np.asarray(machines).astype(str)[pair_keys_unique[rows] // len(stops)],
+        "KISIM": data["KISIM"].astype(str).to_numpy()[first_rows[rows]],
+        "Duruş Adı": np.asarray(stops).astype(str)[pair_keys_unique[rows] % len(stops)],
+        WEEK_KEY_COLUMN: np.asarray(week_axis, dtype=np.int64)[columns],
+        "Süre (Dakika)": values[rows, columns],
+        "Medyan (Dakika)": median[rows],
+        "Z-Skoru": z[rows, columns],
+    }).sort_values("Z-Skoru", ascending=False).reset_index(drop=True)
+
+    logger.info(
+        f"Anomali tespiti tamamlandı: {len(pair_keys_unique)} tezgah-duruş çifti, "
+        f"{week_count} hafta, {len(result)} anomali"
+    )
+    return result
@@ -8,6 +8,11 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional, Union
 import logging
 
+from src import storage
+from src.data_processing import split_week_key, week_keys
+from src.classification import CATEGORY_COLUMN, add_stop_category
+from src.ranking import select_top
+
 # Loglama yapılandırması
 logger = logging.getLogger(__name__)
 
@@ -24,9 +29,8 @@ def second_to_minute(df: pd.DataFrame, second_col: str = "Süre (Saniye)",
     Returns:
         pd.DataFrame: Dakika sütunu eklenmiş DataFrame
     """
-    result_df = df.copy()
-    result_df[minute_col] = (result_df[second_col] / 60).astype(int)
-    return result_df
+    # assign yeni bir tablo döndürür; copy-on-write altında mevcut sütunlar kopyalanmaz
+    return df.assign(**{minute_col: (df[second_col] / 60).astype(int)})
 
 def calculate_stop_time_sum(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -45,7 +49,7 @@ def calculate_stop_time_sum(df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame(columns=['Duruş Adı', 'Süre (Saniye)', 'Süre (Dakika)'])
     
     # Örnek bir hesaplama
-    toplam_sureler = df.groupby("Duruş Adı")["Süre (Saniye)"].sum().reset_index()
+    toplam_sureler = df.groupby("Duruş Adı", observed=True)["Süre (Saniye)"].sum().reset_index()
     toplam_sureler = toplam_sureler.sort_values(by="Süre (Saniye)", ascending=False)
     
     # Saniyeden dakikaya çevir
@@ -66,19 +70,19 @@ def calculate_part_machine_average_time(
     if df.empty:
         return pd.DataFrame(columns=['KISIM', 'Süre (Saniye)', 'Süre (Dakika)'])
     
-    # ÇALIŞMA SÜRESİ dışındaki duruşları filtreleme
-    filtered_df = df[df["Duruş Adı"] != "ÇALIŞMA SÜRESİ"].copy()
+    # ÇALIŞMA SÜRESİ dışındaki duruşları filtreleme (yalnızca gerekli sütunlar)
+    filtered_df = df.loc[df["Duruş Adı"] != "ÇALIŞMA SÜRESİ", ["KISIM", "Süre (Saniye)"]]
     
     # Kısımlara göre toplam süreleri hesapla
-    kisim_sureleri = filtered_df.groupby("KISIM")["Süre (Saniye)"].sum().reset_index()
+    kisim_sureleri = filtered_df.groupby("KISIM", observed=True)["Süre (Saniye)"].sum().reset_index()
     kisim_sureleri = kisim_sureleri.sort_values(by="KISIM", ascending=True)
 
     # KISIM değerlerini tezgah sayılarına bölerek güncelle
-    for idx, row in kisim_sureleri.iterrows():
-        if row["KISIM"] in kisim_tezgah_sayilari:
-            tezgah_sayisi = kisim_tezgah_sayilari[row["KISIM"]]
-            if tezgah_sayisi > 0:  # Sıfıra bölme hatasını önle
-                kisim_sureleri.at[idx, "Süre (Saniye)"] = row["Süre (Saniye)"] / tezgah_sayisi
+    tezgah_sayisi = kisim_sureleri["KISIM"].astype(str).map(kisim_tezgah_sayilari)
+    bolunecek = tezgah_sayisi > 0  # Sıfıra bölme hatasını önle (bilinmeyen kısımlar NaN -> False)
+    kisim_sureleri["Süre (Saniye)"] = kisim_sureleri["Süre (Saniye)"].astype(float).mask(
+        bolunecek, kisim_sureleri["Süre (Saniye)"] / tezgah_sayisi
+    )
 
     # Saniyeden dakikaya çevir
     kisim_sureleri = second_to_minute(kisim_sureleri)
@@ -95,11 +99,11 @@ def calculate_machine_stop_times(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame(columns=['İş Merkezi Kodu ', 'Süre (Saniye)', 'Süre (Dakika)'])
     
-    # ÇALIŞMA SÜRESİ dışındaki duruşları filtreleme
-    filtered_df = df[df['Duruş Adı'] != 'ÇALIŞMA SÜRESİ'].copy()
+    # ÇALIŞMA SÜRESİ dışındaki duruşları filtreleme (yalnızca gerekli sütunlar)
+    filtered_df = df.loc[df['Duruş Adı'] != 'ÇALIŞMA SÜRESİ', ["İş Merkezi Kodu ", "Süre (Saniye)"]]
     
     # İş merkezi koduna göre toplam süreleri hesapla
-    tezgah_sureleri = filtered_df.groupby("İş Merkezi Kodu ")["Süre (Saniye)"].sum().reset_index()
+    tezgah_sureleri = filtered_df.groupby("İş Merkezi Kodu ", observed=True)["Süre (Saniye)"].sum().reset_index()
     
     # Saniyeden dakikaya çevir
     tezgah_sureleri = second_to_minute(tezgah_sureleri)
@@ -120,7 +124,7 @@ def calculate_machine_stop_type_times(df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame(columns=['İş Merkezi Kodu ', 'Duruş Adı', 'Süre (Saniye)', 'Süre (Dakika)'])
     
     # Her bir "İş Merkezi Kodu" ve "Duruş Adı" için toplam süreyi hesapla
-    tezgah_durus_ozet = df.groupby(["İş Merkezi Kodu ", "Duruş Adı"])["Süre (Saniye)"].sum().reset_index()
+    tezgah_durus_ozet = df.groupby(["İş Merkezi Kodu ", "Duruş Adı"], observed=True)["Süre (Saniye)"].sum().reset_index()
     
     # Saniyeden dakikaya çevir
     tezgah_durus_ozet = second_to_minute(tezgah_durus_ozet)
@@ -129,20 +133,28 @@ def calculate_machine_stop_type_times(df: pd.DataFrame) -> pd.DataFrame:
 
 def filter_sort_top_stops(
     df: pd.DataFrame, 
-    max_week: int = 1,
-    gozlemlenecek: str = "KISIM"
+    max_week: Optional[int] = None,
+    gozlemlenecek: str = "KISIM",
+    store_path: Optional[str] = None
 ) -> pd.DataFrame:
     """
     Her bir kısım veya tezgah için en büyük 10 duruşu filtreleyip sıralar.
+    
+    max_week bir yıl-hafta anahtarıdır (bkz. data_processing.week_keys);
+    verilmezse verideki son hafta kullanılır. Sonuçtaki 'Hafta' sütunu ISO
+    hafta numarasıdır.
+    
+    store_path verilirse haftanın verisi hafta bölümlü depodan okunur;
+    yalnızca ilgili (yıl, hafta) bölümü ve gerekli sütunlar açılır.
     """
     logger.info(f"{gozlemlenecek} için en büyük 10 duruş hesaplanıyor...")
     
     # Eğer veri boşsa boş DataFrame döndür
     if df.empty:
-        return pd.DataFrame(columns=[gozlemlenecek, 'Hafta', 'Duruş Adı', 'Süre (Saniye)', 'Süre (Dakika)'])
+        return pd.DataFrame(columns=[gozlemlenecek, 'Yıl', 'Hafta', 'Duruş Adı', 'Süre (Saniye)', 'Süre (Dakika)'])
     
     # Gerekli sütunları kontrol et
-    required_columns = [gozlemlenecek, 'Hafta', 'Duruş Adı', 'Süre (Saniye)']
+    required_columns = [gozlemlenecek, 'Yıl', 'Hafta', 'Duruş Adı', 'Süre (Saniye)']
     for col in required_columns:
         if col not in df.columns:
             logger.error(f"Gerekli sütun bulunamadı: {col}")
@@ -150,23 +162,26 @@ def filter_sort_top_stops(
             return empty_df
     
     # Basitleştirilmiş model: Son haftaya ait en büyük 10 duruşu hesapla
-    latest_week_df = df[df['Hafta'] == max_week]
+    columns = [gozlemlenecek, 'Duruş Adı', 'Süre (Saniye)']
+    keys = week_keys(df)
+    if max_week is None:
+        max_week = int(keys.max())
+    year, week = split_week_key(max_week)
+    if store_path is not None and storage.is_available() and storage.has_partition(year, week, store_path):
+        latest_week_df = storage.read_week(year, week, store_path, columns=columns)
+    else:
+        latest_week_df = df.loc[keys == max_week, columns]
     
     if latest_week_df.empty:
         return pd.DataFrame(columns=required_columns + ['Süre (Dakika)'])
     
-    result = (
-        latest_week_df.groupby([gozlemlenecek, 'Duruş Adı'])['Süre (Saniye)']
-        .sum()
-        .reset_index()
-        .sort_values('Süre (Saniye)', ascending=False)
-        .groupby(gozlemlenecek)
-        .head(10)
-        .reset_index(drop=True)
-    )
+    # Grup başına ilk 10 kısmi seçimle alınır; yalnızca seçilen satırlar sıralanır
+    sums = latest_week_df.groupby([gozlemlenecek, 'Duruş Adı'], observed=True)['Süre (Saniye)'].sum().reset_index()
+    result = select_top(sums, 'Süre (Saniye)', 10, group_column=gozlemlenecek).reset_index(drop=True)
     
-    # Hafta sütunu ekle
-    result['Hafta'] = max_week
+    # Yıl ve hafta sütunlarını ekle
+    result['Yıl'] = year
+    result['Hafta'] = week
     
     # Saniyeden dakikaya çevir
     result = second_to_minute(result)
@@ -187,23 +202,63 @@ def calculate_part_average_stop_times(
     if df.empty:
         return pd.DataFrame(columns=['Duruş Adı', 'Süre (Saniye)', 'Süre (Dakika)'])
     
-    # Belirli kısım için veri filtrele
-    kisim_for_avg = df[df["KISIM"] == kisim].copy()
+    # Belirli kısım için veri filtrele (yalnızca gerekli sütunlar)
+    kisim_mask = df["KISIM"] == kisim
     
-    if kisim_for_avg.empty:
+    if not kisim_mask.any():
         return pd.DataFrame(columns=['Duruş Adı', 'Süre (Saniye)', 'Süre (Dakika)'])
     
     # Tezgah sayısı
     tezgah_sayisi = kisim_tezgah_sayilari.get(kisim, 1)
     
-    # Süreleri tezgah sayısına böl
-    kisim_for_avg['Süre (Saniye)'] = (kisim_for_avg['Süre (Saniye)'] / tezgah_sayisi).astype(int)
+    # Süreleri tezgah sayısına böl (satır bazında tamsayıya yuvarlama korunur)
+    sureler = (df.loc[kisim_mask, 'Süre (Saniye)'] / tezgah_sayisi).astype(int)
     
     # Duruş adlarına göre süreleri topla
-    result = kisim_for_avg.groupby('Duruş Adı')['Süre (Saniye)'].sum().reset_index()
+    result = sureler.groupby(df.loc[kisim_mask, 'Duruş Adı'], observed=True).sum().reset_index()
     result = result.sort_values('Süre (Saniye)', ascending=False)
     
     # Saniyeden dakikaya çevir
     result = second_to_minute(result)
     
-    return result
\ No newline at end of file
+    return result
+
+def calculate_category_stop_times(
+    df: pd.DataFrame,
+    group_column: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Duruş sürelerini STOP_CATEGORIES kategorilerine göre toplar.
+    
+    Duruş adları benzersiz değerler üzerinden bir kez sınıflandırılır.
+    
+    Args:
+        df: İşlenecek DataFrame
+        group_column: Kategoriyle birlikte gruplanacak sütun (örn. 'KISIM');
+            None ise yalnızca kategoriye göre toplanır
+        
+    Returns:
+        pd.DataFrame: Kategori (ve grup) bazında toplam süreler
+    """
+    logger.info("Duruş kategorisi süreleri hesaplanıyor...")
+    
+    keys = ([group_column] if group_column else []) + [CATEGORY_COLUMN]
+    
+    # Eğer veri boşsa boş DataFrame döndür
+    if df.empty:
+        return pd.DataFrame(columns=keys + ['Süre (Saniye)', 'Süre (Dakika)'])
+    
+    # ÇALIŞMA SÜRESİ dışındaki duruşları filtreleme (yalnızca gerekli sütunlar)
+    columns = ([group_column] if group_column else []) + ["Duruş Adı", "Süre (Saniye)"]
+    filtered_df = add_stop_category(df.loc[df["Duruş Adı"] != "ÇALIŞMA SÜRESİ", columns])
+    
+    kategori_sureleri = (
+        filtered_df.groupby(keys, observed=True)["Süre (Saniye)"]
+        .sum()
+        .reset_index()
+        .sort_values(keys[:-1] + ["Süre (Saniye)"], ascending=[True] * (len(keys) - 1) + [False])
+        .reset_index(drop=True)
+    )
+    
+    # Saniyeden dakikaya çevir
+    return second_to_minute(kategori_sureleri)
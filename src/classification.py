@@ -0,0 +1,151 @@
+"""
+Duruş adlarının STOP_CATEGORIES anahtar kelimelerine göre sınıflandırılması.
+
+Her benzersiz duruş adı bir kez sınıflandırılır ve sonuç kategorik kodlar
+üzerinden satırlara yayılır; milyonlarca satırlık bir tablonun maliyeti
+benzersiz duruş adı sayısı kadardır.
+
+Karşılaştırma Türkçe harf kurallarına göre yapılır: 'İ' ve 'I' harfleri
+str.lower() yerine çeviri tablosuyla küçültülür ve Türkçe karakterler ASCII
+karşılıklarına indirgenir. Böylece 'TAMİR', 'Tamir' ve 'TAMIR' aynı anahtar
+kelimeyle eşleşir.
+"""
+
+from typing import Dict, List
+import logging
+
+import numpy as np
+import pandas as pd
+
+from config.settings import STOP_CATEGORIES
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Sınıflandırma sonucunun yazıldığı sütun
+CATEGORY_COLUMN = "Duruş Kategorisi"
+
+# Hiçbir anahtar kelimeyle eşleşmeyen duruşların kategorisi
+DEFAULT_CATEGORY = "diger"
+
+# Türkçe büyük/küçük harf ve aksan katlama tablosu
+_FOLD_TABLE = str.maketrans({
+    "İ": "i", "I": "i", "ı": "i",
+    "Ş": "s", "ş": "s",
+    "Ğ": "g", "ğ": "g",
+    "Ü": "u", "ü": "u",
+    "Ö": "o", "ö": "o",
+    "Ç": "c", "ç": "c",
+    "Â": "a", "â": "a",
+    "Î": "i", "î": "i",
+    "Û": "u", "û": "u",
+})
+
+
+def fold_text(text: str) -> str:
+    """
+    Metni Türkçe kurallara göre küçük harfe ve ASCII karşılıklarına indirger.
+
+    Args:
+        text: Metin
+
+    Returns:
+        str: Katlanmış metin (baştaki ve sondaki boşluklar ile çoklu boşluklar temizlenir)
+    """
+    return " ".join(str(text).translate(_FOLD_TABLE).lower().split())
+
+
+def category_dtype(categories: Dict[str, List[str]] = STOP_CATEGORIES) -> pd.CategoricalDtype:
+    """
+    Kategori sütununun tipini döndürür (tanım sırası ve en sonda varsayılan kategori).
+
+    Args:
+        categories: Kategori -> anahtar kelimeler sözlüğü
+
+    Returns:
+        pd.CategoricalDtype: Kategori tipi
+    """
+    return pd.CategoricalDtype(list(categories) + [DEFAULT_CATEGORY])
+
+
+def classify_name(name: str, categories: Dict[str, List[str]] = STOP_CATEGORIES) -> str:
+    """
+    Tek bir duruş adını sınıflandırır.
+
+    Kategoriler tanım sırasıyla denenir; anahtar kelimelerinden biri duruş
+    adında geçen ilk kategori döner.
+
+    Args:
+        name: Duruş adı
+        categories: Kategori -> anahtar kelimeler sözlüğü
+
+    Returns:
+        str: Kategori adı (eşleşme yoksa DEFAULT_CATEGORY)
+    """
+    folded = fold_text(name)
+    for category, keywords in categories.items():
+        if any(fold_text(keyword) in folded for keyword in keywords):
+            return category
+    return DEFAULT_CATEGORY
+
+
+def classify_series(
+    series: pd.Series,
+    categories: Dict[str, List[str]] = STOP_CATEGORIES
+) -> pd.Series:
+    """
+    Duruş adı sütununu kategorilere çevirir.
+
+    Yalnızca benzersiz değerler sınıflandırılır; sonuç kategori kodlarıyla
+    satırlara yayılır. Boş duruş adları varsayılan kategoriye düşer.
+
+    Args:
+        series: Duruş adı sütunu (kategorik veya metin)
+        categories: Kategori -> anahtar kelimeler sözlüğü
+
+    Returns:
+        pd.Series: Kategorik tipte kategori sütunu (aynı indeksle)
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        uniques = series.cat.categories
+    else:
+        codes, uniques = pd.factorize(series)
+
+    dtype = category_dtype(categories)
+    positions = {category: i for i, category in enumerate(dtype.categories)}
+    default = positions[DEFAULT_CATEGORY]
+
+    # Benzersiz değer -> kategori kodu; -1 (boş) kodu için sona varsayılan eklenir
+    unique_codes = np.array(
+        [positions[classify_name(name, categories)] for name in uniques] + [default],
+        dtype=np.int8
+    )
+    category_codes = unique_codes[codes]
+
+    logger.info(f"{len(uniques)} benzersiz duruş adı {len(series)} satır için sınıflandırıldı.")
+    return pd.Series(
+        pd.Categorical.from_codes(category_codes, dtype=dtype),
+        index=series.index,
+        name=CATEGORY_COLUMN
+    )
+
+
+def add_stop_category(
+    df: pd.DataFrame,
+    categories: Dict[str, List[str]] = STOP_CATEGORIES,
+    name_column: str = "Duruş Adı"
+) -> pd.DataFrame:
+    """
+    Tabloya duruş kategorisi sütununu ekler.
+
+    Args:
+        df: Duruş adı sütununu içeren tablo
+        categories: Kategori -> anahtar kelimeler sözlüğü
+        name_column: Duruş adı sütunu
+
+    Returns:
+        pd.DataFrame: CATEGORY_COLUMN sütunu eklenmiş yeni tablo
+    """
+    return df.assign(**{CATEGORY_COLUMN: classify_series(df[name_column], categories)})
+
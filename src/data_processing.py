@@ -1,11 +1,9 @@
 """
 Veri yükleme, temizleme ve dönüştürme işlemleri için fonksiyonlar.
-
-Bu, daha önceki data_processing.py dosyasının basitleştirilmiş versiyonudur.
-Uygulama tamamlandığında orijinal modül içe aktarılmalıdır.
 """
 
 import os
+import datetime
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Union
@@ -13,10 +11,131 @@ import logging
 
 # Konfigürasyon dosyasını içe aktar
 from config.tezgah_listesi import KISIMLAR_DICT
+from src.readers import read_table
 
 # Loglama yapılandırması
 logger = logging.getLogger(__name__)
 
+# Ham verilerde beklenen sütunlar
+DURUS_COLUMNS = ["İş Merkezi Kodu ", "Duruş Adı", "Duruş Başlangıç Tarih", "Duruş Bitiş Tarih"]
+CALISMA_COLUMNS = ["Makina Kodu", "Tarih", "Çalışma Zamanı", "Planlı Duruş",
+                   "Plansız Duruş", "Oee", "Performans", "Kullanılabilirlik", "Kalite"]
+OEE_COLUMNS = ["Oee", "Performans", "Kullanılabilirlik", "Kalite"]
+
+# Makina kodu -> kısım eşlemesi (vektörel atama için)
+MAKINA_KISIM_MAP = {
+    tezgah: kisim
+    for kisim, tezgahlar in KISIMLAR_DICT.items()
+    for tezgah in tezgahlar
+}
+
+# İşlenmiş duruş verisi için sayısal sütun tipleri
+NUMERIC_SCHEMA = {
+    "Süre (Saniye)": "int32",
+    "Süre (Dakika)": "int32",
+    "Hafta": "int16",
+    "Yıl": "int16",
+    "Oee": "float32",
+    "Performans": "float32",
+    "Kullanılabilirlik": "float32",
+    "Kalite": "float32",
+}
+
+# Kısım sözlüğü tüm tablolarda ortaktır. Kategoriler alfabetik sıralı
+# tutulur, böylece kategorik sıralama metin sıralamasıyla aynı sonucu verir.
+KISIM_DTYPE = pd.CategoricalDtype(sorted(list(KISIMLAR_DICT) + ["Diğer"]))
+
+# Makina kodu ve duruş adı sözlüklerinin tabanı. Her veri setinin
+# kategorileri bu taban ile verideki değerlerin sıralı birleşimidir; modül
+# düzeyinde değişen bir sözlük tutulmaz. Tezgah listesindeki kodları içeren
+# tablolar aynı makina kodu tipini paylaşır, aynı veriden türetilen tablolar
+# (son hafta, özetler) kaynak tablonun tipini taşır.
+CATEGORY_BASES: Dict[str, pd.CategoricalDtype] = {
+    "İş Merkezi Kodu ": pd.CategoricalDtype(sorted(MAKINA_KISIM_MAP)),
+    "Duruş Adı": pd.CategoricalDtype([]),
+}
+
+# Yıl-hafta anahtarı sütunu: Yıl * 100 + ISO hafta (örn. 2024/52 -> 202452).
+# Anahtar yıllar arasında sıralıdır; hafta listeleri bu anahtarla tutulur.
+WEEK_KEY_COLUMN = "Yıl Hafta"
+
+def week_keys(df: pd.DataFrame) -> np.ndarray:
+    """
+    Tablonun 'Yıl' ve 'Hafta' sütunlarından yıl-hafta anahtarlarını hesaplar.
+    
+    Args:
+        df: 'Yıl' ve 'Hafta' sütunlu tablo
+        
+    Returns:
+        np.ndarray: int64 anahtarlar (Yıl * 100 + Hafta)
+    """
+    return df['Yıl'].to_numpy(dtype=np.int64) * 100 + df['Hafta'].to_numpy(dtype=np.int64)
+
+def split_week_key(key: int) -> Tuple[int, int]:
+    """
+    Yıl-hafta anahtarını (yıl, hafta) çiftine ayırır.
+    """
+    return int(key) // 100, int(key) % 100
+
+def week_label(key: int) -> str:
+    """
+    Yıl-hafta anahtarının gösterim metnini döndürür (örn. 202452 -> '2024-52').
+    """
+    year, week = split_week_key(key)
+    return f"{year}-{week:02d}"
+
+def _week_monday(key: int) -> datetime.date:
+    """
+    Yıl-hafta anahtarının ISO haftasının pazartesi gününü döndürür.
+    """
+    return datetime.date.fromisocalendar(*split_week_key(key), 1)
+
+def week_ordinals(keys) -> np.ndarray:
+    """
+    Yıl-hafta anahtarlarını ardışık hafta sıra numaralarına çevirir.
+    
+    Ardışık ISO haftaların sıra numaraları yıl geçişinde de birer artar
+    (202452 ile 202501 arasındaki fark 1'dir); hafta eksenleri ve hafta
+    farkları bu numaralarla hesaplanır.
+    
+    Args:
+        keys: Yıl-hafta anahtarları
+        
+    Returns:
+        np.ndarray: int64 hafta sıra numaraları
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    uniques, inverse = np.unique(keys, return_inverse=True)
+    # 0001-01-01 pazartesidir; pazartesilerin gün sırası 7'ye bölünerek ardışık olur
+    ordinals = np.array([_week_monday(key).toordinal() // 7 for key in uniques], dtype=np.int64)
+    return ordinals[inverse].reshape(keys.shape)
+
+def week_range(first_key: int, last_key: int) -> List[int]:
+    """
+    İki yıl-hafta anahtarı arasındaki (dahil) tüm ISO haftaların anahtarlarını döndürür.
+    
+    Args:
+        first_key: İlk hafta anahtarı
+        last_key: Son hafta anahtarı
+        
+    Returns:
+        List[int]: Ardışık hafta anahtarları
+    """
+    first, last = _week_monday(first_key), _week_monday(last_key)
+    keys = []
+    while first <= last:
+        year, week, _ = first.isocalendar()
+        keys.append(year * 100 + week)
+        first += datetime.timedelta(weeks=1)
+    return keys
+
+def shift_week_key(key: int, weeks: int) -> int:
+    """
+    Yıl-hafta anahtarını verilen sayıda ISO hafta kaydırır (örn. 202501, -1 -> 202452).
+    """
+    year, week, _ = (_week_monday(key) + datetime.timedelta(weeks=weeks)).isocalendar()
+    return year * 100 + week
+
 def assign_kisim(makina_kodu: str) -> str:
     """
     Makina koduna göre kısım atar.
@@ -32,6 +151,209 @@ def assign_kisim(makina_kodu: str) -> str:
             return kisim
     return "Diğer"
 
+def category_dtype(column: str, values: pd.Series) -> pd.CategoricalDtype:
+    """
+    Sütunun kategori tipini taban sözlük ve verideki değerlerden türetir.
+    
+    Kategoriler sıralı tutulur, böylece kategorik sıralama metin sıralamasıyla
+    aynı sonucu verir. Verideki tüm değerler tabanda varsa taban tip döner.
+    
+    Args:
+        column: Sütun adı (CATEGORY_BASES anahtarı)
+        values: Sütundaki değerler
+        
+    Returns:
+        pd.CategoricalDtype: Kategori tipi
+    """
+    base = CATEGORY_BASES[column]
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        observed = values.cat.categories
+    else:
+        observed = pd.Index(values.dropna().unique())
+    new_values = observed.difference(base.categories)
+    if len(new_values) == 0:
+        return base
+    return pd.CategoricalDtype(sorted(set(base.categories) | set(new_values.astype(str))))
+
+def apply_compact_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    İşlenmiş duruş verisine bellek dostu sütun tiplerini uygular.
+    
+    Makina kodu ve duruş adı sütunları veri setinden türetilen (bkz.
+    category_dtype), kısım sütunu sabit sözlüklü kategorik sütunlara; süreler int32'ye, hafta int16'ya ve OEE oranları
+    float32'ye dönüştürülür.
+    
+    Args:
+        df: İşlenmiş duruş verisi
+        
+    Returns:
+        pd.DataFrame: Dönüştürülmüş veri
+    """
+    conversions = {}
+    
+    for column in CATEGORY_BASES:
+        if column in df.columns:
+            conversions[column] = df[column].astype(category_dtype(column, df[column]))
+    
+    if "KISIM" in df.columns:
+        conversions["KISIM"] = df["KISIM"].astype(KISIM_DTYPE)
+    
+    for column, dtype in NUMERIC_SCHEMA.items():
+        if column in df.columns:
+            conversions[column] = df[column].astype(dtype)
+    
+    return df.assign(**conversions)
+
+def memory_report(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sütun bazında bellek kullanım raporu oluşturur.
+    
+    Args:
+        df: İncelenecek DataFrame
+        
+    Returns:
+        pd.DataFrame: Sütun, tip, bellek (bayt), satır başına bellek ve pay sütunlarını içeren rapor
+    """
+    usage = df.memory_usage(deep=True, index=False)
+    total = usage.sum()
+    rows = max(len(df), 1)
+    
+    return pd.DataFrame({
+        "Sütun": usage.index,
+        "Tip": [str(df[col].dtype) for col in usage.index],
+        "Bellek (Bayt)": usage.values,
+        "Satır Başına (Bayt)": usage.values / rows,
+        "Pay (%)": usage.values / total * 100 if total else 0.0
+    })
+
+def kisim_machine_counts(arizali_tezgahlar: Optional[List[str]] = None) -> Dict[str, int]:
+    """
+    Arızalı tezgahlar hariç her kısımdaki tezgah sayısını döndürür.
+    
+    Args:
+        arizali_tezgahlar: Arızalı tezgah kodları
+        
+    Returns:
+        Dict[str, int]: Kısım-tezgah sayıları
+    """
+    arizali = set(arizali_tezgahlar or [])
+    return {
+        kisim: len([t for t in tezgahlar if t not in arizali])
+        for kisim, tezgahlar in KISIMLAR_DICT.items()
+    }
+
+def read_raw_data(
+    durus_file: str,
+    calisma_file: str,
+    arizali_file: str = None
+) -> Tuple[pd.DataFrame, pd.DataFrame, List[str]]:
+    """
+    Ham duruş, çalışma süresi ve arızalı tezgah verilerini dosyalardan okur.
+    
+    Args:
+        durus_file: Duruş verisi dosya yolu
+        calisma_file: Çalışma süresi dosya yolu
+        arizali_file: Arızalı tezgah listesi dosya yolu
+        
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame, List[str]]: Duruş verisi, çalışma süresi verisi ve arızalı tezgahlar
+    """
+    logger.info(f"Ham veriler okunuyor: {durus_file}, {calisma_file}")
+    
+    durus_df = read_table(durus_file, DURUS_COLUMNS)
+    calisma_df = read_table(calisma_file, CALISMA_COLUMNS)
+    
+    arizali_tezgahlar = []
+    if arizali_file and os.path.exists(arizali_file):
+        with open(arizali_file, 'r', encoding='utf-8') as f:
+            arizali_tezgahlar = [line.strip() for line in f if line.strip()]
+    
+    logger.info(f"Ham veriler okundu. Duruş: {len(durus_df)} satır, Çalışma: {len(calisma_df)} satır")
+    return durus_df, calisma_df, arizali_tezgahlar
+
+def build_analysis_frame(
+    durus_df: pd.DataFrame,
+    calisma_df: Optional[pd.DataFrame] = None,
+    arizali_tezgahlar: Optional[List[str]] = None
+) -> Tuple[pd.DataFrame, Dict, List[int]]:
+    """
+    Ham duruş verisinden analiz veri setini oluşturur.
+    
+    Süreler başlangıç/bitiş tarihlerinden hesaplanır, ISO hafta numarası ve
+    kısım bilgisi eklenir, arızalı tezgahlar çıkarılır ve varsa çalışma
+    süresi verisindeki günlük OEE değerleri duruş satırlarına eklenir.
+    
+    Args:
+        durus_df: Ham duruş verisi
+        calisma_df: Ham çalışma süresi verisi
+        arizali_tezgahlar: Analiz dışı bırakılacak arızalı tezgah kodları
+        
+    Returns:
+        Tuple[pd.DataFrame, Dict, List[int]]: İşlenmiş veri, kısım-tezgah sayıları ve
+            sıralı yıl-hafta anahtarları (bkz. week_keys)
+    """
+    arizali = set(arizali_tezgahlar or [])
+    
+    df = durus_df[DURUS_COLUMNS].dropna()
+    df = df.assign(**{'İş Merkezi Kodu ': df['İş Merkezi Kodu '].astype(str).str.strip()})
+    
+    # Arızalı tezgahları çıkar
+    if arizali:
+        df = df[~df['İş Merkezi Kodu '].isin(arizali)]
+    
+    start = pd.to_datetime(df['Duruş Başlangıç Tarih'])
+    end = pd.to_datetime(df['Duruş Bitiş Tarih'])
+    seconds = (end - start).dt.total_seconds()
+    
+    df = df.assign(**{
+        'Duruş Başlangıç Tarih': start,
+        'Duruş Bitiş Tarih': end,
+        'Süre (Saniye)': seconds.fillna(0).astype('int64')
+    })
+    
+    # Süresi sıfır veya negatif olan kayıtları çıkar
+    invalid = df['Süre (Saniye)'] <= 0
+    if invalid.any():
+        logger.warning(f"Süresi sıfır veya negatif olan {int(invalid.sum())} kayıt çıkarıldı.")
+        df = df[~invalid]
+    
+    # ISO yıl ve hafta (hafta bölümlü depo için yıl da saklanır)
+    takvim = df['Duruş Başlangıç Tarih'].dt.isocalendar()
+    df = df.assign(**{
+        'Süre (Dakika)': df['Süre (Saniye)'] // 60,
+        'Hafta': takvim.week.astype('int64'),
+        'Yıl': takvim.year.astype('int64'),
+        'KISIM': df['İş Merkezi Kodu '].map(MAKINA_KISIM_MAP).fillna('Diğer')
+    })
+    
+    # Günlük OEE değerlerini ekle
+    if calisma_df is not None and not calisma_df.empty:
+        oee = (
+            calisma_df.assign(**{
+                'İş Merkezi Kodu ': calisma_df['Makina Kodu'].astype(str).str.strip(),
+                'Gün': pd.to_datetime(calisma_df['Tarih']).dt.normalize()
+            })
+            .groupby(['İş Merkezi Kodu ', 'Gün'])[OEE_COLUMNS]
+            .mean()
+            .reset_index()
+        )
+        df = (
+            df.assign(Gün=df['Duruş Başlangıç Tarih'].dt.normalize())
+            .merge(oee, on=['İş Merkezi Kodu ', 'Gün'], how='left')
+            .drop(columns='Gün')
+        )
+    
+    df = apply_compact_schema(df.reset_index(drop=True))
+    logger.info(f"İşlenmiş veri bellek kullanımı: {df.memory_usage(deep=True).sum() / 1024 ** 2:.1f} MB")
+    
+    # Arızalı tezgahlar hariç kısım-tezgah sayıları
+    kisim_tezgah_sayilari = kisim_machine_counts(arizali)
+    
+    # Yıl-hafta anahtarları; farklı yılların aynı hafta numaraları karışmaz
+    weeks = sorted(int(w) for w in np.unique(week_keys(df)))
+    
+    return df, kisim_tezgah_sayilari, weeks
+
 def prepare_data_for_analysis(
     durus_file: str,
     calisma_file: str,
@@ -51,54 +373,44 @@ def prepare_data_for_analysis(
     logger.info("Veri hazırlama işlemi başlıyor...")
     
     try:
-        # Örnek veri ve parametreler oluştur
-        df = pd.DataFrame({
-            'İş Merkezi Kodu ': ['CT.D01', 'CT.D02', 'İM.K01', 'İM.MV1'],
-            'Duruş Adı': ['YEMEK MOLASI', 'ARIZA', 'TASARIM', 'ÇALIŞMA SÜRESİ'],
-            'Duruş Başlangıç Tarih': pd.date_range(start='2023-01-01', periods=4),
-            'Duruş Bitiş Tarih': pd.date_range(start='2023-01-01 01:00:00', periods=4),
-            'Süre (Saniye)': [3600, 7200, 1800, 28800],
-            'Süre (Dakika)': [60, 120, 30, 480],
-            'Hafta': [1, 1, 2, 2],
-            'Oee': [0.85, 0.78, 0.92, 0.88],
-            'Performans': [0.90, 0.82, 0.95, 0.87],
-            'Kullanılabilirlik': [0.92, 0.85, 0.96, 0.90],
-            'Kalite': [0.97, 0.88, 0.98, 0.95]
-        })
-        
-        # Kısım bilgisini ekle
-        df['KISIM'] = df['İş Merkezi Kodu '].apply(assign_kisim)
-        
-        # Örnek kısım-tezgah sayıları
-        kisim_tezgah_sayilari = {
-            'KISIM 2.1': len(KISIM_2_1),
-            'KISIM 2.2': len(KISIM_2_2),
-            'KISIM 3.1': len(KISIM_3_1),
-            'KISIM 3.2': len(KISIM_3_2),
-            'KISIM 4.1': len(KISIM_4_1),
-            'KISIM 4.2': len(KISIM_4_2),
-            'KISIM 5.1': len(KISIM_5_1)
-        }
-        
-        # Örnek hafta listesi
-        weeks = [1, 2]
-        
-        logger.info("Veri hazırlama işlemi tamamlandı (örnek veri oluşturuldu).")
+        durus_df, calisma_df, arizali_tezgahlar = read_raw_data(
+            durus_file,
+            calisma_file,
+            arizali_file
+        )
+        
+        df, kisim_tezgah_sayilari, weeks = build_analysis_frame(
+            durus_df,
+            calisma_df,
+            arizali_tezgahlar
+        )
+        
+        logger.info(f"Veri hazırlama işlemi tamamlandı. Satır sayısı: {len(df)}")
         return df, kisim_tezgah_sayilari, weeks
         
     except Exception as e:
         logger.error(f"Veri hazırlama hatası: {str(e)}", exc_info=True)
-        # Hata durumunda temel örnek bir veri oluştur
-        df = pd.DataFrame(columns=['İş Merkezi Kodu ', 'Duruş Adı', 'Süre (Dakika)', 'KISIM', 'Hafta'])
-        return df, {}, [1]
+        # Hata durumunda boş veri ve boş hafta listesi döndür; çağıranlar
+        # hafta olmamasını "geçerli kayıt yok" olarak ele alır
+        df = pd.DataFrame(columns=['İş Merkezi Kodu ', 'Duruş Adı', 'Süre (Dakika)', 'KISIM', 'Yıl', 'Hafta'])
+        return df, {}, []
 
-def get_latest_week_data(df: pd.DataFrame, weeks: List[int]) -> pd.DataFrame:
+def get_latest_week_data(
+    df: pd.DataFrame,
+    weeks: List[int],
+    store_path: Optional[str] = None
+) -> pd.DataFrame:
     """
     En son haftaya ait veriyi filtreler.
     
+    store_path verilirse veri hafta bölümlü depodan okunur ve yalnızca son
+    haftanın (yıl, hafta) bölümü açılır; bölüm bulunamazsa bellekteki tablo
+    filtrelenir.
+    
     Args:
         df: Tüm veri seti
-        weeks: Sıralanmış hafta numaraları listesi
+        weeks: Sıralı yıl-hafta anahtarları
+        store_path: İşlenmiş veri deposu dizini
         
     Returns:
         pd.DataFrame: Son haftaya ait filtrelenmiş veri
@@ -107,10 +419,18 @@ def get_latest_week_data(df: pd.DataFrame, weeks: List[int]) -> pd.DataFrame:
         logger.warning("Hafta bilgisi bulunamadı!")
         return pd.DataFrame()
         
-    latest_week = weeks[-1]  # Son hafta
-    logger.info(f"Son hafta verisi filtreleniyor: Hafta {latest_week}")
+    latest_year, latest_week = split_week_key(weeks[-1])  # Son hafta
+    logger.info(f"Son hafta verisi filtreleniyor: Hafta {week_label(weeks[-1])}")
+    
+    latest_week_df = None
+    if store_path is not None:
+        # Döngüsel içe aktarmayı önlemek için depo modülü burada yüklenir
+        from src import storage
+        if storage.is_available() and storage.has_partition(latest_year, latest_week, store_path):
+            latest_week_df = storage.read_week(latest_year, latest_week, store_path)
     
-    latest_week_df = df[df['Hafta'] == latest_week]
+    if latest_week_df is None:
+        latest_week_df = df[week_keys(df) == weeks[-1]]
     logger.info(f"Son hafta satır sayısı: {len(latest_week_df)}")
     
-    return latest_week_df
\ No newline at end of file
+    return latest_week_df
@@ -0,0 +1,172 @@
+"""
+Duruş dakikalarının haftanın saatlerine (168 dilim) dağıtılması.
+
+Her duruşun süresi, kapsadığı saat dilimlerine bölünür: ilk ve son saatin
+kısmi dakikaları haftanın saatine (pazartesi 00:00'dan itibaren 0..167)
+katlanarak doğrudan eklenir. Aradaki tam saatler de dilimlemeden önce
+katlanır: tam haftalar grubun her dilimine 60 dakika ekler, kalan saatler
+ise haftanın saati üzerinde dairesel bir fark dizisine (+60 / -60) yazılıp
+birikimli toplamla açılır. Böylece dizi boyutu veri aralığından bağımsız
+olarak grup x 169 kalır ve günlerce süren bir duruş da kayıt başına döngü
+kurmadan dağıtılır.
+
+Sonuç, tezgah x 168 ve kısım x 168 dakika matrisleridir; değerler seçilen
+haftalardaki toplam duruş dakikasıdır.
+"""
+
+from typing import Dict, List, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing import week_keys
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Haftadaki saat sayısı
+HOURS_PER_WEEK = 168
+
+# Grafik eksenindeki gün kısaltmaları (pazartesiden başlayarak)
+DAY_LABELS = ["Pzt", "Sal", "Çar", "Per", "Cum", "Cmt", "Paz"]
+
+
+def week_origin(start: pd.Series) -> pd.Timestamp:
+    """
+    En erken başlangıcın bulunduğu haftanın pazartesi 00:00 zamanını döndürür.
+
+    Args:
+        start: Başlangıç zamanları
+
+    Returns:
+        pd.Timestamp: Zaman ekseninin başlangıcı
+    """
+    first = start.min().normalize()
+    return first - pd.Timedelta(days=first.dayofweek)
+
+
+def hour_of_week_minutes(
+    codes: np.ndarray,
+    start_seconds: np.ndarray,
+    end_seconds: np.ndarray,
+    group_count: int
+) -> np.ndarray:
+    """
+    Kayıtların sürelerini grup x haftanın saati matrisine dağıtır.
+
+    Args:
+        codes: Kayıtların grup kodları (0..group_count-1)
+        start_seconds: Başlangıçlar (eksen başlangıcından itibaren saniye, >= 0)
+        end_seconds: Bitişler (eksen başlangıcından itibaren saniye)
+        group_count: Grup sayısı
+
+    Returns:
+        np.ndarray: (group_count, 168) dakika matrisi
+    """
+    if len(codes) == 0:
+        return np.zeros((group_count, HOURS_PER_WEEK))
+
+    end_seconds = np.maximum(end_seconds, start_seconds)
+    first_hour = (start_seconds // 3600).astype(np.int64)
+    last_hour = (end_seconds // 3600).astype(np.int64)
+    codes = codes.astype(np.int64)
+    flat_size = group_count * HOURS_PER_WEEK
+
+    same_hour = first_hour == last_hour
+    # İlk saatteki kısmi süre (tek saatlik kayıtlarda tüm süre)
+    first_minutes = np.where(
+        same_hour,
+        end_seconds - start_seconds,
+        (first_hour + 1) * 3600 - start_seconds
+    ) / 60
+    # Son saatteki kısmi süre
+    last_minutes = np.where(same_hour, 0, end_seconds - last_hour * 3600) / 60
+
+    # Kısmi saatler doğrudan haftanın saatine katlanarak toplanır
+    base = codes * HOURS_PER_WEEK
+    minutes = np.bincount(base + first_hour % HOURS_PER_WEEK, weights=first_minutes, minlength=flat_size)
+    minutes += np.bincount(base + last_hour % HOURS_PER_WEEK, weights=last_minutes, minlength=flat_size)
+    minutes = minutes.reshape(group_count, HOURS_PER_WEEK)
+
+    # Aradaki tam saatler: tam haftalar grubun her dilimine 60 dakika ekler
+    full_hours = np.maximum(last_hour - first_hour - 1, 0)
+    full_weeks, remainder = np.divmod(full_hours, HOURS_PER_WEEK)
+    minutes += 60.0 * np.bincount(codes, weights=full_weeks, minlength=group_count)[:, None]
+
+    # Kalan saatler haftanın saati üzerinde dairesel aralıktır; grup başına
+    # 169 uzunluklu fark dizisine yazılır, haftayı aşan kısım başa sarar
+    rows = remainder > 0
+    diff_base = codes[rows] * (HOURS_PER_WEEK + 1)
+    begin = (first_hour[rows] + 1) % HOURS_PER_WEEK
+    stop = begin + remainder[rows]
+    wraps = stop > HOURS_PER_WEEK
+    diff_size = group_count * (HOURS_PER_WEEK + 1)
+    diff = np.bincount(diff_base + begin, minlength=diff_size)
+    diff -= np.bincount(diff_base + np.minimum(stop, HOURS_PER_WEEK), minlength=diff_size)
+    diff += np.bincount(diff_base[wraps], minlength=diff_size)
+    diff -= np.bincount(diff_base[wraps] + stop[wraps] - HOURS_PER_WEEK, minlength=diff_size)
+    diff = diff.reshape(group_count, HOURS_PER_WEEK + 1)
+    minutes += 60.0 * np.cumsum(diff, axis=1)[:, :HOURS_PER_WEEK]
+
+    return minutes
+
+
+def compute_heatmaps(
+    df: pd.DataFrame,
+    weeks: Optional[List[int]] = None,
+    machine_column: str = "İş Merkezi Kodu "
+) -> Dict[str, pd.DataFrame]:
+    """
+    Tezgah ve kısım bazında haftanın saatlerine göre duruş dakikalarını hesaplar.
+
+    ÇALIŞMA SÜRESİ kayıtları duruş sayılmaz.
+
+    Args:
+        df: İşlenmiş duruş verisi
+        weeks: Hesaba katılacak yıl-hafta anahtarları (None ise tüm veri)
+        machine_column: Tezgah kodu sütunu
+
+    Returns:
+        Dict[str, pd.DataFrame]: 'tezgah' (KISIM, tezgah çok düzeyli indeksli)
+            ve 'kisim' (KISIM indeksli) tabloları; sütunlar 0..167 saat dilimleri
+    """
+    columns = pd.RangeIndex(HOURS_PER_WEEK, name="Haftanın Saati")
+    mask = df["Duruş Adı"] != "ÇALIŞMA SÜRESİ"
+    if weeks is not None:
+        mask &= np.isin(week_keys(df), weeks)
+    df = df.loc[mask, ["KISIM", machine_column, "Duruş Başlangıç Tarih", "Duruş Bitiş Tarih"]]
+
+    if df.empty:
+        return {
+            "tezgah": pd.DataFrame(
+                columns=columns,
+                index=pd.MultiIndex.from_arrays([[], []], names=["KISIM", machine_column])
+            ),
+            "kisim": pd.DataFrame(columns=columns, index=pd.Index([], name="KISIM")),
+        }
+
+    start = pd.to_datetime(df["Duruş Başlangıç Tarih"])
+    end = pd.to_datetime(df["Duruş Bitiş Tarih"])
+    origin = week_origin(start)
+
+    # Tezgah grupları (her tezgahın ilk kaydındaki kısımla)
+    codes, uniques = pd.factorize(df[machine_column], sort=True)
+    first_rows = np.unique(codes, return_index=True)[1]
+
+    matrix = hour_of_week_minutes(
+        codes,
+        (start - origin).dt.total_seconds().to_numpy(),
+        (end - origin).dt.total_seconds().to_numpy(),
+        len(uniques)
+    )
+
+    index = pd.MultiIndex.from_arrays(
+        [df["KISIM"].iloc[first_rows].astype(str).to_numpy(), np.asarray(uniques).astype(str)],
+        names=["KISIM", machine_column]
+    )
+    tezgah = pd.DataFrame(matrix, index=index, columns=columns).sort_index()
+    kisim = tezgah.groupby(level="KISIM").sum()
+
+    logger.info(f"Haftanın saatlerine göre duruş dağılımı hesaplandı: {len(df)} duruş, {len(uniques)} tezgah")
+    return {"tezgah": tezgah, "kisim": kisim}
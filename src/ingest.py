@@ -0,0 +1,350 @@
+"""
+Haftalık dışa aktarımların işlenmiş veri deposuna artımlı olarak eklenmesi.
+
+Her tezgah için depoya yazılmış en büyük 'Duruş Başlangıç Tarih' değeri
+(su seviyesi) saklanır. Yeni bir dışa aktarım geldiğinde yalnızca su
+seviyesinden sonraki satırlar işlenir; su seviyesiyle aynı andaki satırlar
+kayıt anahtarıyla depodaki kayıtlara karşı tekilleştirilir. Haftalık özet
+tablosu yalnızca veri eklenen haftalar için yeniden hesaplanır; haftalık
+trendler, anomaliler ve sıra değişimleri satır verisi yerine bu özetten
+hesaplanır.
+
+Depo dizinindeki '_' ile başlayan dosyalar Parquet veri setinin parçası
+sayılmaz; su seviyeleri ve haftalık özet bu adlarla saklanır.
+"""
+
+import os
+import json
+from typing import Dict, List, Tuple, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src import storage
+from src.data_processing import (
+    DURUS_COLUMNS,
+    build_analysis_frame,
+    kisim_machine_counts,
+    apply_compact_schema,
+    week_keys
+)
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Depo içindeki yardımcı dosyalar
+WATERMARK_FILE = "_watermarks.json"
+AGGREGATE_FILE = "_haftalik_ozet.parquet"
+
+# Bir duruş kaydını tekil olarak tanımlayan sütunlar
+RECORD_KEY = ["İş Merkezi Kodu ", "Duruş Adı", "Duruş Başlangıç Tarih", "Duruş Bitiş Tarih"]
+
+# Haftalık özet tablosunun gruplama sütunları
+AGGREGATE_KEYS = ["Yıl", "Hafta", "KISIM", "İş Merkezi Kodu ", "Duruş Adı"]
+
+
+def load_watermarks(store_path: str = storage.DEFAULT_STORE_PATH) -> Dict[str, pd.Timestamp]:
+    """
+    Tezgah bazında su seviyelerini okur.
+
+    Args:
+        store_path: Depo dizini
+
+    Returns:
+        Dict[str, pd.Timestamp]: Tezgah kodu -> depodaki en büyük başlangıç tarihi
+    """
+    file_path = os.path.join(store_path, WATERMARK_FILE)
+    if not os.path.exists(file_path):
+        return {}
+    with open(file_path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    return {code: pd.Timestamp(value) for code, value in raw.items()}
+
+
+def save_watermarks(watermarks: Dict[str, pd.Timestamp], store_path: str = storage.DEFAULT_STORE_PATH) -> str:
+    """
+    Tezgah bazında su seviyelerini yazar.
+
+    Args:
+        watermarks: Tezgah kodu -> en büyük başlangıç tarihi
+        store_path: Depo dizini
+
+    Returns:
+        str: Yazılan dosya yolu
+    """
+    os.makedirs(store_path, exist_ok=True)
+    file_path = os.path.join(store_path, WATERMARK_FILE)
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {code: value.isoformat() for code, value in sorted(watermarks.items())},
+            f, ensure_ascii=False, indent=2
+        )
+    return file_path
+
+
+def advance_watermarks(watermarks: Dict[str, pd.Timestamp], df: pd.DataFrame) -> Dict[str, pd.Timestamp]:
+    """
+    İşlenmiş verideki en büyük başlangıç tarihleriyle su seviyelerini ilerletir.
+
+    Args:
+        watermarks: Mevcut su seviyeleri
+        df: Depoya yazılan işlenmiş veri
+
+    Returns:
+        Dict[str, pd.Timestamp]: Güncellenmiş su seviyeleri
+    """
+    updated = dict(watermarks)
+    if df.empty:
+        return updated
+    latest = df.groupby("İş Merkezi Kodu ", observed=True)["Duruş Başlangıç Tarih"].max()
+    for code, value in latest.items():
+        code = str(code)
+        if code not in updated or value > updated[code]:
+            updated[code] = value
+    return updated
+
+
+def _record_keys(durus_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Ham duruş verisinden normalize edilmiş kayıt anahtarlarını oluşturur.
+    """
+    return pd.DataFrame({
+        "İş Merkezi Kodu ": durus_df["İş Merkezi Kodu "].astype(str).str.strip(),
+        "Duruş Adı": durus_df["Duruş Adı"].astype(str),
+        "Duruş Başlangıç Tarih": pd.to_datetime(durus_df["Duruş Başlangıç Tarih"]),
+        "Duruş Bitiş Tarih": pd.to_datetime(durus_df["Duruş Bitiş Tarih"]),
+    }, index=durus_df.index)
+
+
+def select_new_rows(
+    durus_df: pd.DataFrame,
+    watermarks: Dict[str, pd.Timestamp],
+    store_path: str = storage.DEFAULT_STORE_PATH
+) -> pd.DataFrame:
+    """
+    Ham duruş verisinden depoda bulunmayan satırları seçer.
+
+    Su seviyesinden sonra başlayan satırlar yeni kabul edilir. Su seviyesiyle
+    aynı anda başlayan satırlar, yalnızca o haftanın bölümündeki kayıt
+    anahtarlarıyla karşılaştırılır. Seçilen satırlar kendi içinde de kayıt
+    anahtarına göre tekilleştirilir.
+
+    Args:
+        durus_df: Ham duruş verisi
+        watermarks: Tezgah bazında su seviyeleri
+        store_path: Depo dizini
+
+    Returns:
+        pd.DataFrame: Yeni ham satırlar
+    """
+    raw = durus_df[DURUS_COLUMNS].dropna()
+    keys = _record_keys(raw)
+
+    watermark = pd.to_datetime(keys["İş Merkezi Kodu "].map(watermarks))
+    start = keys["Duruş Başlangıç Tarih"]
+    boundary = start == watermark
+    candidates = watermark.isna() | (start > watermark) | boundary
+
+    keys = keys[candidates].drop_duplicates()
+    boundary = boundary[keys.index]
+
+    # Su seviyesindeki satırları depodaki kayıtlarla karşılaştır
+    if boundary.any():
+        takvim = keys.loc[boundary, "Duruş Başlangıç Tarih"].dt.isocalendar()
+        partitions = sorted(set(zip(takvim.year.astype(int), takvim.week.astype(int))))
+        partitions = [p for p in partitions if p in set(storage.list_partitions(store_path))]
+        if partitions:
+            stored = storage.read_partitions(store_path, partitions, columns=RECORD_KEY)
+            stored = stored.astype({"İş Merkezi Kodu ": str, "Duruş Adı": str}).drop_duplicates()
+            matched = keys[boundary].reset_index().merge(stored, on=RECORD_KEY, how="inner")["index"]
+            keys = keys.drop(index=matched)
+
+    logger.info(f"Yeni kayıt seçimi: {len(raw)} satırdan {len(keys)} yeni satır")
+    return raw.loc[keys.index]
+
+
+def update_weekly_aggregates(
+    partitions: List[Tuple[int, int]],
+    store_path: str = storage.DEFAULT_STORE_PATH
+) -> pd.DataFrame:
+    """
+    Haftalık özet tablosunu yalnızca verilen bölümler için yeniden hesaplar.
+
+    Özet, (yıl, hafta, kısım, tezgah, duruş adı) bazında toplam süre ve duruş
+    sayısını içerir. Diğer haftaların satırları olduğu gibi korunur.
+
+    Args:
+        partitions: Güncellenecek (yıl, hafta) bölümleri
+        store_path: Depo dizini
+
+    Returns:
+        pd.DataFrame: Güncel haftalık özet tablosu
+    """
+    existing = read_weekly_aggregates(store_path)
+    if not partitions:
+        return existing
+
+    data = storage.read_partitions(store_path, partitions, columns=AGGREGATE_KEYS + ["Süre (Saniye)"])
+    delta = (
+        data.groupby(AGGREGATE_KEYS, observed=True)["Süre (Saniye)"]
+        .agg(["sum", "size"])
+        .rename(columns={"sum": "Süre (Saniye)", "size": "Duruş Sayısı"})
+        .reset_index()
+    )
+    delta["Süre (Dakika)"] = delta["Süre (Saniye)"] // 60
+
+    if not existing.empty:
+        guncellenen = pd.MultiIndex.from_tuples(partitions, names=["Yıl", "Hafta"])
+        korunan = ~pd.MultiIndex.from_frame(existing[["Yıl", "Hafta"]]).isin(guncellenen)
+        delta = pd.concat([existing[korunan], delta], ignore_index=True)
+
+    ozet = apply_compact_schema(
+        delta.sort_values(AGGREGATE_KEYS).reset_index(drop=True)
+    )
+    ozet.to_parquet(os.path.join(store_path, AGGREGATE_FILE), index=False)
+    logger.info(f"Haftalık özet güncellendi: {len(partitions)} hafta, toplam {len(ozet)} satır")
+    return ozet
+
+
+def read_weekly_aggregates(store_path: str = storage.DEFAULT_STORE_PATH) -> pd.DataFrame:
+    """
+    Haftalık özet tablosunu okur.
+
+    Args:
+        store_path: Depo dizini
+
+    Returns:
+        pd.DataFrame: Haftalık özet (yoksa boş tablo)
+    """
+    file_path = os.path.join(store_path, AGGREGATE_FILE)
+    if not os.path.exists(file_path):
+        return pd.DataFrame(columns=AGGREGATE_KEYS + ["Süre (Saniye)", "Duruş Sayısı", "Süre (Dakika)"])
+    return apply_compact_schema(pd.read_parquet(file_path))
+
+
+def weekly_aggregate_frame(
+    weeks: List[int],
+    arizali_tezgahlar: Optional[List[str]] = None,
+    store_path: str = storage.DEFAULT_STORE_PATH
+) -> pd.DataFrame:
+    """
+    Haftalık özetin analiz haftalarına ait satırlarını döndürür.
+
+    Özet, işlenmiş veriyle aynı sütun adlarını taşıdığından yalnızca grup,
+    duruş adı ve hafta bazında toplam süre kullanan aşamalara (trendler,
+    anomaliler, sıra değişimleri) doğrudan verilebilir.
+
+    Args:
+        weeks: Yıl-hafta anahtarları
+        arizali_tezgahlar: Hariç tutulacak arızalı tezgah kodları
+        store_path: Depo dizini
+
+    Returns:
+        pd.DataFrame: Haftalık özet satırları
+    """
+    ozet = read_weekly_aggregates(store_path)
+    if ozet.empty:
+        return ozet
+    mask = np.isin(week_keys(ozet), weeks)
+    arizali = set(arizali_tezgahlar or [])
+    if arizali:
+        mask &= ~ozet["İş Merkezi Kodu "].isin(arizali).to_numpy()
+    return ozet[mask].reset_index(drop=True)
+
+
+def store_frame(df: pd.DataFrame, store_path: str = storage.DEFAULT_STORE_PATH) -> Dict:
+    """
+    Tüm dışa aktarımdan hazırlanan veriyi depoya yazar; tablodaki haftaların
+    bölümleri değiştirilir, su seviyeleri ve haftalık özet güncellenir.
+
+    Args:
+        df: İşlenmiş veri
+        store_path: Depo dizini
+
+    Returns:
+        Dict: Yazılan bölümler ve satır sayısı
+    """
+    partitions = storage.write_partitions(df, store_path)
+    save_watermarks(advance_watermarks(load_watermarks(store_path), df), store_path)
+    update_weekly_aggregates(partitions, store_path)
+    return {"rows": len(df), "partitions": partitions}
+
+
+def ingest_incremental(
+    durus_df: pd.DataFrame,
+    calisma_df: Optional[pd.DataFrame] = None,
+    arizali_tezgahlar: Optional[List[str]] = None,
+    store_path: str = storage.DEFAULT_STORE_PATH
+) -> Dict:
+    """
+    Ham dışa aktarımdaki yeni satırları işleyip depoya ekler.
+
+    Args:
+        durus_df: Ham duruş verisi
+        calisma_df: Ham çalışma süresi verisi
+        arizali_tezgahlar: Arızalı tezgah kodları
+        store_path: Depo dizini
+
+    Returns:
+        Dict: Okunan, yeni ve eklenen satır sayıları ile güncellenen bölümler
+    """
+    watermarks = load_watermarks(store_path)
+
+    # Arızalı tezgahların satırları depoya yazılmaz; su seviyeleri ilerlemediği
+    # için seçimden önce çıkarılır
+    arizali = set(arizali_tezgahlar or [])
+    if arizali:
+        durus_df = durus_df[~durus_df["İş Merkezi Kodu "].astype(str).str.strip().isin(arizali)]
+    new_rows = select_new_rows(durus_df, watermarks, store_path)
+
+    result = {"rows_read": len(durus_df), "rows_new": len(new_rows), "rows_stored": 0, "partitions": []}
+    if new_rows.empty:
+        logger.info("Artımlı aktarım: depoda olmayan yeni satır bulunamadı.")
+        return result
+
+    delta, _, _ = build_analysis_frame(new_rows, calisma_df, arizali_tezgahlar)
+    partitions = storage.append_partitions(delta, store_path)
+    save_watermarks(advance_watermarks(watermarks, delta), store_path)
+    update_weekly_aggregates(partitions, store_path)
+
+    result.update({"rows_stored": len(delta), "partitions": partitions})
+    logger.info(
+        f"Artımlı aktarım tamamlandı: {len(new_rows)} yeni satır, "
+        f"{len(delta)} satır {len(partitions)} haftaya eklendi"
+    )
+    return result
+
+
+def load_export_frame(
+    durus_df: pd.DataFrame,
+    arizali_tezgahlar: Optional[List[str]] = None,
+    store_path: str = storage.DEFAULT_STORE_PATH
+) -> Tuple[pd.DataFrame, Dict, List[int]]:
+    """
+    Dışa aktarımın kapsadığı haftaları depodan okur.
+
+    build_analysis_frame ile aynı biçimde (veri, kısım-tezgah sayıları,
+    hafta listesi) döndürür; satırlar yeniden işlenmez.
+
+    Args:
+        durus_df: Ham duruş verisi (yalnızca tarih aralığı için kullanılır)
+        arizali_tezgahlar: Arızalı tezgah kodları
+        store_path: Depo dizini
+
+    Returns:
+        Tuple[pd.DataFrame, Dict, List[int]]: İşlenmiş veri, kısım-tezgah sayıları ve
+            sıralı yıl-hafta anahtarları
+    """
+    start = pd.to_datetime(durus_df["Duruş Başlangıç Tarih"]).dropna()
+    takvim = start.dt.isocalendar()
+    export_partitions = set(zip(takvim.year.astype(int), takvim.week.astype(int)))
+    partitions = [p for p in storage.list_partitions(store_path) if p in export_partitions]
+
+    df = storage.read_partitions(store_path, partitions)
+    arizali = set(arizali_tezgahlar or [])
+    if arizali and not df.empty:
+        df = df[~df["İş Merkezi Kodu "].isin(arizali)].reset_index(drop=True)
+
+    weeks = sorted(int(w) for w in np.unique(week_keys(df))) if not df.empty else []
+    return df, kisim_machine_counts(arizali), weeks
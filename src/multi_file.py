@@ -0,0 +1,285 @@
+"""
+Birden fazla dışa aktarım dosyasının (dizin veya glob deseni) paralel okunması.
+
+MES dışa aktarımları haftalık veya kısım bazında ayrı dosyalar halinde
+gelir. Bu modül dosya listesini çözer, dosyaları bir süreç havuzunda eş
+zamanlı ayrıştırır (xlsx ayrıştırma CPU yoğun olduğundan iş parçacığı
+yerine süreç kullanılır; dosyalar src.readers arka uçlarıyla okunur),
+dosyalar arasında sütun tutarlılığını kontrol eder ve sonuçları tek bir
+birleştirme işlemiyle tek tabloda toplar. Süreçler okudukları tabloları
+pickle ile geri göndermek yerine paylaşımlı Arrow IPC dosyalarına yazar;
+ana süreç bunları bellek eşlemeli olarak açar.
+
+Okuma analiz iş parçacığından (QThread) başlatıldığından havuz, grafik
+havuzunda olduğu gibi 'spawn' bağlamıyla oluşturulur; fork ile kopyalanan
+Qt ve kilit durumları çalışan süreçleri kilitleyebilir.
+"""
+
+import os
+import glob
+import multiprocessing
+import time
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Tuple, Optional, Sequence, Union
+import logging
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from src.readers import read_table, file_patterns
+from src import shared_frames
+from src.shared_frames import SharedFrameStore, open_frame, write_frame
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Dizin verildiğinde aranan dosya desenleri (kurulu okuyucuların desteklediği uzantılar)
+SOURCE_PATTERNS = tuple(file_patterns())
+
+# Glob deseni olduğunu gösteren karakterler
+_GLOB_CHARS = set("*?[")
+
+
+def is_multi_source(source: Union[str, Sequence[str]]) -> bool:
+    """
+    Kaynağın birden fazla dosyayı (dizin, glob deseni veya liste) ifade edip
+    etmediğini döndürür.
+
+    Args:
+        source: Dosya yolu, dizin, glob deseni veya dosya listesi
+
+    Returns:
+        bool: Çoklu kaynaksa True
+    """
+    if not isinstance(source, str):
+        return True
+    return os.path.isdir(source) or bool(_GLOB_CHARS & set(source))
+
+
+def resolve_sources(
+    source: Union[str, Sequence[str]],
+    patterns: Sequence[str] = SOURCE_PATTERNS
+) -> List[str]:
+    """
+    Dosya, dizin, glob deseni veya bunların listesini sıralı dosya listesine çevirir.
+
+    Excel'in açık dosyalar için oluşturduğu '~$' ile başlayan kilit dosyaları atlanır.
+
+    Args:
+        source: Dosya yolu, dizin, glob deseni veya bunların listesi
+        patterns: Dizin verildiğinde aranacak dosya desenleri
+
+    Returns:
+        List[str]: Dosya yolları (tekrarsız, sıralı)
+    """
+    items = [source] if isinstance(source, str) else list(source)
+
+    files = []
+    for item in items:
+        if os.path.isdir(item):
+            matches = [f for pattern in patterns for f in glob.glob(os.path.join(item, pattern))]
+        elif _GLOB_CHARS & set(item):
+            matches = glob.glob(item)
+        else:
+            matches = [item] if os.path.isfile(item) else []
+        files.extend(sorted(f for f in matches if not os.path.basename(f).startswith("~$")))
+
+    # Sırayı koruyarak tekrarları çıkar
+    return list(dict.fromkeys(files))
+
+
+def parse_file(file_path: str, columns: Sequence[str], share_dir: Optional[str] = None) -> Dict:
+    """
+    Tek bir dosyayı okur. Süreç havuzunda çalıştırıldığı için modül düzeyindedir
+    ve hata yükseltmek yerine hatayı sonuç sözlüğünde döndürür.
+
+    share_dir verilirse tablo bu dizine Arrow IPC dosyası olarak yazılır ve
+    sonuçta tablo yerine dosyanın tanıtıcısı döner.
+
+    Args:
+        file_path: Dosya yolu
+        columns: Okunacak sütunlar
+        share_dir: Paylaşımlı tablo dizini
+
+    Returns:
+        Dict: 'file', 'data', 'handle', 'rows', 'seconds' ve 'error' anahtarları
+    """
+    start = time.perf_counter()
+    try:
+        df = read_table(file_path, columns)
+        handle = None
+        if share_dir is not None:
+            fd, path = tempfile.mkstemp(suffix=shared_frames.IPC_EXTENSION, dir=share_dir)
+            os.close(fd)
+            handle = write_frame(df, path)
+            df = None
+        return {
+            "file": file_path,
+            "data": df,
+            "handle": handle,
+            "rows": len(df) if df is not None else shared_frames.open_table(handle).num_rows,
+            "seconds": time.perf_counter() - start,
+            "error": None
+        }
+    except Exception as e:
+        return {
+            "file": file_path,
+            "data": None,
+            "handle": None,
+            "rows": 0,
+            "seconds": time.perf_counter() - start,
+            "error": str(e)
+        }
+
+
+def check_consistency(results: List[Dict], columns: Sequence[str]) -> Tuple[List[str], List[str]]:
+    """
+    Dosyalar arasında sütun tutarlılığını kontrol eder.
+
+    Okunamayan veya gerekli sütunları eksik dosyalar hata, aynı sütunun
+    dosyalarda farklı tiplerle okunması uyarı olarak raporlanır.
+
+    Args:
+        results: parse_file sonuçları
+        columns: Beklenen sütunlar
+
+    Returns:
+        Tuple[List[str], List[str]]: Hata ve uyarı mesajları
+    """
+    errors = []
+    warnings = []
+
+    for result in results:
+        name = os.path.basename(result["file"])
+        if result["error"] is not None:
+            errors.append(f"{name}: {result['error']}")
+
+    if errors:
+        return errors, warnings
+
+    for col in columns:
+        dtypes = {}
+        for result in results:
+            if result["rows"] > 0:
+                dtypes.setdefault(str(result["data"][col].dtype), []).append(os.path.basename(result["file"]))
+        if len(dtypes) > 1:
+            detay = "; ".join(f"{dtype}: {', '.join(files)}" for dtype, files in dtypes.items())
+            warnings.append(f"'{col}' sütunu dosyalarda farklı tiplerde okundu ({detay})")
+
+    return errors, warnings
+
+
+def _combine(results: List[Dict], columns: Sequence[str]) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Dosya sonuçlarını tutarlılık kontrolünden geçirip tek tabloda birleştirir.
+    """
+    errors, warnings = check_consistency(results, columns)
+    for warning in warnings:
+        logger.warning(warning)
+    if errors:
+        raise ValueError("Dosyalar birleştirilemedi:\n" + "\n".join(errors))
+
+    # Sütun başına tek birleştirme: sonuç bir kez ayrılır. Dosyalar kendi
+    # kategori sözlükleriyle okunduğundan kategorik sütunlar sözlükleri
+    # birleştirilerek eklenir; düz concat farklı sözlüklerde nesne tipine döner.
+    data = {}
+    for col in columns:
+        parts = [r["data"][col] for r in results]
+        if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            data[col] = union_categoricals(parts, sort_categories=True, ignore_order=True)
+        else:
+            data[col] = pd.concat(parts, ignore_index=True)
+    df = pd.DataFrame(data, columns=list(columns))
+    return df, warnings
+
+
+def load_files(
+    files: Sequence[str],
+    columns: Sequence[str],
+    max_workers: Optional[int] = None
+) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Dosyaları paralel okuyup tek tabloda birleştirir.
+
+    Tek dosya veya tek çalışan için süreç havuzu açılmaz.
+
+    Args:
+        files: Dosya yolları
+        columns: Okunacak sütunlar (tablo bu sırayla döndürülür)
+        max_workers: En fazla süreç sayısı (None ise işlemci sayısı)
+
+    Returns:
+        Tuple[pd.DataFrame, Dict]: Birleştirilmiş veri ve dosya bazında rapor
+
+    Raises:
+        ValueError: Dosya bulunamazsa, okunamazsa veya sütunlar eksikse
+    """
+    if not files:
+        raise ValueError("Okunacak dosya bulunamadı.")
+
+    workers = min(len(files), max_workers or os.cpu_count() or 1)
+    start = time.perf_counter()
+
+    if workers > 1:
+        # Süreçler tabloları paylaşımlı dizine yazar; birleştirme sonrası dizin silinir
+        store = SharedFrameStore() if shared_frames.is_available() else None
+        results = []
+        try:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                results = list(executor.map(
+                    parse_file, files, repeat(list(columns)), repeat(store.path if store else None)
+                ))
+            for r in results:
+                if r["handle"] is not None:
+                    r["data"] = open_frame(r["handle"])
+            df, warnings = _combine(results, columns)
+        finally:
+            if store is not None:
+                # Eşlenmiş tablolara başvurular bırakılıp dizin silinir
+                for r in results:
+                    r["data"] = None
+                store.close()
+    else:
+        results = [parse_file(f, columns) for f in files]
+        df, warnings = _combine(results, columns)
+
+    report = {
+        "files": [
+            {"file": r["file"], "rows": r["rows"], "seconds": r["seconds"]}
+            for r in results
+        ],
+        "total_rows": len(df),
+        "wall_seconds": time.perf_counter() - start,
+        "workers": workers,
+        "warnings": warnings
+    }
+    logger.info(
+        f"{len(files)} dosya {workers} süreçle {report['wall_seconds']:.2f} saniyede okundu. "
+        f"Toplam satır: {len(df)}"
+    )
+    return df, report
+
+
+def format_report(report: Dict) -> str:
+    """
+    Dosya bazında okuma raporunu metne çevirir.
+
+    Args:
+        report: load_files raporu
+
+    Returns:
+        str: Her dosya için satır sayısı ve okuma süresini içeren metin
+    """
+    lines = [
+        f"  {os.path.basename(f['file'])}: {f['rows']} satır, {f['seconds']:.2f} sn"
+        for f in report["files"]
+    ]
+    lines.append(
+        f"Toplam: {len(report['files'])} dosya, {report['total_rows']} satır, "
+        f"{report['wall_seconds']:.2f} sn ({report['workers']} süreç)"
+    )
+    lines.extend(f"Uyarı: {w}" for w in report["warnings"])
+    return "\n".join(lines)
@@ -0,0 +1,269 @@
+"""
+Tezgah x dakika doluluk bit haritası ve kullanım göstergeleri.
+
+Duruş aralıkları dakika çözünürlüğünde bir zaman eksenine yerleştirilir ve
+her tezgah için "bu dakikada duruşta mı" bilgisini tutan bir bit dizisine
+çevrilir (np.packbits; bir hafta tezgah başına 10.080 bit = 1.260 bayt).
+Aynı tezgahın çakışan duruşları aynı bitleri işaretlediğinden bir kez
+sayılır.
+
+Bit dizileri üzerinde birleşim (herhangi bir tezgah duruşta), kesişim (tüm
+tezgahlar duruşta) ve bit sayımı bayt düzeyinde vektörel işlemlerle yapılır.
+Eş zamanlı duruşta olan tezgah sayısı ise yalnızca istenen tezgahların
+satırları açılarak dakika bazında toplanır.
+"""
+
+from typing import Dict, List, Optional, Sequence
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing import week_keys
+from src.heatmap import HOURS_PER_WEEK, week_origin
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Haftadaki dakika sayısı
+MINUTES_PER_WEEK = HOURS_PER_WEEK * 60
+
+# Bit haritası oluşturulurken aynı anda işlenen tezgah sayısı (fark dizisi belleğini sınırlar)
+BUILD_CHUNK = 32
+
+# Bayt başına işaretli bit sayısı
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(packed: np.ndarray, axis: Optional[int] = None) -> np.ndarray:
+    """
+    Paketlenmiş bit dizisindeki işaretli bit sayısını döndürür.
+
+    Args:
+        packed: np.packbits çıktısı (uint8)
+        axis: Toplama ekseni (None ise tümü)
+
+    Returns:
+        np.ndarray: Bit sayısı
+    """
+    return _POPCOUNT[packed].sum(axis=axis, dtype=np.int64)
+
+
+class OccupancyBitmap:
+    """
+    Tezgahların dakika bazında duruş durumunu tutan bit haritası.
+
+    bits[i] i. tezgahın paketlenmiş dakika dizisidir; j. bit, zaman ekseninin
+    başlangıcından (origin) j dakika sonrasını gösterir.
+    """
+
+    def __init__(
+        self,
+        bits: np.ndarray,
+        machines: Sequence[str],
+        kisim: Sequence[str],
+        origin: pd.Timestamp,
+        minutes: int
+    ):
+        """
+        Bit haritasını oluştur.
+
+        Args:
+            bits: (tezgah sayısı, ceil(dakika / 8)) uint8 dizisi
+            machines: Tezgah kodları (satır sırasıyla)
+            kisim: Tezgahların kısımları
+            origin: Zaman ekseninin başlangıcı
+            minutes: Zaman eksenindeki dakika sayısı
+        """
+        self.bits = bits
+        self.machines = pd.Index(machines, name="İş Merkezi Kodu ")
+        self.kisim = np.asarray(kisim)
+        self.origin = origin
+        self.minutes = minutes
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        weeks: Optional[List[int]] = None,
+        machine_column: str = "İş Merkezi Kodu "
+    ) -> "OccupancyBitmap":
+        """
+        Duruş kayıtlarından bit haritası oluşturur.
+
+        Zaman ekseni ilk duruşun haftasının pazartesi 00:00'ından son duruşun
+        başladığı haftanın sonuna kadardır; bu aralığın dışına taşan süreler
+        kırpılır. Başlangıç ve bitiş en yakın dakikaya yuvarlanır.
+        ÇALIŞMA SÜRESİ kayıtları duruş sayılmaz.
+
+        Args:
+            df: İşlenmiş duruş verisi
+            weeks: Hesaba katılacak yıl-hafta anahtarları (None ise tüm veri)
+            machine_column: Tezgah kodu sütunu
+
+        Returns:
+            OccupancyBitmap: Bit haritası
+        """
+        mask = df["Duruş Adı"] != "ÇALIŞMA SÜRESİ"
+        if weeks is not None:
+            mask &= np.isin(week_keys(df), weeks)
+        df = df.loc[mask, ["KISIM", machine_column, "Duruş Başlangıç Tarih", "Duruş Bitiş Tarih"]]
+        if df.empty:
+            return cls(np.zeros((0, 0), dtype=np.uint8), [], [], pd.Timestamp(0), 0)
+
+        start = pd.to_datetime(df["Duruş Başlangıç Tarih"])
+        end = pd.to_datetime(df["Duruş Bitiş Tarih"])
+        origin = week_origin(start)
+        week_count = int((start.max() - origin) / pd.Timedelta(weeks=1)) + 1
+        minutes = week_count * MINUTES_PER_WEEK
+
+        codes, uniques = pd.factorize(df[machine_column], sort=True)
+        first_rows = np.unique(codes, return_index=True)[1]
+        first = np.clip(((start - origin).dt.total_seconds() / 60).round().to_numpy(np.int64), 0, minutes)
+        last = np.clip(((end - origin).dt.total_seconds() / 60).round().to_numpy(np.int64), 0, minutes)
+        valid = last > first
+        codes, first, last = codes[valid], first[valid], last[valid]
+
+        # Tezgah grupları halinde fark dizisi -> birikimli toplam -> bit dizisi
+        machine_count = len(uniques)
+        bits = np.zeros((machine_count, (minutes + 7) // 8), dtype=np.uint8)
+        order = np.argsort(codes, kind="stable")
+        codes, first, last = codes[order], first[order], last[order]
+        bounds = np.searchsorted(codes, np.arange(0, machine_count + BUILD_CHUNK, BUILD_CHUNK))
+        for chunk, (lo, hi) in enumerate(zip(bounds[:-1], bounds[1:])):
+            rows = min(BUILD_CHUNK, machine_count - chunk * BUILD_CHUNK)
+            if rows <= 0:
+                break
+            base = (codes[lo:hi] - chunk * BUILD_CHUNK).astype(np.int64) * (minutes + 1)
+            size = rows * (minutes + 1)
+            diff = np.bincount(base + first[lo:hi], minlength=size)
+            diff -= np.bincount(base + last[lo:hi], minlength=size)
+            active = np.cumsum(diff.reshape(rows, minutes + 1), axis=1)[:, :minutes] > 0
+            bits[chunk * BUILD_CHUNK:chunk * BUILD_CHUNK + rows] = np.packbits(active, axis=1)
+
+        logger.info(
+            f"Doluluk bit haritası oluşturuldu: {machine_count} tezgah x {minutes} dakika "
+            f"({bits.nbytes / 1024:.0f} KB)"
+        )
+        return cls(
+            bits,
+            np.asarray(uniques).astype(str),
+            df["KISIM"].iloc[first_rows].astype(str).to_numpy(),
+            origin,
+            minutes
+        )
+
+    def _rows(self, machines: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Tezgah kodlarını satır indekslerine çevirir (None ise tüm satırlar).
+        """
+        if machines is None:
+            return np.arange(len(self.machines))
+        rows = self.machines.get_indexer(list(machines))
+        return rows[rows >= 0]
+
+    def rows_of_kisim(self, kisim: str) -> List[str]:
+        """
+        Bir kısmın tezgah kodlarını döndürür.
+        """
+        return self.machines[self.kisim == kisim].tolist()
+
+    def union(self, machines: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Tezgahlardan en az birinin duruşta olduğu dakikaların paketlenmiş dizisi.
+        """
+        rows = self._rows(machines)
+        if len(rows) == 0:
+            return np.zeros(self.bits.shape[1], dtype=np.uint8)
+        return np.bitwise_or.reduce(self.bits[rows], axis=0)
+
+    def intersection(self, machines: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Tezgahların tümünün duruşta olduğu dakikaların paketlenmiş dizisi.
+        """
+        rows = self._rows(machines)
+        if len(rows) == 0:
+            return np.zeros(self.bits.shape[1], dtype=np.uint8)
+        return np.bitwise_and.reduce(self.bits[rows], axis=0)
+
+    def stopped_minutes(self) -> pd.Series:
+        """
+        Her tezgahın duruşta geçirdiği dakika sayısı (çakışmalar bir kez sayılır).
+        """
+        return pd.Series(popcount(self.bits, axis=1), index=self.machines, name="Duruş Dakikası")
+
+    def simultaneous_down(self, machines: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Her dakikada duruşta olan tezgah sayısı.
+
+        Args:
+            machines: Tezgah kodları (None ise tümü)
+
+        Returns:
+            np.ndarray: Dakika başına duruştaki tezgah sayısı
+        """
+        rows = self._rows(machines)
+        counts = np.zeros(self.minutes, dtype=np.int32)
+        for lo in range(0, len(rows), BUILD_CHUNK):
+            chunk = np.unpackbits(self.bits[rows[lo:lo + BUILD_CHUNK]], axis=1, count=self.minutes)
+            counts += chunk.sum(axis=0, dtype=np.int32)
+        return counts
+
+    def utilization(self) -> pd.DataFrame:
+        """
+        Tezgah bazında duruş dakikası ve duruş/kullanım oranları.
+
+        Returns:
+            pd.DataFrame: 'İş Merkezi Kodu ', 'KISIM', 'Duruş Dakikası',
+                'Duruş Oranı' ve 'Kullanım Oranı' sütunları
+        """
+        stopped = self.stopped_minutes()
+        ratio = stopped.to_numpy() / self.minutes if self.minutes else np.zeros(len(stopped))
+        return pd.DataFrame({
+            "İş Merkezi Kodu ": self.machines,
+            "KISIM": self.kisim,
+            "Duruş Dakikası": stopped.to_numpy(),
+            "Duruş Oranı": ratio,
+            "Kullanım Oranı": 1 - ratio,
+        }).sort_values("Duruş Oranı", ascending=False).reset_index(drop=True)
+
+    def kisim_metrics(self) -> pd.DataFrame:
+        """
+        Kısım bazında kapsama ve eş zamanlı duruş göstergeleri.
+
+        Returns:
+            pd.DataFrame: Kısım başına tezgah sayısı, ortalama duruş oranı, en az
+                bir / tüm tezgahların duruşta olduğu süre oranı, en fazla eş
+                zamanlı duruştaki tezgah sayısı ve birden fazla tezgahın aynı
+                anda duruşta olduğu dakika sayısı
+        """
+        records = []
+        minutes = self.minutes or 1
+        for kisim in sorted(set(self.kisim)):
+            machines = self.rows_of_kisim(kisim)
+            down = self.simultaneous_down(machines)
+            records.append({
+                "KISIM": kisim,
+                "Tezgah Sayısı": len(machines),
+                "Ortalama Duruş Oranı": down.sum() / (minutes * len(machines)),
+                "En Az Bir Tezgah Duruşta": popcount(self.union(machines)) / minutes,
+                "Tüm Tezgahlar Duruşta": popcount(self.intersection(machines)) / minutes,
+                "En Fazla Eş Zamanlı Duruş": int(down.max()),
+                "Eş Zamanlı Duruş Dakikası": int((down >= 2).sum()),
+            })
+        return pd.DataFrame(records)
+
+
+def compute_occupancy(df: pd.DataFrame, weeks: Optional[List[int]] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Duruş verisinden bit haritasını oluşturup tezgah ve kısım göstergelerini hesaplar.
+
+    Args:
+        df: İşlenmiş duruş verisi
+        weeks: Hesaba katılacak yıl-hafta anahtarları (None ise tüm veri)
+
+    Returns:
+        Dict[str, pd.DataFrame]: 'tezgah' (utilization) ve 'kisim' (kisim_metrics) tabloları
+    """
+    bitmap = OccupancyBitmap.from_frame(df, weeks)
+    return {"tezgah": bitmap.utilization(), "kisim": bitmap.kisim_metrics()}
@@ -0,0 +1,137 @@
+"""
+Çalışma süresi verisinden zaman ağırlıklı OEE hesabı.
+
+Günlük OEE oranlarının düz ortalaması uzun ve kısa çalışan günleri eşit
+sayar. Bu modülde her oran, payı ve paydası toplanabilir olacak şekilde
+kendi süresiyle ağırlıklandırılır:
+
+    Planlı Üretim Süresi = Çalışma Zamanı + Plansız Duruş
+    Kullanılabilirlik    = Σ(Kullanılabilirlik × Planlı Üretim Süresi) / Σ Planlı Üretim Süresi
+    Performans           = Σ(Performans × Çalışma Zamanı) / Σ Çalışma Zamanı
+    Kalite               = Σ(Kalite × Performans × Çalışma Zamanı) / Σ(Performans × Çalışma Zamanı)
+    Oee                  = Σ(Oee × Planlı Üretim Süresi) / Σ Planlı Üretim Süresi
+
+Bu ağırlıklarla toplu değerler de Oee = Kullanılabilirlik × Performans ×
+Kalite eşitliğini korur. Ağırlıklı paylar ve ağırlıklar tezgah × hafta
+düzeyinde tek bir gruplamayla toplanır; kısım ve fabrika tabloları bu küçük
+tablonun yeniden toplanmasıyla elde edilir.
+"""
+
+from typing import Dict, List, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing import MAKINA_KISIM_MAP, OEE_COLUMNS, WEEK_KEY_COLUMN
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Planlı üretim süresi sütunu (Çalışma Zamanı + Plansız Duruş)
+PLANNED_TIME_COLUMN = "Planlı Üretim Süresi"
+
+# Metrik -> ağırlık sütunu
+METRIC_WEIGHTS = {
+    "Oee": PLANNED_TIME_COLUMN,
+    "Kullanılabilirlik": PLANNED_TIME_COLUMN,
+    "Performans": "Çalışma Zamanı",
+    "Kalite": "İdeal Üretim Süresi",
+}
+
+# Tablo seviyesi -> gruplama sütunları
+LEVEL_KEYS = {
+    "tezgah": ["İş Merkezi Kodu ", "KISIM", WEEK_KEY_COLUMN],
+    "kisim": ["KISIM", WEEK_KEY_COLUMN],
+    "genel": [WEEK_KEY_COLUMN],
+}
+
+
+def _weighted_components(calisma_df: pd.DataFrame, arizali_tezgahlar: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Satır bazında ağırlıklı payları ve ağırlıkları hesaplar.
+    """
+    machines = calisma_df["Makina Kodu"].astype(str).str.strip()
+    run_time = pd.to_numeric(calisma_df["Çalışma Zamanı"], errors="coerce").fillna(0).clip(lower=0)
+    unplanned = pd.to_numeric(calisma_df["Plansız Duruş"], errors="coerce").fillna(0).clip(lower=0)
+
+    weights = {
+        PLANNED_TIME_COLUMN: run_time + unplanned,
+        "Çalışma Zamanı": run_time,
+    }
+    performance = pd.to_numeric(calisma_df["Performans"], errors="coerce")
+    weights["İdeal Üretim Süresi"] = (performance * run_time).fillna(0)
+
+    # ISO yıl-hafta anahtarı (Yıl * 100 + Hafta); yıl geçişindeki haftalar karışmaz
+    takvim = pd.to_datetime(calisma_df["Tarih"], errors="coerce").dt.isocalendar()
+    components = pd.DataFrame({
+        "İş Merkezi Kodu ": machines,
+        "KISIM": machines.map(MAKINA_KISIM_MAP).fillna("Diğer"),
+        WEEK_KEY_COLUMN: takvim["year"] * 100 + takvim["week"],
+        **weights,
+    })
+
+    for metric, weight_column in METRIC_WEIGHTS.items():
+        values = pd.to_numeric(calisma_df[metric], errors="coerce")
+        # Eksik oranların ağırlığı paydaya da katılmaz
+        weight = weights[weight_column].where(values.notna(), 0)
+        components[metric] = (values * weight).fillna(0)
+        components[f"{metric} Ağırlığı"] = weight
+
+    components = components.dropna(subset=[WEEK_KEY_COLUMN])
+    if arizali_tezgahlar:
+        components = components[~components["İş Merkezi Kodu "].isin(set(arizali_tezgahlar))]
+    return components.astype({WEEK_KEY_COLUMN: "int64"})
+
+
+def _ratios(sums: pd.DataFrame) -> pd.DataFrame:
+    """
+    Toplanmış paylardan metrikleri hesaplar; ağırlığı sıfır olan metrikler NaN olur.
+    """
+    result = sums[[PLANNED_TIME_COLUMN, "Çalışma Zamanı"]].copy()
+    for metric in METRIC_WEIGHTS:
+        weight = sums[f"{metric} Ağırlığı"].to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result[metric] = np.where(weight > 0, sums[metric].to_numpy(dtype=np.float64) / weight, np.nan)
+    return result[OEE_COLUMNS + [PLANNED_TIME_COLUMN, "Çalışma Zamanı"]].reset_index()
+
+
+def compute_oee_tables(
+    calisma_df: pd.DataFrame,
+    arizali_tezgahlar: Optional[List[str]] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Tezgah × hafta, kısım × hafta ve fabrika × hafta zaman ağırlıklı OEE tablolarını hesaplar.
+
+    Args:
+        calisma_df: Ham çalışma süresi verisi
+        arizali_tezgahlar: Hesaba katılmayacak arızalı tezgah kodları
+
+    Returns:
+        Dict[str, pd.DataFrame]: 'tezgah', 'kisim' ve 'genel' tabloları; her biri
+            gruplama sütunları, OEE_COLUMNS, planlı üretim süresi ve çalışma
+            zamanı sütunlarını içerir
+    """
+    if calisma_df is None or calisma_df.empty:
+        return {
+            level: pd.DataFrame(columns=keys + OEE_COLUMNS + [PLANNED_TIME_COLUMN, "Çalışma Zamanı"])
+            for level, keys in LEVEL_KEYS.items()
+        }
+
+    components = _weighted_components(calisma_df, arizali_tezgahlar)
+    value_columns = [c for c in components.columns if c not in LEVEL_KEYS["tezgah"]]
+
+    # Tek gruplama: tezgah × hafta toplamları
+    machine_sums = components.groupby(LEVEL_KEYS["tezgah"], sort=True)[value_columns].sum()
+
+    tables = {"tezgah": _ratios(machine_sums)}
+    for level in ("kisim", "genel"):
+        # Üst seviyeler tezgah × hafta toplamlarından yeniden toplanır
+        sums = machine_sums.groupby(level=LEVEL_KEYS[level], sort=True).sum()
+        tables[level] = _ratios(sums)
+
+    logger.info(
+        f"Zaman ağırlıklı OEE hesaplandı: {len(tables['tezgah'])} tezgah-hafta, "
+        f"{len(tables['kisim'])} kısım-hafta, {len(tables['genel'])} hafta"
+    )
+    return tables
@@ -0,0 +1,143 @@
+"""
+Grafiklerin süreç havuzunda paylaşımlı tablolar üzerinden çizilmesi.
+
+Grafik görevleri tabloları değil, SharedFrameStore tanıtıcılarını alır; her
+çalışan süreç ihtiyaç duyduğu sütunları bellek eşlemeli olarak açar.
+Süreçlere yalnızca grafiklerin çizildiği özet tablolar (tezgah x duruş adı
+süreleri ve OEE tabloları) paylaşılır; satır düzeyindeki analiz tablosu
+süreçlere hiç gönderilmez. Böylece her görev tabloyu kendi argümanı olarak
+pickle ile taşımaz ve tek bir kopya tüm süreçlerce okunur.
+
+Qt iş parçacığından fork ile süreç oluşturmak kilitlenmelere yol açabildiği
+için havuz 'spawn' bağlamıyla başlatılır. Çalışan süreçler grafikleri yalnızca
+dosyaya kaydeder; ekranda gösterim ana süreçte yapılmalıdır.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import logging
+
+import matplotlib
+
+from src.shared_frames import open_frame
+from src.visualization import plot_bar, generate_oee_visuals
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# İptal kontrolü için her çalışan sürece düşen görev sayısı
+TASKS_PER_WORKER = 4
+
+
+def _use_file_backend() -> None:
+    """
+    Çalışan süreçte pencere açmayan matplotlib arka ucunu seçer (henüz şekil
+    oluşturulmadığından pyplot içe aktarıldıktan sonra da geçerlidir).
+    """
+    matplotlib.use("Agg")
+
+
+def plot_machine_batch(
+    handle: str,
+    codes: Sequence[str],
+    machine_code_column: str = "İş Merkezi Kodu ",
+    save: bool = True
+) -> int:
+    """
+    Paylaşılan özet tablosundan bir grup tezgahın duruş grafiğini çizer.
+
+    Args:
+        handle: Tezgah-duruş özet tablosunun tanıtıcısı
+        codes: Çizilecek tezgah kodları
+        machine_code_column: Tezgah kodu sütunu
+        save: Grafikler kaydedilsin mi
+
+    Returns:
+        int: İşlenen tezgah sayısı
+    """
+    _use_file_backend()
+    df = open_frame(handle)
+    plot_bar(df[df[machine_code_column].isin(codes)], machine_code_column, save=save, show=False)
+    return len(codes)
+
+
+def plot_oee(handles: Dict[str, str], weeks: List[int]) -> int:
+    """
+    Paylaşılan OEE tablolarından genel, kısım ve tezgah OEE grafiklerini çizer.
+
+    Args:
+        handles: Seviye ('genel', 'kisim', 'tezgah') -> OEE tablosu tanıtıcısı
+        weeks: Hafta listesi
+
+    Returns:
+        int: Hafta sayısı
+    """
+    _use_file_backend()
+    generate_oee_visuals({level: open_frame(handle) for level, handle in handles.items()}, weeks)
+    return len(weeks)
+
+
+def machine_chart_tasks(
+    handle: str,
+    codes: Sequence[str],
+    max_workers: int,
+    machine_code_column: str = "İş Merkezi Kodu ",
+    save: bool = True
+) -> List[Tuple[Callable, tuple]]:
+    """
+    Tezgah grafiklerini süreç başına birkaç göreve bölen görev listesini oluşturur.
+
+    Args:
+        handle: Tezgah-duruş özet tablosunun tanıtıcısı
+        codes: Tezgah kodları
+        max_workers: Süreç sayısı
+        machine_code_column: Tezgah kodu sütunu
+        save: Grafikler kaydedilsin mi
+
+    Returns:
+        List[Tuple[Callable, tuple]]: (fonksiyon, argümanlar) görevleri
+    """
+    batch_count = max(1, min(len(codes), max_workers * TASKS_PER_WORKER))
+    return [
+        (plot_machine_batch, (handle, list(codes[i::batch_count]), machine_code_column, save))
+        for i in range(batch_count)
+        if codes[i::batch_count]
+    ]
+
+
+def run_chart_tasks(
+    tasks: List[Tuple[Callable, tuple]],
+    max_workers: int,
+    cancel_check: Optional[Callable[[], bool]] = None
+) -> bool:
+    """
+    Grafik görevlerini süreç havuzunda çalıştırır.
+
+    Args:
+        tasks: (modül düzeyinde fonksiyon, argümanlar) görevleri
+        max_workers: Süreç sayısı
+        cancel_check: Her görev tamamlandığında çağrılır; True dönerse
+            bekleyen görevler iptal edilir
+
+    Returns:
+        bool: Tüm görevler tamamlandıysa True, iptal edildiyse False
+    """
+    if not tasks:
+        return True
+
+    context = multiprocessing.get_context("spawn")
+    executor = ProcessPoolExecutor(max_workers=min(max_workers, len(tasks)), mp_context=context)
+    try:
+        futures = [executor.submit(func, *args) for func, args in tasks]
+        for future in as_completed(futures):
+            future.result()
+            if cancel_check is not None and cancel_check():
+                logger.info("Paralel grafik çizimi iptal edildi.")
+                executor.shutdown(wait=True, cancel_futures=True)
+                return False
+    finally:
+        executor.shutdown(wait=True)
+
+    logger.info(f"{len(tasks)} grafik görevi {max_workers} süreçle tamamlandı.")
+    return True
@@ -0,0 +1,141 @@
+"""
+Duruş nedenlerinin Pareto / ABC analizi.
+
+Duruş süreleri grup (fabrika, kısım veya tezgah) ve duruş adı bazında
+toplanır, tek bir sıralamayla (grup artan, süre azalan) dizilir ve grup içi
+birikimli toplamla birikimli paylar hesaplanır:
+
+    Pay            = süre / grup toplamı
+    Birikimli Pay  = grup içinde büyükten küçüğe birikimli süre / grup toplamı
+
+Sınıflar, her nedenin kendisinden önceki birikimli paya göre atanır; böylece
+%80 sınırını aşan neden de A sınıfında kalır:
+
+    A: önceki birikimli pay < %80
+    B: önceki birikimli pay < %95
+    C: diğerleri
+"""
+
+from typing import Dict, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# ABC sınıf sınırları (önceki birikimli pay)
+ABC_THRESHOLDS = {"A": 0.80, "B": 0.95}
+
+# Sınıf sütunu ve kategorik tipi
+CLASS_COLUMN = "ABC Sınıfı"
+CLASS_DTYPE = pd.CategoricalDtype(["A", "B", "C"], ordered=True)
+
+# Seviye -> gruplama sütunu (None: tüm fabrika)
+LEVEL_COLUMNS = {
+    "genel": None,
+    "kisim": "KISIM",
+    "tezgah": "İş Merkezi Kodu ",
+}
+
+# Excel sayfa adları
+SHEET_NAMES = {
+    "genel": "Pareto - Genel",
+    "kisim": "Pareto - Kısım",
+    "tezgah": "Pareto - Tezgah",
+}
+
+
+def compute_pareto(df: pd.DataFrame, group_column: Optional[str] = None) -> pd.DataFrame:
+    """
+    Grup bazında duruş adlarının pay, birikimli pay ve ABC sınıfını hesaplar.
+
+    ÇALIŞMA SÜRESİ kayıtları duruş sayılmaz.
+
+    Args:
+        df: İşlenmiş duruş verisi
+        group_column: Gruplama sütunu (None ise tüm veri tek grup)
+
+    Returns:
+        pd.DataFrame: Grup ve duruş adı başına bir satır; grup içinde süreye
+            göre azalan sıralı
+    """
+    keys = ([group_column] if group_column else []) + ["Duruş Adı"]
+    columns = keys + ["Süre (Dakika)", "Pay", "Birikimli Pay", CLASS_COLUMN]
+
+    mask = df["Duruş Adı"] != "ÇALIŞMA SÜRESİ"
+    if df.empty or not mask.any():
+        return pd.DataFrame(columns=columns)
+
+    sums = df.loc[mask].groupby(keys, observed=True)["Süre (Saniye)"].sum().reset_index()
+
+    # Tek sıralama: grup artan, süre azalan
+    sums = sums.sort_values(
+        keys[:-1] + ["Süre (Saniye)"],
+        ascending=[True] * (len(keys) - 1) + [False],
+        kind="stable"
+    ).reset_index(drop=True)
+    seconds = sums["Süre (Saniye)"].to_numpy(dtype=np.float64)
+
+    if group_column:
+        # Grup sınırlarında sıfırlanan birikimli toplam
+        group_codes = pd.factorize(sums[group_column])[0]
+        cumulative = np.cumsum(seconds)
+        group_start = np.r_[True, group_codes[1:] != group_codes[:-1]]
+        offsets = np.where(group_start, cumulative - seconds, 0)
+        cumulative -= np.maximum.accumulate(offsets)
+        totals = np.bincount(group_codes, weights=seconds)[group_codes]
+    else:
+        cumulative = np.cumsum(seconds)
+        totals = np.full(len(seconds), seconds.sum())
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = np.where(totals > 0, seconds / totals, 0.0)
+        cumulative_share = np.where(totals > 0, cumulative / totals, 0.0)
+    previous_share = cumulative_share - share
+
+    classes = np.select(
+        [previous_share < ABC_THRESHOLDS["A"], previous_share < ABC_THRESHOLDS["B"]],
+        ["A", "B"],
+        "C"
+    )
+
+    result = sums[keys].assign(**{
+        "Süre (Dakika)": seconds / 60,
+        "Pay": share,
+        "Birikimli Pay": cumulative_share,
+        CLASS_COLUMN: pd.Categorical(classes, dtype=CLASS_DTYPE),
+    })
+    return result[columns]
+
+
+def compute_pareto_tables(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Fabrika, kısım ve tezgah seviyelerinde Pareto tablolarını hesaplar.
+
+    Args:
+        df: İşlenmiş duruş verisi
+
+    Returns:
+        Dict[str, pd.DataFrame]: 'genel', 'kisim' ve 'tezgah' tabloları
+    """
+    tables = {level: compute_pareto(df, column) for level, column in LEVEL_COLUMNS.items()}
+    genel = tables["genel"]
+    logger.info(
+        f"Pareto analizi tamamlandı: {len(genel)} duruş nedeni, "
+        f"A sınıfında {int((genel[CLASS_COLUMN] == 'A').sum())} neden"
+    )
+    return tables
+
+
+def write_pareto_sheets(writer: pd.ExcelWriter, tables: Dict[str, pd.DataFrame]) -> None:
+    """
+    Pareto tablolarını açık bir Excel dosyasına ayrı sayfalar olarak yazar.
+
+    Args:
+        writer: Açık ExcelWriter
+        tables: compute_pareto_tables çıktısı
+    """
+    for level, sheet_name in SHEET_NAMES.items():
+        tables[level].to_excel(writer, sheet_name=sheet_name, index=False)
@@ -0,0 +1,212 @@
+"""
+Analiz aşamaları için süre ve bellek ölçüm fonksiyonları.
+
+Her aşama için duvar saati süresi, iş parçacığı CPU süresi, giriş/çıkış satır
+sayıları ve tracemalloc ile ölçülen tepe bellek kullanımı kaydedilir. Sonuçlar
+sözlük olarak döndürülür, JSON dosyasına yazılabilir ve istenirse cProfile
+çıktısı alınabilir.
+"""
+
+import os
+import json
+import time
+import cProfile
+import tracemalloc
+import datetime
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any
+import logging
+
+import pandas as pd
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+
+def count_rows(obj: Any) -> Optional[int]:
+    """
+    Bir aşama girdisi veya çıktısı için satır sayısını döndürür.
+
+    Args:
+        obj: DataFrame, Series, tuple, dict veya başka bir nesne
+
+    Returns:
+        Optional[int]: Satır sayısı, belirlenemezse None
+    """
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return len(obj)
+    if isinstance(obj, tuple):
+        # (df, ...) biçimindeki sonuçlarda ilk tabloyu say
+        for item in obj:
+            if isinstance(item, (pd.DataFrame, pd.Series)):
+                return len(item)
+        return None
+    if isinstance(obj, dict):
+        counts = [len(v) for v in obj.values() if isinstance(v, (pd.DataFrame, pd.Series))]
+        return sum(counts) if counts else None
+    return None
+
+
+class StageProfiler:
+    """
+    Analiz aşamalarının süre ve bellek ölçümlerini toplayan sınıf.
+
+    Aşamalar iç içe ölçülmez; her aşama tek bir iş parçacığında sırayla
+    çalıştırılmalıdır.
+    """
+
+    def __init__(self, trace_memory: bool = True, use_cprofile: bool = False):
+        """
+        Profilleyiciyi başlat.
+
+        Args:
+            trace_memory: tracemalloc ile tepe bellek ölçümü yapılsın mı
+            use_cprofile: cProfile ile fonksiyon düzeyinde profil alınsın mı
+        """
+        self.trace_memory = trace_memory
+        self.use_cprofile = use_cprofile
+        self.stages: List[Dict] = []
+        self._profile = cProfile.Profile() if use_cprofile else None
+        self._started_tracemalloc = False
+        self._started_at = None
+        self._finished_at = None
+
+    def start(self) -> None:
+        """
+        Ölçümü başlat.
+        """
+        self._started_at = datetime.datetime.now()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self._profile is not None:
+            self._profile.enable()
+
+    def stop(self) -> None:
+        """
+        Ölçümü durdur.
+        """
+        if self._profile is not None:
+            self._profile.disable()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self._finished_at = datetime.datetime.now()
+
+    @contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None):
+        """
+        Bir aşamayı ölçen bağlam yöneticisi.
+
+        Dönen kayıt sözlüğüne aşama içinden 'rows_out' yazılabilir.
+
+        Args:
+            name: Aşama adı
+            rows_in: Giriş satır sayısı
+
+        Yields:
+            Dict: Aşama kaydı
+        """
+        record = {
+            "stage": name,
+            "wall_time_s": 0.0,
+            "cpu_time_s": 0.0,
+            "rows_in": rows_in,
+            "rows_out": None,
+            "peak_memory_bytes": None,
+            "cached": False
+        }
+
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            mem_before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield record
+        finally:
+            record["wall_time_s"] = time.perf_counter() - wall_start
+            record["cpu_time_s"] = time.thread_time() - cpu_start
+            if tracing:
+                record["peak_memory_bytes"] = max(0, tracemalloc.get_traced_memory()[1] - mem_before)
+            self.stages.append(record)
+
+    def record_cached(self, name: str, rows_in: Optional[int] = None, rows_out: Optional[int] = None) -> None:
+        """
+        Önbellekten alınan bir aşamayı kaydet.
+
+        Args:
+            name: Aşama adı
+            rows_in: Giriş satır sayısı
+            rows_out: Çıkış satır sayısı
+        """
+        self.stages.append({
+            "stage": name,
+            "wall_time_s": 0.0,
+            "cpu_time_s": 0.0,
+            "rows_in": rows_in,
+            "rows_out": rows_out,
+            "peak_memory_bytes": None,
+            "cached": True
+        })
+
+    def report(self) -> Dict:
+        """
+        Ölçüm raporunu oluştur.
+
+        Returns:
+            Dict: Aşama kayıtları ve toplamları
+        """
+        measured = [s for s in self.stages if not s["cached"]]
+        peaks = [s["peak_memory_bytes"] for s in measured if s["peak_memory_bytes"] is not None]
+        return {
+            "started_at": self._started_at.isoformat() if self._started_at else None,
+            "finished_at": self._finished_at.isoformat() if self._finished_at else None,
+            "stages": list(self.stages),
+            "total": {
+                "wall_time_s": sum(s["wall_time_s"] for s in measured),
+                "cpu_time_s": sum(s["cpu_time_s"] for s in measured),
+                "peak_memory_bytes": max(peaks) if peaks else None,
+                "stage_count": len(self.stages),
+                "cached_stage_count": len(self.stages) - len(measured)
+            }
+        }
+
+    def save_json(self, file_path: str) -> str:
+        """
+        Ölçüm raporunu JSON dosyasına yaz.
+
+        Args:
+            file_path: JSON dosya yolu
+
+        Returns:
+            str: Yazılan dosya yolu
+        """
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        logger.info(f"Profil raporu kaydedildi: {file_path}")
+        return file_path
+
+    def dump_cprofile(self, file_path: str) -> Optional[str]:
+        """
+        cProfile çıktısını dosyaya yaz (pstats biçimi).
+
+        Args:
+            file_path: Çıktı dosya yolu
+
+        Returns:
+            Optional[str]: Yazılan dosya yolu, cProfile kapalıysa None
+        """
+        if self._profile is None:
+            return None
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._profile.dump_stats(file_path)
+        logger.info(f"cProfile çıktısı kaydedildi: {file_path}")
+        return file_path
@@ -0,0 +1,201 @@
+"""
+Arayüzdeki detaya inme (KISIM -> tezgah -> duruş) sorguları için sorgu servisi.
+
+İşlenmiş veri bir kez hazırlanır: her boyut sütunu (KISIM, tezgah, duruş
+adı, yıl-hafta anahtarı) tamsayı kodlara çevrilir ve groupby(...).indices ile her
+değerin satır konumları (artan sıralı tamsayı dizileri) saklanır. Bir
+sorgu, istenen filtrelerin konum dizilerini kesiştirir ve yalnızca bu
+konumlardaki kodları np.bincount ile toplar; tüm tablo üzerinde maske
+oluşturulmaz.
+
+Sonuçlar sorgu parametrelerine göre sınırlı boyutlu bir önbellekte tutulur;
+aynı tıklama tekrarlandığında hesap yapılmaz. Dönen tablolar önbellekle
+paylaşıldığından salt okunur kabul edilmelidir.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing import WEEK_KEY_COLUMN, week_keys
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Sorgu boyutu -> veri sütunu
+DIMENSIONS = {
+    "kisim": "KISIM",
+    "tezgah": "İş Merkezi Kodu ",
+    "durus": "Duruş Adı",
+    "hafta": WEEK_KEY_COLUMN,
+}
+
+# Önbellekte tutulacak en fazla sorgu sonucu
+CACHE_SIZE = 256
+
+
+class QueryService:
+    """
+    Önceden hesaplanmış grup konum indeksleri üzerinden dilim ve toplam sorguları.
+    """
+
+    def __init__(self, df: pd.DataFrame, cache_size: int = CACHE_SIZE):
+        """
+        Servisi oluştur ve boyut indekslerini hazırla.
+
+        ÇALIŞMA SÜRESİ kayıtları ve boyut sütunlarından biri boş olan kayıtlar
+        sorgulara katılmaz.
+
+        Args:
+            df: İşlenmiş duruş verisi
+            cache_size: Önbellekte tutulacak en fazla sorgu sonucu
+        """
+        columns = [column for column in DIMENSIONS.values() if column != WEEK_KEY_COLUMN] + ["Yıl", "Hafta"]
+        df = df.loc[df["Duruş Adı"] != "ÇALIŞMA SÜRESİ"].dropna(subset=columns)
+        # Hafta boyutu yıl-hafta anahtarıdır; farklı yılların aynı hafta numaraları ayrı kalır
+        self.df = df.assign(**{WEEK_KEY_COLUMN: week_keys(df)})
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple, pd.DataFrame]" = OrderedDict()
+
+        self.minutes = self.df["Süre (Saniye)"].to_numpy(dtype=np.float64) / 60
+        self.codes: Dict[str, np.ndarray] = {}
+        self.labels: Dict[str, np.ndarray] = {}
+        self.lookup: Dict[str, Dict[Hashable, int]] = {}
+        self.indices: Dict[str, Dict[Hashable, np.ndarray]] = {}
+        for dimension, column in DIMENSIONS.items():
+            codes, uniques = pd.factorize(self.df[column], sort=True)
+            self.codes[dimension] = codes
+            self.labels[dimension] = np.asarray(uniques)
+            self.lookup[dimension] = {label: code for code, label in enumerate(self.labels[dimension])}
+            # groupby.indices: değer -> artan sıralı satır konumları
+            self.indices[dimension] = pd.Series(codes).groupby(codes).indices
+
+        logger.info(
+            f"Sorgu servisi hazırlandı: {len(self.df)} duruş, "
+            + ", ".join(f"{len(labels)} {dimension}" for dimension, labels in self.labels.items())
+        )
+
+    def positions(self, **filters) -> np.ndarray:
+        """
+        Filtrelere uyan satırların konumlarını döndürür.
+
+        Args:
+            **filters: Boyut -> değer filtreleri (örn. kisim="KISIM 3.2", hafta=202412);
+                None değerli filtreler yok sayılır
+
+        Returns:
+            np.ndarray: Artan sıralı satır konumları
+        """
+        arrays = []
+        for dimension, value in filters.items():
+            if value is None:
+                continue
+            if dimension not in DIMENSIONS:
+                raise ValueError(f"Bilinmeyen sorgu boyutu: {dimension}")
+            code = self.lookup[dimension].get(value)
+            if code is None:
+                return np.zeros(0, dtype=np.int64)
+            arrays.append(self.indices[dimension][code])
+
+        if not arrays:
+            return np.arange(len(self.df))
+        # Kesişim en kısa konum dizisinden başlar; ara sonuçlar küçük kalır
+        arrays.sort(key=len)
+        result = arrays[0]
+        for rows in arrays[1:]:
+            result = np.intersect1d(result, rows, assume_unique=True)
+        return result
+
+    def _cached(self, key: Tuple, compute) -> pd.DataFrame:
+        """
+        Sonucu önbellekten döndürür; yoksa hesaplayıp en eski kaydı çıkararak saklar.
+        """
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        result = compute()
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def aggregate(self, by: str, **filters) -> pd.DataFrame:
+        """
+        Filtrelere uyan duruşları bir boyuta göre toplar.
+
+        Args:
+            by: Gruplama boyutu ('kisim', 'tezgah', 'durus' veya 'hafta')
+            **filters: Boyut -> değer filtreleri
+
+        Returns:
+            pd.DataFrame: Boyut sütunu, 'Süre (Dakika)' ve 'Duruş Sayısı';
+                hafta için haftaya göre artan, diğerleri için süreye göre azalan sıralı
+        """
+        key = ("aggregate", by) + tuple(sorted((k, v) for k, v in filters.items() if v is not None))
+        return self._cached(key, lambda: self._aggregate(by, filters))
+
+    def _aggregate(self, by: str, filters: Dict) -> pd.DataFrame:
+        """
+        aggregate hesabı: konumlardaki kodlar üzerinde bincount.
+        """
+        column = DIMENSIONS[by]
+        rows = self.positions(**filters)
+        codes = self.codes[by][rows]
+        size = len(self.labels[by])
+        minutes = np.bincount(codes, weights=self.minutes[rows], minlength=size)
+        counts = np.bincount(codes, minlength=size)
+
+        present = np.flatnonzero(counts)
+        result = pd.DataFrame({
+            column: self.labels[by][present],
+            "Süre (Dakika)": minutes[present],
+            "Duruş Sayısı": counts[present],
+        })
+        if by != "hafta":
+            result = result.sort_values("Süre (Dakika)", ascending=False, kind="stable")
+        return result.reset_index(drop=True)
+
+    def rows(self, **filters) -> pd.DataFrame:
+        """
+        Filtrelere uyan duruş kayıtlarını döndürür.
+
+        Args:
+            **filters: Boyut -> değer filtreleri
+
+        Returns:
+            pd.DataFrame: Kayıtlar (kaynak sırasıyla)
+        """
+        key = ("rows",) + tuple(sorted((k, v) for k, v in filters.items() if v is not None))
+        return self._cached(key, lambda: self.df.iloc[self.positions(**filters)])
+
+    def kisim_machines(self, kisim: str, hafta: Optional[int] = None) -> pd.DataFrame:
+        """
+        Bir kısmın tezgahlarını toplam duruş süresine göre döndürür.
+        """
+        return self.aggregate("tezgah", kisim=kisim, hafta=hafta)
+
+    def machine_stops(self, tezgah: str, hafta: Optional[int] = None) -> pd.DataFrame:
+        """
+        Bir tezgahın duruş adlarına göre süre dağılımını döndürür.
+        """
+        return self.aggregate("durus", tezgah=tezgah, hafta=hafta)
+
+    def stop_weeks(
+        self,
+        durus: str,
+        kisim: Optional[str] = None,
+        tezgah: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Bir duruş adının (isteğe bağlı kısım/tezgah içinde) haftalık sürelerini döndürür.
+        """
+        return self.aggregate("hafta", durus=durus, kisim=kisim, tezgah=tezgah)
+
+    def clear_cache(self) -> None:
+        """
+        Sorgu önbelleğini boşaltır.
+        """
+        self._cache.clear()
@@ -0,0 +1,168 @@
+"""
+Tezgah ve duruş sıralamaları için kısmi seçim yardımcıları.
+
+İlk/son k kaydı bulmak için tüm tabloyu sıralamak gerekmez: tek grup için
+np.argpartition ile k aday O(n) sürede ayrılır ve yalnızca bu k kayıt
+sıralanır. Gruplu seçimde satırlar grup kodlarına göre kararlı biçimde
+bloklara ayrılır ve her blokta aynı kısmi seçim uygulanır; grupların kendi
+içinde tam sıralanması gerekmez. Grup sayısı çok büyükse blok döngüsü
+yerine tek bir groupby.rank kullanılır.
+
+Sıra değişimi, son hafta ile takvimde bir önceki haftanın grup
+toplamlarından hesaplanan sıra numaralarının farkıdır (1 = en çok duruş). Pozitif değişim, grubun duruş
+sıralamasında yukarı çıktığını (daha fazla duruşa geçtiğini) gösterir.
+"""
+
+from typing import List, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing import WEEK_KEY_COLUMN, shift_week_key, week_keys
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Gruplu seçimde kısmi seçimin blok blok yapıldığı en fazla grup sayısı; daha
+# çok grupta Python döngüsü yerine tek bir vektörel groupby.rank kullanılır
+MAX_SELECTION_BLOCKS = 1000
+
+# Sıra değişimi tablosunun sütunları
+RANK_COLUMNS = [
+    "Süre (Dakika)", "Önceki Süre (Dakika)", "Sıra", "Önceki Sıra", "Sıra Değişimi"
+]
+
+
+def top_k_indices(values: np.ndarray, k: int, largest: bool = True) -> np.ndarray:
+    """
+    En büyük (veya en küçük) k değerin konumlarını sıralı olarak döndürür.
+
+    NaN değerler her iki yönde de en sona konur. Eşit değerlerde önce gelen
+    konum önce döner.
+
+    Args:
+        values: Değerler
+        k: Seçilecek değer sayısı
+        largest: True ise en büyükler (azalan), False ise en küçükler (artan)
+
+    Returns:
+        np.ndarray: Seçilen konumlar
+    """
+    values = np.asarray(values, dtype=np.float64)
+    # Seçim her zaman küçükten büyüğe yapılır; NaN en sona
+    keys = np.where(np.isnan(values), np.inf, -values if largest else values)
+    k = min(max(k, 0), len(keys))
+    if k == 0:
+        return np.zeros(0, dtype=np.int64)
+    if k < len(keys):
+        # k. değer sınırındaki eşitlerden önce gelen konumlar alınır
+        kth = keys[np.argpartition(keys, k - 1)[k - 1]]
+        below = np.flatnonzero(keys < kth)
+        candidates = np.concatenate([below, np.flatnonzero(keys == kth)[:k - len(below)]])
+    else:
+        candidates = np.arange(len(keys))
+    return candidates[np.lexsort((candidates, keys[candidates]))]
+
+
+def select_top(
+    df: pd.DataFrame,
+    value_column: str,
+    k: int,
+    largest: bool = True,
+    group_column: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Tablodan (grup başına) ilk k satırı tam sıralama yapmadan seçer.
+
+    Args:
+        df: Kaynak tablo
+        value_column: Sıralama değeri sütunu
+        k: Grup başına seçilecek satır sayısı
+        largest: True ise en büyük değerler, False ise en küçükler
+        group_column: Gruplama sütunu (None ise tüm tablo tek grup)
+
+    Returns:
+        pd.DataFrame: Seçilen satırlar; değere göre (largest ise azalan) sıralı
+    """
+    if df.empty:
+        return df
+
+    if group_column is None:
+        return df.iloc[top_k_indices(df[value_column].to_numpy(), k, largest)]
+
+    # Satırlar grup kodlarına göre kararlı biçimde bloklara ayrılır; blok
+    # içindeki sıra satır sırasıdır, böylece eşitlikler satır sırasına göre ayrılır
+    codes, uniques = pd.factorize(df[group_column])
+    values = df[value_column].to_numpy(dtype=np.float64)
+    if len(uniques) > MAX_SELECTION_BLOCKS:
+        ranks = df.groupby(group_column, observed=True)[value_column].rank(
+            method="first", ascending=not largest, na_option="bottom"
+        )
+        positions = np.flatnonzero(ranks.to_numpy() <= k)
+    else:
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        blocks = [np.zeros(0, dtype=np.int64)]
+        for begin, end in zip(bounds[:-1], bounds[1:]):
+            block = order[begin:end]
+            blocks.append(block if len(block) <= k else block[top_k_indices(values[block], k, largest)])
+        positions = np.sort(np.concatenate(blocks))
+
+    # Yalnızca seçilen (en fazla grup sayısı x k) satır sıralanır
+    return df.iloc[positions[top_k_indices(values[positions], len(positions), largest)]]
+
+
+def rank_changes(
+    df: pd.DataFrame,
+    weeks: List[int],
+    group_column: str = "İş Merkezi Kodu "
+) -> pd.DataFrame:
+    """
+    Son hafta ile önceki hafta arasındaki duruş sıralaması değişimlerini hesaplar.
+
+    Önceki hafta, son haftadan bir önceki takvim haftasıdır (yıl geçişleri
+    dahil); kaydı olmayan bir hafta atlanmaz. Sıralar grup toplam duruş
+    süresine göre verilir (1 = en çok duruş). Bir haftada kaydı olmayan
+    grubun o haftaki süresi 0, sırası boş kalır (hafta hiç kayıt içermiyorsa
+    tüm önceki sıralar boştur). ÇALIŞMA SÜRESİ kayıtları duruş sayılmaz.
+
+    Args:
+        df: İşlenmiş duruş verisi
+        weeks: Sıralı yıl-hafta anahtarları
+        group_column: Sıralanacak grup sütunu
+
+    Returns:
+        pd.DataFrame: Grup başına süre, sıra ve sıra değişimi; son haftanın
+            sırasına göre artan sıralı
+    """
+    if len(weeks) < 2:
+        logger.warning("Sıra değişimi için en az iki haftalık veri gerekli.")
+        return pd.DataFrame(columns=[group_column] + RANK_COLUMNS)
+
+    current_week = weeks[-1]
+    previous_week = shift_week_key(current_week, -1)
+    keys = week_keys(df)
+    mask = (df["Duruş Adı"] != "ÇALIŞMA SÜRESİ").to_numpy() & np.isin(keys, [previous_week, current_week])
+    data = df.loc[mask, [group_column, "Süre (Saniye)"]].assign(**{WEEK_KEY_COLUMN: keys[mask]})
+
+    totals = (
+        data.groupby([group_column, WEEK_KEY_COLUMN], observed=True)["Süre (Saniye)"]
+        .sum()
+        .unstack(WEEK_KEY_COLUMN)
+        .reindex(columns=[previous_week, current_week])
+        / 60
+    )
+    ranks = totals.rank(ascending=False, method="min").astype("Int64")
+    totals = totals.fillna(0.0)
+
+    result = pd.DataFrame({
+        "Süre (Dakika)": totals[current_week],
+        "Önceki Süre (Dakika)": totals[previous_week],
+        "Sıra": ranks[current_week],
+        "Önceki Sıra": ranks[previous_week],
+        "Sıra Değişimi": ranks[previous_week] - ranks[current_week],
+    })
+    result.index = result.index.astype(str)
+    result = result.rename_axis(group_column).reset_index()
+    return result.sort_values("Sıra", na_position="last", kind="stable").reset_index(drop=True)
@@ -0,0 +1,630 @@
+"""
+Dışa aktarım dosyaları için okuyucu arka uçları.
+
+Okuyucular uzantıya ve kurulu kütüphanelere göre bir kayıt tablosundan
+seçilir: CSV için pyarrow, Excel için (kuruluysa) calamine veya openpyxl ile
+akışlı okuma, Parquet/Feather için doğrudan yükleme. Hangi arka uç
+kullanılırsa kullanılsın sonuç aynı tipli şemaya (COLUMN_KINDS) dönüştürülür.
+
+pd.read_excel tüm çalışma sayfasını (tüm sütunlarıyla) Python nesneleri
+olarak belleğe aldıktan sonra usecols seçimini uygular. Buradaki okuyucu
+openpyxl'in salt okunur modunda satırları tek tek dolaşır, yalnızca gerekli
+sütunların değerlerini sabit boyutlu parçalar halinde toplar ve her parçayı
+hemen tipli dizilere (datetime64, float64, kategori kodları) dönüştürür.
+Dönüştürülen parçalar, sayfanın boyut bilgisinden önceden ayrılan sütun
+dizilerine yazılır; parçalar ayrıca saklanıp sonda birleştirilmez. Python
+nesnelerinin kapladığı geçici bellek parça boyutuyla sınırlıdır.
+"""
+
+import os
+import csv
+import gzip
+import importlib.util
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+try:
+    import openpyxl
+except ImportError:  # pragma: no cover - isteğe bağlı bağımlılık
+    openpyxl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as ds
+except ImportError:  # pragma: no cover - isteğe bağlı bağımlılık
+    pa = None
+    pa_csv = None
+    ds = None
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Varsayılan parça boyutu (satır)
+DEFAULT_CHUNK_SIZE = 50_000
+
+# Akışlı okunabilen dosya uzantıları
+STREAMING_EXTENSIONS = (".xlsx", ".xlsm")
+
+# CSV'de denenecek alan ayırıcılar (MES Türkçe yerel ayarda ';' kullanır)
+CSV_DELIMITERS = ",;\t"
+
+# CSV tarih biçimleri (ISO 8601'e ek olarak)
+CSV_TIMESTAMP_FORMATS = ["%d.%m.%Y %H:%M:%S", "%d.%m.%Y %H:%M", "%d.%m.%Y"]
+
+# Sütun türü -> okunan dizinin tipi (kategoriler için kodlar)
+KIND_DTYPES = {
+    "category": np.int32,
+    "datetime": "datetime64[ns]",
+    "float": np.float64,
+    "object": object,
+}
+
+# Bilinen sütunların hedef tipleri; listede olmayan sütunlar nesne olarak kalır
+COLUMN_KINDS = {
+    "İş Merkezi Kodu ": "category",
+    "Duruş Adı": "category",
+    "Duruş Başlangıç Tarih": "datetime",
+    "Duruş Bitiş Tarih": "datetime",
+    "Makina Kodu": "category",
+    "Tarih": "datetime",
+    "Çalışma Zamanı": "float",
+    "Planlı Duruş": "float",
+    "Plansız Duruş": "float",
+    "Oee": "float",
+    "Performans": "float",
+    "Kullanılabilirlik": "float",
+    "Kalite": "float",
+}
+
+
+def iter_excel_chunks(
+    file_path: str,
+    columns: Sequence[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    sheet_name: Optional[str] = None,
+    nrows: Optional[int] = None
+) -> Iterator[Dict[str, list]]:
+    """
+    Excel dosyasını satır satır okuyup gerekli sütunları parçalar halinde döndürür.
+
+    İlk satır başlık satırı kabul edilir. Tamamen boş satırlar atlanır.
+    nrows verilirse o kadar satır okunduktan sonra dosyanın geri kalanı
+    ayrıştırılmadan okuma durdurulur.
+
+    Args:
+        file_path: .xlsx dosya yolu
+        columns: Okunacak sütunlar
+        chunk_size: Parça başına satır sayısı
+        sheet_name: Çalışma sayfası adı (None ise ilk sayfa)
+        nrows: En fazla okunacak veri satırı (None ise tümü)
+
+    Yields:
+        Dict[str, list]: Sütun adı -> parça değerleri
+
+    Raises:
+        ValueError: Gerekli sütunlar başlık satırında yoksa
+    """
+    if openpyxl is None:
+        raise RuntimeError("Akışlı Excel okuma için openpyxl kurulu olmalıdır.")
+
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        rows = sheet.iter_rows(values_only=True)
+
+        header = next(rows, None)
+        if header is None:
+            raise ValueError(f"Dosyada başlık satırı bulunamadı: {file_path}")
+
+        positions = {name: i for i, name in enumerate(header) if name is not None}
+        missing = [col for col in columns if col not in positions]
+        if missing:
+            raise ValueError(f"Dosyada eksik sütunlar: {', '.join(missing)}")
+
+        indices = [positions[col] for col in columns]
+        width = len(header)
+        chunk = {col: [] for col in columns}
+        count = 0
+        remaining = nrows if nrows is not None else -1
+
+        for row in rows:
+            if remaining == 0:
+                break
+            # Kısa satırlar (sondaki boş hücreler) başlık genişliğine tamamlanır
+            if len(row) < width:
+                row = tuple(row) + (None,) * (width - len(row))
+            values = [row[i] for i in indices]
+            if all(v is None for v in values):
+                continue
+            for col, value in zip(columns, values):
+                chunk[col].append(value)
+            count += 1
+            remaining -= 1
+            if count == chunk_size:
+                yield chunk
+                chunk = {col: [] for col in columns}
+                count = 0
+
+        if count:
+            yield chunk
+    finally:
+        workbook.close()
+
+
+def excel_row_hint(file_path: str, sheet_name: Optional[str] = None) -> Optional[int]:
+    """
+    Çalışma sayfasının boyut bilgisinden veri satırı sayısını tahmin eder.
+
+    Salt okunur modda yalnızca sayfanın boyut kaydı okunur; hücreler
+    ayrıştırılmaz. Boş satırlar sayıldığından tahmin gerçek sayıdan büyük
+    olabilir; boyut kaydı olmayan dosyalarda None döner.
+
+    Args:
+        file_path: .xlsx dosya yolu
+        sheet_name: Çalışma sayfası adı (None ise ilk sayfa)
+
+    Returns:
+        Optional[int]: Başlık hariç satır sayısı tahmini
+    """
+    if openpyxl is None:
+        return None
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        max_row = sheet.max_row
+    finally:
+        workbook.close()
+    return max(max_row - 1, 0) if max_row else None
+
+
+class _ColumnBuffer:
+    """
+    Parçaları önceden ayrılmış tek bir diziye yazan sütun tamponu.
+
+    Kapasite yetmezse dizi iki katına büyütülür; okuma bitince fazlası
+    yerinde kırpılır.
+    """
+
+    def __init__(self, dtype, capacity: int):
+        self.array = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def append(self, values: np.ndarray) -> None:
+        end = self.size + len(values)
+        if end > len(self.array):
+            grown = np.empty(max(end, 2 * len(self.array)), dtype=self.array.dtype)
+            grown[:self.size] = self.array[:self.size]
+            self.array = grown
+        self.array[self.size:end] = values
+        self.size = end
+
+    def finish(self) -> np.ndarray:
+        array, self.array = self.array, None
+        if len(array) != self.size:
+            array.resize(self.size, refcheck=False)
+        return array
+
+
+class _CategoryEncoder:
+    """
+    Parçalar boyunca büyüyen kategori sözlüğü ile değerleri tamsayı kodlara çevirir.
+    """
+
+    def __init__(self):
+        self.lookup: Dict = {}
+
+    def encode(self, values: list) -> np.ndarray:
+        lookup = self.lookup
+        codes = np.empty(len(values), dtype=np.int32)
+        for i, value in enumerate(values):
+            if value is None:
+                codes[i] = -1
+            else:
+                code = lookup.get(value)
+                if code is None:
+                    code = lookup[value] = len(lookup)
+                codes[i] = code
+        return codes
+
+    def categorical(self, codes: np.ndarray) -> pd.Categorical:
+        return pd.Categorical.from_codes(codes, categories=list(self.lookup))
+
+
+def _convert_chunk(values: list, kind: str, encoder: Optional[_CategoryEncoder]) -> np.ndarray:
+    """
+    Bir parçanın sütun değerlerini tipli diziye dönüştürür.
+    """
+    if kind == "category":
+        return encoder.encode(values)
+    if kind == "datetime":
+        return pd.to_datetime(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype="datetime64[ns]")
+    if kind == "float":
+        return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype=np.float64)
+    return np.asarray(values, dtype=object)
+
+
+def read_excel_streaming(
+    file_path: str,
+    columns: Sequence[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    nrows: Optional[int] = None,
+    sheet_name: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Excel dosyasını akışlı okuyup tipli bir tablo döndürür.
+
+    Metin sütunları kategorik, tarih sütunları datetime64 ve sayısal sütunlar
+    float64 olarak döner (bkz. COLUMN_KINDS).
+
+    Args:
+        file_path: .xlsx dosya yolu
+        columns: Okunacak sütunlar
+        chunk_size: Parça başına satır sayısı
+        nrows: En fazla okunacak veri satırı (None ise tümü)
+        sheet_name: Çalışma sayfası adı
+
+    Returns:
+        pd.DataFrame: Okunan veri
+    """
+    kinds = {col: COLUMN_KINDS.get(col, "object") for col in columns}
+    encoders = {col: _CategoryEncoder() for col, kind in kinds.items() if kind == "category"}
+
+    # Sütun dizileri sayfa boyutundan bir kez ayrılır; tahmin yoksa parça boyutundan büyütülür
+    capacity = excel_row_hint(file_path, sheet_name)
+    if capacity is None:
+        capacity = chunk_size
+    if nrows is not None:
+        capacity = min(capacity, nrows)
+    buffers = {col: _ColumnBuffer(KIND_DTYPES[kinds[col]], capacity) for col in columns}
+
+    chunk_count = 0
+    for chunk in iter_excel_chunks(file_path, columns, chunk_size, sheet_name, nrows):
+        for col in columns:
+            buffers[col].append(_convert_chunk(chunk[col], kinds[col], encoders.get(col)))
+        chunk_count += 1
+
+    data = {}
+    for col in columns:
+        array = buffers.pop(col).finish()
+        data[col] = encoders[col].categorical(array) if col in encoders else array
+
+    df = pd.DataFrame(data, columns=list(columns))
+    logger.info(f"Akışlı okuma tamamlandı: {os.path.basename(file_path)} ({len(df)} satır, {chunk_count} parça)")
+    return df
+
+
+def _has_module(name: str) -> bool:
+    """
+    Modülün içe aktarılmadan kurulu olup olmadığını kontrol eder.
+    """
+    return importlib.util.find_spec(name) is not None
+
+
+def file_extension(file_path: str) -> str:
+    """
+    Dosya uzantısını küçük harfle döndürür; sıkıştırılmış dosyalarda iki
+    uzantı birlikte döner (örn. '.csv.gz').
+
+    Args:
+        file_path: Dosya yolu
+
+    Returns:
+        str: Uzantı
+    """
+    root, ext = os.path.splitext(file_path.lower())
+    if ext == ".gz":
+        return os.path.splitext(root)[1] + ext
+    return ext
+
+
+def _check_columns(available: Sequence[str], columns: Sequence[str]) -> None:
+    """
+    Gerekli sütunların dosyada bulunduğunu kontrol eder.
+    """
+    available = set(available)
+    missing = [col for col in columns if col not in available]
+    if missing:
+        raise ValueError(f"Dosyada eksik sütunlar: {', '.join(missing)}")
+
+
+def apply_column_kinds(df: pd.DataFrame, columns: Sequence[str]) -> pd.DataFrame:
+    """
+    Tabloyu ortak tipli şemaya dönüştürür: COLUMN_KINDS'e göre kategorik,
+    datetime64[ns] ve float64 sütunlar. Zaten doğru tipteki sütunlara dokunulmaz.
+
+    Args:
+        df: Arka uçtan dönen tablo
+        columns: Döndürülecek sütunlar (bu sırayla)
+
+    Returns:
+        pd.DataFrame: Tipli tablo
+    """
+    converted = {}
+    for col in columns:
+        kind = COLUMN_KINDS.get(col)
+        series = df[col]
+        if kind == "category" and not isinstance(series.dtype, pd.CategoricalDtype):
+            converted[col] = series.astype("category")
+        elif kind == "datetime" and series.dtype != "datetime64[ns]":
+            if not pd.api.types.is_datetime64_any_dtype(series):
+                series = pd.to_datetime(series, errors="coerce")
+            converted[col] = series.astype("datetime64[ns]")
+        elif kind == "float" and series.dtype != np.float64:
+            converted[col] = pd.to_numeric(series, errors="coerce").astype(np.float64)
+
+    df = df[list(columns)]
+    return df.assign(**converted) if converted else df
+
+
+def _sniff_csv(file_path: str) -> Tuple[str, List[str]]:
+    """
+    CSV dosyasının ilk satırından alan ayırıcıyı ve başlıkları bulur.
+    """
+    opener = gzip.open if file_path.lower().endswith(".gz") else open
+    with opener(file_path, "rt", encoding="utf-8-sig", newline="") as f:
+        first_line = f.readline()
+
+    delimiter = max(CSV_DELIMITERS, key=first_line.count)
+    header = next(csv.reader([first_line], delimiter=delimiter), [])
+    return delimiter, header
+
+
+def _read_csv_pyarrow(
+    file_path: str,
+    columns: Sequence[str],
+    chunk_size: int,
+    nrows: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    CSV dosyasını pyarrow ile okur; yalnızca gerekli sütunlar ayrıştırılır ve
+    tipler okuma sırasında belirlenir. nrows verilirse dosya blok blok okunur
+    ve yeterli satıra ulaşıldığında durulur.
+    """
+    delimiter, header = _sniff_csv(file_path)
+    _check_columns(header, columns)
+
+    kinds = {"category": pa.dictionary(pa.int32(), pa.string()),
+             "datetime": pa.timestamp("ns"),
+             "float": pa.float64()}
+    column_types = {col: kinds[COLUMN_KINDS[col]] for col in columns if col in COLUMN_KINDS}
+
+    parse_options = pa_csv.ParseOptions(delimiter=delimiter)
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=list(columns),
+        column_types=column_types,
+        timestamp_parsers=[pa_csv.ISO8601] + CSV_TIMESTAMP_FORMATS,
+        # ';' ayırıcılı dosyalar Türkçe yerel ayardadır ve ondalık ayırıcı virgüldür
+        decimal_point="," if delimiter == ";" else "."
+    )
+
+    if nrows is None:
+        table = pa_csv.read_csv(file_path, parse_options=parse_options, convert_options=convert_options)
+        return table.to_pandas()
+
+    reader = pa_csv.open_csv(file_path, parse_options=parse_options, convert_options=convert_options)
+    batches = []
+    count = 0
+    try:
+        for batch in reader:
+            batches.append(batch)
+            count += batch.num_rows
+            if count >= nrows:
+                break
+    finally:
+        reader.close()
+    table = pa.Table.from_batches(batches, schema=reader.schema)
+    return table.slice(0, nrows).to_pandas()
+
+
+def _parse_timestamps(series: pd.Series) -> pd.Series:
+    """
+    Metin tarihleri pyarrow okuyucusuyla aynı biçim sırasıyla (önce ISO 8601,
+    sonra CSV_TIMESTAMP_FORMATS) ayrıştırır; gün/ay sırası tahmin edilmez.
+    """
+    expected = series.notna().sum()
+    for fmt in ["ISO8601"] + CSV_TIMESTAMP_FORMATS:
+        parsed = pd.to_datetime(series, format=fmt, errors="coerce")
+        if parsed.notna().sum() == expected:
+            return parsed
+    return pd.to_datetime(series, errors="coerce")
+
+
+def _read_csv_pandas(
+    file_path: str,
+    columns: Sequence[str],
+    chunk_size: int,
+    nrows: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    pyarrow kurulu değilse CSV dosyasını pandas ile okur.
+    """
+    delimiter, header = _sniff_csv(file_path)
+    _check_columns(header, columns)
+    df = pd.read_csv(
+        file_path,
+        sep=delimiter,
+        decimal="," if delimiter == ";" else ".",
+        usecols=list(columns),
+        encoding="utf-8-sig",
+        nrows=nrows
+    )
+    dates = {col: _parse_timestamps(df[col]) for col in columns if COLUMN_KINDS.get(col) == "datetime"}
+    return df.assign(**dates)
+
+
+def _read_excel_pandas(
+    file_path: str,
+    columns: Sequence[str],
+    nrows: Optional[int] = None,
+    engine: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Excel dosyasını pd.read_excel ile okur.
+    """
+    wanted = set(columns)
+    df = pd.read_excel(file_path, usecols=lambda col: col in wanted, nrows=nrows, engine=engine)
+    _check_columns(df.columns, columns)
+    return df
+
+
+def _read_arrow_file(
+    file_path: str,
+    columns: Sequence[str],
+    file_format: str,
+    nrows: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Parquet veya Feather dosyasından yalnızca gerekli sütunları okur.
+    """
+    dataset = ds.dataset(file_path, format=file_format)
+    _check_columns(dataset.schema.names, columns)
+    if nrows is not None:
+        return dataset.head(nrows, columns=list(columns)).to_pandas()
+    return dataset.to_table(columns=list(columns)).to_pandas()
+
+
+# Okuyucu kayıt tablosu; aynı uzantı için önce kaydedilen ve kurulu olan arka uç seçilir
+_BACKENDS: List[Dict] = []
+
+
+def register_backend(
+    name: str,
+    extensions: Sequence[str],
+    reader: Callable[[str, Sequence[str], int, Optional[int]], pd.DataFrame],
+    is_available: Callable[[], bool] = lambda: True
+) -> None:
+    """
+    Okuyucu kayıt tablosuna yeni bir arka uç ekler.
+
+    Args:
+        name: Arka uç adı (loglarda ve raporlarda görünür)
+        extensions: Desteklenen uzantılar (örn. ['.csv', '.csv.gz'])
+        reader: (dosya yolu, sütunlar, parça boyutu, en fazla satır) alıp tablo
+            döndüren fonksiyon; satır sınırı None ise tüm dosya okunur
+        is_available: Gerekli kütüphanelerin kurulu olup olmadığını döndüren fonksiyon
+    """
+    _BACKENDS.append({
+        "name": name,
+        "extensions": tuple(ext.lower() for ext in extensions),
+        "reader": reader,
+        "is_available": is_available
+    })
+
+
+def select_backend(file_path: str) -> Dict:
+    """
+    Dosya için kullanılacak arka ucu seçer.
+
+    Args:
+        file_path: Dosya yolu
+
+    Returns:
+        Dict: Arka uç kaydı ('name', 'extensions', 'reader', 'is_available')
+
+    Raises:
+        ValueError: Uzantıyı okuyabilen kurulu bir arka uç yoksa
+    """
+    ext = file_extension(file_path)
+    for backend in _BACKENDS:
+        if ext in backend["extensions"] and backend["is_available"]():
+            return backend
+    raise ValueError(f"Desteklenmeyen dosya biçimi: {ext or os.path.basename(file_path)}")
+
+
+def supported_extensions() -> List[str]:
+    """
+    Kurulu arka uçlarla okunabilen uzantıları kayıt sırasıyla döndürür.
+
+    Returns:
+        List[str]: Uzantılar
+    """
+    extensions = [
+        ext for backend in _BACKENDS if backend["is_available"]()
+        for ext in backend["extensions"]
+    ]
+    return list(dict.fromkeys(extensions))
+
+
+def file_patterns() -> List[str]:
+    """
+    Desteklenen uzantılar için dosya desenlerini döndürür (örn. '*.csv').
+
+    Returns:
+        List[str]: Glob desenleri
+    """
+    return [f"*{ext}" for ext in supported_extensions()]
+
+
+def file_dialog_filter() -> str:
+    """
+    Dosya seçme penceresi için filtre metnini döndürür.
+
+    Returns:
+        str: Qt dosya filtresi
+    """
+    return f"Veri Dosyaları ({' '.join(file_patterns())});;Tüm Dosyalar (*)"
+
+
+def read_table(
+    file_path: str,
+    columns: Sequence[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    nrows: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Dosyayı uzantısına uygun arka uçla okuyup ortak tipli şemaya dönüştürür.
+
+    nrows verildiğinde arka uçlar dosyanın yalnızca başını okur (önizleme için);
+    dosyanın geri kalanı ayrıştırılmaz.
+
+    Args:
+        file_path: Dosya yolu
+        columns: Okunacak sütunlar (tablo bu sırayla döndürülür)
+        chunk_size: Akışlı okumada parça başına satır sayısı
+        nrows: En fazla okunacak veri satırı (None ise tümü)
+
+    Returns:
+        pd.DataFrame: Okunan veri
+
+    Raises:
+        ValueError: Biçim desteklenmiyorsa veya gerekli sütunlar dosyada yoksa
+    """
+    backend = select_backend(file_path)
+    df = apply_column_kinds(backend["reader"](file_path, columns, chunk_size, nrows), columns)
+    logger.info(f"{os.path.basename(file_path)} '{backend['name']}' ile okundu ({len(df)} satır)")
+    return df
+
+
+register_backend(
+    "pyarrow-csv", [".csv", ".csv.gz"], _read_csv_pyarrow,
+    lambda: pa_csv is not None
+)
+register_backend("pandas-csv", [".csv", ".csv.gz"], _read_csv_pandas)
+register_backend(
+    "calamine", [".xlsx", ".xlsm", ".xlsb", ".xls", ".ods"],
+    lambda path, columns, chunk_size, nrows: _read_excel_pandas(path, columns, nrows, engine="calamine"),
+    lambda: _has_module("python_calamine")
+)
+register_backend(
+    "openpyxl-akisli", STREAMING_EXTENSIONS, read_excel_streaming,
+    lambda: openpyxl is not None
+)
+register_backend(
+    "xlrd", [".xls"],
+    lambda path, columns, chunk_size, nrows: _read_excel_pandas(path, columns, nrows, engine="xlrd"),
+    lambda: _has_module("xlrd")
+)
+register_backend(
+    "pyarrow-parquet", [".parquet"],
+    lambda path, columns, chunk_size, nrows: _read_arrow_file(path, columns, "parquet", nrows),
+    lambda: ds is not None
+)
+register_backend(
+    "pyarrow-feather", [".feather", ".arrow"],
+    lambda path, columns, chunk_size, nrows: _read_arrow_file(path, columns, "feather", nrows),
+    lambda: ds is not None
+)
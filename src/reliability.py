@@ -0,0 +1,195 @@
+"""
+Arıza duruşlarından tezgah ve kısım bazında güvenilirlik göstergeleri.
+
+Arıza duruşları STOP_CATEGORIES["ariza"] anahtar kelimeleriyle seçilir.
+Kayıtlar tezgah ve başlangıç zamanına göre bir kez sıralanır; aynı tezgahın
+çakışan arızaları, tezgah içindeki birikimli en geç bitiş zamanıyla
+karşılaştırılarak tek arıza olayı ve tek arıza süresi olarak sayılır. Tezgah bazında toplamlar
+np.bincount ile alınır, Python'da tezgahlar üzerinde döngü kurulmaz.
+
+    Arıza Sayısı   = çakışmalar birleştirilmiş arıza olayı sayısı
+    Arıza Süresi   = çakışmalar birleştirilmiş toplam arıza süresi
+    Çalışma Süresi = dönem uzunluğu - arıza süresi
+    MTBF           = çalışma süresi / arıza sayısı
+    MTTR           = arıza süresi / arıza sayısı
+    Çalışma Oranı  = çalışma süresi / dönem uzunluğu
+
+Dönem, seçilen haftalardaki ilk duruşun başladığı günden son duruşun bittiği
+günün sonuna kadardır ve tüm tezgahlar için aynıdır. Arızası olmayan
+tezgahların MTBF ve MTTR değerleri boş kalır.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.classification import classify_series
+from src.data_processing import week_keys
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Arıza kategorisinin STOP_CATEGORIES anahtarı
+FAILURE_CATEGORY = "ariza"
+
+# Excel sayfa adları
+SHEET_NAMES = {
+    "tezgah": "Güvenilirlik - Tezgah",
+    "kisim": "Güvenilirlik - Kısım",
+}
+
+# Sonuç tablolarının metrik sütunları
+METRIC_COLUMNS = [
+    "Arıza Sayısı", "Arıza Süresi (Dakika)", "Çalışma Süresi (Saat)",
+    "MTBF (Saat)", "MTTR (Dakika)", "Çalışma Oranı"
+]
+
+
+def _empty_tables() -> Dict[str, pd.DataFrame]:
+    """
+    Veri olmadığında dönen boş tablolar.
+    """
+    return {
+        "tezgah": pd.DataFrame(columns=["İş Merkezi Kodu ", "KISIM"] + METRIC_COLUMNS),
+        "kisim": pd.DataFrame(columns=["KISIM"] + METRIC_COLUMNS),
+    }
+
+
+def merged_failure_seconds(
+    codes: np.ndarray,
+    start: np.ndarray,
+    end: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Her arıza kaydının, aynı tezgahın önceki arızalarıyla çakışmayan süresini hesaplar.
+
+    Kayıtlar tezgah koduna ve başlangıca göre sıralı olmalıdır. Her kaydın
+    başlangıcı, tezgahtaki önceki kayıtların en geç bitişinden öncedeyse bu
+    bitişe kaydırılır; böylece toplam, çakışmalar birleştirilmiş süreyi verir.
+    Tezgahın ilk kaydı ya da önceki kayıtların en geç bitişinden sonra
+    başlayan kayıt yeni bir arıza olayı başlatır.
+
+    Args:
+        codes: Tezgah kodları (sıralı)
+        start: Başlangıç zamanları (int64 nanosaniye)
+        end: Bitiş zamanları (int64 nanosaniye)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Kayıt başına çakışmasız süre (saniye) ve
+            kaydın yeni bir arıza olayı başlatıp başlatmadığı
+    """
+    if len(codes) == 0:
+        return np.zeros(0, dtype=np.float64), np.zeros(0, dtype=bool)
+
+    # Tezgah içindeki birikimli en geç bitiş (önceki kayıtlar için bir kaydırılır)
+    latest_end = pd.Series(end).groupby(codes, sort=False).cummax().to_numpy()
+    new_machine = np.empty(len(codes), dtype=bool)
+    new_machine[0] = True
+    new_machine[1:] = codes[1:] != codes[:-1]
+    previous_end = np.empty_like(latest_end)
+    previous_end[0] = start[0]
+    previous_end[1:] = latest_end[:-1]
+
+    effective_start = np.where(new_machine, start, np.maximum(start, previous_end))
+    event_start = new_machine | (start > previous_end)
+    return np.clip(end - effective_start, 0, None) / 1e9, event_start
+
+
+def _metrics(sums: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """
+    Arıza sayısı, arıza süresi ve dönem uzunluğu toplamlarından göstergeleri hesaplar.
+    """
+    count = sums["Arıza Sayısı"].to_numpy(dtype=np.float64)
+    down = sums["down"].to_numpy(dtype=np.float64)
+    uptime = sums["period"].to_numpy(dtype=np.float64) - down
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = sums[keys].assign(**{
+            "Arıza Sayısı": sums["Arıza Sayısı"].astype("int64"),
+            "Arıza Süresi (Dakika)": down / 60,
+            "Çalışma Süresi (Saat)": uptime / 3600,
+            "MTBF (Saat)": np.where(count > 0, uptime / 3600 / count, np.nan),
+            "MTTR (Dakika)": np.where(count > 0, down / 60 / count, np.nan),
+            "Çalışma Oranı": uptime / sums["period"].to_numpy(dtype=np.float64),
+        })
+    return result.sort_values("Arıza Süresi (Dakika)", ascending=False).reset_index(drop=True)
+
+
+def compute_reliability(
+    df: pd.DataFrame,
+    weeks: Optional[List[int]] = None,
+    machine_column: str = "İş Merkezi Kodu "
+) -> Dict[str, pd.DataFrame]:
+    """
+    Tezgah ve kısım bazında arıza sayısı, MTBF, MTTR ve çalışma oranını hesaplar.
+
+    Args:
+        df: İşlenmiş duruş verisi (tezgah, KISIM, Duruş Adı, Hafta ve tarih sütunları)
+        weeks: Hesaba katılacak yıl-hafta anahtarları (None ise tüm veri)
+        machine_column: Tezgah kodu sütunu
+
+    Returns:
+        Dict[str, pd.DataFrame]: 'tezgah' ve 'kisim' tabloları (arıza süresine göre azalan sıralı)
+    """
+    if weeks is not None:
+        df = df[np.isin(week_keys(df), weeks)]
+    if df.empty:
+        return _empty_tables()
+
+    start = pd.to_datetime(df["Duruş Başlangıç Tarih"])
+    end = pd.to_datetime(df["Duruş Bitiş Tarih"])
+    period_start = start.min().floor("D")
+    period_end = end.max().ceil("D")
+    period_seconds = (period_end - period_start).total_seconds()
+
+    # Dönemde kaydı olan tezgahlar ve her birinin ilk kaydındaki kısım
+    codes, uniques = pd.factorize(df[machine_column], sort=True)
+    machine_count = len(uniques)
+    first_rows = np.unique(codes, return_index=True)[1]
+
+    # Arıza kayıtları tezgah ve başlangıca göre sıralanır
+    failure = (classify_series(df["Duruş Adı"]) == FAILURE_CATEGORY).to_numpy()
+    f_codes = codes[failure]
+    f_start = start.to_numpy()[failure].astype("datetime64[ns]").view(np.int64)
+    f_end = end.to_numpy()[failure].astype("datetime64[ns]").view(np.int64)
+    order = np.lexsort((f_start, f_codes))
+    f_codes, f_start, f_end = f_codes[order], f_start[order], f_end[order]
+
+    # Çakışan kayıtlar tek arıza olayıdır; MTBF ve MTTR olay sayısına bölünür
+    failure_seconds, event_start = merged_failure_seconds(f_codes, f_start, f_end)
+    counts = np.bincount(f_codes[event_start], minlength=machine_count)
+    down_seconds = np.bincount(f_codes, weights=failure_seconds, minlength=machine_count)
+
+    sums = pd.DataFrame({
+        machine_column: np.asarray(uniques).astype(str),
+        "KISIM": df["KISIM"].iloc[first_rows].astype(str).to_numpy(),
+        "Arıza Sayısı": counts,
+        "down": down_seconds,
+        "period": np.full(machine_count, period_seconds),
+    })
+
+    tables = {
+        "tezgah": _metrics(sums, [machine_column, "KISIM"]),
+        "kisim": _metrics(
+            sums.groupby("KISIM", sort=True)[["Arıza Sayısı", "down", "period"]].sum().reset_index(),
+            ["KISIM"]
+        ),
+    }
+    logger.info(
+        f"Güvenilirlik göstergeleri hesaplandı: {int(counts.sum())} arıza, "
+        f"{machine_count} tezgah, {period_seconds / 86400:.0f} günlük dönem"
+    )
+    return tables
+
+
+def write_reliability_sheets(writer: pd.ExcelWriter, tables: Dict[str, pd.DataFrame]) -> None:
+    """
+    Güvenilirlik tablolarını açık bir Excel dosyasına ayrı sayfalar olarak yazar.
+
+    Args:
+        writer: Açık ExcelWriter
+        tables: compute_reliability çıktısı
+    """
+    for level, sheet_name in SHEET_NAMES.items():
+        tables[level].to_excel(writer, sheet_name=sheet_name, index=False)
@@ -0,0 +1,200 @@
+"""
+Süreçler arasında büyük tabloların Arrow IPC dosyalarıyla paylaşılması.
+
+Süreç havuzuna gönderilen her tablo normalde pickle ile serileştirilip her
+çalışan süreçte yeniden oluşturulur. Bu modülde tablo bir kez Arrow IPC
+dosyası olarak yazılır ve süreçlere yalnızca dosya yolu (tanıtıcı) iletilir.
+Çalışan süreçler dosyayı bellek eşlemeli (memory-mapped) açar; sayısal ve
+tarih sütunları kopyalanmadan, işletim sisteminin sayfa önbelleği üzerinden
+okunur.
+
+Paylaşılan dosyalar SharedFrameStore'un geçici dizininde tutulur ve depo
+kapatıldığında (veya çöp toplayıcı nesneyi sildiğinde, en geç yorumlayıcı
+kapanırken) dizinle birlikte silinir.
+
+pyarrow kurulu değilse is_available() False döner; çağıranlar tabloları
+doğrudan (pickle ile) aktarmaya devam eder.
+"""
+
+import os
+import re
+import shutil
+import tempfile
+import weakref
+from typing import Dict, List, Optional
+import logging
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - isteğe bağlı bağımlılık
+    pa = None
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Paylaşılan dosyaların uzantısı
+IPC_EXTENSION = ".arrow"
+
+# Geçici dizin adı öneki
+DIRECTORY_PREFIX = "raporlama_paylasim_"
+
+
+def is_available() -> bool:
+    """
+    Paylaşımlı tablo aktarımının kullanılabilir olup olmadığını döndürür.
+
+    Returns:
+        bool: pyarrow kuruluysa True
+    """
+    return pa is not None
+
+
+def write_frame(df: pd.DataFrame, path: str) -> str:
+    """
+    Tabloyu sıkıştırmasız Arrow IPC dosyası olarak yazar.
+
+    Sıkıştırma bellek eşlemeli okumada kopyasız erişimi engellediğinden
+    kullanılmaz.
+
+    Args:
+        df: Yazılacak tablo (indeks yazılmaz)
+        path: Dosya yolu
+
+    Returns:
+        str: Dosya yolu (tanıtıcı)
+    """
+    if not is_available():
+        raise RuntimeError("Paylaşımlı tablo aktarımı için pyarrow kurulu olmalıdır.")
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return path
+
+
+def open_table(handle: str, columns: Optional[List[str]] = None) -> "pa.Table":
+    """
+    Paylaşılan tabloyu bellek eşlemeli olarak Arrow tablosu şeklinde açar.
+
+    Dönen tablonun tamponları doğrudan eşlenmiş dosyayı gösterir; veri okunana
+    kadar belleğe alınmaz.
+
+    Args:
+        handle: write_frame veya SharedFrameStore.put ile alınan tanıtıcı
+        columns: Seçilecek sütunlar (None ise tümü)
+
+    Returns:
+        pa.Table: Arrow tablosu
+    """
+    if not is_available():
+        raise RuntimeError("Paylaşımlı tablo aktarımı için pyarrow kurulu olmalıdır.")
+
+    # Eşleme, tablo tamponları yaşadığı sürece açık kalır
+    source = pa.memory_map(handle, "r")
+    table = pa.ipc.open_file(source).read_all()
+    return table.select(columns) if columns is not None else table
+
+
+def open_frame(handle: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Paylaşılan tabloyu pandas tablosu olarak açar.
+
+    Boş değer içermeyen sayısal ve tarih sütunları eşlenmiş dosyayı kopyalamadan
+    gösterir (salt okunur); kategorik sütunlarda yalnızca kodlar dönüştürülür.
+
+    Args:
+        handle: Tanıtıcı
+        columns: Seçilecek sütunlar (None ise tümü)
+
+    Returns:
+        pd.DataFrame: Tablo
+    """
+    return open_table(handle, columns).to_pandas(split_blocks=True)
+
+
+class SharedFrameStore:
+    """
+    Analiz süresince süreçler arasında paylaşılan tabloların deposu.
+
+    Her tablo depoya bir kez yazılır; süreçlere put() ile alınan tanıtıcı
+    gönderilir ve süreçler tabloyu open_frame() ile açar. Depo bağlam
+    yöneticisi olarak kullanılabilir; close() çağrılmasa bile nesne silinirken
+    veya yorumlayıcı kapanırken geçici dizin temizlenir.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Depoyu başlat ve geçici dizini oluştur.
+
+        Args:
+            directory: Geçici dizinin oluşturulacağı üst dizin (None ise sistem varsayılanı)
+        """
+        if not is_available():
+            raise RuntimeError("Paylaşımlı tablo aktarımı için pyarrow kurulu olmalıdır.")
+
+        self.path = tempfile.mkdtemp(prefix=DIRECTORY_PREFIX, dir=directory)
+        self.handles: Dict[str, str] = {}
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.path, True)
+        logger.info(f"Paylaşımlı tablo deposu oluşturuldu: {self.path}")
+
+    def put(self, name: str, df: pd.DataFrame) -> str:
+        """
+        Tabloyu depoya yazar. Aynı adla yeniden yazılan tablo yenisiyle değiştirilir.
+
+        Args:
+            name: Tablo adı
+            df: Tablo
+
+        Returns:
+            str: Tanıtıcı (süreçlere iletilecek dosya yolu)
+        """
+        if self.closed:
+            raise RuntimeError("Paylaşımlı tablo deposu kapatılmış.")
+
+        file_name = re.sub(r"[^\w.-]", "_", name) + IPC_EXTENSION
+        handle = write_frame(df, os.path.join(self.path, file_name))
+        self.handles[name] = handle
+        logger.info(f"Tablo paylaşıma açıldı: {name} ({len(df)} satır, {os.path.getsize(handle) / 1024 ** 2:.1f} MB)")
+        return handle
+
+    def get(self, name: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Depodaki tabloyu adıyla açar.
+
+        Args:
+            name: Tablo adı
+            columns: Seçilecek sütunlar
+
+        Returns:
+            pd.DataFrame: Tablo
+        """
+        return open_frame(self.handles[name], columns)
+
+    @property
+    def closed(self) -> bool:
+        """
+        Deponun kapatılıp kapatılmadığını döndürür.
+        """
+        return not self._finalizer.alive
+
+    def close(self) -> None:
+        """
+        Geçici dizini ve tüm paylaşılan dosyaları siler.
+
+        Açık bellek eşlemeleri işletim sistemi tarafından son başvuru
+        kapanana kadar korunur; dosyalar dizinden hemen kaldırılır.
+        """
+        if not self.closed:
+            self._finalizer()
+            logger.info(f"Paylaşımlı tablo deposu silindi: {self.path}")
+        self.handles = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -0,0 +1,555 @@
+"""
+Serbest sorgular için gömülü SQL analiz deposu.
+
+İşlenmiş duruş verisi ve çalışma süresi verisi tek dosyalık bir veritabanına
+'durus' ve 'calisma' tabloları olarak yazılır. Sütun adları SQL'de tırnak
+gerektirmeyecek biçime çevrilir (örn. 'İş Merkezi Kodu ' -> tezgah,
+'Süre (Saniye)' -> sure_saniye). Her iki tabloda tezgah, (yil, hafta) ve
+kisim sütunlarında indeks bulunur; Excel dosyaları yeniden okunmadan
+haftalık/tezgah/kısım bazında gruplamalar saniyenin altında yanıtlanır.
+
+Yazma, Parquet deposundaki bölüm değiştirme mantığını izler: yeni verideki
+her (yıl, hafta) çiftinin eski satırları silinir ve yeni satırlar eklenir;
+diğer haftalara dokunulmaz. Her haftanın satır sayısı ve içerik özeti ayrı
+bir tabloda saklanır; aynı dışa aktarım yeniden yazıldığında içeriği
+değişmeyen haftalar silinip yeniden eklenmez.
+
+DuckDB kuruluysa DuckDB, değilse Python ile gelen SQLite kullanılır.
+Serbest sorgular yalnızca SELECT veya WITH ile başlayabilir ve salt okunur
+bağlantıyla çalışır. Sorgu bağlantılarında başka veritabanı dosyası
+eklenemez (ATTACH/DETACH); SQLite'ta değer atayan PRAGMA'lar bir yetki
+denetleyicisiyle, DuckDB'de dış erişim ayarıyla engellenir.
+"""
+
+import os
+import re
+import sqlite3
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.request import pathname2url
+import logging
+
+import numpy as np
+import pandas as pd
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover - isteğe bağlı bağımlılık
+    duckdb = None
+
+from config.settings import DATA_PATHS
+from src.classification import fold_text
+from src.data_processing import MAKINA_KISIM_MAP
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Kullanılan veritabanı motoru
+BACKEND = "duckdb" if duckdb is not None else "sqlite"
+
+# Varsayılan veritabanı dosyası
+DEFAULT_DB_PATH = os.path.join(
+    DATA_PATHS["processed_data"],
+    "analiz.duckdb" if duckdb is not None else "analiz.sqlite"
+)
+
+# Adı genel kuraldan farklı olan sütunlar (iki tabloda ortak anahtarlar)
+COLUMN_NAMES = {
+    "İş Merkezi Kodu ": "tezgah",
+    "Makina Kodu": "tezgah",
+    "Duruş Başlangıç Tarih": "baslangic",
+    "Duruş Bitiş Tarih": "bitis",
+}
+
+# Tablo -> indeksli sütun grupları
+TABLE_INDEXES = {
+    "durus": [("tezgah",), ("yil", "hafta"), ("kisim",)],
+    "calisma": [("tezgah",), ("yil", "hafta"), ("kisim",)],
+}
+
+# Hafta değiştirme anahtarı
+WEEK_COLUMNS = ["yil", "hafta"]
+
+# Tablo x hafta içerik özetlerinin tutulduğu tablo
+FINGERPRINT_TABLE = "_hafta_ozetleri"
+
+# Sorgu konsolunda bir sayfadaki satır sayısı
+PAGE_SIZE = 500
+
+# Sayfalanan sorgu sonucunun yazıldığı geçici tablo
+RESULT_TABLE = "sorgu_sonucu"
+
+# Serbest sorguların başlayabileceği anahtar kelimeler
+QUERY_KEYWORDS = ("SELECT", "WITH")
+
+# Argüman alan ancak yalnızca şema okuyan PRAGMA'lar (pragma_table_info(...) gibi)
+INTROSPECTION_PRAGMAS = {
+    "table_info", "table_xinfo", "table_list", "index_list", "index_info",
+    "index_xinfo", "foreign_key_list",
+}
+
+# Sorgu metninin başındaki yorumlar
+_LEADING_COMMENTS = re.compile(r"^(?:\s+|--[^\n]*(?:\n|$)|/\*.*?\*/)*", re.DOTALL)
+
+# Örnek sorgu (sorgu konsolunun başlangıç metni)
+EXAMPLE_QUERY = (
+    "SELECT kisim, tezgah, SUM(sure_dakika) AS toplam_dakika, COUNT(*) AS durus_sayisi\n"
+    "FROM durus\n"
+    "WHERE durus_adi <> 'ÇALIŞMA SÜRESİ'\n"
+    "GROUP BY kisim, tezgah\n"
+    "ORDER BY toplam_dakika DESC"
+)
+
+
+def is_duckdb_available() -> bool:
+    """
+    DuckDB'nin kurulu olup olmadığını döndürür.
+
+    Returns:
+        bool: duckdb kuruluysa True (değilse SQLite kullanılır)
+    """
+    return duckdb is not None
+
+
+def sql_name(column: str) -> str:
+    """
+    Sütun adını tırnak gerektirmeyen SQL adına çevirir.
+
+    Args:
+        column: Veri sütunu adı
+
+    Returns:
+        str: Küçük harfli, ASCII, alt çizgi ayrımlı ad (örn. 'Süre (Dakika)' -> 'sure_dakika')
+    """
+    if column in COLUMN_NAMES:
+        return COLUMN_NAMES[column]
+    return re.sub(r"[^0-9a-z]+", "_", fold_text(column)).strip("_")
+
+
+def _to_sql_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Tabloyu SQL sütun adlarına ve veritabanının yazabildiği tiplere çevirir.
+    """
+    frame = df.rename(columns=sql_name)
+    for column in frame.columns:
+        if isinstance(frame[column].dtype, pd.CategoricalDtype):
+            frame[column] = frame[column].astype(object)
+    return frame
+
+
+def durus_table(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    İşlenmiş duruş verisinden 'durus' tablosunu hazırlar.
+
+    Args:
+        df: İşlenmiş duruş verisi ('Yıl' ve 'Hafta' sütunları zorunlu)
+
+    Returns:
+        pd.DataFrame: SQL sütun adlı tablo
+    """
+    return _to_sql_frame(df.dropna(subset=["Yıl", "Hafta"]))
+
+
+def calisma_table(calisma_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Ham çalışma süresi verisinden 'calisma' tablosunu hazırlar.
+
+    Makina kodu boşluklardan arındırılarak tezgah sütununa yazılır; kısım ve
+    ISO yıl/hafta, duruş tablosuyla aynı kurallarla eklenir. Tarihi
+    okunamayan satırlar yazılmaz.
+
+    Args:
+        calisma_df: Ham çalışma süresi verisi
+
+    Returns:
+        pd.DataFrame: SQL sütun adlı tablo
+    """
+    data = calisma_df.copy()
+    data["Makina Kodu"] = data["Makina Kodu"].astype(str).str.strip()
+    data["Tarih"] = pd.to_datetime(data["Tarih"], errors="coerce")
+    data = data.dropna(subset=["Tarih"])
+
+    takvim = data["Tarih"].dt.isocalendar()
+    data["KISIM"] = data["Makina Kodu"].map(MAKINA_KISIM_MAP).fillna("Diğer")
+    data["Yıl"] = takvim["year"].astype("int16")
+    data["Hafta"] = takvim["week"].astype("int16")
+    return _to_sql_frame(data)
+
+
+def connect(db_path: str = DEFAULT_DB_PATH, read_only: bool = False, check_same_thread: bool = True):
+    """
+    Veritabanına bağlantı açar.
+
+    Args:
+        db_path: Veritabanı dosyası
+        read_only: True ise salt okunur bağlantı (dosya mevcut olmalıdır)
+        check_same_thread: False ise sqlite3 bağlantısı açıldığı iş parçacığı
+            dışında da kullanılabilir (DuckDB bağlantıları için geçerli değildir)
+
+    Returns:
+        DuckDB veya sqlite3 bağlantısı
+    """
+    if duckdb is not None:
+        return duckdb.connect(db_path, read_only=read_only)
+    if read_only:
+        uri = f"file:{pathname2url(os.path.abspath(db_path))}?mode=ro"
+        return sqlite3.connect(uri, uri=True, check_same_thread=check_same_thread)
+    return sqlite3.connect(db_path, check_same_thread=check_same_thread)
+
+
+def _authorize_query(action: int, arg1, arg2, db_name, trigger) -> int:
+    """
+    Serbest sorgu bağlantısının SQLite yetki denetleyicisi.
+
+    Başka veritabanı ekleme/çıkarma ve değer atayan PRAGMA'lar reddedilir.
+    """
+    if action in (sqlite3.SQLITE_ATTACH, sqlite3.SQLITE_DETACH):
+        return sqlite3.SQLITE_DENY
+    if action == sqlite3.SQLITE_PRAGMA and arg2 is not None and arg1 not in INTROSPECTION_PRAGMAS:
+        return sqlite3.SQLITE_DENY
+    return sqlite3.SQLITE_OK
+
+
+def _query_connection(db_path: str):
+    """
+    Serbest sorgular için salt okunur ve kısıtlı bir bağlantı açar.
+
+    Sorgu arka plan iş parçacığında çalıştırılıp sayfaları arayüz iş
+    parçacığında okunduğundan bağlantı iş parçacıkları arasında paylaşılır;
+    aynı anda yalnızca bir iş parçacığı kullanır.
+    """
+    if duckdb is not None:
+        return duckdb.connect(db_path, read_only=True, config={"enable_external_access": False})
+    con = connect(db_path, read_only=True, check_same_thread=False)
+    con.set_authorizer(_authorize_query)
+    return con
+
+
+def _table_exists(con, table: str) -> bool:
+    """
+    Tablonun veritabanında bulunup bulunmadığını döndürür.
+    """
+    if duckdb is not None:
+        sql = "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?"
+    else:
+        sql = "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = ?"
+    return con.execute(sql, [table]).fetchone()[0] > 0
+
+
+def _sqlite_values(frame: pd.DataFrame) -> np.ndarray:
+    """
+    Tablo değerlerini sqlite3'ün bağlayabildiği Python değerlerinden oluşan
+    (satır x sütun) nesne dizisine çevirir.
+
+    Tarihler 'YYYY-AA-GG SS:DD:ss' metnine, boş değerler None'a çevrilir.
+    Satırlar tek tek demet olarak oluşturulmaz; dizinin dilimleri doğrudan
+    çok satırlı INSERT parametrelerine açılır.
+    """
+    values = np.empty((len(frame), len(frame.columns)), dtype=object)
+    for position, column in enumerate(frame.columns):
+        series = frame[column]
+        missing = series.isna().to_numpy()
+        if pd.api.types.is_datetime64_any_dtype(series):
+            series = series.dt.strftime("%Y-%m-%d %H:%M:%S")
+        values[:, position] = series.to_numpy()
+        if missing.any():
+            values[missing, position] = None
+    return values
+
+
+def _insert_rows(con, table: str, frame: pd.DataFrame) -> None:
+    """
+    Satırları çok satırlı INSERT ifadeleriyle ekler (SQLite).
+
+    Her ifade, bağlantının parametre sınırını aşmayacak kadar satır taşır;
+    executemany'deki satır başına çağrı yükü ortadan kalkar.
+    """
+    values = _sqlite_values(frame)
+    try:
+        limit = con.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    except AttributeError:  # pragma: no cover - Python < 3.11
+        limit = 999
+    chunk_size = max(1, limit // len(frame.columns))
+    columns = ", ".join(frame.columns)
+    row = "(" + ", ".join("?" * len(frame.columns)) + ")"
+    full_sql = f"INSERT INTO {table} ({columns}) VALUES " + ", ".join([row] * chunk_size)
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start:start + chunk_size]
+        sql = full_sql if len(chunk) == chunk_size else (
+            f"INSERT INTO {table} ({columns}) VALUES " + ", ".join([row] * len(chunk))
+        )
+        con.execute(sql, chunk.ravel().tolist())
+
+
+def week_fingerprints(frame: pd.DataFrame) -> Dict[Tuple[int, int], str]:
+    """
+    Tablodaki her (yıl, hafta) çiftinin satır sayısı ve içerik özetini hesaplar.
+
+    Özet, satır özetlerinin (pandas hash_pandas_object) 2^64 modülünde
+    toplamıdır; satır sırasından bağımsızdır.
+
+    Args:
+        frame: SQL sütun adlı tablo
+
+    Returns:
+        Dict[Tuple[int, int], str]: (yıl, hafta) -> 'satır sayısı:özet'
+    """
+    hashes = pd.util.hash_pandas_object(frame, index=False).to_numpy()
+    keys = frame["yil"].to_numpy(dtype=np.int64) * 100 + frame["hafta"].to_numpy(dtype=np.int64)
+    uniques, inverse = np.unique(keys, return_inverse=True)
+    sums = np.zeros(len(uniques), dtype=np.uint64)
+    np.add.at(sums, inverse, hashes)
+    counts = np.bincount(inverse, minlength=len(uniques))
+    return {
+        (int(key) // 100, int(key) % 100): f"{count}:{digest:016x}"
+        for key, count, digest in zip(uniques, counts, sums)
+    }
+
+
+def _stored_fingerprints(con, table: str) -> Dict[Tuple[int, int], str]:
+    """
+    Tablonun depodaki hafta özetlerini okur (özet tablosu yoksa boş).
+    """
+    if not _table_exists(con, FINGERPRINT_TABLE):
+        return {}
+    rows = con.execute(
+        f"SELECT yil, hafta, ozet FROM {FINGERPRINT_TABLE} WHERE tablo = ?", [table]
+    ).fetchall()
+    return {(int(yil), int(hafta)): ozet for yil, hafta, ozet in rows}
+
+
+def _replace_weeks(con, table: str, frame: pd.DataFrame) -> int:
+    """
+    Tablodaki, yeni verinin kapsadığı haftalardan içeriği değişenleri yeni
+    satırlarla değiştirir.
+
+    Tablo yoksa yeni verinin şemasıyla oluşturulur; indeksler yoksa eklenir.
+
+    Returns:
+        int: Yazılan satır sayısı
+    """
+    fingerprints = week_fingerprints(frame)
+    exists = _table_exists(con, table)
+    stored = _stored_fingerprints(con, table) if exists else {}
+    weeks = [week for week, fingerprint in fingerprints.items() if stored.get(week) != fingerprint]
+    if not weeks:
+        logger.info(f"SQL deposu: {table} tablosunda değişen hafta yok, yazma atlandı.")
+        return 0
+
+    if len(weeks) < len(fingerprints):
+        keys = frame["yil"].to_numpy(dtype=np.int64) * 100 + frame["hafta"].to_numpy(dtype=np.int64)
+        frame = frame[np.isin(keys, [yil * 100 + hafta for yil, hafta in weeks])]
+    if exists:
+        con.executemany(f"DELETE FROM {table} WHERE yil = ? AND hafta = ?", weeks)
+
+    if duckdb is not None:
+        con.register("yeni_veri", frame)
+        if exists:
+            con.execute(f"INSERT INTO {table} BY NAME SELECT * FROM yeni_veri")
+        else:
+            con.execute(f"CREATE TABLE {table} AS SELECT * FROM yeni_veri")
+        con.unregister("yeni_veri")
+    else:
+        if not exists:
+            con.execute(pd.io.sql.get_schema(frame, table, con=con))
+        _insert_rows(con, table, frame)
+
+    # İndeksler tablo doldurulduktan sonra bir kez oluşturulur
+    for columns in TABLE_INDEXES[table]:
+        name = f"ix_{table}_{'_'.join(columns)}"
+        con.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+
+    # Yazılan haftaların özetleri güncellenir
+    con.execute(
+        f"CREATE TABLE IF NOT EXISTS {FINGERPRINT_TABLE} "
+        "(tablo VARCHAR, yil INTEGER, hafta INTEGER, ozet VARCHAR, PRIMARY KEY (tablo, yil, hafta))"
+    )
+    con.executemany(
+        f"DELETE FROM {FINGERPRINT_TABLE} WHERE tablo = ? AND yil = ? AND hafta = ?",
+        [(table, yil, hafta) for yil, hafta in weeks]
+    )
+    con.executemany(
+        f"INSERT INTO {FINGERPRINT_TABLE} (tablo, yil, hafta, ozet) VALUES (?, ?, ?, ?)",
+        [(table, yil, hafta, fingerprints[(yil, hafta)]) for yil, hafta in weeks]
+    )
+    return len(frame)
+
+
+def write_store(
+    df: pd.DataFrame,
+    calisma_df: Optional[pd.DataFrame] = None,
+    db_path: str = DEFAULT_DB_PATH
+) -> Dict[str, int]:
+    """
+    İşlenmiş duruş ve çalışma süresi verisini SQL deposuna yazar.
+
+    Her tabloda yeni verinin kapsadığı (yıl, hafta) çiftlerinden içeriği
+    değişenler yenisiyle değiştirilir; iki tablonun yazımı tek işlemde yapılır.
+
+    Args:
+        df: İşlenmiş duruş verisi
+        calisma_df: Ham çalışma süresi verisi (None ise yalnızca duruşlar yazılır)
+        db_path: Veritabanı dosyası
+
+    Returns:
+        Dict[str, int]: Tablo -> yazılan satır sayısı (değişmeyen haftalar sayılmaz)
+    """
+    tables = {"durus": durus_table(df)}
+    if calisma_df is not None and not calisma_df.empty:
+        tables["calisma"] = calisma_table(calisma_df)
+    tables = {table: frame for table, frame in tables.items() if not frame.empty}
+
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    written = {}
+    con = connect(db_path)
+    try:
+        con.execute("BEGIN TRANSACTION")
+        for table, frame in tables.items():
+            written[table] = _replace_weeks(con, table, frame)
+        con.commit()
+    except Exception:
+        con.rollback()
+        raise
+    finally:
+        con.close()
+
+    logger.info(
+        f"SQL deposu güncellendi ({BACKEND}): {db_path} ("
+        + ", ".join(f"{table}: {rows} satır" for table, rows in written.items()) + ")"
+    )
+    return written
+
+
+def normalize_query(sql: str) -> str:
+    """
+    Sorgu metnini sarmalanabilir hale getirir (boşluklar ve sondaki ';' atılır).
+
+    Args:
+        sql: Sorgu metni
+
+    Returns:
+        str: Temizlenmiş sorgu
+
+    Raises:
+        ValueError: Sorgu boşsa veya SELECT/WITH ile başlamıyorsa
+    """
+    sql = sql.strip().rstrip(";").strip()
+    if not sql:
+        raise ValueError("Sorgu metni boş.")
+    keyword = re.match(r"[(\s]*(\w*)", _LEADING_COMMENTS.sub("", sql)).group(1).upper()
+    if keyword not in QUERY_KEYWORDS:
+        raise ValueError("Yalnızca SELECT veya WITH ile başlayan sorgular çalıştırılabilir.")
+    return sql
+
+
+def _read(con, sql: str, params: Sequence = ()) -> pd.DataFrame:
+    """
+    Sorguyu açık bağlantıda çalıştırıp sonucu tablo olarak döndürür.
+    """
+    if duckdb is not None:
+        return con.execute(sql, list(params)).df()
+    return pd.read_sql_query(sql, con, params=list(params))
+
+
+def run_query(sql: str, params: Sequence = (), db_path: str = DEFAULT_DB_PATH) -> pd.DataFrame:
+    """
+    SQL deposunda salt okunur bir sorgu çalıştırır.
+
+    Args:
+        sql: Sorgu metni (SELECT veya WITH ile başlayan tek ifade)
+        params: Sorgu parametreleri ('?' yer tutucuları için)
+        db_path: Veritabanı dosyası
+
+    Returns:
+        pd.DataFrame: Sorgu sonucu
+    """
+    sql = normalize_query(sql)
+    con = _query_connection(db_path)
+    try:
+        return _read(con, sql, params)
+    finally:
+        con.close()
+
+
+def list_tables(db_path: str = DEFAULT_DB_PATH) -> Dict[str, List[str]]:
+    """
+    Depodaki tabloları ve sütunlarını döndürür.
+
+    Args:
+        db_path: Veritabanı dosyası
+
+    Returns:
+        Dict[str, List[str]]: Tablo -> sütun adları (depo yoksa boş)
+    """
+    if not os.path.exists(db_path):
+        return {}
+
+    con = connect(db_path, read_only=True)
+    try:
+        return {
+            table: list(_read(con, f"SELECT * FROM {table} LIMIT 0").columns)
+            for table in TABLE_INDEXES
+            if _table_exists(con, table)
+        }
+    finally:
+        con.close()
+
+
+class QueryPager:
+    """
+    Bir sorgunun sonucunu sayfa sayfa okuyan salt okunur imleç.
+
+    Sorgu bir kez çalıştırılır ve sonucu bağlantıya özel geçici tabloya
+    yazılır; sayfalar bu tablodan LIMIT/OFFSET ile okunur. Sıralı bir sorgu
+    her sayfa için yeniden sıralanmaz ve sonuç belleğe bir kerede alınmaz.
+    """
+
+    def __init__(self, sql: str, db_path: str = DEFAULT_DB_PATH, page_size: int = PAGE_SIZE):
+        """
+        Sorguyu çalıştır; sütunları ve toplam satır sayısını oku.
+
+        Args:
+            sql: Sorgu metni (SELECT veya WITH ile başlayan tek ifade)
+            db_path: Veritabanı dosyası
+            page_size: Sayfa başına satır sayısı
+        """
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(f"SQL deposu bulunamadı: {db_path}")
+
+        self.sql = normalize_query(sql)
+        self.page_size = page_size
+        self.con = _query_connection(db_path)
+        try:
+            # Geçici tablo bağlantıya özeldir; salt okunur depoya yazılmaz
+            self.con.execute(f"CREATE TEMP TABLE {RESULT_TABLE} AS {self.sql}")
+            self.columns = [str(column) for column in _read(self.con, f"SELECT * FROM {RESULT_TABLE} LIMIT 0").columns]
+            self.row_count = int(self.con.execute(f"SELECT COUNT(*) FROM {RESULT_TABLE}").fetchone()[0])
+        except Exception:
+            self.close()
+            raise
+
+    def page(self, number: int) -> pd.DataFrame:
+        """
+        Bir sayfanın satırlarını döndürür.
+
+        Args:
+            number: Sayfa numarası (0'dan başlar)
+
+        Returns:
+            pd.DataFrame: Sayfa satırları
+        """
+        return _read(
+            self.con,
+            f"SELECT * FROM {RESULT_TABLE} LIMIT ? OFFSET ?",
+            (self.page_size, number * self.page_size)
+        )
+
+    def close(self) -> None:
+        """
+        Bağlantıyı (ve geçici sonuç tablosunu) kapatır.
+        """
+        if self.con is not None:
+            self.con.close()
+            self.con = None
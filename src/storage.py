@@ -0,0 +1,280 @@
+"""
+İşlenmiş duruş verisi için hafta bölümlü Parquet deposu.
+
+İşlenmiş veri, ISO yıl ve hafta numarasına göre Hive biçiminde bölümlenmiş
+bir Parquet veri seti olarak saklanır (data/processed/durus/Yıl=2024/Hafta=5/...).
+Okuma fonksiyonları yalnızca istenen bölümleri açar; son hafta analizinin
+maliyeti saklanan geçmişin büyüklüğünden bağımsızdır.
+
+pyarrow kurulu değilse depo devre dışıdır; is_available() False döner ve
+analiz bellek içindeki tablo ile devam eder.
+"""
+
+import os
+import re
+import datetime
+from typing import Dict, List, Tuple, Optional
+import logging
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:  # pragma: no cover - isteğe bağlı bağımlılık
+    pa = None
+    ds = None
+
+from config.settings import DATA_PATHS
+from src.data_processing import apply_compact_schema
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Varsayılan depo dizini
+DEFAULT_STORE_PATH = os.path.join(DATA_PATHS["processed_data"], "durus")
+
+# Bölüm sütunları (Hive dizin adlarında bu sırayla yer alır)
+PARTITION_COLUMNS = ["Yıl", "Hafta"]
+
+# Bölüm dizin adı deseni
+_PARTITION_PATTERN = re.compile(r"^(?P<key>[^=]+)=(?P<value>-?\d+)$")
+
+
+def is_available() -> bool:
+    """
+    Parquet deposunun kullanılabilir olup olmadığını döndürür.
+
+    Returns:
+        bool: pyarrow kuruluysa True
+    """
+    return pa is not None
+
+
+def _partitioning():
+    """
+    Yıl/Hafta Hive bölümleme tanımını döndürür.
+    """
+    return ds.partitioning(
+        pa.schema([("Yıl", pa.int16()), ("Hafta", pa.int16())]),
+        flavor="hive"
+    )
+
+
+def _check_partition_columns(df: pd.DataFrame) -> None:
+    """
+    Yazma öncesinde pyarrow ve bölüm sütunlarının varlığını kontrol eder.
+    """
+    if not is_available():
+        raise RuntimeError("Parquet deposu için pyarrow kurulu olmalıdır.")
+
+    missing = [col for col in PARTITION_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Bölüm sütunları bulunamadı: {', '.join(missing)}")
+
+
+def write_partitions(df: pd.DataFrame, store_path: str = DEFAULT_STORE_PATH) -> List[Tuple[int, int]]:
+    """
+    İşlenmiş veriyi hafta bölümlerine yazar.
+
+    Tablodaki her (yıl, hafta) bölümü diskteki karşılığının yerine yazılır;
+    tabloda bulunmayan bölümlere dokunulmaz.
+
+    Args:
+        df: İşlenmiş veri ('Yıl' ve 'Hafta' sütunları zorunlu)
+        store_path: Depo dizini
+
+    Returns:
+        List[Tuple[int, int]]: Yazılan (yıl, hafta) bölümleri
+    """
+    _check_partition_columns(df)
+    if df.empty:
+        return []
+
+    os.makedirs(store_path, exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    ds.write_dataset(
+        table,
+        store_path,
+        format="parquet",
+        partitioning=_partitioning(),
+        basename_template="part-{i}.parquet",
+        existing_data_behavior="delete_matching"
+    )
+
+    written = sorted(
+        (int(y), int(w))
+        for y, w in df[PARTITION_COLUMNS].drop_duplicates().itertuples(index=False)
+    )
+    logger.info(f"İşlenmiş veri depoya yazıldı: {store_path} ({len(df)} satır, {len(written)} bölüm)")
+    return written
+
+
+def append_partitions(df: pd.DataFrame, store_path: str = DEFAULT_STORE_PATH) -> List[Tuple[int, int]]:
+    """
+    İşlenmiş veriyi mevcut bölümlere yeni dosyalar olarak ekler.
+
+    Mevcut dosyalar okunmaz veya değiştirilmez; her çağrı bölüm dizinlerine
+    zaman damgalı yeni bir dosya yazar.
+
+    Args:
+        df: İşlenmiş veri ('Yıl' ve 'Hafta' sütunları zorunlu)
+        store_path: Depo dizini
+
+    Returns:
+        List[Tuple[int, int]]: Veri eklenen (yıl, hafta) bölümleri
+    """
+    _check_partition_columns(df)
+    if df.empty:
+        return []
+
+    # Zaman damgalı dosya adları sözlük sırasında da kronolojik sıralanır
+    batch = datetime.datetime.now().strftime("%Y%m%d%H%M%S%f")
+
+    os.makedirs(store_path, exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    ds.write_dataset(
+        table,
+        store_path,
+        format="parquet",
+        partitioning=_partitioning(),
+        basename_template=f"part-{batch}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore"
+    )
+
+    appended = sorted(
+        (int(y), int(w))
+        for y, w in df[PARTITION_COLUMNS].drop_duplicates().itertuples(index=False)
+    )
+    logger.info(f"Depoya eklendi: {store_path} ({len(df)} satır, {len(appended)} bölüm)")
+    return appended
+
+
+def list_partitions(store_path: str = DEFAULT_STORE_PATH) -> List[Tuple[int, int]]:
+    """
+    Depodaki (yıl, hafta) bölümlerini dizin adlarından listeler; veri okunmaz.
+
+    Args:
+        store_path: Depo dizini
+
+    Returns:
+        List[Tuple[int, int]]: Sıralı (yıl, hafta) bölümleri
+    """
+    partitions = []
+    if not os.path.isdir(store_path):
+        return partitions
+
+    for year_dir in os.listdir(store_path):
+        year_match = _PARTITION_PATTERN.match(year_dir)
+        if not year_match or year_match.group("key") != "Yıl":
+            continue
+        year_path = os.path.join(store_path, year_dir)
+        if not os.path.isdir(year_path):
+            continue
+        for week_dir in os.listdir(year_path):
+            week_match = _PARTITION_PATTERN.match(week_dir)
+            if week_match and week_match.group("key") == "Hafta":
+                partitions.append((int(year_match.group("value")), int(week_match.group("value"))))
+
+    return sorted(partitions)
+
+
+def has_partition(year: int, week: int, store_path: str = DEFAULT_STORE_PATH) -> bool:
+    """
+    Depoda verilen (yıl, hafta) bölümünün bulunup bulunmadığını döndürür.
+
+    Hafta numarası tek başına bir bölümü belirlemez; aynı hafta numarası
+    depodaki başka yıllarda da bulunabilir.
+
+    Args:
+        year: ISO yıl
+        week: ISO hafta numarası
+        store_path: Depo dizini
+
+    Returns:
+        bool: Bölüm varsa True
+    """
+    return (int(year), int(week)) in set(list_partitions(store_path))
+
+
+def read_partitions(
+    store_path: str = DEFAULT_STORE_PATH,
+    partitions: Optional[List[Tuple[int, int]]] = None,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Depodan yalnızca istenen bölümleri ve sütunları okur.
+
+    Args:
+        store_path: Depo dizini
+        partitions: Okunacak (yıl, hafta) bölümleri (None ise tümü)
+        columns: Okunacak sütunlar (None ise tümü)
+
+    Returns:
+        pd.DataFrame: Sıkıştırılmış şemaya dönüştürülmüş veri
+    """
+    if not is_available():
+        raise RuntimeError("Parquet deposu için pyarrow kurulu olmalıdır.")
+
+    if partitions is not None and not partitions:
+        return pd.DataFrame(columns=columns or [])
+
+    dataset = ds.dataset(store_path, format="parquet", partitioning=_partitioning())
+
+    # Bölüm filtresi; pyarrow eşleşmeyen dizinleri hiç açmaz
+    expression = None
+    for year, week in partitions or []:
+        condition = (ds.field("Yıl") == year) & (ds.field("Hafta") == week)
+        expression = condition if expression is None else expression | condition
+
+    table = dataset.to_table(columns=columns, filter=expression)
+    df = apply_compact_schema(table.to_pandas())
+    logger.info(f"Depodan okundu: {len(df)} satır, {len(partitions) if partitions is not None else 'tüm'} bölüm")
+    return df
+
+
+def read_week(
+    year: int,
+    week: int,
+    store_path: str = DEFAULT_STORE_PATH,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Tek bir (yıl, hafta) bölümünün verisini okur.
+
+    Args:
+        year: ISO yıl
+        week: ISO hafta numarası
+        store_path: Depo dizini
+        columns: Okunacak sütunlar
+
+    Returns:
+        pd.DataFrame: Haftaya ait veri (bölüm depoda yoksa boş tablo)
+    """
+    if not has_partition(year, week, store_path):
+        logger.warning(f"Depoda {year} yılı {week}. haftaya ait bölüm bulunamadı: {store_path}")
+        return pd.DataFrame(columns=columns or [])
+    return read_partitions(store_path, [(int(year), int(week))], columns)
+
+
+def store_summary(store_path: str = DEFAULT_STORE_PATH) -> Dict:
+    """
+    Depo hakkında özet bilgi döndürür.
+
+    Args:
+        store_path: Depo dizini
+
+    Returns:
+        Dict: Bölüm sayısı, ilk/son bölüm ve disk boyutu (bayt)
+    """
+    partitions = list_partitions(store_path)
+    size = 0
+    for root, _, files in os.walk(store_path):
+        size += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    return {
+        "path": store_path,
+        "partition_count": len(partitions),
+        "first": partitions[0] if partitions else None,
+        "last": partitions[-1] if partitions else None,
+        "size_bytes": size
+    }
@@ -0,0 +1,298 @@
+"""
+Test ve performans ölçümleri için sentetik duruş ve çalışma süresi verisi üretimi.
+
+Üretilen tablolar MES dışa aktarımlarıyla aynı sütunlara sahiptir ve
+doğrudan build_analysis_frame fonksiyonuna veya Excel dosyalarına
+yazılarak prepare_data_for_analysis fonksiyonuna verilebilir.
+"""
+
+import os
+import math
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Tuple, Optional
+import logging
+
+from config.tezgah_listesi import KISIMLAR_DICT
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Vardiya süresi (saniye)
+SHIFT_SECONDS = 8 * 3600
+
+# Duruş tipleri: (ad, seçilme ağırlığı, ortalama süre (dakika))
+STOP_TYPES = [
+    ("YEMEK MOLASI", 0.14, 30),
+    ("ÇAY MOLASI", 0.10, 15),
+    ("AYAR", 0.14, 25),
+    ("SMED", 0.06, 45),
+    ("ARIZA", 0.07, 60),
+    ("BOZULMA", 0.04, 90),
+    ("TAMİR", 0.03, 75),
+    ("TASARIM", 0.04, 40),
+    ("MALZEME BEKLEME", 0.10, 35),
+    ("OPERATÖR YOK", 0.06, 120),
+    ("KALİTE KONTROL", 0.08, 20),
+    ("ÇALIŞMA SÜRESİ", 0.14, 240),
+]
+
+# Arızalı tezgahlarda arıza tipi duruşların ağırlık çarpanı
+FAULTY_FAILURE_FACTOR = 6.0
+FAILURE_STOPS = ("ARIZA", "BOZULMA", "TAMİR")
+
+
+def select_machines(n_machines: Optional[int] = None) -> List[str]:
+    """
+    KISIMLAR_DICT içindeki kısımlara dengeli dağılmış tezgah kodları seçer.
+
+    İstenen sayı tanımlı tezgah sayısından büyükse, kısımlara sırayla
+    dağıtılmış ek kodlar ("<kod>-<n>") üretilir; bu kodlar hiçbir kısma ait
+    olmadığından analizde "Diğer" kısmına düşer.
+
+    Args:
+        n_machines: Tezgah sayısı (None ise tüm tanımlı tezgahlar)
+
+    Returns:
+        List[str]: Tezgah kodları
+    """
+    # Kısımlar arasında sırayla dolaşan tezgah listesi
+    sections = list(KISIMLAR_DICT.values())
+    interleaved = [
+        tezgahlar[i]
+        for i in range(max(len(t) for t in sections))
+        for tezgahlar in sections
+        if i < len(tezgahlar)
+    ]
+    if n_machines is None:
+        return interleaved
+
+    machines = interleaved[:n_machines]
+    cycle = 2
+    while len(machines) < n_machines:
+        remaining = n_machines - len(machines)
+        machines.extend(f"{code}-{cycle}" for code in interleaved[:remaining])
+        cycle += 1
+    return machines
+
+
+def generate_durus_data(
+    machines: List[str],
+    n_weeks: int = 4,
+    stops_per_shift: int = 3,
+    overlap_rate: float = 0.05,
+    faulty_machines: Optional[List[str]] = None,
+    shifts_per_day: int = 3,
+    start_date: str = "2024-01-01",
+    seed: int = 0
+) -> pd.DataFrame:
+    """
+    Sentetik duruş verisi üretir.
+
+    Args:
+        machines: Tezgah kodları
+        n_weeks: Hafta sayısı
+        stops_per_shift: Vardiya başına duruş sayısı
+        overlap_rate: Bir önceki duruşla çakışan duruşların oranı (0-1)
+        faulty_machines: Arıza tipi duruşları daha sık görülen tezgahlar
+        shifts_per_day: Günlük vardiya sayısı
+        start_date: Başlangıç tarihi (pazartesi olması önerilir)
+        seed: Rastgele sayı üreteci tohumu
+
+    Returns:
+        pd.DataFrame: Duruş dışa aktarımı ile aynı sütunlara sahip veri
+    """
+    rng = np.random.default_rng(seed)
+
+    n_machines = len(machines)
+    n_shifts = n_machines * n_weeks * 7 * shifts_per_day
+    n_rows = n_shifts * stops_per_shift
+    if n_rows == 0:
+        return pd.DataFrame(columns=["İş Merkezi Kodu ", "Duruş Adı",
+                                     "Duruş Başlangıç Tarih", "Duruş Bitiş Tarih"])
+
+    names = np.array([t[0] for t in STOP_TYPES], dtype=object)
+    weights = np.array([t[1] for t in STOP_TYPES])
+    mean_minutes = np.array([t[2] for t in STOP_TYPES], dtype=float)
+
+    # Her vardiyanın tezgah indeksi ve başlangıç zamanı (saniye)
+    shift_idx = np.arange(n_shifts)
+    machine_idx = shift_idx // (n_weeks * 7 * shifts_per_day)
+    shift_in_machine = shift_idx % (n_weeks * 7 * shifts_per_day)
+    shift_start = shift_in_machine.astype(np.int64) * SHIFT_SECONDS * 3 // shifts_per_day
+
+    # Duruş tiplerini seç; arızalı tezgahlarda arıza tiplerini ağırlıklandır
+    row_machine = np.repeat(machine_idx, stops_per_shift)
+    faulty = np.isin(np.asarray(machines, dtype=object), list(faulty_machines or []))
+    type_idx = rng.choice(len(STOP_TYPES), size=n_rows, p=weights / weights.sum())
+    if faulty.any():
+        faulty_weights = weights.copy()
+        faulty_weights[np.isin(names, FAILURE_STOPS)] *= FAULTY_FAILURE_FACTOR
+        faulty_rows = faulty[row_machine]
+        type_idx[faulty_rows] = rng.choice(
+            len(STOP_TYPES), size=int(faulty_rows.sum()), p=faulty_weights / faulty_weights.sum()
+        )
+
+    # Süreler: tip ortalamasına göre log-normal, vardiya süresiyle sınırlı
+    durations = rng.lognormal(mean=0.0, sigma=0.6, size=n_rows) * mean_minutes[type_idx] * 60
+    durations = np.clip(durations, 60, SHIFT_SECONDS).astype(np.int64)
+
+    # Vardiya içindeki başlangıç zamanları (sıralı)
+    offsets = np.sort(rng.integers(0, SHIFT_SECONDS, size=(n_shifts, stops_per_shift)), axis=1)
+    starts = (np.repeat(shift_start, stops_per_shift) + offsets.ravel()).astype(np.int64)
+
+    # Çakışmalar: seçilen duruşlar bir önceki duruşun içinde başlar
+    if overlap_rate > 0 and stops_per_shift > 1:
+        first_in_shift = (np.arange(n_rows) % stops_per_shift) == 0
+        overlap = (rng.random(n_rows) < overlap_rate) & ~first_in_shift
+        prev = np.flatnonzero(overlap) - 1
+        starts[overlap] = starts[prev] + (rng.random(len(prev)) * durations[prev]).astype(np.int64)
+
+    base = np.datetime64(pd.Timestamp(start_date).to_datetime64(), "s")
+    start_ts = base + starts.astype("timedelta64[s]")
+    end_ts = start_ts + durations.astype("timedelta64[s]")
+
+    return pd.DataFrame({
+        "İş Merkezi Kodu ": np.asarray(machines, dtype=object)[row_machine],
+        "Duruş Adı": names[type_idx],
+        "Duruş Başlangıç Tarih": start_ts.astype("datetime64[ns]"),
+        "Duruş Bitiş Tarih": end_ts.astype("datetime64[ns]"),
+    })
+
+
+def generate_calisma_data(
+    machines: List[str],
+    n_weeks: int = 4,
+    start_date: str = "2024-01-01",
+    seed: int = 0
+) -> pd.DataFrame:
+    """
+    Sentetik günlük çalışma süresi ve OEE verisi üretir.
+
+    Args:
+        machines: Tezgah kodları
+        n_weeks: Hafta sayısı
+        start_date: Başlangıç tarihi
+        seed: Rastgele sayı üreteci tohumu
+
+    Returns:
+        pd.DataFrame: Çalışma süresi dışa aktarımı ile aynı sütunlara sahip veri
+    """
+    rng = np.random.default_rng(seed + 1)
+
+    n_days = n_weeks * 7
+    n_rows = len(machines) * n_days
+    days = pd.date_range(start=start_date, periods=n_days, freq="D")
+
+    # Dakika cinsinden günlük süreler
+    planli = rng.integers(30, 120, size=n_rows).astype(float)
+    plansiz = rng.integers(0, 240, size=n_rows).astype(float)
+    calisma = 1440.0 - planli - plansiz
+
+    kullanilabilirlik = calisma / (calisma + plansiz)
+    performans = rng.uniform(0.70, 0.98, size=n_rows)
+    kalite = rng.uniform(0.90, 1.00, size=n_rows)
+    oee = kullanilabilirlik * performans * kalite
+
+    return pd.DataFrame({
+        "Makina Kodu": np.repeat(np.asarray(machines, dtype=object), n_days),
+        "Tarih": np.tile(days.values, len(machines)),
+        "Çalışma Zamanı": calisma,
+        "Planlı Duruş": planli,
+        "Plansız Duruş": plansiz,
+        "Oee": oee,
+        "Performans": performans,
+        "Kullanılabilirlik": kullanilabilirlik,
+        "Kalite": kalite,
+    })
+
+
+def generate_dataset(
+    n_rows: Optional[int] = None,
+    n_machines: Optional[int] = None,
+    n_weeks: int = 4,
+    stops_per_shift: int = 3,
+    overlap_rate: float = 0.05,
+    n_faulty: int = 2,
+    shifts_per_day: int = 3,
+    start_date: str = "2024-01-01",
+    seed: int = 0
+) -> Dict:
+    """
+    Duruş, çalışma süresi ve arızalı tezgah verilerinden oluşan sentetik veri seti üretir.
+
+    n_rows verilirse hafta sayısı, duruş satır sayısı bu değere ulaşacak
+    şekilde artırılır (n_weeks alt sınır olarak kullanılır); fazla satırlar
+    tüm tezgahlar arasından rastgele örneklenerek atılır.
+
+    Args:
+        n_rows: Hedef duruş satır sayısı
+        n_machines: Tezgah sayısı (None ise tüm tanımlı tezgahlar)
+        n_weeks: Hafta sayısı
+        stops_per_shift: Vardiya başına duruş sayısı
+        overlap_rate: Çakışan duruş oranı
+        n_faulty: Arızalı tezgah sayısı
+        shifts_per_day: Günlük vardiya sayısı
+        start_date: Başlangıç tarihi
+        seed: Rastgele sayı üreteci tohumu
+
+    Returns:
+        Dict: 'durus', 'calisma' ve 'arizali' anahtarlarını içeren veri seti
+    """
+    machines = select_machines(n_machines)
+
+    if n_rows is not None:
+        rows_per_week = len(machines) * 7 * shifts_per_day * stops_per_shift
+        n_weeks = max(n_weeks, math.ceil(n_rows / rows_per_week))
+
+    rng = np.random.default_rng(seed)
+    n_faulty = min(n_faulty, len(machines))
+    arizali = sorted(rng.choice(machines, size=n_faulty, replace=False).tolist()) if n_faulty else []
+
+    durus = generate_durus_data(
+        machines,
+        n_weeks=n_weeks,
+        stops_per_shift=stops_per_shift,
+        overlap_rate=overlap_rate,
+        faulty_machines=arizali,
+        shifts_per_day=shifts_per_day,
+        start_date=start_date,
+        seed=seed
+    )
+    if n_rows is not None and len(durus) > n_rows:
+        # Satırlar tezgah sırasıyla üretildiğinden baştan kesmek son tezgahları
+        # ve kısımları düşürür; tüm tezgahlardan eşit olasılıkla örneklenir
+        keep = np.sort(rng.choice(len(durus), size=n_rows, replace=False))
+        durus = durus.iloc[keep].reset_index(drop=True)
+
+    calisma = generate_calisma_data(machines, n_weeks=n_weeks, start_date=start_date, seed=seed)
+
+    logger.info(
+        f"Sentetik veri üretildi: {len(machines)} tezgah, {n_weeks} hafta, "
+        f"{len(durus)} duruş satırı, {len(calisma)} çalışma satırı"
+    )
+    return {"durus": durus, "calisma": calisma, "arizali": arizali}
+
+
+def write_dataset(dataset: Dict, directory: str) -> Tuple[str, str, str]:
+    """
+    Sentetik veri setini Excel ve metin dosyalarına yazar.
+
+    Args:
+        dataset: generate_dataset çıktısı
+        directory: Çıktı dizini
+
+    Returns:
+        Tuple[str, str, str]: Duruş, çalışma süresi ve arızalı tezgah dosya yolları
+    """
+    os.makedirs(directory, exist_ok=True)
+    durus_file = os.path.join(directory, "durus.xlsx")
+    calisma_file = os.path.join(directory, "calisma.xlsx")
+    arizali_file = os.path.join(directory, "arizali.txt")
+
+    dataset["durus"].to_excel(durus_file, index=False)
+    dataset["calisma"].to_excel(calisma_file, index=False)
+    with open(arizali_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(dataset["arizali"]))
+
+    return durus_file, calisma_file, arizali_file
@@ -0,0 +1,200 @@
+"""
+Haftalar boyunca kayan pencere ve üstel ağırlıklı trend göstergeleri.
+
+Duruş süreleri önce grup (tezgah, kısım veya duruş adı) x hafta dakika
+matrisine tek bir np.bincount ile toplanır. Hafta ekseni ilk ve son hafta
+arasındaki tüm ISO haftalarını yıl-hafta anahtarlarıyla (yıl geçişleri
+dahil) içerir; kaydı olmayan haftalar sıfırdır. Tüm göstergeler bu küçük
+matris üzerinde sütun yönünde vektörel hesaplanır:
+
+    Kayan toplam (w hafta)  = birikimli toplam[t] - birikimli toplam[t - w]
+    Kayan ortalama          = kayan toplam / penceredeki hafta sayısı
+    EWMA                    = pandas ewm(span=EWMA_SPAN, adjust=False)
+    Haftalık artış          = süre[t] - süre[t - 1]
+
+Pencere henüz dolmamışsa (ilk haftalar) mevcut haftalar kullanılır; ilk
+haftanın artışı boş kalır. Son haftada en büyük pozitif artışı gösteren
+gruplar işaretlenir.
+"""
+
+from typing import Dict, List, Optional, Sequence
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing import WEEK_KEY_COLUMN, week_keys, week_ordinals, week_range
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Kayan pencere uzunlukları (hafta)
+WINDOWS = (4, 8, 13)
+
+# Üstel ağırlıklı ortalamanın span değeri (hafta)
+EWMA_SPAN = 4
+
+# Seviye -> gruplama sütunu
+LEVEL_COLUMNS = {
+    "tezgah": "İş Merkezi Kodu ",
+    "kisim": "KISIM",
+    "durus": "Duruş Adı",
+}
+
+# Seviye -> artış grafiği başlığı
+LEVEL_TITLES = {
+    "tezgah": "En Çok Artan Tezgahlar",
+    "kisim": "En Çok Artan Kısımlar",
+    "durus": "En Çok Artan Duruşlar",
+}
+
+# Seviye başına işaretlenecek en büyük artış sayısı
+TOP_INCREASES = 10
+
+
+def weekly_matrix(
+    df: pd.DataFrame,
+    group_column: str,
+    weeks: Sequence[int]
+) -> pd.DataFrame:
+    """
+    Grup x hafta toplam duruş dakikası matrisini oluşturur.
+
+    ÇALIŞMA SÜRESİ kayıtları duruş sayılmaz.
+
+    Args:
+        df: İşlenmiş duruş verisi
+        group_column: Gruplama sütunu
+        weeks: Sıralı yıl-hafta anahtarları; eksen ilk ve son hafta arasındaki
+            tüm ISO haftaları (yıl geçişleri dahil) kapsar
+
+    Returns:
+        pd.DataFrame: Satırları grup, sütunları yıl-hafta anahtarı olan dakika matrisi
+    """
+    week_axis = pd.Index(
+        week_range(weeks[0], weeks[-1]) if len(weeks) else [], dtype=np.int64, name=WEEK_KEY_COLUMN
+    )
+    keys = week_keys(df)
+    mask = (df["Duruş Adı"] != "ÇALIŞMA SÜRESİ").to_numpy() & np.isin(keys, week_axis)
+    data = df.loc[mask, [group_column, "Süre (Saniye)"]]
+
+    codes, uniques = pd.factorize(data[group_column], sort=True)
+    week_codes = week_ordinals(keys[mask]) - (week_ordinals([weeks[0]])[0] if len(weeks) else 0)
+    size = len(uniques) * len(week_axis)
+    minutes = np.bincount(
+        codes.astype(np.int64) * len(week_axis) + week_codes,
+        weights=data["Süre (Saniye)"].to_numpy(dtype=np.float64) / 60,
+        minlength=size
+    ).reshape(len(uniques), len(week_axis))
+
+    return pd.DataFrame(
+        minutes,
+        index=pd.Index(np.asarray(uniques).astype(str), name=group_column),
+        columns=week_axis
+    )
+
+
+def rolling_metrics(matrix: pd.DataFrame) -> pd.DataFrame:
+    """
+    Grup x hafta matrisinden kayan toplam/ortalama, EWMA ve haftalık artışları hesaplar.
+
+    Args:
+        matrix: weekly_matrix çıktısı
+
+    Returns:
+        pd.DataFrame: Grup ve hafta başına bir satırlık uzun tablo
+    """
+    values = matrix.to_numpy(dtype=np.float64)
+    group_count, week_count = values.shape
+
+    # Başa sıfır sütunu eklenmiş birikimli toplam: cumsum[:, t + 1] = ilk t + 1 haftanın toplamı
+    cumulative = np.zeros((group_count, week_count + 1))
+    np.cumsum(values, axis=1, out=cumulative[:, 1:])
+    positions = np.arange(week_count)
+
+    metrics = {"Süre (Dakika)": values}
+    for window in WINDOWS:
+        lower = np.maximum(positions + 1 - window, 0)
+        total = cumulative[:, positions + 1] - cumulative[:, lower]
+        metrics[f"Toplam {window} Hafta"] = total
+        metrics[f"Ortalama {window} Hafta"] = total / (positions + 1 - lower)
+
+    metrics["EWMA"] = pd.DataFrame(values.T).ewm(span=EWMA_SPAN, adjust=False).mean().to_numpy().T
+
+    # İlk haftanın önceki haftası bilinmediğinden artışı boş kalır
+    previous = np.full_like(values, np.nan)
+    previous[:, 1:] = values[:, :-1]
+    metrics["Önceki Hafta (Dakika)"] = previous
+    metrics["Artış (Dakika)"] = values - previous
+    with np.errstate(divide="ignore", invalid="ignore"):
+        metrics["Artış Oranı"] = np.where(previous > 0, (values - previous) / previous, np.nan)
+
+    index = pd.MultiIndex.from_product([matrix.index, matrix.columns], names=[matrix.index.name, matrix.columns.name])
+    return pd.DataFrame({name: array.ravel() for name, array in metrics.items()}, index=index).reset_index()
+
+
+def flag_increases(table: pd.DataFrame, top_n: int = TOP_INCREASES) -> pd.DataFrame:
+    """
+    Son haftada haftalık artışı en büyük olan grupları işaretler.
+
+    Args:
+        table: rolling_metrics çıktısı
+        top_n: İşaretlenecek en fazla grup sayısı
+
+    Returns:
+        pd.DataFrame: 'Artış İşareti' sütunu eklenmiş tablo
+    """
+    table = table.assign(**{"Artış İşareti": False})
+    if table.empty:
+        return table
+    latest = table[WEEK_KEY_COLUMN] == table[WEEK_KEY_COLUMN].max()
+    increases = table.loc[latest & (table["Artış (Dakika)"] > 0), "Artış (Dakika)"]
+    table.loc[increases.nlargest(top_n).index, "Artış İşareti"] = True
+    return table
+
+
+def compute_trends(
+    df: pd.DataFrame,
+    weeks: List[int],
+    levels: Optional[Dict[str, str]] = None,
+    top_n: int = TOP_INCREASES
+) -> Dict[str, pd.DataFrame]:
+    """
+    Tezgah, kısım ve duruş adı bazında haftalık trend tablolarını hesaplar.
+
+    Args:
+        df: İşlenmiş duruş verisi
+        weeks: Sıralı yıl-hafta anahtarları
+        levels: Seviye -> gruplama sütunu (None ise LEVEL_COLUMNS)
+        top_n: Seviye başına işaretlenecek en büyük artış sayısı
+
+    Returns:
+        Dict[str, pd.DataFrame]: Seviye başına grup x hafta uzun tablolar
+    """
+    levels = levels or LEVEL_COLUMNS
+    tables = {
+        level: flag_increases(rolling_metrics(weekly_matrix(df, column, weeks)), top_n)
+        for level, column in levels.items()
+    }
+    logger.info(
+        f"Haftalık trendler hesaplandı: {len(weeks)} hafta, "
+        + ", ".join(f"{level}: {int(table['Artış İşareti'].sum())} artış" for level, table in tables.items())
+    )
+    return tables
+
+
+def latest_increases(table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Trend tablosundan son haftanın işaretli artışlarını büyükten küçüğe döndürür.
+
+    Args:
+        table: compute_trends seviye tablosu
+
+    Returns:
+        pd.DataFrame: İşaretli satırlar
+    """
+    return (
+        table[table["Artış İşareti"]]
+        .sort_values("Artış (Dakika)", ascending=False)
+        .reset_index(drop=True)
+    )
@@ -0,0 +1,318 @@
+"""
+Duruş ve çalışma süresi verileri için vektörel veri kalitesi kontrolleri.
+
+Her kural tablonun tamamı üzerinde tek bir vektörel işlemle satır bazında
+bir maske üretir; satırlar Python döngüsüyle dolaşılmaz. Kalite raporu her
+kural için ihlal sayısını ve ilk birkaç ihlalin satır indekslerini içerir.
+
+Metin sütunları kontrol başında bir kez kategorik kodlara çevrilir; makina
+kodu kontrolü yalnızca benzersiz değerler üzerinde yapılır ve tekrar eden
+satırlar metinler yerine tamsayı kodların özet değerleriyle bulunur.
+"""
+
+import time
+from typing import Dict, List, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+
+from config.tezgah_listesi import KISIMLAR_DICT
+from src.data_processing import OEE_COLUMNS
+
+# Loglama yapılandırması
+logger = logging.getLogger(__name__)
+
+# Raporda kural başına gösterilen örnek satır sayısı
+SAMPLE_SIZE = 5
+
+# KISIMLAR_DICT'te tanımlı tüm makina kodları
+KNOWN_MACHINES = frozenset(tezgah for tezgahlar in KISIMLAR_DICT.values() for tezgah in tezgahlar)
+
+
+def _as_datetime(series: pd.Series) -> pd.Series:
+    """
+    Sütunu datetime tipine çevirir; ayrıştırılamayan değerler NaT olur.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    return pd.to_datetime(series, errors="coerce")
+
+
+def unparseable_dates(series: pd.Series) -> np.ndarray:
+    """
+    Boş veya tarihe çevrilemeyen değerleri işaretler.
+
+    Args:
+        series: Tarih sütunu
+
+    Returns:
+        np.ndarray: İhlal maskesi
+    """
+    return _as_datetime(series).isna().to_numpy()
+
+
+def end_before_start(start: pd.Series, end: pd.Series) -> np.ndarray:
+    """
+    Bitiş tarihi başlangıç tarihinden önce olan kayıtları işaretler.
+
+    Args:
+        start: Başlangıç tarihleri
+        end: Bitiş tarihleri
+
+    Returns:
+        np.ndarray: İhlal maskesi (tarihi eksik satırlar işaretlenmez)
+    """
+    return (_as_datetime(end) < _as_datetime(start)).to_numpy()
+
+
+def non_positive_durations(start: pd.Series, end: pd.Series) -> np.ndarray:
+    """
+    Süresi sıfır veya negatif olan kayıtları işaretler.
+
+    Analizde süreler tam saniyeye yuvarlandığından bir saniyeden kısa
+    duruşlar da sıfır süreli sayılır (build_analysis_frame bu satırları çıkarır).
+
+    Args:
+        start: Başlangıç tarihleri
+        end: Bitiş tarihleri
+
+    Returns:
+        np.ndarray: İhlal maskesi (tarihi eksik satırlar işaretlenmez)
+    """
+    duration = _as_datetime(end) - _as_datetime(start)
+    return (duration < pd.Timedelta(seconds=1)).to_numpy()
+
+
+def _encode_text_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Metin sütunlarını kategorik tipe çevirir; diğer sütunlara dokunulmaz.
+    """
+    text_columns = {
+        col: "category" for col in df.columns
+        if pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col])
+    }
+    return df.astype(text_columns) if text_columns else df
+
+
+def _column_values(series: pd.Series) -> np.ndarray:
+    """
+    Sütunu özetlenebilir sayısal diziye çevirir (kategori kodu, tarih için int64).
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy()
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.to_numpy().view(np.int64)
+    if pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy()
+    return pd.factorize(series)[0]
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Her satırı tek bir 64 bit özet değerine indirger.
+
+    Args:
+        df: Tablo
+
+    Returns:
+        np.ndarray: uint64 satır özetleri
+    """
+    hashes = np.zeros(len(df), dtype=np.uint64)
+    for col in df.columns:
+        # FNV çarpanıyla karıştırma; sütun sırası özeti etkiler
+        hashes = hashes * np.uint64(0x100000001B3) ^ pd.util.hash_array(_column_values(df[col]))
+    return hashes
+
+
+def duplicate_rows(df: pd.DataFrame) -> np.ndarray:
+    """
+    Birebir tekrar eden satırları işaretler; her grubun ilk satırı işaretlenmez.
+
+    Satırlar tek bir 64 bit özet değerine indirgenir ve tekrarlar bu özetler
+    üzerinden bulunur; sütunlar ikili olarak karşılaştırılmaz.
+
+    Args:
+        df: Kontrol edilecek tablo
+
+    Returns:
+        np.ndarray: İhlal maskesi
+    """
+    return pd.Series(row_hashes(df)).duplicated(keep="first").to_numpy()
+
+
+def unknown_machines(series: pd.Series, known: frozenset = KNOWN_MACHINES) -> np.ndarray:
+    """
+    KISIMLAR_DICT'te tanımlı olmayan veya boş makina kodlarını işaretler.
+
+    Kontrol benzersiz değerler üzerinde yapılır ve kodlarla satırlara yayılır.
+
+    Args:
+        series: Makina kodu sütunu
+        known: Tanımlı makina kodları
+
+    Returns:
+        np.ndarray: İhlal maskesi
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        uniques = series.cat.categories
+    else:
+        codes, uniques = pd.factorize(series)
+
+    unknown = ~pd.Index(uniques).astype(str).str.strip().isin(known)
+    # -1 kodu boş değerdir ve bilinmeyen sayılır
+    return np.where(codes >= 0, unknown[codes], True)
+
+
+def out_of_unit_range(series: pd.Series) -> np.ndarray:
+    """
+    [0, 1] aralığı dışındaki oranları işaretler; boş değerler işaretlenmez.
+
+    Args:
+        series: Oran sütunu
+
+    Returns:
+        np.ndarray: İhlal maskesi
+    """
+    values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64)
+    return (values < 0) | (values > 1)
+
+
+def _durus_rules(df: pd.DataFrame) -> List[Dict]:
+    """
+    Duruş tablosu için kural listesini döndürür.
+    """
+    start, end = df["Duruş Başlangıç Tarih"], df["Duruş Bitiş Tarih"]
+    return [
+        {"rule": "tarih_okunamadi", "column": "Duruş Başlangıç Tarih",
+         "description": "Başlangıç tarihi boş veya okunamıyor",
+         "check": lambda: unparseable_dates(start)},
+        {"rule": "tarih_okunamadi", "column": "Duruş Bitiş Tarih",
+         "description": "Bitiş tarihi boş veya okunamıyor",
+         "check": lambda: unparseable_dates(end)},
+        {"rule": "bitis_baslangictan_once", "column": None,
+         "description": "Bitiş tarihi başlangıçtan önce",
+         "check": lambda: end_before_start(start, end)},
+        {"rule": "sure_sifir_veya_negatif", "column": None,
+         "description": "Süre sıfır veya negatif (1 saniyeden kısa)",
+         "check": lambda: non_positive_durations(start, end)},
+        {"rule": "tekrarlanan_satir", "column": None,
+         "description": "Birebir tekrarlanan satır",
+         "check": lambda: duplicate_rows(df)},
+        {"rule": "bilinmeyen_makina", "column": "İş Merkezi Kodu ",
+         "description": "Makina kodu tezgah listesinde yok",
+         "check": lambda: unknown_machines(df["İş Merkezi Kodu "])},
+    ]
+
+
+def _calisma_rules(df: pd.DataFrame) -> List[Dict]:
+    """
+    Çalışma süresi tablosu için kural listesini döndürür.
+    """
+    rules = [
+        {"rule": "tarih_okunamadi", "column": "Tarih",
+         "description": "Tarih boş veya okunamıyor",
+         "check": lambda: unparseable_dates(df["Tarih"])},
+        {"rule": "tekrarlanan_satir", "column": None,
+         "description": "Birebir tekrarlanan satır",
+         "check": lambda: duplicate_rows(df)},
+        {"rule": "bilinmeyen_makina", "column": "Makina Kodu",
+         "description": "Makina kodu tezgah listesinde yok",
+         "check": lambda: unknown_machines(df["Makina Kodu"])},
+    ]
+    for col in OEE_COLUMNS:
+        if col in df.columns:
+            rules.append({
+                "rule": "oran_aralik_disi", "column": col,
+                "description": f"{col} değeri [0, 1] aralığı dışında",
+                "check": lambda col=col: out_of_unit_range(df[col])
+            })
+    return rules
+
+
+def _run_rules(table: str, df: pd.DataFrame, rules: List[Dict], sample_size: int) -> List[Dict]:
+    """
+    Kuralları çalıştırıp ihlal sayılarını ve örnek satır indekslerini toplar.
+    """
+    results = []
+    for rule in rules:
+        mask = rule["check"]()
+        positions = np.flatnonzero(mask)
+        results.append({
+            "table": table,
+            "rule": rule["rule"],
+            "column": rule["column"],
+            "description": rule["description"],
+            "count": int(len(positions)),
+            "samples": df.index[positions[:sample_size]].tolist()
+        })
+    return results
+
+
+def validate_frames(
+    durus_df: Optional[pd.DataFrame],
+    calisma_df: Optional[pd.DataFrame] = None,
+    sample_size: int = SAMPLE_SIZE
+) -> Dict:
+    """
+    Duruş ve çalışma süresi tablolarını tüm kurallarla kontrol eder.
+
+    Args:
+        durus_df: Ham duruş verisi
+        calisma_df: Ham çalışma süresi verisi
+        sample_size: Kural başına raporlanacak örnek satır sayısı
+
+    Returns:
+        Dict: 'rows' (tablo -> satır sayısı), 'rules' (kural sonuçları),
+            'issue_count' (toplam ihlal) ve 'seconds' (kontrol süresi)
+    """
+    start = time.perf_counter()
+    rows = {}
+    results = []
+
+    tables = [("durus", durus_df, _durus_rules), ("calisma", calisma_df, _calisma_rules)]
+    for table, df, rules in tables:
+        if df is None:
+            continue
+        rows[table] = len(df)
+        df = _encode_text_columns(df)
+        results.extend(_run_rules(table, df, rules(df), sample_size))
+
+    report = {
+        "rows": rows,
+        "rules": results,
+        "issue_count": sum(r["count"] for r in results),
+        "seconds": time.perf_counter() - start
+    }
+    logger.info(
+        f"Veri kalitesi kontrolü tamamlandı: {sum(rows.values())} satır, "
+        f"{report['issue_count']} ihlal, {report['seconds']:.2f} saniye"
+    )
+    return report
+
+
+def format_quality_report(report: Dict) -> str:
+    """
+    Kalite raporunu metne çevirir; ihlali olmayan kurallar gösterilmez.
+
+    Args:
+        report: validate_frames çıktısı
+
+    Returns:
+        str: Kural bazında ihlal sayıları ve örnek satır indeksleri
+    """
+    table_names = {"durus": "Duruş", "calisma": "Çalışma"}
+    issues = [r for r in report["rules"] if r["count"] > 0]
+    if not issues:
+        return "Veri kalitesi kontrolü: sorun bulunamadı."
+
+    lines = [f"Veri kalitesi kontrolü: {report['issue_count']} ihlal"]
+    for r in issues:
+        total = report["rows"][r["table"]]
+        samples = ", ".join(str(s) for s in r["samples"])
+        lines.append(
+            f"  [{table_names[r['table']]}] {r['description']}: {r['count']} satır "
+            f"(%{100 * r['count'] / total:.2f}; örnek satırlar: {samples})"
+        )
+    return "\n".join(lines)
@@ -8,9 +8,12 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Callable, Dict, List, Tuple, Optional, Union
 import logging
 
+from src.data_processing import WEEK_KEY_COLUMN, shift_week_key, week_keys, week_label
+from src.ranking import select_top
+
 # Loglama yapılandırması
 logger = logging.getLogger(__name__)
 
@@ -36,9 +39,6 @@ def visualize_pie(
     """
     logger.info(f"Pasta grafik oluşturuluyor: {baslik}")
     
-    # Veri çerçevesini kopyalama
-    data = data.copy()
-    
     # Klasör yolunu belirleme
     if custom_folder is not None:
         folder_path = custom_folder
@@ -81,12 +81,12 @@ def visualize_pie(
         # Toplam süre hesaplama
         total_time = data["Süre (Dakika)"].sum()
         
-        # Yüzde hesaplama
-        data["Yüzde"] = (data["Süre (Dakika)"] / total_time * 100)
+        # Yüzde hesaplama (girdi tabloyu değiştirmeden yeni tabloda)
+        data = data.assign(Yüzde=data["Süre (Dakika)"] / total_time * 100)
         
         # Eşik değerinden küçük olanları "Diğer" olarak gruplama
-        diger_sure = data[data["Yüzde"] < threshold]["Süre (Dakika)"].sum()
-        diger_df = data[data["Yüzde"] >= threshold].copy()
+        diger_sure = data.loc[data["Yüzde"] < threshold, "Süre (Dakika)"].sum()
+        diger_df = data[data["Yüzde"] >= threshold]
         
         # "Diğer" satırını ekleme
         if diger_sure > 0:
@@ -140,10 +140,16 @@ def visualize_bar(
     text: int = 1, 
     baslik: str = "Tüm İş Merkezleri",
     save: bool = True,
-    show: bool = True
+    show: bool = True,
+    top_k: Optional[int] = None,
+    largest: bool = True
 ) -> None:
     """
     Duruş sürelerini çubuk grafik olarak görselleştirir.
+    
+    top_k verilirse bundan/buna yerine süreye göre en büyük (largest=False
+    ise en küçük) top_k tezgah kısmi seçimle alınır; verinin önceden
+    sıralanmış olması gerekmez. Çubuklar süreye göre artan sırada çizilir.
     """
     logger.info(f"Çubuk grafik oluşturuluyor: {baslik}")
     
@@ -167,7 +173,12 @@ def visualize_bar(
             buna = len(data)
         
         # Veriyi filtrele
-        filtered_data = data.iloc[bundan:buna].copy()
+        if top_k is not None:
+            filtered_data = select_top(data, "Süre (Dakika)", top_k, largest=largest)
+            if largest:
+                filtered_data = filtered_data.iloc[::-1]
+        else:
+            filtered_data = data.iloc[bundan:buna]
         
         # Veri yoksa uyarı ver ve çık
         if filtered_data.empty:
@@ -178,7 +189,7 @@ def visualize_bar(
         total_time = data["Süre (Dakika)"].sum()
         
         # Yüzde hesapla
-        filtered_data["Yüzde"] = (filtered_data["Süre (Dakika)"] / total_time) * 100
+        filtered_data = filtered_data.assign(Yüzde=(filtered_data["Süre (Dakika)"] / total_time) * 100)
         
         # Grafik oluşturma
         plt.figure(figsize=(12, 8))
@@ -232,10 +243,14 @@ def visualize_weekly_comparison(
     save: bool = True,
     show: bool = True,
     sort_by_last_week: bool = True,
-    target_week: int = 1
+    target_week: int = 1,
+    cancel_check: Optional[Callable[[], bool]] = None
 ) -> None:
     """
     4 haftalık duruş karşılaştırmasını görselleştirir.
+    
+    cancel_check verilirse her grafikten önce çağrılır; True dönerse kalan
+    grafikler çizilmeden çıkılır.
     """
     logger.info(f"{gozlem} için haftalık karşılaştırma grafikleri oluşturuluyor...")
     
@@ -254,11 +269,17 @@ def visualize_weekly_comparison(
         ensure_dir(folder_path)
         
         # Her gözlem değeri için grafik oluştur
-        for gozlemlenen, data in df.groupby(gozlem):
+        for gozlemlenen, data in df.groupby(gozlem, observed=True):
+            # İptal kontrol noktası
+            if cancel_check is not None and cancel_check():
+                logger.info("Haftalık karşılaştırma grafikleri iptal edildi.")
+                return
+            
             plt.figure(figsize=(12, 8))
             
-            # Hafta listesini al
-            weeks = sorted(data["Hafta"].unique())
+            # Hafta listesini al (yıl-hafta anahtarları; yıl dönümünde sıra korunur)
+            keys = week_keys(data)
+            weeks = sorted(np.unique(keys))
             
             # Kategorileri al
             categories = data['Duruş Adı'].unique()
@@ -270,7 +291,7 @@ def visualize_weekly_comparison(
             bar_width = 0.8 / len(weeks)
             
             for i, week in enumerate(weeks):
-                week_data = data[data['Hafta'] == week]
+                week_data = data[keys == week]
                 
                 # Her kategori için değer bul
                 heights = []
@@ -285,7 +306,7 @@ def visualize_weekly_comparison(
                 x_pos = x_positions - 0.4 + (i + 0.5) * bar_width
                 bars = plt.bar(
                     x_pos, heights, width=bar_width, 
-                    label=f'Hafta {week}',
+                    label=week_label(week),
                     color=sns.color_palette(palet)[i % 10]
                 )
             
@@ -322,10 +343,14 @@ def plot_bar(
     duration_column: str = "Süre (Dakika)", 
     threshold: float = 3,
     save: bool = True,
-    show: bool = True
+    show: bool = True,
+    cancel_check: Optional[Callable[[], bool]] = None
 ) -> None:
     """
     Her bir tezgah için duruş sürelerini çubuk grafik olarak görselleştirir.
+    
+    cancel_check verilirse her tezgah grafiğinden önce çağrılır; True dönerse
+    kalan grafikler çizilmeden çıkılır.
     """
     logger.info("Tezgah duruş grafikleri oluşturuluyor...")
     
@@ -335,16 +360,16 @@ def plot_bar(
         return
     
     try:
-        # Unique makine kodlarını al
-        machine_codes = df[machine_code_column].unique()
-
         # Klasör yolunu tanımla
         folder_path = 'Raporlar/Tezgahlar/Son Hafta'
         ensure_dir(folder_path)
         
-        for code in machine_codes:
-            # Makineye ait verileri filtrele
-            machine_data = df[df[machine_code_column] == code].copy()
+        # Makine verilerini tek geçişte grupla (her tezgah için tüm tabloyu taramadan)
+        for code, machine_data in df.groupby(machine_code_column, observed=True, sort=False):
+            # İptal kontrol noktası
+            if cancel_check is not None and cancel_check():
+                logger.info("Tezgah duruş grafikleri iptal edildi.")
+                return
             
             # Toplam süreyi hesapla
             total_duration = machine_data[duration_column].sum()
@@ -355,7 +380,7 @@ def plot_bar(
                 continue
                 
             # Duruş adlarına göre grupla
-            machine_summary = machine_data.groupby(stoppage_column)[duration_column].sum().reset_index()
+            machine_summary = machine_data.groupby(stoppage_column, observed=True)[duration_column].sum().reset_index()
             
             # Grafiği oluştur
             plt.figure(figsize=(10, 6))
@@ -407,10 +432,9 @@ def visualize_top_bottom_machines(
         # Toplam süreyi hesapla
         total_time = df["Süre (Dakika)"].sum()
 
-        # İlk ve son tezgahları seç
-        df_sorted = df.sort_values(by="Süre (Dakika)", ascending=True)
-        top = df_sorted.tail(top_count)  # En yüksek değerler
-        bottom = df_sorted.head(bottom_count)  # En düşük değerler
+        # İlk ve son tezgahları kısmi seçimle al (artan sırada)
+        top = select_top(df, "Süre (Dakika)", top_count).iloc[::-1]  # En yüksek değerler
+        bottom = select_top(df, "Süre (Dakika)", bottom_count, largest=False)  # En düşük değerler
 
         # Seçilen satırları birleştir
         selected_data = pd.concat([bottom, top])
@@ -448,38 +472,70 @@ def visualize_top_bottom_machines(
     except Exception as e:
         logger.error(f"En çok ve en az duruşa sahip tezgahlar grafiği oluşturulurken hata: {str(e)}")
 
+def _plot_oee_trend(
+    data: pd.DataFrame,
+    weeks: List[int],
+    baslik: str,
+    file_path: str
+) -> None:
+    """
+    Bir kısım veya tezgahın haftalık OEE metriklerini çizgi grafik olarak kaydeder.
+    """
+    metric_columns = ["Oee", "Performans", "Kullanılabilirlik", "Kalite"]
+    haftalik = data.set_index(WEEK_KEY_COLUMN)[metric_columns].reindex(sorted(weeks))
+    
+    plt.figure(figsize=(10, 6))
+    for col, label in zip(metric_columns, ['OEE', 'Performans', 'Kullanılabilirlik', 'Kalite']):
+        plt.plot([week_label(week) for week in haftalik.index], haftalik[col], marker='o', label=label)
+    plt.title(baslik)
+    plt.xlabel("Hafta")
+    plt.ylim([0, 1])
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+    plt.legend(loc='lower left')
+    
+    plt.savefig(file_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
 def generate_oee_visuals(
-    df: pd.DataFrame, 
-    weeks: List[int]
+    oee_tables: Dict[str, pd.DataFrame], 
+    weeks: List[int],
+    cancel_check: Optional[Callable[[], bool]] = None
 ) -> None:
     """
-    OEE, performans, kullanılabilirlik ve kalite değerlerini görselleştirir.
+    Zaman ağırlıklı OEE, performans, kullanılabilirlik ve kalite değerlerini görselleştirir.
+    
+    Genel grafikler her hafta için Raporlar/Tee/Genel, haftalık eğilim
+    grafikleri her kısım için Raporlar/Tee/Kısımlar ve her tezgah için
+    Raporlar/Tee/Tezgahlar klasörüne kaydedilir.
+    
+    Args:
+        oee_tables: src.oee.compute_oee_tables çıktısı ('genel', 'kisim', 'tezgah')
+        weeks: Yıl-hafta anahtarları
+        cancel_check: Her kısım/tezgah grafiğinden önce çağrılır; True dönerse
+            kalan grafikler çizilmeden çıkılır
     """
     logger.info("OEE görselleri oluşturuluyor...")
     
     # Veri yoksa işlem yapma
-    if df.empty:
+    if oee_tables["genel"].empty:
         logger.warning("OEE görselleri için veri bulunamadı.")
         return
     
     try:
+        # Haftalık fabrika değerleri (eksik metrikler 0 kabul edilir)
+        metric_columns = ["Oee", "Performans", "Kullanılabilirlik", "Kalite"]
+        haftalik = oee_tables["genel"].set_index(WEEK_KEY_COLUMN)[metric_columns].reindex(weeks).fillna(0)
+        
         # Her hafta için
         for week in weeks:
-            week_df = df[df["Hafta"] == week]
-            
-            # Genel ortalama
-            oee_general = week_df["Oee"].mean() if "Oee" in week_df.columns else 0
-            performans_general = week_df["Performans"].mean() if "Performans" in week_df.columns else 0
-            kullanilabilirlik_general = week_df["Kullanılabilirlik"].mean() if "Kullanılabilirlik" in week_df.columns else 0
-            kalite_general = week_df["Kalite"].mean() if "Kalite" in week_df.columns else 0
+            values = haftalik.loc[week].tolist()
             
             # Grafik oluştur
             plt.figure(figsize=(10, 6))
             metrics = ['OEE', 'Performans', 'Kullanılabilirlik', 'Kalite']
-            values = [oee_general, performans_general, kullanilabilirlik_general, kalite_general]
             
             plt.bar(metrics, values, color=sns.color_palette("Blues_d"))
-            plt.title(f"{week}. Hafta OEE Metrikleri")
+            plt.title(f"{week_label(week)} Hafta OEE Metrikleri")
             plt.ylim([0, 1])
             plt.grid(axis='y', linestyle='--', alpha=0.7)
             
@@ -490,11 +546,334 @@ def generate_oee_visuals(
             # Grafiği kaydet
             folder_path = f"Raporlar/Tee/Genel"
             ensure_dir(folder_path)
-            file_path = os.path.join(folder_path, f"{week} Hafta.png")
+            file_path = os.path.join(folder_path, f"{week_label(week)} Hafta.png")
             plt.savefig(file_path, dpi=300, bbox_inches='tight')
             
             # Grafiği kapat
             plt.close()
+        
+        # Kısım ve tezgah bazında haftalık eğilim grafikleri
+        for level, column, folder_path in [
+            ("kisim", "KISIM", "Raporlar/Tee/Kısımlar"),
+            ("tezgah", "İş Merkezi Kodu ", "Raporlar/Tee/Tezgahlar")
+        ]:
+            table = oee_tables.get(level)
+            if table is None or table.empty:
+                continue
+            ensure_dir(folder_path)
+            for name, group in table.groupby(column, observed=True, sort=True):
+                # İptal kontrol noktası
+                if cancel_check is not None and cancel_check():
+                    logger.info("OEE görselleri iptal edildi.")
+                    return
+                _plot_oee_trend(
+                    group, weeks, f"{name} - Haftalık OEE Metrikleri",
+                    os.path.join(folder_path, f"{name}.png")
+                )
+            logger.info(f"OEE eğilim grafikleri kaydedildi: {folder_path}")
+    
+    except Exception as e:
+        logger.error(f"OEE görselleri oluşturulurken hata: {str(e)}")
+
+def visualize_category_breakdown(
+    data: pd.DataFrame,
+    group_column: str = "KISIM",
+    category_column: str = "Duruş Kategorisi",
+    baslik: str = "Kısımlara Göre Duruş Kategorileri",
+    save: bool = True,
+    show: bool = True
+) -> None:
+    """
+    Grup (kısım veya tezgah) bazında duruş kategorisi sürelerini yığılmış
+    yatay çubuk grafik olarak görselleştirir.
+    """
+    logger.info(f"Duruş kategorisi grafiği oluşturuluyor: {baslik}")
+    
+    # Eğer veri yoksa işlem yapma
+    if data.empty or 'Süre (Dakika)' not in data.columns:
+        logger.warning(f"Duruş kategorisi grafiği için veri bulunamadı: {baslik}")
+        return
+    
+    try:
+        # Grup x kategori tablosu (kategori sırası tip tanımındaki sırayla)
+        tablo = data.pivot_table(
+            index=group_column,
+            columns=category_column,
+            values="Süre (Dakika)",
+            aggfunc="sum",
+            fill_value=0,
+            observed=True
+        )
+        tablo = tablo.loc[tablo.sum(axis=1).sort_values().index]
+        
+        # Grafik oluştur
+        ax = tablo.plot(
+            kind="barh",
+            stacked=True,
+            figsize=(12, max(4, 0.5 * len(tablo))),
+            color=sns.color_palette("Set2", len(tablo.columns))
+        )
+        ax.set_title(baslik, fontsize=14)
+        ax.set_xlabel("Süre (Dakika)", fontsize=12)
+        ax.set_ylabel(group_column, fontsize=12)
+        ax.legend(title="Kategori", bbox_to_anchor=(1.01, 1), loc="upper left")
+        plt.tight_layout()
+        
+        # Grafiği kaydet
+        if save:
+            folder_path = 'Raporlar/Genel'
+            ensure_dir(folder_path)
+            file_path = os.path.join(folder_path, f"{baslik}.png")
+            plt.savefig(file_path, dpi=300, bbox_inches='tight')
+            logger.info(f"Grafik kaydedildi: {file_path}")
+        
+        # Grafiği göster
+        if show:
+            plt.show()
+        
+        # Grafiği kapat
+        plt.close()
+    
+    except Exception as e:
+        logger.error(f"Duruş kategorisi grafiği oluşturulurken hata: {str(e)}")
+
+def visualize_hour_of_week_heatmap(
+    matrix: pd.DataFrame,
+    baslik: str,
+    folder_path: str = "Raporlar/Isı Haritası",
+    save: bool = True,
+    show: bool = True
+) -> None:
+    """
+    Satırları kısım veya tezgah, sütunları haftanın 168 saati olan duruş
+    dakikası matrisini ısı haritası olarak görselleştirir.
+    """
+    logger.info(f"Isı haritası oluşturuluyor: {baslik}")
+    
+    # Veri yoksa işlem yapma
+    if matrix.empty:
+        logger.warning(f"Isı haritası için veri bulunamadı: {baslik}")
+        return
+    
+    try:
+        plt.figure(figsize=(16, max(3, 0.35 * len(matrix) + 1.5)))
+        ax = sns.heatmap(
+            matrix,
+            cmap="YlOrRd",
+            cbar_kws={"label": "Duruş (Dakika)"},
+            xticklabels=False,
+            yticklabels=[str(label) for label in matrix.index]
+        )
+        
+        # Gün sınırları ve gün etiketleri
+        gunler = ["Pzt", "Sal", "Çar", "Per", "Cum", "Cmt", "Paz"]
+        for gun in range(1, 7):
+            ax.axvline(gun * 24, color="white", linewidth=1.5)
+        ax.set_xticks([gun * 24 + 12 for gun in range(7)])
+        ax.set_xticklabels(gunler, rotation=0)
+        
+        plt.title(baslik, fontsize=14)
+        plt.xlabel("Haftanın Günü (her gün 24 saat)")
+        plt.ylabel("")
+        plt.tight_layout()
+        
+        # Grafiği kaydet
+        if save:
+            ensure_dir(folder_path)
+            file_path = os.path.join(folder_path, f"{baslik}.png")
+            plt.savefig(file_path, dpi=300, bbox_inches='tight')
+            logger.info(f"Grafik kaydedildi: {file_path}")
+        
+        # Grafiği göster
+        if show:
+            plt.show()
+        
+        # Grafiği kapat
+        plt.close()
+    
+    except Exception as e:
+        logger.error(f"Isı haritası oluşturulurken hata: {str(e)}")
+
+def visualize_trend_increases(
+    increases: pd.DataFrame,
+    group_column: str,
+    baslik: str,
+    save: bool = True,
+    show: bool = True
+) -> None:
+    """
+    Son haftada en çok artan grupların önceki ve son hafta sürelerini,
+    4 haftalık ortalamayla birlikte yatay çubuk grafik olarak görselleştirir.
+    """
+    logger.info(f"Haftalık artış grafiği oluşturuluyor: {baslik}")
+    
+    # Veri yoksa işlem yapma
+    if increases.empty:
+        logger.warning(f"Haftalık artış grafiği için veri bulunamadı: {baslik}")
+        return
+    
+    try:
+        # En büyük artış en üstte olacak şekilde sırala
+        data = increases.iloc[::-1]
+        y_positions = np.arange(len(data))
+        hafta = int(data[WEEK_KEY_COLUMN].iloc[0])
+        
+        plt.figure(figsize=(12, max(4, 0.6 * len(data) + 1.5)))
+        plt.barh(y_positions + 0.2, data["Önceki Hafta (Dakika)"], height=0.4,
+                 color="#b0b0b0", label=f"Hafta {week_label(shift_week_key(hafta, -1))}")
+        plt.barh(y_positions - 0.2, data["Süre (Dakika)"], height=0.4,
+                 color="#d62728", label=f"Hafta {week_label(hafta)}")
+        plt.scatter(data["Ortalama 4 Hafta"], y_positions, color="black", marker="|",
+                    s=300, zorder=3, label="4 Haftalık Ortalama")
+        
+        # Artış miktarlarını çubukların sonuna yaz
+        for y, (sure, artis) in enumerate(zip(data["Süre (Dakika)"], data["Artış (Dakika)"])):
+            plt.text(sure, y - 0.2, f"  +{artis:.0f}", va="center", fontsize=9)
+        
+        plt.yticks(y_positions, data[group_column].astype(str))
+        plt.title(baslik, fontsize=14)
+        plt.xlabel("Süre (Dakika)", fontsize=12)
+        plt.legend(loc="lower right")
+        plt.tight_layout()
+        
+        # Grafiği kaydet
+        if save:
+            folder_path = 'Raporlar/Genel'
+            ensure_dir(folder_path)
+            file_path = os.path.join(folder_path, f"{baslik}.png")
+            plt.savefig(file_path, dpi=300, bbox_inches='tight')
+            logger.info(f"Grafik kaydedildi: {file_path}")
+        
+        # Grafiği göster
+        if show:
+            plt.show()
+        
+        # Grafiği kapat
+        plt.close()
+    
+    except Exception as e:
+        logger.error(f"Haftalık artış grafiği oluşturulurken hata: {str(e)}")
+
+def visualize_anomaly_summary(
+    anomalies: pd.DataFrame,
+    baslik: str = "Duruş Anomalileri",
+    top_n: int = 20,
+    save: bool = True,
+    show: bool = True
+) -> None:
+    """
+    En yüksek z-skorlu tezgah x duruş tipi anomalilerini tek bir yatay çubuk
+    grafikte özetler; etiketlerde haftanın süresi ve geçmiş medyanı yer alır.
+    """
+    logger.info(f"Anomali özeti grafiği oluşturuluyor: {baslik}")
+    
+    # Veri yoksa işlem yapma
+    if anomalies.empty:
+        logger.warning(f"Anomali özeti için veri bulunamadı: {baslik}")
+        return
+    
+    try:
+        # En yüksek z-skoru en üstte olacak şekilde sırala
+        data = anomalies.nlargest(top_n, "Z-Skoru").iloc[::-1]
+        etiketler = [
+            f"{tezgah} - {durus} ({week_label(hafta)})"
+            for tezgah, durus, hafta in zip(data["İş Merkezi Kodu "], data["Duruş Adı"], data[WEEK_KEY_COLUMN])
+        ]
+        renkler = ["#d62728" if z > 0 else "#1f77b4" for z in data["Z-Skoru"]]
+        
+        plt.figure(figsize=(12, max(4, 0.45 * len(data) + 1.5)))
+        plt.barh(np.arange(len(data)), data["Z-Skoru"], color=renkler)
+        
+        # Süre ve medyanı çubukların sonuna yaz
+        for y, (z, sure, medyan) in enumerate(zip(data["Z-Skoru"], data["Süre (Dakika)"], data["Medyan (Dakika)"])):
+            plt.text(max(z, 0), y, f"  {sure:.0f} dk (medyan {medyan:.0f})", va="center", fontsize=9)
+        
+        plt.yticks(np.arange(len(data)), etiketler)
+        plt.title(baslik, fontsize=14)
+        plt.xlabel("Sağlam Z-Skoru", fontsize=12)
+        plt.tight_layout()
+        
+        # Grafiği kaydet
+        if save:
+            folder_path = 'Raporlar/Genel'
+            ensure_dir(folder_path)
+            file_path = os.path.join(folder_path, f"{baslik}.png")
+            plt.savefig(file_path, dpi=300, bbox_inches='tight')
+            logger.info(f"Grafik kaydedildi: {file_path}")
+        
+        # Grafiği göster
+        if show:
+            plt.show()
+        
+        # Grafiği kapat
+        plt.close()
+    
+    except Exception as e:
+        logger.error(f"Anomali özeti grafiği oluşturulurken hata: {str(e)}")
+
+def visualize_pareto(
+    data: pd.DataFrame,
+    baslik: str,
+    folder_path: str = "Raporlar/Genel",
+    top_n: int = 25,
+    save: bool = True,
+    show: bool = True
+) -> None:
+    """
+    Tek bir grubun Pareto tablosunu, ABC sınıfına göre renklendirilmiş süre
+    çubukları ve ikincil eksende birikimli pay çizgisiyle görselleştirir.
+    """
+    logger.info(f"Pareto grafiği oluşturuluyor: {baslik}")
+    
+    # Veri yoksa işlem yapma
+    if data.empty:
+        logger.warning(f"Pareto grafiği için veri bulunamadı: {baslik}")
+        return
+    
+    try:
+        # En büyük nedenler (tablo süreye göre azalan sıralıdır)
+        data = data.head(top_n)
+        x_positions = np.arange(len(data))
+        sinif_renkleri = {"A": "#d62728", "B": "#ff7f0e", "C": "#7f7f7f"}
+        
+        fig, ax = plt.subplots(figsize=(14, 8))
+        ax.bar(
+            x_positions,
+            data["Süre (Dakika)"],
+            color=[sinif_renkleri[str(sinif)] for sinif in data["ABC Sınıfı"]]
+        )
+        ax.set_xticks(x_positions)
+        ax.set_xticklabels(data["Duruş Adı"], rotation=75, ha="right")
+        ax.set_ylabel("Süre (Dakika)", fontsize=12)
+        
+        # Birikimli pay çizgisi ve %80 sınırı
+        ax2 = ax.twinx()
+        ax2.plot(x_positions, data["Birikimli Pay"] * 100, color="black", marker="o", markersize=4)
+        ax2.axhline(80, color="black", linestyle="--", linewidth=1)
+        ax2.set_ylim(0, 105)
+        ax2.set_ylabel("Birikimli Pay (%)", fontsize=12)
+        
+        # Sınıf açıklamaları
+        for sinif, renk in sinif_renkleri.items():
+            ax.bar(0, 0, color=renk, label=f"Sınıf {sinif}")
+        ax.legend(title="ABC", loc="center right")
+        
+        ax.set_title(baslik, fontsize=14)
+        fig.tight_layout()
+        
+        # Grafiği kaydet
+        if save:
+            ensure_dir(folder_path)
+            file_path = os.path.join(folder_path, f"{baslik}.png")
+            plt.savefig(file_path, dpi=300, bbox_inches='tight')
+            logger.info(f"Grafik kaydedildi: {file_path}")
+        
+        # Grafiği göster
+        if show:
+            plt.show()
+        
+        # Grafiği kapat
+        plt.close()
     
     except Exception as e:
-        logger.error(f"OEE görselleri oluşturulurken hata: {str(e)}")
\ No newline at end of file
+        logger.error(f"Pareto grafiği oluşturulurken hata: {str(e)}")
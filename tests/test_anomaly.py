@@ -0,0 +1,66 @@
+"""
+Sağlam z-skoru ile haftalık anomali tespiti testleri.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.anomaly import ANOMALY_COLUMNS, Z_THRESHOLD, detect_anomalies, robust_z_scores
+from src.data_processing import build_analysis_frame
+
+
+def test_robust_z_scores_mad_fallbacks():
+    values = np.array([
+        [10.0, 12.0, 11.0, 9.0, 100.0],
+        [5.0, 5.0, 5.0, 5.0, 20.0],
+        [7.0, 7.0, 7.0, 7.0, 7.0],
+    ])
+
+    z = robust_z_scores(values)
+
+    # MAD = 1: z = 0.6745 x (100 - 11) / 1
+    assert np.isclose(z[0, -1], 0.6745 * 89)
+    # MAD sıfır; ortalama mutlak sapma = 3
+    assert np.isclose(z[1, -1], 15 / (1.2533 * 3))
+    assert np.isnan(z[2]).all()
+
+
+def test_detect_anomalies_flags_latest_week_spike():
+    # Altı hafta (yıl geçişi dahil); CT.D01 AYAR son haftada sıçrar,
+    # CT.D02 AYAR 202451 haftasında kayıtsızdır ve sıfır sayılır
+    mondays = pd.date_range("2024-12-02", periods=6, freq="7D")
+    minutes = [60, 62, 58, 61, 59, 600]
+    start = pd.DatetimeIndex(list(mondays) + [mondays[0], mondays[1], mondays[3], mondays[4], mondays[5]]) + pd.Timedelta(hours=8)
+    raw = pd.DataFrame({
+        "İş Merkezi Kodu ": ["CT.D01"] * 6 + ["CT.D02"] * 5,
+        "Duruş Adı": ["AYAR"] * 11,
+        "Duruş Başlangıç Tarih": start,
+        "Duruş Bitiş Tarih": start + pd.to_timedelta(minutes + [30] * 5, unit="min"),
+    })
+    df, _, weeks = build_analysis_frame(raw)
+
+    result = detect_anomalies(df, weeks)
+
+    assert list(result.columns) == ANOMALY_COLUMNS
+    assert len(result) == 1
+    row = result.iloc[0]
+    assert row["İş Merkezi Kodu "] == "CT.D01"
+    assert row["Yıl Hafta"] == 202502
+    assert row["Süre (Dakika)"] == 600
+    assert row["Z-Skoru"] >= Z_THRESHOLD
+
+    all_weeks = detect_anomalies(df, weeks, latest_only=False)
+    assert (all_weeks["İş Merkezi Kodu "] == "CT.D02").any()
+
+
+def test_detect_anomalies_needs_min_weeks():
+    start = pd.to_datetime(["2025-01-06 08:00"])
+    raw = pd.DataFrame({
+        "İş Merkezi Kodu ": ["CT.D01"],
+        "Duruş Adı": ["AYAR"],
+        "Duruş Başlangıç Tarih": start,
+        "Duruş Bitiş Tarih": start + pd.Timedelta(minutes=30),
+    })
+    df, _, weeks = build_analysis_frame(raw)
+
+    assert detect_anomalies(df, weeks).empty
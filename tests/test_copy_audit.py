@@ -0,0 +1,12 @@
+"""
+Analiz aşamalarının ham duruş tablosunu kopyalamadığını doğrulayan test.
+"""
+
+from benchmarks.copy_audit import assert_no_full_copies, run_copy_audit
+
+# Sabit bellek maliyetlerinin kopya maliyetine göre küçük kaldığı en küçük boyut
+AUDIT_ROWS = 200_000
+
+
+def test_no_stage_copies_raw_table():
+    assert_no_full_copies(run_copy_audit(AUDIT_ROWS))
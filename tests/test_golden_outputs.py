@@ -0,0 +1,35 @@
+"""
+Hesaplama fonksiyonlarının kayıtlı referans çıktılarla eşdeğerlik testleri.
+
+Referans çıktılar benchmarks/golden altındadır ve optimizasyonlardan önceki
+src.calculations ile üretilmiştir. Bir değişiklik çıktıları bilerek
+değiştiriyorsa referanslar 'python -m benchmarks.equivalence --write-golden'
+ile yeniden üretilmelidir.
+"""
+
+import pytest
+
+import src.calculations as calculations
+from benchmarks.equivalence import (
+    GOLDEN_SEED,
+    GOLDEN_SIZES,
+    OUTPUT_SPECS,
+    build_jobs,
+    compare_frames,
+    generated_frame,
+    read_golden,
+)
+
+
+def _cases():
+    for n_rows in GOLDEN_SIZES:
+        df, kisim_tezgah_sayilari, weeks = generated_frame(n_rows, GOLDEN_SEED)
+        for output, spec_name, func_name, call in build_jobs(df, kisim_tezgah_sayilari, weeks):
+            yield pytest.param(n_rows, output, spec_name, func_name, call, id=f"{n_rows}-{output}")
+
+
+@pytest.mark.parametrize("n_rows, output, spec_name, func_name, call", list(_cases()))
+def test_matches_golden_output(n_rows, output, spec_name, func_name, call):
+    expected = read_golden(output, n_rows, GOLDEN_SEED)
+    actual = call(getattr(calculations, func_name))
+    assert compare_frames(expected, actual, OUTPUT_SPECS[spec_name]) == []
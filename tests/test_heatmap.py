@@ -0,0 +1,59 @@
+"""
+Duruş dakikalarının haftanın saatlerine dağıtılması testleri.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing import build_analysis_frame
+from src.heatmap import HOURS_PER_WEEK, compute_heatmaps, hour_of_week_minutes
+
+
+def _minutes(start_hours, end_hours):
+    """
+    Tek grubun kayıtlarını (eksen başlangıcından itibaren saat) dağıtır.
+    """
+    start = np.asarray(start_hours, dtype=np.float64) * 3600
+    end = np.asarray(end_hours, dtype=np.float64) * 3600
+    return hour_of_week_minutes(np.zeros(len(start), dtype=np.int64), start, end, 1)[0]
+
+
+def test_partial_hours_are_split():
+    minutes = _minutes([0.5], [2.25])
+
+    assert minutes[:3].tolist() == [30, 60, 15]
+    assert minutes[3:].sum() == 0
+
+
+def test_long_stop_wraps_around_week():
+    # Pazar 23:00 - Pazartesi 01:00
+    wrap = _minutes([167], [169])
+    assert wrap[HOURS_PER_WEEK - 1] == 60
+    assert wrap[0] == 60
+    assert wrap.sum() == 120
+
+    # Sekiz günlük duruş: her dilim 60 dk, ilk gün iki kez
+    long = _minutes([0], [192])
+    assert long.sum() == 192 * 60
+    assert (long[:24] == 120).all()
+    assert (long[24:] == 60).all()
+
+
+def test_compute_heatmaps_groups_and_filters():
+    start = pd.to_datetime(["2025-01-06 08:00", "2025-01-07 10:30", "2025-01-06 08:00", "2025-01-13 08:00"])
+    raw = pd.DataFrame({
+        "İş Merkezi Kodu ": ["CT.D01", "CT.D02", "CT.D01", "CT.D01"],
+        "Duruş Adı": ["AYAR", "ARIZA", "ÇALIŞMA SÜRESİ", "AYAR"],
+        "Duruş Başlangıç Tarih": start,
+        "Duruş Bitiş Tarih": start + pd.to_timedelta([90, 30, 600, 60], unit="min"),
+    })
+    df = build_analysis_frame(raw)[0]
+
+    tables = compute_heatmaps(df, weeks=[202502])
+    tezgah, kisim = tables["tezgah"], tables["kisim"]
+
+    assert tezgah.shape == (2, HOURS_PER_WEEK)
+    assert tezgah.loc[("KISIM 2.1", "CT.D01"), 8] == 60
+    assert tezgah.loc[("KISIM 2.1", "CT.D01"), 9] == 30
+    assert tezgah.loc[("KISIM 2.1", "CT.D02"), 24 + 10] == 30
+    assert kisim.loc["KISIM 2.1"].sum() == 120
@@ -0,0 +1,73 @@
+"""
+Su seviyeli artımlı aktarım testleri.
+"""
+
+import pandas as pd
+import pytest
+
+from src import storage
+from src.ingest import ingest_incremental, load_watermarks, read_weekly_aggregates
+
+pytestmark = pytest.mark.skipif(not storage.is_available(), reason="pyarrow kurulu değil")
+
+
+def _export(rows):
+    """
+    (tezgah, duruş adı, başlangıç, dakika) satırlarından ham dışa aktarım oluşturur.
+    """
+    start = pd.to_datetime([row[2] for row in rows])
+    return pd.DataFrame({
+        "İş Merkezi Kodu ": [row[0] for row in rows],
+        "Duruş Adı": [row[1] for row in rows],
+        "Duruş Başlangıç Tarih": start,
+        "Duruş Bitiş Tarih": start + pd.to_timedelta([row[3] for row in rows], unit="min"),
+    })
+
+
+FIRST_EXPORT = [
+    ("CT.D01", "AYAR", "2025-01-06 08:00", 30),
+    ("CT.D01", "ARIZA", "2025-01-07 08:00", 60),
+    ("CT.D02", "AYAR", "2025-01-06 09:00", 15),
+]
+
+
+def test_reingesting_same_export_adds_nothing(tmp_path):
+    store = str(tmp_path / "depo")
+
+    first = ingest_incremental(_export(FIRST_EXPORT), store_path=store)
+    second = ingest_incremental(_export(FIRST_EXPORT), store_path=store)
+
+    assert first["rows_stored"] == 3
+    assert first["partitions"] == [(2025, 2)]
+    assert second["rows_new"] == 0
+    assert load_watermarks(store)["CT.D01"] == pd.Timestamp("2025-01-07 08:00")
+
+
+def test_only_rows_after_watermark_are_added(tmp_path):
+    store = str(tmp_path / "depo")
+    ingest_incremental(_export(FIRST_EXPORT), store_path=store)
+
+    result = ingest_incremental(_export(FIRST_EXPORT + [
+        # Su seviyesiyle aynı anda başlayan farklı kayıt
+        ("CT.D01", "TASARIM", "2025-01-07 08:00", 10),
+        ("CT.D02", "AYAR", "2025-01-13 09:00", 45),
+        ("CT.D03", "AYAR", "2025-01-13 10:00", 20),
+    ]), store_path=store)
+
+    assert result["rows_new"] == 3
+    assert sorted(result["partitions"]) == [(2025, 2), (2025, 3)]
+
+    aggregates = read_weekly_aggregates(store)
+    totals = aggregates.groupby("Hafta")["Süre (Saniye)"].sum()
+    assert totals.loc[2] == (30 + 60 + 15 + 10) * 60
+    assert totals.loc[3] == (45 + 20) * 60
+    assert load_watermarks(store)["CT.D03"] == pd.Timestamp("2025-01-13 10:00")
+
+
+def test_faulty_machines_are_not_stored(tmp_path):
+    store = str(tmp_path / "depo")
+
+    result = ingest_incremental(_export(FIRST_EXPORT), arizali_tezgahlar=["CT.D02"], store_path=store)
+
+    assert result["rows_stored"] == 2
+    assert "CT.D02" not in load_watermarks(store)
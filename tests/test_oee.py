@@ -0,0 +1,69 @@
+"""
+Zaman ağırlıklı OEE tabloları testleri.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.oee import PLANNED_TIME_COLUMN, compute_oee_tables
+
+
+def _calisma(rows):
+    """
+    (tezgah, tarih, çalışma, plansız duruş, performans, kalite) satırlarından
+    çalışma süresi verisi oluşturur; kullanılabilirlik ve OEE bu değerlerden
+    hesaplanır.
+    """
+    df = pd.DataFrame(rows, columns=["Makina Kodu", "Tarih", "Çalışma Zamanı", "Plansız Duruş", "Performans", "Kalite"])
+    df["Planlı Duruş"] = 0
+    df["Kullanılabilirlik"] = df["Çalışma Zamanı"] / (df["Çalışma Zamanı"] + df["Plansız Duruş"])
+    df["Oee"] = df["Kullanılabilirlik"] * df["Performans"] * df["Kalite"]
+    return df
+
+
+def test_oee_is_weighted_by_planned_time():
+    calisma = _calisma([
+        ("CT.D01", "2025-01-06", 100, 0, 0.9, 1.0),
+        ("CT.D01", "2025-01-07", 300, 100, 0.5, 1.0),
+    ])
+
+    tezgah = compute_oee_tables(calisma)["tezgah"]
+
+    assert len(tezgah) == 1
+    row = tezgah.iloc[0]
+    assert row[PLANNED_TIME_COLUMN] == 500
+    # (0.9 x 100 + 0.375 x 400) / 500; günlük ortalama 0.6375 olurdu
+    assert row["Oee"] == pytest.approx(0.48)
+    assert row["Kullanılabilirlik"] == pytest.approx(0.8)
+    assert row["Performans"] == pytest.approx(0.6)
+
+
+def test_aggregated_oee_keeps_product_identity():
+    rng = np.random.default_rng(1)
+    dates = pd.date_range("2024-12-23", periods=14, freq="D").strftime("%Y-%m-%d")
+    rows = [
+        (machine, date, rng.uniform(100, 600), rng.uniform(0, 200), rng.uniform(0.5, 1), rng.uniform(0.8, 1))
+        for machine in ("CT.D01", "CT.D02", "CT.D07")
+        for date in dates
+    ]
+    tables = compute_oee_tables(_calisma(rows))
+
+    for table in tables.values():
+        product = table["Kullanılabilirlik"] * table["Performans"] * table["Kalite"]
+        np.testing.assert_allclose(table["Oee"], product)
+
+    # Yıl geçişindeki haftalar ayrı anahtarlardır
+    assert tables["genel"]["Yıl Hafta"].tolist() == [202452, 202501]
+
+
+def test_excluded_machines_and_empty_input():
+    calisma = _calisma([
+        ("CT.D01", "2025-01-06", 100, 0, 0.9, 1.0),
+        ("CT.D02", "2025-01-06", 100, 0, 0.5, 1.0),
+    ])
+
+    tezgah = compute_oee_tables(calisma, arizali_tezgahlar=["CT.D02"])["tezgah"]
+    assert tezgah["İş Merkezi Kodu "].tolist() == ["CT.D01"]
+
+    assert all(table.empty for table in compute_oee_tables(calisma.iloc[:0]).values())
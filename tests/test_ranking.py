@@ -0,0 +1,77 @@
+"""
+Kısmi seçimle ilk k satır seçimi ve haftalık sıra değişimi testleri.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing import build_analysis_frame
+from src.ranking import MAX_SELECTION_BLOCKS, rank_changes, select_top
+
+
+def _stops(rows):
+    """
+    (tezgah, duruş adı, başlangıç, dakika) satırlarından işlenmiş duruş verisi oluşturur.
+    """
+    start = pd.to_datetime([row[2] for row in rows])
+    raw = pd.DataFrame({
+        "İş Merkezi Kodu ": [row[0] for row in rows],
+        "Duruş Adı": [row[1] for row in rows],
+        "Duruş Başlangıç Tarih": start,
+        "Duruş Bitiş Tarih": start + pd.to_timedelta([row[3] for row in rows], unit="min"),
+    })
+    return build_analysis_frame(raw)[0]
+
+
+def test_select_top_matches_full_sort_per_group():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"g": rng.integers(0, 5, 200), "v": rng.permutation(200)})
+
+    result = select_top(df, "v", 3, group_column="g")
+    expected = df.sort_values("v", ascending=False).groupby("g").head(3)
+
+    assert sorted(result.index) == sorted(expected.index)
+    for _, group in result.groupby("g"):
+        assert group["v"].is_monotonic_decreasing
+
+
+def test_select_top_many_groups_and_smallest():
+    df = pd.DataFrame({"g": np.repeat(np.arange(MAX_SELECTION_BLOCKS + 1), 3), "v": np.tile([3, 1, 2], MAX_SELECTION_BLOCKS + 1)})
+
+    result = select_top(df, "v", 1, largest=False, group_column="g")
+
+    assert len(result) == MAX_SELECTION_BLOCKS + 1
+    assert (result["v"] == 1).all()
+
+
+def test_rank_changes_across_year_boundary():
+    df = _stops([
+        ("CT.D01", "AYAR", "2024-12-23 08:00", 60),
+        ("CT.D02", "AYAR", "2024-12-24 08:00", 30),
+        ("CT.D01", "AYAR", "2024-12-30 08:00", 10),
+        ("CT.D02", "AYAR", "2024-12-31 08:00", 120),
+        ("CT.D03", "AYAR", "2025-01-02 08:00", 5),
+        ("CT.D03", "ÇALIŞMA SÜRESİ", "2025-01-02 09:00", 500),
+    ])
+
+    result = rank_changes(df, [202452, 202501]).set_index("İş Merkezi Kodu ")
+
+    assert list(result.index) == ["CT.D02", "CT.D01", "CT.D03"]
+    assert result.loc["CT.D02", "Sıra Değişimi"] == 1
+    assert result.loc["CT.D01", "Sıra Değişimi"] == -1
+    assert result.loc["CT.D03", "Süre (Dakika)"] == 5
+    assert result.loc["CT.D03", "Önceki Süre (Dakika)"] == 0
+    assert pd.isna(result.loc["CT.D03", "Önceki Sıra"])
+
+
+def test_rank_changes_compares_with_calendar_previous_week():
+    # Son haftadan önceki kayıtlı hafta iki hafta geridedir; önceki takvim haftası boştur
+    df = _stops([
+        ("CT.D01", "AYAR", "2024-12-16 08:00", 60),
+        ("CT.D01", "AYAR", "2024-12-30 08:00", 10),
+    ])
+
+    result = rank_changes(df, [202451, 202501])
+
+    assert result.loc[0, "Önceki Süre (Dakika)"] == 0
+    assert pd.isna(result.loc[0, "Önceki Sıra"])
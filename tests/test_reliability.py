@@ -0,0 +1,63 @@
+"""
+Arıza süreleri birleştirme ve güvenilirlik göstergeleri testleri.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing import build_analysis_frame
+from src.reliability import compute_reliability, merged_failure_seconds
+
+
+def test_merged_failure_seconds_merges_overlaps_per_machine():
+    codes = np.array([0, 0, 0, 1])
+    start = np.array([0, 1800, 3600 * 5, 600]) * 10**9
+    end = np.array([3600, 3600 * 2, 3600 * 5 + 900, 1200]) * 10**9
+
+    seconds, event_start = merged_failure_seconds(codes, start, end)
+
+    # İkinci kayıt ilkinin bitişinden sonraki yarım saati ekler
+    assert seconds.tolist() == [3600, 3600, 900, 600]
+    assert event_start.tolist() == [True, False, True, True]
+
+
+def test_merged_failure_seconds_contained_record_adds_nothing():
+    codes = np.array([0, 0, 0])
+    start = np.array([0, 600, 1200]) * 10**9
+    end = np.array([3600, 1200, 2400]) * 10**9
+
+    seconds, event_start = merged_failure_seconds(codes, start, end)
+
+    assert seconds.sum() == 3600
+    assert event_start.tolist() == [True, False, False]
+
+
+def test_compute_reliability_counts_overlapping_failures_once():
+    start = pd.to_datetime([
+        "2025-01-06 08:00", "2025-01-06 08:30", "2025-01-06 12:00",
+        "2025-01-07 08:00", "2025-01-07 10:00",
+    ])
+    raw = pd.DataFrame({
+        "İş Merkezi Kodu ": ["CT.D01", "CT.D01", "CT.D01", "CT.D02", "CT.D02"],
+        "Duruş Adı": ["ARIZA", "Tamir", "BOZULMA", "AYAR", "ÇALIŞMA SÜRESİ"],
+        "Duruş Başlangıç Tarih": start,
+        "Duruş Bitiş Tarih": start + pd.to_timedelta([60, 90, 30, 45, 120], unit="min"),
+    })
+    df = build_analysis_frame(raw)[0]
+
+    tables = compute_reliability(df)
+    tezgah = tables["tezgah"].set_index("İş Merkezi Kodu ")
+
+    # 08:00-09:00 ve 08:30-10:00 tek olay (120 dk), 12:00-12:30 ikinci olay
+    assert tezgah.loc["CT.D01", "Arıza Sayısı"] == 2
+    assert tezgah.loc["CT.D01", "Arıza Süresi (Dakika)"] == 150
+    assert tezgah.loc["CT.D01", "MTTR (Dakika)"] == 75
+    # Dönem 2025-01-06 00:00 - 2025-01-08 00:00
+    assert tezgah.loc["CT.D01", "Çalışma Süresi (Saat)"] == 48 - 2.5
+
+    assert tezgah.loc["CT.D02", "Arıza Sayısı"] == 0
+    assert np.isnan(tezgah.loc["CT.D02", "MTBF (Saat)"])
+    assert tezgah.loc["CT.D02", "Çalışma Oranı"] == 1
+
+    kisim = tables["kisim"].set_index("KISIM")
+    assert kisim.loc["KISIM 2.1", "Arıza Sayısı"] == 2
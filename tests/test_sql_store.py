@@ -0,0 +1,85 @@
+"""
+SQL deposundaki serbest sorguların salt okunur sınırları testleri.
+"""
+
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from src import sql_store
+from src.data_processing import build_analysis_frame
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """
+    İki duruş kaydı içeren geçici bir SQL deposu.
+    """
+    start = pd.to_datetime(["2025-01-06 08:00", "2025-01-07 09:00"])
+    raw = pd.DataFrame({
+        "İş Merkezi Kodu ": ["CT.D01", "CT.D02"],
+        "Duruş Adı": ["AYAR", "ARIZA"],
+        "Duruş Başlangıç Tarih": start,
+        "Duruş Bitiş Tarih": start + pd.Timedelta(minutes=30),
+    })
+    path = str(tmp_path / "analiz.db")
+    sql_store.write_store(build_analysis_frame(raw)[0], db_path=path)
+    return path
+
+
+@pytest.mark.parametrize("sql, expected", [
+    ("SELECT 1;", "SELECT 1"),
+    ("  -- yorum\n/* blok */ with x AS (SELECT 1) SELECT * FROM x ; ", "-- yorum\n/* blok */ with x AS (SELECT 1) SELECT * FROM x"),
+    ("(SELECT 1)", "(SELECT 1)"),
+])
+def test_normalize_query_accepts_select(sql, expected):
+    assert sql_store.normalize_query(sql) == expected
+
+
+@pytest.mark.parametrize("sql", [
+    "",
+    " ; ",
+    "DELETE FROM durus",
+    "-- SELECT\nDROP TABLE durus",
+    "/* SELECT */ UPDATE durus SET tezgah = 'x'",
+    "ATTACH DATABASE 'x.db' AS x",
+    "PRAGMA journal_mode = DELETE",
+])
+def test_normalize_query_rejects_other_statements(sql):
+    with pytest.raises(ValueError):
+        sql_store.normalize_query(sql)
+
+
+def test_authorizer_denies_attach_and_pragma_writes():
+    deny, ok = sqlite3.SQLITE_DENY, sqlite3.SQLITE_OK
+    authorize = sql_store._authorize_query
+
+    assert authorize(sqlite3.SQLITE_ATTACH, "x.db", None, None, None) == deny
+    assert authorize(sqlite3.SQLITE_DETACH, "x", None, None, None) == deny
+    assert authorize(sqlite3.SQLITE_PRAGMA, "journal_mode", "delete", "main", None) == deny
+    assert authorize(sqlite3.SQLITE_PRAGMA, "journal_mode", None, "main", None) == ok
+    assert authorize(sqlite3.SQLITE_PRAGMA, "table_info", "durus", "main", None) == ok
+    assert authorize(sqlite3.SQLITE_SELECT, None, None, None, None) == ok
+
+
+def test_query_pager_reads_pages(db_path):
+    pager = sql_store.QueryPager("SELECT tezgah FROM durus ORDER BY tezgah", db_path=db_path, page_size=1)
+    try:
+        assert pager.row_count == 2
+        assert pager.page(1)["tezgah"].tolist() == ["CT.D02"]
+        assert pager.page(2).empty
+    finally:
+        pager.close()
+
+
+@pytest.mark.skipif(sql_store.BACKEND != "sqlite", reason="SQLite yetki denetleyicisi")
+@pytest.mark.parametrize("sql, error", [
+    ("WITH x AS (SELECT 1) DELETE FROM durus", "readonly"),
+    ("SELECT * FROM pragma_optimize(2)", "not authorized"),
+])
+def test_query_connection_is_read_only(db_path, sql, error):
+    with pytest.raises(Exception, match=error):
+        sql_store.run_query(sql, db_path=db_path)
+    assert len(sql_store.run_query("SELECT * FROM durus", db_path=db_path)) == 2
+    assert len(sql_store.run_query("SELECT * FROM pragma_table_info('durus')", db_path=db_path)) > 0